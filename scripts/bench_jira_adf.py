@@ -0,0 +1,138 @@
+"""Benchmark Jira issue projection and ADF description extraction.
+
+Compares, on large synthetic documents shaped like real Jira Cloud issues:
+- full vs ``fields=``-projected ``get_issue`` payloads (bytes + decode/parse time)
+- the previous two-level ADF walk vs the iterative ``adf_to_text`` extractor
+
+Run with:  uv run python scripts/bench_jira_adf.py
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import timeit
+from typing import Any
+
+from jira_impl.adf import adf_to_text
+from jira_impl.jira_client import _ISSUE_FIELDS, parse_issue
+
+_WORDS = "login fails after deploy token cache retry timeout customer payment export report".split()
+
+
+def _legacy_extract(value: Any) -> str:
+    """The pre-projection extractor (top-level paragraphs only)."""
+    if not isinstance(value, dict) or not isinstance(value.get("content"), list):
+        return ""
+    parts: list[str] = []
+    for block in value["content"]:
+        if not isinstance(block, dict) or not isinstance(block.get("content"), list):
+            continue
+        for node in block["content"]:
+            if isinstance(node, dict) and isinstance(node.get("text"), str):
+                parts.append(node["text"])
+    return "\n".join(p for p in parts if p.strip())
+
+
+def _sentence(rng: random.Random, n: int = 12) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(n))
+
+
+def _text(s: str) -> dict[str, Any]:
+    return {"type": "text", "text": s}
+
+
+def _para(rng: random.Random) -> dict[str, Any]:
+    return {"type": "paragraph", "content": [_text(_sentence(rng)), {"type": "hardBreak"}, _text(_sentence(rng))]}
+
+
+def _list(rng: random.Random, depth: int) -> dict[str, Any]:
+    items = []
+    for _ in range(4):
+        content: list[dict[str, Any]] = [_para(rng)]
+        if depth < 4:
+            content.append(_list(rng, depth + 1))
+        items.append({"type": "listItem", "content": content})
+    return {"type": "bulletList" if depth % 2 else "orderedList", "content": items}
+
+
+def _table(rng: random.Random, rows: int = 20, cols: int = 5) -> dict[str, Any]:
+    return {
+        "type": "table",
+        "content": [
+            {
+                "type": "tableRow",
+                "content": [{"type": "tableCell", "content": [_para(rng)]} for _ in range(cols)],
+            }
+            for _ in range(rows)
+        ],
+    }
+
+
+def large_adf(seed: int = 7, sections: int = 40) -> dict[str, Any]:
+    """A long incident-style description: prose, nested lists, code and tables."""
+    rng = random.Random(seed)
+    content: list[dict[str, Any]] = []
+    for i in range(sections):
+        content.append({"type": "heading", "attrs": {"level": 2}, "content": [_text(f"Section {i}")]})
+        content.extend(_para(rng) for _ in range(3))
+        content.append(_list(rng, 1))
+        content.append({"type": "codeBlock", "content": [_text("\n".join(_sentence(rng, 6) for _ in range(15)))]})
+        if i % 4 == 0:
+            content.append(_table(rng))
+    return {"type": "doc", "version": 1, "content": content}
+
+
+def full_issue(description: dict[str, Any]) -> dict[str, Any]:
+    """A busy issue as returned without ``fields=``: custom fields, comments, changelog."""
+    rng = random.Random(3)
+    fields: dict[str, Any] = {
+        "summary": "Checkout fails for EU customers",
+        "description": description,
+        "status": {"name": "In Progress", "statusCategory": {"key": "indeterminate"}},
+        "assignee": {"accountId": "acc-1", "displayName": "Dev"},
+        "updated": "2024-05-01T10:20:30.123+0000",
+        "comment": {"comments": [{"body": large_adf(i, 2), "author": {"accountId": "a"}} for i in range(30)]},
+        "attachment": [{"filename": f"log{i}.txt", "size": 1000 + i} for i in range(20)],
+    }
+    fields.update({f"customfield_{10000 + i}": _sentence(rng, 20) for i in range(80)})
+    return {
+        "key": "PROJ-1",
+        "fields": fields,
+        "changelog": {"histories": [{"items": [{"field": "status", "toString": _sentence(rng)}]} for _ in range(300)]},
+        "renderedFields": {"description": "<p>" + _sentence(rng, 2000) + "</p>"},
+    }
+
+
+def _bench(label: str, fn: Any, number: int) -> float:
+    seconds = min(timeit.repeat(fn, number=number, repeat=5)) / number
+    print(f"  {label:<38} {seconds * 1e3:9.3f} ms")
+    return seconds
+
+
+def main() -> None:
+    doc = large_adf()
+    full = full_issue(doc)
+    projected = {"key": full["key"], "fields": {k: full["fields"][k] for k in _ISSUE_FIELDS}}
+    full_raw = json.dumps(full)
+    projected_raw = json.dumps(projected)
+
+    print("Payload size")
+    print(f"  full issue        {len(full_raw) / 1024:9.1f} KiB")
+    print(f"  fields= projected {len(projected_raw) / 1024:9.1f} KiB")
+
+    print("Decode + parse_issue")
+    _bench("full", lambda: parse_issue(json.loads(full_raw)), 20)
+    _bench("projected", lambda: parse_issue(json.loads(projected_raw)), 20)
+
+    legacy_text = _legacy_extract(doc)
+    text = adf_to_text(doc)
+    print("ADF extraction (chars recovered)")
+    print(f"  legacy two-level walk {len(legacy_text):9d}")
+    print(f"  adf_to_text           {len(text):9d}")
+    _bench("legacy two-level walk", lambda: _legacy_extract(doc), 50)
+    _bench("adf_to_text (iterative, full tree)", lambda: adf_to_text(doc), 50)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Microbenchmark: full-text ticket search vs a substring scan.
+
+Loads 100k synthetic tickets (titles and descriptions drawn from a 20k-word
+Zipf-like vocabulary) into the in-memory TicketStore and a SqliteTicketStore,
+then times ranked searches and filtered counts. The baseline is the previous
+substring scan over every title and description.
+
+Run with:  uv run python scripts/bench_jira_service_search.py [N]
+"""
+
+from __future__ import annotations
+
+import itertools
+import os
+import random
+import sys
+import tempfile
+import timeit
+from typing import TYPE_CHECKING
+
+from jira_service.models import TicketStore
+from jira_service.sqlite_store import SqliteTicketStore
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Words the queries below use, at increasingly rare Zipf ranks.
+_SEEDED = {"login": 5, "mobile": 20, "payment": 50, "timeout": 200, "export": 500}
+
+
+def _vocabulary(rng: random.Random, size: int) -> list[str]:
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    words: set[str] = set()
+    while len(words) < size - len(_SEEDED):
+        word = "".join(rng.choice(letters) for _ in range(rng.randint(4, 9)))
+        if word not in _SEEDED:
+            words.add(word)
+    vocabulary = sorted(words)
+    rng.shuffle(vocabulary)
+    for word, rank in sorted(_SEEDED.items(), key=lambda item: item[1]):
+        vocabulary.insert(rank, word)
+    return vocabulary
+
+
+def _items(n: int) -> list[tuple[str, str, str | None]]:
+    rng = random.Random(1)
+    vocabulary = _vocabulary(rng, 20_000)
+    cumulative = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(vocabulary))))
+
+    def text(k: int) -> str:
+        return " ".join(rng.choices(vocabulary, cum_weights=cumulative, k=k))
+
+    return [(text(6), text(30), None) for _ in range(n)]
+
+
+def _scan(items: list[tuple[str, str, str | None]], needle: str) -> list[int]:
+    needle = needle.casefold()
+    return [i for i, (t, d, _) in enumerate(items) if needle in t.casefold() or needle in d.casefold()]
+
+
+def _time(fn: Callable[[], object], number: int = 20) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=3)) / number
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    items = _items(n)
+    memory = TicketStore()
+    memory.create_many(items)
+    path = os.path.join(tempfile.mkdtemp(), "tickets.db")
+    sqlite = SqliteTicketStore(path)
+    sqlite.create_many(items)
+
+    queries = ["login", "payment", "timeo", "login mobile", "exp pay"]
+    print(f"{n:,} tickets")
+    print(f"  {'query':<16} {'matches':>8} {'scan (ms)':>11} {'memory (ms)':>12} {'fts5 (ms)':>10}")
+    for query in queries:
+        word = query.split()[0]
+        scan = _time(lambda word=word: _scan(items, word), number=1) * 1e3
+        matches = memory.count(query=query)
+        mem = _time(lambda query=query: memory.search(query, limit=20)) * 1e3
+        fts = _time(lambda query=query: sqlite.search(query, limit=20)) * 1e3
+        print(f"  {query:<16} {matches:>8} {scan:11.2f} {mem:12.3f} {fts:10.3f}")
+    sqlite.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Microbenchmark: indexed TicketStore vs the previous list-backed store.
+
+Loads 100k tickets (mixed statuses/assignees) into both and times id lookups,
+status/assignee filters, counts and deletes.
+
+Run with:  uv run python scripts/bench_jira_service_store.py [N]
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import timeit
+from typing import TYPE_CHECKING
+
+from jira_service.models import Ticket, TicketStore
+from tickets_api.client import TicketStatus
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class ListStore:
+    """The previous store: a plain list with linear scans."""
+
+    def __init__(self) -> None:
+        self.tickets: list[Ticket] = []
+
+    def upsert(self, ticket: Ticket) -> None:
+        self.tickets.append(ticket)
+
+    def get(self, ticket_id: str) -> Ticket | None:
+        for ticket in self.tickets:
+            if ticket.id == ticket_id:
+                return ticket
+        return None
+
+    def find(self, *, status: TicketStatus | None = None, assignee: str | None = None) -> list[Ticket]:
+        return [
+            t
+            for t in self.tickets
+            if (status is None or t.status == status) and (assignee is None or t.assignee == assignee)
+        ]
+
+    def count(self, status: TicketStatus) -> int:
+        return sum(1 for t in self.tickets if t.status == status)
+
+    def delete(self, ticket_id: str) -> bool:
+        for index, ticket in enumerate(self.tickets):
+            if ticket.id == ticket_id:
+                del self.tickets[index]
+                return True
+        return False
+
+
+def _tickets(n: int) -> list[Ticket]:
+    rng = random.Random(1)
+    statuses = [TicketStatus.OPEN] * 6 + [TicketStatus.IN_PROGRESS] * 3 + [TicketStatus.CLOSED]
+    return [
+        Ticket(
+            id=f"TICKET-{i}",
+            title=f"Ticket {i}",
+            description="synthetic",
+            status=rng.choice(statuses),
+            assignee=f"user-{rng.randrange(500)}" if rng.random() < 0.9 else None,
+        )
+        for i in range(1, n + 1)
+    ]
+
+
+def _time(fn: Callable[[], object], number: int) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=3)) / number
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    tickets = _tickets(n)
+    legacy, indexed = ListStore(), TicketStore()
+    for ticket in tickets:
+        legacy.upsert(ticket)
+        indexed.upsert(ticket)
+
+    rng = random.Random(2)
+    ids = [f"TICKET-{rng.randrange(1, n + 1)}" for _ in range(200)]
+    cases: list[tuple[str, Callable[[ListStore | TicketStore], object], int]] = [
+        ("get by id (x200)", lambda s: [s.get(i) for i in ids], 3),
+        ("filter status=closed", lambda s: s.find(status=TicketStatus.CLOSED), 5),
+        ("filter assignee=user-7", lambda s: s.find(assignee="user-7"), 5),
+        ("filter status+assignee", lambda s: s.find(status=TicketStatus.OPEN, assignee="user-7"), 5),
+        (
+            "count status=in_progress",
+            lambda s: s.count(TicketStatus.IN_PROGRESS) if isinstance(s, ListStore) else s.count(status=TicketStatus.IN_PROGRESS),
+            5,
+        ),
+    ]
+
+    print(f"{n:,} tickets")
+    print(f"  {'operation':<28} {'list (ms)':>12} {'indexed (ms)':>14} {'speedup':>9}")
+    for label, op, number in cases:
+        before = _time(lambda op=op: op(legacy), number) * 1e3
+        after = _time(lambda op=op: op(indexed), number) * 1e3
+        print(f"  {label:<28} {before:12.3f} {after:14.4f} {before / max(after, 1e-9):8.0f}x")
+
+    victims = [f"TICKET-{i}" for i in range(n // 2, n // 2 + 100)]
+    before = _time(lambda: [legacy.delete(v) for v in victims], 1) * 1e3
+    after = _time(lambda: [indexed.delete(v) for v in victims], 1) * 1e3
+    print(f"  {'delete (x100)':<28} {before:12.3f} {after:14.4f} {before / max(after, 1e-9):8.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Microbenchmark: fast JSON list responses vs response-model serialisation.
+
+Times GET /tickets (jira_service) through TestClient, against a copy of the
+previous route, which built a pydantic model per row and let FastAPI
+validate and serialise the response model, and against the current route,
+which encodes the rows directly with service_common.json_response.
+
+TestClient adds a fixed cost per request, so the "body" rows also time
+only the part that changed: building the response body from a page of
+store tickets.
+
+The encoder in use (orjson or stdlib json) is printed. Install the
+service-common "fast" extra to benchmark orjson.
+
+Run with:  uv run python scripts/bench_service_json.py
+"""
+
+from __future__ import annotations
+
+import timeit
+from typing import TYPE_CHECKING, Any
+
+from fastapi import FastAPI, Query
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+from jira_service.main import app as jira_app
+from jira_service.models import TicketStore, page_tickets, set_store
+from jira_service.routes import TicketOut, TicketsResponse, _encode_cursor
+
+from service_common import fast_json
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def _model_path_app() -> FastAPI:
+    """The previous implementation of the list route."""
+    app = FastAPI()
+
+    @app.get("/tickets", response_model=TicketsResponse)
+    def list_tickets(limit: int = Query(100, ge=1, le=1000)) -> TicketsResponse:
+        page = page_tickets(status=None, query=None, after=None, limit=limit)
+        return TicketsResponse(
+            tickets=[TicketOut(**t.__dict__) for t in page.tickets],
+            next_cursor=None
+            if page.next_after is None
+            else _encode_cursor(page.next_after),
+        )
+
+    return app
+
+
+def _time(fn: Callable[[], object], number: int = 100) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number
+
+
+def _model_body(field: Any, tickets: list) -> bytes:
+    content = TicketsResponse(tickets=[TicketOut(**t.__dict__) for t in tickets])
+    # What fastapi.routing.serialize_response does for a response_model.
+    value, errors = field.validate(content, {}, loc=("response",))
+    assert not errors
+    return JSONResponse(field.serialize(value)).body
+
+
+def _fast_body(tickets: list) -> bytes:
+    return fast_json.dumps(
+        {"tickets": [t.__dict__ for t in tickets], "next_cursor": None}
+    )
+
+
+def main() -> None:
+    store = TicketStore()
+    store.create_many(
+        [
+            (f"Ticket {i} title", f"Description of ticket {i}. " * 6, f"user{i % 20}")
+            for i in range(5_000)
+        ]
+    )
+    set_store(store)
+
+    encoder = "orjson" if fast_json.orjson is not None else "json (stdlib)"
+    before = TestClient(_model_path_app())
+    after = TestClient(jira_app)
+
+    print(f"encoder: {encoder}")
+    header = f"{'model (ms)':>11} {'fast (ms)':>10} {'speedup':>8}"
+    print(f"  {'endpoint':<34} {'rows':>5} {header}")
+    for url, rows in (("/tickets?limit=100", 100), ("/tickets?limit=1000", 1000)):
+        assert before.get(url).json() == after.get(url).json()
+        model = _time(lambda url=url: before.get(url)) * 1e3
+        fast = _time(lambda url=url: after.get(url)) * 1e3
+        print(f"  {url:<34} {rows:>5} {model:11.2f} {fast:10.2f} {model / fast:7.1f}x")
+
+    field = next(
+        r for r in before.app.routes if isinstance(r, APIRoute) and r.path == "/tickets"
+    ).response_field
+    print(f"  {'body only':<34} {'rows':>5} {header}")
+    for rows in (100, 1000):
+        tickets = store.find()[:rows]
+        model = _time(lambda t=tickets: _model_body(field, t), number=20) * 1e3
+        fast = _time(lambda t=tickets: _fast_body(t), number=20) * 1e3
+        print(
+            f"  {'TicketsResponse':<34} {rows:>5} "
+            f"{model:11.2f} {fast:10.2f} {model / fast:7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,6 @@
 import logging
+import math
+
 from fastapi import APIRouter, HTTPException
 
 import ai_api
@@ -22,6 +24,16 @@ def generate(request: GenerateRequest) -> GenerateResponse:
             response_schema=request.response_schema,
         )
     except RuntimeError as exc:
+        # Providers signal back-pressure with a `retry_after` hint (seconds).
+        retry_after = getattr(exc, "retry_after", None)
+        if isinstance(retry_after, int | float):
+            logger.warning("AI generation rate limited | retry_after=%.2fs", retry_after)
+            raise HTTPException(
+                status_code=429,
+                detail="AI service is busy; please retry shortly",
+                headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+            ) from exc
+
         logger.exception("AI generation failed (sanitized)")
         raise HTTPException(
             status_code=500,
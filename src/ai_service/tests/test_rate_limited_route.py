@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from ai_service.main import create_app
+from fastapi.testclient import TestClient
+
+import ai_api
+
+
+class _BusyError(RuntimeError):
+    def __init__(self) -> None:
+        super().__init__("rate limited")
+        self.retry_after = 2.3
+
+
+class _BusyAIClient:
+    def generate_response(
+        self,
+        user_input: str,
+        system_prompt: str,
+        response_schema: dict[str, object] | None = None,
+    ) -> str | dict[str, object]:
+        raise _BusyError
+
+
+def test_rate_limited_provider_returns_429_with_retry_after() -> None:
+    """Provider back-pressure is surfaced as 429 instead of a generic 500."""
+    app = create_app()
+
+    with patch.object(ai_api, "get_client", return_value=_BusyAIClient()):
+        client = TestClient(app)
+        response = client.post(
+            "/ai/generate",
+            json={"user_input": "hi", "system_prompt": "be helpful"},
+        )
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "3"
@@ -1 +1,5 @@
 """Gemini AI provider implementation."""
+
+from gemini_impl.provider import GeminiProvider
+
+__all__ = ["GeminiProvider"]
@@ -1,22 +1,136 @@
-"""Lightweight Gemini client abstraction."""
+"""Gemini REST client (generateContent / streamGenerateContent)."""
 
 from __future__ import annotations
 
-from typing import Any
+import json
+from typing import TYPE_CHECKING, Any
 
-from gemini_impl.errors import GeminiError
+import httpx
+
+from gemini_impl.errors import GeminiError, GeminiHTTPError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+# JSON Schema keywords understood by Gemini's OpenAPI-style responseSchema.
+_SCHEMA_KEYS = frozenset(
+    {
+        "type",
+        "format",
+        "description",
+        "nullable",
+        "enum",
+        "properties",
+        "required",
+        "items",
+        "minItems",
+        "maxItems",
+        "anyOf",
+        "propertyOrdering",
+    }
+)
+
+
+def to_gemini_schema(response_schema: dict[str, Any]) -> dict[str, Any]:
+    """Map an ai_api ``response_schema`` onto Gemini's ``responseSchema``.
+
+    Accepts the same envelope (``{"name", "schema"}``) or bare JSON schema
+    as the OpenAI provider. Unsupported keywords (e.g. additionalProperties)
+    are dropped and ``["string", "null"]`` style types become ``nullable``.
+    """
+    schema = response_schema.get("schema", response_schema)
+    return _convert(schema) if isinstance(schema, dict) else {"type": "OBJECT"}
+
+
+def _convert(node: dict[str, Any]) -> dict[str, Any]:
+    out: dict[str, Any] = {}
+    for key, value in node.items():
+        if key not in _SCHEMA_KEYS:
+            continue
+        if key == "type":
+            types = [value] if isinstance(value, str) else list(value)
+            if "null" in types:
+                out["nullable"] = True
+                types = [t for t in types if t != "null"]
+            if types:
+                out["type"] = str(types[0]).upper()
+        elif key == "properties" and isinstance(value, dict):
+            out["properties"] = {
+                name: _convert(sub)
+                for name, sub in value.items()
+                if isinstance(sub, dict)
+            }
+        elif key == "items" and isinstance(value, dict):
+            out["items"] = _convert(value)
+        elif key == "anyOf" and isinstance(value, list):
+            out["anyOf"] = [_convert(sub) for sub in value if isinstance(sub, dict)]
+        else:
+            out[key] = value
+    return out
+
+
+def _candidate_text(payload: object) -> str:
+    """Concatenate text parts of the first candidate ('' if none)."""
+    if not isinstance(payload, dict):
+        return ""
+    candidates = payload.get("candidates")
+    if not isinstance(candidates, list) or not candidates:
+        return ""
+    first = candidates[0]
+    content = first.get("content") if isinstance(first, dict) else None
+    parts = content.get("parts") if isinstance(content, dict) else None
+    if not isinstance(parts, list):
+        return ""
+    return "".join(
+        p["text"]
+        for p in parts
+        if isinstance(p, dict) and isinstance(p.get("text"), str)
+    )
 
 
 class GeminiClient:
-    """Lightweight Gemini client abstraction.
+    """Pooled HTTP client for the Gemini ``v1beta`` REST API.
 
-    Mirrors what a real Gemini SDK call would look like,
-    but is intentionally minimal.
+    One ``httpx.Client`` (and its keep-alive connection pool) is reused for
+    every call made through this instance. Call ``close()`` when done.
     """
 
-    def __init__(self, api_key: str) -> None:
-        """Initialize the Gemini client."""
-        self._api_key = api_key
+    def __init__(  # noqa: PLR0913
+        self,
+        api_key: str,
+        *,
+        model: str = "gemini-1.5-pro",
+        base_url: str = "https://generativelanguage.googleapis.com",
+        timeout_seconds: float = 30.0,
+        connect_timeout_seconds: float = 5.0,
+        max_connections: int = 20,
+        http_client: httpx.Client | None = None,
+    ) -> None:
+        """Initialize the Gemini client.
+
+        Args:
+            api_key: Gemini API key (sent as ``x-goog-api-key``).
+            model: Model name, e.g. ``gemini-1.5-pro``.
+            base_url: API root; point at a local stand-in for tests/benchmarks.
+            timeout_seconds: Read/write/pool timeout per request.
+            connect_timeout_seconds: TCP/TLS connect timeout.
+            max_connections: Pool size (keep-alive connections are capped too).
+            http_client: Optional pre-built client (takes ownership).
+        """
+        self._model = model
+        self._http = http_client or httpx.Client(
+            base_url=base_url.rstrip("/"),
+            headers={"x-goog-api-key": api_key, "Content-Type": "application/json"},
+            timeout=httpx.Timeout(timeout_seconds, connect=connect_timeout_seconds),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        )
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        self._http.close()
 
     def generate(
         self,
@@ -24,16 +138,94 @@ class GeminiClient:
         system_prompt: str,
         response_schema: dict[str, Any] | None = None,
     ) -> str | dict[str, Any]:
-        """Generate a Gemini-style response."""
+        """Generate a response; returns a dict when ``response_schema`` is set.
+
+        Raises:
+            GeminiError: On empty prompts, transport failures or HTTP errors.
+            TimeoutError: If the request times out.
+            ValueError: If structured output is not a JSON object.
+        """
+        body = self._body(prompt, system_prompt, response_schema)
+        path = self._path("generateContent")
+        resp = self._send(lambda: self._http.post(path, json=body))
+        text = _candidate_text(resp.json())
+
+        if not response_schema:
+            return text
+        if not text:
+            return {}
+        loaded = json.loads(text)
+        if not isinstance(loaded, dict):
+            # ValueError, like a JSON decode error: both are a bad response format.
+            error_msg = "Structured response is not a JSON object"
+            raise ValueError(error_msg)  # noqa: TRY004
+        return loaded
+
+    def stream(self, prompt: str, system_prompt: str) -> Iterator[str]:
+        """Yield text chunks as they arrive (server-sent events).
+
+        Raises:
+            GeminiError: On empty prompts, transport failures or HTTP errors.
+            TimeoutError: If the request times out.
+        """
+        body = self._body(prompt, system_prompt, None)
+        try:
+            with self._http.stream(
+                "POST",
+                self._path("streamGenerateContent"),
+                params={"alt": "sse"},
+                json=body,
+            ) as resp:
+                if resp.status_code >= 400:  # noqa: PLR2004
+                    raise GeminiHTTPError(resp.status_code)
+                for line in resp.iter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    chunk = _candidate_text(json.loads(line[len("data:") :]))
+                    if chunk:
+                        yield chunk
+        except httpx.TimeoutException as exc:
+            error_msg = "Gemini request timed out"
+            raise TimeoutError(error_msg) from exc
+        except httpx.RequestError as exc:
+            error_msg = f"Gemini request failed: {exc}"
+            raise GeminiError(error_msg) from exc
+
+    def _path(self, method: str) -> str:
+        return f"/v1beta/models/{self._model}:{method}"
+
+    @staticmethod
+    def _body(
+        prompt: str,
+        system_prompt: str,
+        response_schema: dict[str, Any] | None,
+    ) -> dict[str, Any]:
         if not prompt:
             error_msg = "Prompt cannot be empty"
             raise GeminiError(error_msg)
 
-        # Simulated Gemini-style response
+        body: dict[str, Any] = {
+            "contents": [{"role": "user", "parts": [{"text": prompt}]}],
+        }
+        if system_prompt:
+            body["systemInstruction"] = {"parts": [{"text": system_prompt}]}
         if response_schema:
-            return {
-                "action": "respond",
-                "content": prompt[:50],
+            body["generationConfig"] = {
+                "responseMimeType": "application/json",
+                "responseSchema": to_gemini_schema(response_schema),
             }
+        return body
 
-        return f"[Gemini] {system_prompt} | {prompt}"
+    @staticmethod
+    def _send(call: Callable[[], httpx.Response]) -> httpx.Response:
+        try:
+            resp = call()
+        except httpx.TimeoutException as exc:
+            error_msg = "Gemini request timed out"
+            raise TimeoutError(error_msg) from exc
+        except httpx.RequestError as exc:
+            error_msg = f"Gemini request failed: {exc}"
+            raise GeminiError(error_msg) from exc
+        if resp.status_code >= 400:  # noqa: PLR2004
+            raise GeminiHTTPError(resp.status_code)
+        return resp
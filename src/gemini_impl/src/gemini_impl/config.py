@@ -8,12 +8,30 @@ import os
 class GeminiConfig:
     """Configuration loader for Gemini provider."""
 
+    DEFAULT_BASE_URL = "https://generativelanguage.googleapis.com"
+    DEFAULT_MODEL = "gemini-1.5-pro"
+    DEFAULT_TIMEOUT_SECONDS = 30.0
+    DEFAULT_CONNECT_TIMEOUT_SECONDS = 5.0
+    DEFAULT_MAX_CONNECTIONS = 20
+
     def __init__(self) -> None:
         """Load Gemini configuration from environment variables."""
         self.api_key = os.getenv("GEMINI_API_KEY")
-        self.model = os.getenv("GEMINI_MODEL", "gemini-1.5-pro")
+        self.model = os.getenv("GEMINI_MODEL", self.DEFAULT_MODEL)
+        self.base_url = os.getenv("GEMINI_BASE_URL", self.DEFAULT_BASE_URL).rstrip("/")
+        self.timeout_seconds = float(
+            os.getenv("GEMINI_TIMEOUT_SECONDS", str(self.DEFAULT_TIMEOUT_SECONDS))
+        )
+        self.connect_timeout_seconds = float(
+            os.getenv(
+                "GEMINI_CONNECT_TIMEOUT_SECONDS",
+                str(self.DEFAULT_CONNECT_TIMEOUT_SECONDS),
+            )
+        )
+        self.max_connections = int(
+            os.getenv("GEMINI_MAX_CONNECTIONS", str(self.DEFAULT_MAX_CONNECTIONS))
+        )
 
         if not self.api_key:
             error_msg = "Missing required environment variable: GEMINI_API_KEY"
             raise RuntimeError(error_msg)
-
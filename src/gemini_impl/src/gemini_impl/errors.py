@@ -1,4 +1,14 @@
 """Custom exceptions for the Gemini provider."""
 
+
 class GeminiError(Exception):
     """Base exception for Gemini provider errors."""
+
+
+class GeminiHTTPError(GeminiError):
+    """Raised when the Gemini API responds with an error status."""
+
+    def __init__(self, status_code: int) -> None:
+        """Initialize with the HTTP status code (response body is not kept)."""
+        super().__init__(f"Gemini request failed: HTTP {status_code}")
+        self.status_code = status_code
@@ -2,20 +2,46 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from ai_api.client_abc import AIInterface
+from ai_api import AIInterface
 from gemini_impl.client import GeminiClient
 from gemini_impl.config import GeminiConfig
+from gemini_impl.errors import GeminiError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# Sanitized messages shared with the other AI providers.
+_TIMED_OUT = "AI service timed out while generating a response"
+_INVALID_FORMAT = "AI service returned an invalid response format"
+_FAILED = "AI service failed to generate a response"
 
 
 class GeminiProvider(AIInterface):
     """Gemini implementation of the shared AIInterface."""
 
-    def __init__(self) -> None:
-        """Initialize Gemini provider with configuration and client."""
-        self._config = GeminiConfig()
-        self._client = GeminiClient(api_key=self._config.api_key)
+    def __init__(self, client: GeminiClient | None = None) -> None:
+        """Initialize Gemini provider with configuration and a pooled client.
+
+        Args:
+            client: Optional pre-built client (configuration is then skipped).
+        """
+        if client is None:
+            config = GeminiConfig()
+            client = GeminiClient(
+                api_key=str(config.api_key),
+                model=config.model,
+                base_url=config.base_url,
+                timeout_seconds=config.timeout_seconds,
+                connect_timeout_seconds=config.connect_timeout_seconds,
+                max_connections=config.max_connections,
+            )
+        self._client = client
+
+    def close(self) -> None:
+        """Release pooled HTTP connections."""
+        self._client.close()
 
     def generate_response(
         self,
@@ -23,9 +49,37 @@ class GeminiProvider(AIInterface):
         system_prompt: str,
         response_schema: dict[str, Any] | None = None,
     ) -> str | dict[str, Any]:
-        """Generate a response using the Gemini backend."""
-        return self._client.generate(
-            prompt=user_input,
-            system_prompt=system_prompt,
-            response_schema=response_schema,
-        )
+        """Generate a response using the Gemini backend.
+
+        Raises:
+            RuntimeError: For provider failures, timeouts or invalid output.
+        """
+        try:
+            result: str | dict[str, Any] = self._client.generate(
+                prompt=user_input,
+                system_prompt=system_prompt,
+                response_schema=response_schema,
+            )
+        except TimeoutError:
+            raise RuntimeError(_TIMED_OUT) from None
+        except ValueError:
+            raise RuntimeError(_INVALID_FORMAT) from None
+        except GeminiError:
+            raise RuntimeError(_FAILED) from None
+        return result
+
+    def stream_response(self, user_input: str, system_prompt: str) -> Iterator[str]:
+        """Yield conversational text chunks as Gemini streams them.
+
+        Raises:
+            RuntimeError: For provider failures or timeouts.
+        """
+        try:
+            yield from self._client.stream(
+                prompt=user_input,
+                system_prompt=system_prompt,
+            )
+        except TimeoutError:
+            raise RuntimeError(_TIMED_OUT) from None
+        except (GeminiError, ValueError):
+            raise RuntimeError(_FAILED) from None
@@ -1,32 +1,133 @@
-"""Tests for GeminiProvider."""
-from gemini_impl.provider import GeminiProvider
+"""Tests for GeminiProvider against a local stand-in Gemini server."""
+
+from __future__ import annotations
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+from typing import TYPE_CHECKING, Any, ClassVar
+
 import pytest
 
+from gemini_impl.client import GeminiClient, to_gemini_schema
+from gemini_impl.provider import GeminiProvider
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class _StandInGemini(BaseHTTPRequestHandler):
+    """Minimal generateContent / streamGenerateContent stand-in (keep-alive)."""
+
+    protocol_version = "HTTP/1.1"
+    requests: ClassVar[list[dict[str, Any]]] = []
+    client_ports: ClassVar[set[int]] = set()
+    status = 200
+    delay = 0.0
+
+    def log_message(self, *args: object) -> None:
+        """Keep test output quiet."""
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length", "0"))
+        body = json.loads(self.rfile.read(length) or b"{}")
+        type(self).requests.append(
+            {"path": self.path, "key": self.headers.get("x-goog-api-key"), "body": body}
+        )
+        type(self).client_ports.add(self.client_address[1])
+        time.sleep(type(self).delay)
 
-@pytest.fixture(autouse=True)
-def set_env(monkeypatch: pytest.MonkeyPatch) -> None:
-    """Set required Gemini environment variables for tests."""
+        if type(self).status != 200:
+            self._send(type(self).status, b'{"error": {"message": "secret detail"}}')
+            return
+
+        prompt = body["contents"][0]["parts"][0]["text"]
+        if ":streamGenerateContent" in self.path:
+            events = b"".join(
+                b"data: " + json.dumps(_candidate(word)).encode() + b"\r\n\r\n"
+                for word in ["Hello", " from", " Gemini"]
+            )
+            self._send(200, events, "text/event-stream")
+            return
+
+        if "generationConfig" in body:
+            text = json.dumps({"action": "create_ticket", "title": prompt})
+        else:
+            text = f"echo: {prompt}"
+        self._send(200, json.dumps(_candidate(text)).encode())
+
+    def _send(
+        self, status: int, payload: bytes, ctype: str = "application/json"
+    ) -> None:
+        try:
+            self.send_response(status)
+            self.send_header("Content-Type", ctype)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True  # client gave up (timeout tests)
+
+
+def _candidate(text: str) -> dict[str, Any]:
+    return {"candidates": [{"content": {"role": "model", "parts": [{"text": text}]}}]}
+
+
+@pytest.fixture
+def server() -> Iterator[str]:
+    """Serve the stand-in Gemini API on an ephemeral port."""
+    _StandInGemini.requests = []
+    _StandInGemini.client_ports = set()
+    _StandInGemini.status = 200
+    _StandInGemini.delay = 0.0
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _StandInGemini)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def provider(server: str, monkeypatch: pytest.MonkeyPatch) -> Iterator[GeminiProvider]:
+    """Return a provider pointed at the stand-in server."""
     monkeypatch.setenv("GEMINI_API_KEY", "test-key")
     monkeypatch.setenv("GEMINI_MODEL", "gemini-test")
+    monkeypatch.setenv("GEMINI_BASE_URL", server)
+    p = GeminiProvider()
+    yield p
+    p.close()
 
-def test_generate_simple_response() -> None:
-    """Verify GeminiProvider returns a simple response."""
-    provider = GeminiProvider()
 
+def test_generate_simple_response(provider: GeminiProvider) -> None:
+    """Conversational output comes from generateContent."""
     result = provider.generate_response(
         user_input="Hello",
         system_prompt="You are helpful",
     )
 
-    assert isinstance(result, str)
-    assert "Gemini" in result
-
+    assert result == "echo: Hello"
+    sent = _StandInGemini.requests[0]
+    assert sent["path"] == "/v1beta/models/gemini-test:generateContent"
+    assert sent["key"] == "test-key"
+    assert sent["body"]["systemInstruction"]["parts"][0]["text"] == "You are helpful"
 
-def test_generate_structured_response() -> None:
-    """Verify GeminiProvider returns structured output when schema is provided."""
-    provider = GeminiProvider()
 
-    schema = {"type": "object"}
+def test_generate_structured_response(provider: GeminiProvider) -> None:
+    """Structured output maps the schema and returns a dict."""
+    schema = {
+        "name": "intent",
+        "schema": {
+            "type": "object",
+            "properties": {
+                "action": {"type": "string"},
+                "title": {"type": ["string", "null"]},
+            },
+            "required": ["action"],
+            "additionalProperties": False,
+        },
+    }
 
     result = provider.generate_response(
         user_input="Create a ticket",
@@ -34,5 +135,75 @@ def test_generate_structured_response() -> None:
         response_schema=schema,
     )
 
-    assert isinstance(result, dict)
-    assert "content" in result
+    assert result == {"action": "create_ticket", "title": "Create a ticket"}
+    config = _StandInGemini.requests[0]["body"]["generationConfig"]
+    assert config["responseMimeType"] == "application/json"
+    assert config["responseSchema"] == to_gemini_schema(schema)
+
+
+def test_connections_are_reused(provider: GeminiProvider) -> None:
+    """Sequential calls share one pooled keep-alive connection."""
+    for i in range(5):
+        provider.generate_response(user_input=f"hi {i}", system_prompt="sys")
+
+    assert len(_StandInGemini.requests) == 5
+    assert len(_StandInGemini.client_ports) == 1
+
+
+def test_streaming_yields_chunks(provider: GeminiProvider) -> None:
+    """SSE events from streamGenerateContent are yielded as text chunks."""
+    chunks = list(provider.stream_response(user_input="Hello", system_prompt="sys"))
+
+    assert chunks == ["Hello", " from", " Gemini"]
+    assert _StandInGemini.requests[0]["path"].endswith(":streamGenerateContent?alt=sse")
+
+
+def test_http_errors_are_sanitized(provider: GeminiProvider) -> None:
+    """Provider error bodies never reach callers."""
+    _StandInGemini.status = 503
+
+    with pytest.raises(RuntimeError, match="AI service failed") as exc:
+        provider.generate_response(user_input="Hello", system_prompt="sys")
+
+    assert "secret" not in str(exc.value)
+
+
+def test_timeout_is_reported(server: str) -> None:
+    """Timeouts surface as a sanitized RuntimeError."""
+    _StandInGemini.delay = 0.5
+    client = GeminiClient("k", base_url=server, timeout_seconds=0.05)
+    provider = GeminiProvider(client=client)
+
+    with pytest.raises(RuntimeError, match="timed out"):
+        provider.generate_response(user_input="Hello", system_prompt="sys")
+    provider.close()
+
+
+def test_schema_mapping_drops_unsupported_keywords() -> None:
+    """Keywords Gemini rejects are dropped and types are upper-cased."""
+    mapped = to_gemini_schema(
+        {
+            "type": "object",
+            "properties": {
+                "tags": {"type": "array", "items": {"type": "string"}},
+                "note": {"type": ["string", "null"], "$comment": "x"},
+            },
+            "additionalProperties": False,
+        }
+    )
+
+    assert mapped == {
+        "type": "OBJECT",
+        "properties": {
+            "tags": {"type": "ARRAY", "items": {"type": "STRING"}},
+            "note": {"nullable": True, "type": "STRING"},
+        },
+    }
+
+
+def test_missing_api_key_raises(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A missing GEMINI_API_KEY fails at construction."""
+    monkeypatch.delenv("GEMINI_API_KEY", raising=False)
+
+    with pytest.raises(RuntimeError, match="GEMINI_API_KEY"):
+        GeminiProvider()
@@ -0,0 +1,124 @@
+"""
+Subscriber for jira_service's ticket invalidation stream.
+
+jira_service publishes every ticket change (API writes and Jira webhooks) on
+``GET /events/invalidations`` as Server-Sent Events. This module follows that
+stream from a background thread, resumes from the last seen sequence number
+after disconnects, and hands each event to registered listeners so caches can
+be dropped on push instead of by polling.
+
+Sequence numbers are only meaningful within one jira_service process (its
+``epoch``). When the service restarted or the gap is too long to replay, it
+sends ``{"kind": "reset", "seq": ..., "epoch": ...}``: listeners must then
+drop every cached ticket, and the subscriber continues from that ``seq``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+Listener = Callable[[dict[str, Any]], None]
+
+
+class InvalidationSubscriber:
+    """Background SSE consumer with automatic resume."""
+
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        http_client: httpx.Client | None = None,
+        reconnect_seconds: float = 2.0,
+    ) -> None:
+        self._url = f"{base_url.rstrip('/')}/events/invalidations"
+        self._http = http_client or httpx.Client(timeout=httpx.Timeout(5.0, read=60.0))
+        self._reconnect = reconnect_seconds
+        self._listeners: list[Listener] = []
+        self._last_seq = 0
+        self._epoch: str | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def last_seq(self) -> int:
+        return self._last_seq
+
+    @property
+    def epoch(self) -> str | None:
+        return self._epoch
+
+    def add_listener(self, listener: Listener) -> None:
+        """Register a callback invoked with each invalidation event dict."""
+        self._listeners.append(listener)
+
+    def start(self) -> None:
+        """Follow the stream from a daemon thread until stop() is called."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="ticket-invalidations", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._http.close()
+
+    def consume(self, max_events: int | None = None) -> int:
+        """Read one connection's worth of events; return how many were dispatched."""
+        params: dict[str, int | str] = {"since": self._last_seq}
+        if self._epoch is not None:
+            params["epoch"] = self._epoch
+        if max_events is not None:
+            params["max_events"] = max_events
+
+        dispatched = 0
+        data_lines: list[str] = []
+        with self._http.stream("GET", self._url, params=params) as resp:
+            resp.raise_for_status()
+            if self._epoch is None:
+                self._epoch = resp.headers.get("X-Invalidation-Epoch")
+            for line in resp.iter_lines():
+                if self._stop.is_set():
+                    break
+                if line.startswith("data:"):
+                    data_lines.append(line[5:].strip())
+                elif not line and data_lines:
+                    self._dispatch("\n".join(data_lines))
+                    data_lines = []
+                    dispatched += 1
+        return dispatched
+
+    def _dispatch(self, data: str) -> None:
+        try:
+            event = json.loads(data)
+        except ValueError:
+            logger.warning("Invalid invalidation event ignored")
+            return
+        if event.get("kind") == "reset":
+            logger.warning("Invalidation history lost; listeners must resync")
+            self._last_seq = int(event.get("seq", 0))
+            self._epoch = event.get("epoch") or self._epoch
+        else:
+            self._last_seq = max(self._last_seq, int(event.get("seq", 0)))
+        for listener in self._listeners:
+            try:
+                listener(event)
+            except Exception:
+                logger.exception("Invalidation listener failed")
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.consume()
+            except (httpx.HTTPError, RuntimeError):
+                if not self._stop.is_set():
+                    logger.warning("Invalidation stream disconnected; reconnecting")
+            self._stop.wait(self._reconnect)
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 import logging
+import os
+from typing import Any
+
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 
 from integration_app.config import load_config
+from integration_app.invalidation import InvalidationSubscriber
 from integration_app.slack_entry import SlackEventHandler
 from slack_adapter.slack_adapter import SlackServiceClient
 from ai_adapter.ai_adapter import register as register_ai_adapter
@@ -17,13 +21,36 @@ logger = logging.getLogger(__name__)
 
 app = FastAPI(title="HW3 Integration App")
 
+_invalidations: InvalidationSubscriber | None = None
+
+
+def _log_invalidation(event: dict[str, Any]) -> None:
+    logger.info(
+        "Ticket invalidated | id=%s | kind=%s | seq=%s",
+        event.get("ticket_id"),
+        event.get("kind"),
+        event.get("seq"),
+    )
+
 
 @app.on_event("startup")
 def startup() -> None:
+    global _invalidations  # noqa: PLW0603
     load_config()
+    if os.environ.get("JIRA_INVALIDATIONS_ENABLED", "").lower() in {"1", "true", "yes"}:
+        _invalidations = InvalidationSubscriber(os.environ["JIRA_SERVICE_BASE_URL"])
+        _invalidations.add_listener(_log_invalidation)
+        _invalidations.start()
+        logger.info("Subscribed to jira_service invalidation stream")
     logger.info("Integration app startup complete")
 
 
+@app.on_event("shutdown")
+def shutdown() -> None:
+    if _invalidations is not None:
+        _invalidations.stop()
+
+
 @app.get("/health")
 def health() -> dict[str, str]:
     return {"status": "ok"}
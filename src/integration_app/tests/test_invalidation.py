@@ -0,0 +1,67 @@
+"""Tests for the jira_service invalidation stream subscriber."""
+
+from __future__ import annotations
+
+import httpx
+
+from integration_app.invalidation import InvalidationSubscriber
+
+
+def test_consume_dispatches_events_and_resumes_from_last_seq() -> None:
+    seen_params: list[dict[str, str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_params.append(dict(request.url.params))
+        body = (
+            ": keepalive\n\n"
+            'id: 4\nevent: invalidate\ndata: {"seq": 4, "ticket_id": "P-1", "kind": "updated"}\n\n'
+            'id: 5\nevent: invalidate\ndata: {"seq": 5, "ticket_id": "P-2", "kind": "deleted"}\n\n'
+        )
+        return httpx.Response(200, text=body, headers={"content-type": "text/event-stream"})
+
+    sub = InvalidationSubscriber(
+        "http://jira-service/",
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+    received: list[str] = []
+    sub.add_listener(lambda event: received.append(event["ticket_id"]))
+
+    assert sub.consume() == 2
+    sub.consume()
+
+    assert received == ["P-1", "P-2", "P-1", "P-2"]
+    assert sub.last_seq == 5
+    assert seen_params == [{"since": "0"}, {"since": "5"}]
+
+
+def test_reset_event_rewinds_sequence_and_adopts_new_epoch() -> None:
+    seen_params: list[dict[str, str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_params.append(dict(request.url.params))
+        if len(seen_params) == 1:
+            body = 'id: 40\nevent: invalidate\ndata: {"seq": 40, "ticket_id": "P-1", "kind": "updated"}\n\n'
+            return httpx.Response(200, text=body, headers={"X-Invalidation-Epoch": "boot-1"})
+        # The service restarted: its sequence is back near zero.
+        body = 'id: 3\nevent: reset\ndata: {"seq": 3, "kind": "reset", "epoch": "boot-2"}\n\n'
+        return httpx.Response(200, text=body, headers={"X-Invalidation-Epoch": "boot-2"})
+
+    sub = InvalidationSubscriber(
+        "http://jira-service/",
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+    kinds: list[str] = []
+    sub.add_listener(lambda event: kinds.append(event["kind"]))
+
+    sub.consume()
+    sub.consume()
+    sub.consume()
+
+    assert kinds == ["updated", "reset", "reset"]
+    assert seen_params[:3] == [
+        {"since": "0"},
+        {"since": "40", "epoch": "boot-1"},
+        {"since": "3", "epoch": "boot-2"},
+    ]
+    assert sub.last_seq == 3
+    assert sub.epoch == "boot-2"
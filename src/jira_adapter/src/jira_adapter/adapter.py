@@ -11,20 +11,60 @@ IMPORTANT:
 from __future__ import annotations
 
 import os
-
-from tickets_api.client import Ticket, TicketInterface, TicketStatus, bind_client
+from collections.abc import Callable, Iterable, Iterator, Sequence
+
+from tickets_api.client import (
+    Ticket,
+    TicketCreateResult,
+    TicketInterface,
+    TicketSpec,
+    TicketStatus,
+    bind_client,
+)
 from tickets_service_api_client import Client
+from tickets_service_api_client.api.default.batch_create_tickets_tickets_batch_create_post import (
+    sync as batch_create_tickets,
+)
+from tickets_service_api_client.api.default.batch_delete_tickets_tickets_batch_delete_post import (
+    sync as batch_delete_tickets,
+)
+from tickets_service_api_client.api.default.batch_update_tickets_tickets_batch_update_post import (
+    sync as batch_update_tickets,
+)
 from tickets_service_api_client.api.default.create_ticket_tickets_post import (
     sync as create_ticket,
 )
+from tickets_service_api_client.api.default.delete_ticket_tickets_ticket_id_delete import (
+    sync as delete_ticket,
+)
 from tickets_service_api_client.api.default.get_ticket_tickets_ticket_id_get import (
     sync as get_ticket,
 )
 from tickets_service_api_client.api.default.list_tickets_tickets_get import (
     sync as list_tickets,
 )
+from tickets_service_api_client.api.default.update_ticket_tickets_ticket_id_patch import (
+    sync_detailed as update_ticket,
+)
+from tickets_service_api_client.models.batch_create_in import BatchCreateIn
+from tickets_service_api_client.models.batch_delete_in import BatchDeleteIn
+from tickets_service_api_client.models.batch_delete_item import BatchDeleteItem
+from tickets_service_api_client.models.batch_item_result import BatchItemResult
+from tickets_service_api_client.models.batch_response import BatchResponse
+from tickets_service_api_client.models.batch_update_in import BatchUpdateIn
+from tickets_service_api_client.models.batch_update_item import BatchUpdateItem
 from tickets_service_api_client.models.ticket_in import TicketIn
 from tickets_service_api_client.models.ticket_out import TicketOut
+from tickets_service_api_client.models.ticket_patch import TicketPatch
+from tickets_service_api_client.models.ticket_status import (
+    TicketStatus as ServiceTicketStatus,
+)
+from tickets_service_api_client.types import UNSET
+
+# Largest page jira_service accepts; fewer round trips when following cursors.
+_PAGE_SIZE = 1000
+# Largest batch jira_service accepts per :batchCreate/:batchUpdate/:batchDelete.
+_BATCH_SIZE = 1000
 
 
 class JiraServiceTicket(Ticket):
@@ -51,7 +91,8 @@ class JiraServiceTicket(Ticket):
 
     @property
     def assignee(self) -> str | None:
-        return self._dto.assignee
+        assignee = self._dto.assignee
+        return assignee if isinstance(assignee, str) else None
 
 
 class JiraServiceTicketClient(TicketInterface):
@@ -63,6 +104,32 @@ class JiraServiceTicketClient(TicketInterface):
             raise RuntimeError("JIRA_SERVICE_BASE_URL is empty")
         self._client = Client(base_url=base_url)
 
+    def _iter_ticket_dtos(
+        self,
+        query: str | None = None,
+        status: TicketStatus | None = None,
+    ) -> Iterator[TicketOut]:
+        """Yield every matching ticket, following ``next_cursor`` page by page.
+
+        Filtering happens in the service, so only matching tickets cross the wire.
+        """
+        cursor = None
+        while True:
+            response = list_tickets(
+                client=self._client,
+                limit=_PAGE_SIZE,
+                cursor=UNSET if cursor is None else cursor,
+                status=UNSET if status is None else ServiceTicketStatus(status.value),
+                q=query or UNSET,
+            )
+            tickets = getattr(response, "tickets", None) if response else None
+            if not tickets:
+                return
+            yield from tickets
+            cursor = getattr(response, "next_cursor", None)
+            if not isinstance(cursor, str):
+                return
+
     def create_ticket(
         self,
         title: str,
@@ -72,28 +139,94 @@ class JiraServiceTicketClient(TicketInterface):
         try:
             dto = create_ticket(
                 client=self._client,
-                body=TicketIn(title=title, description=description),
+                body=TicketIn(title=title, description=description, assignee=assignee),
             )
+            if dto is None:
+                raise RuntimeError("Ticket create did not return a ticket")
+            return JiraServiceTicket(dto)
 
-            # Generated client may return None even on 201; verify via list.
-            if dto is not None:
-                return JiraServiceTicket(dto)
-
-            response = list_tickets(client=self._client)
-            tickets = getattr(response, "tickets", None) if response else None
-            if not tickets:
-                raise RuntimeError("Ticket create returned None and list is empty")
-
-            return JiraServiceTicket(tickets[-1])
-
-        except Exception as exc:  # noqa: BLE001
+        except Exception as exc:
             raise ConnectionError("Failed to create ticket via Jira service") from exc
 
+    def _batch(self, call: Callable[..., object], bodies: Iterable[object]) -> list[BatchItemResult]:
+        """Send batch requests chunk by chunk; results come back in input order."""
+        results: list[BatchItemResult] = []
+        for body in bodies:
+            try:
+                response = call(client=self._client, body=body)
+            except Exception as exc:
+                raise ConnectionError("Failed to send batch to Jira service") from exc
+            if not isinstance(response, BatchResponse):
+                raise ConnectionError("Jira service rejected the batch request")
+            results.extend(response.results)
+        return results
+
+    def create_tickets(self, specs: Sequence[TicketSpec]) -> list[TicketCreateResult]:
+        """Create tickets with one :batchCreate request per 1000 specs."""
+        bodies = (
+            BatchCreateIn(
+                tickets=[
+                    TicketIn(title=s.title, description=s.description, assignee=s.assignee)
+                    for s in specs[start : start + _BATCH_SIZE]
+                ]
+            )
+            for start in range(0, len(specs), _BATCH_SIZE)
+        )
+        return [
+            TicketCreateResult(ticket=JiraServiceTicket(r.ticket))
+            if isinstance(r.ticket, TicketOut)
+            else TicketCreateResult(ticket=None, error=r.error or f"HTTP {r.status}")
+            for r in self._batch(batch_create_tickets, bodies)
+        ]
+
+    def update_tickets(
+        self,
+        ticket_ids: Sequence[str],
+        status: TicketStatus | None = None,
+        title: str | None = None,
+    ) -> list[Ticket | None]:
+        """Apply the same change to many tickets via :batchUpdate.
+
+        Returns the updated tickets in input order, None where the id does
+        not exist. Raises ValueError if the service rejects the change.
+        """
+        new_title = UNSET if title is None else title
+        new_status = UNSET if status is None else ServiceTicketStatus(status.value)
+        bodies = (
+            BatchUpdateIn(
+                updates=[
+                    BatchUpdateItem(id=i, title=new_title, status=new_status)
+                    for i in ticket_ids[start : start + _BATCH_SIZE]
+                ]
+            )
+            for start in range(0, len(ticket_ids), _BATCH_SIZE)
+        )
+        updated: list[Ticket | None] = []
+        for result in self._batch(batch_update_tickets, bodies):
+            if result.status == 400:
+                raise ValueError(result.error or "invalid ticket update")
+            updated.append(JiraServiceTicket(result.ticket) if isinstance(result.ticket, TicketOut) else None)
+        return updated
+
+    def delete_tickets(self, ticket_ids: Sequence[str]) -> list[bool]:
+        """Delete many tickets via :batchDelete; one flag per id, in input order.
+
+        An item reports the removed ticket, or none if the id did not exist.
+        """
+        bodies = (
+            BatchDeleteIn(deletes=[BatchDeleteItem(id=i) for i in ticket_ids[start : start + _BATCH_SIZE]])
+            for start in range(0, len(ticket_ids), _BATCH_SIZE)
+        )
+        return [
+            result.status == 200 and isinstance(result.ticket, TicketOut)
+            for result in self._batch(batch_delete_tickets, bodies)
+        ]
+
     def get_ticket(self, ticket_id: str) -> Ticket | None:
         try:
             dto = get_ticket(ticket_id=ticket_id, client=self._client)
             return JiraServiceTicket(dto) if dto else None
-        except Exception as exc:  # noqa: BLE001
+        except Exception as exc:
             raise ConnectionError("Failed to fetch ticket via Jira service") from exc
 
     def search_tickets(
@@ -101,26 +234,39 @@ class JiraServiceTicketClient(TicketInterface):
         query: str | None = None,
         status: TicketStatus | None = None,
     ) -> list[Ticket]:
-        _ = query
-        _ = status
         try:
-            response = list_tickets(client=self._client)
-            tickets = getattr(response, "tickets", None) if response else None
-            if not tickets:
-                return []
-            return [JiraServiceTicket(t) for t in tickets]
-        except Exception as exc:  # noqa: BLE001
+            return [JiraServiceTicket(t) for t in self._iter_ticket_dtos(query, status)]
+        except Exception as exc:
             raise ConnectionError("Failed to list tickets via Jira service") from exc
 
-    def update_ticket(self, *args, **kwargs) -> Ticket:
-        raise NotImplementedError(
-            "update_ticket is not supported by the Jira service API yet"
-        )
-
-    def delete_ticket(self, *args, **kwargs) -> bool:
-        raise NotImplementedError(
-            "delete_ticket is not supported by the Jira service API yet"
+    def update_ticket(
+        self,
+        ticket_id: str,
+        status: TicketStatus | None = None,
+        title: str | None = None,
+    ) -> Ticket:
+        body = TicketPatch(
+            title=UNSET if title is None else title,
+            status=UNSET if status is None else ServiceTicketStatus(status.value),
         )
+        try:
+            response = update_ticket(ticket_id=ticket_id, client=self._client, body=body)
+        except Exception as exc:
+            raise ConnectionError("Failed to update ticket via Jira service") from exc
+        if response.status_code == 404:
+            raise KeyError(ticket_id)
+        if response.status_code == 400:
+            raise ValueError(response.content.decode(errors="replace"))
+        if not isinstance(response.parsed, TicketOut):
+            raise ConnectionError(f"Jira service update failed with HTTP {int(response.status_code)}")
+        return JiraServiceTicket(response.parsed)
+
+    def delete_ticket(self, ticket_id: str) -> bool:
+        try:
+            response = delete_ticket(ticket_id=ticket_id, client=self._client)
+        except Exception as exc:
+            raise ConnectionError("Failed to delete ticket via Jira service") from exc
+        return bool(getattr(response, "deleted", False))
 
 
 # -------------------------
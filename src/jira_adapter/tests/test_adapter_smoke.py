@@ -5,9 +5,16 @@ from __future__ import annotations
 import importlib
 from unittest.mock import Mock, patch
 
+import pytest
 import tickets_api
 import jira_adapter
-from tickets_api.client import TicketStatus
+from tickets_api.client import TicketSpec, TicketStatus
+from tickets_service_api_client.models import (
+    BatchItemResult,
+    BatchResponse,
+    TicketDeletedResponse,
+    TicketOut,
+)
 
 
 def setup_function() -> None:
@@ -92,27 +99,96 @@ def test_search_tickets_transforms_list(monkeypatch) -> None:
     assert tickets[1].status == TicketStatus.CLOSED
 
 
-def test_update_ticket_not_supported(monkeypatch) -> None:
-    """update_ticket should fail cleanly since service does not support it."""
+def test_search_tickets_passes_filters_and_follows_cursor(monkeypatch) -> None:
+    """search_tickets should filter server-side and walk every page."""
     monkeypatch.setenv("JIRA_SERVICE_BASE_URL", "http://testserver")
 
-    client = tickets_api.get_client()
+    first = Mock(tickets=[Mock(id="T-1", status="closed")], next_cursor="c1")
+    last = Mock(tickets=[Mock(id="T-9", status="closed")], next_cursor=None)
+
+    with patch("jira_adapter.adapter.list_tickets", side_effect=[first, last]) as list_mock:
+        client = tickets_api.get_client()
+        tickets = client.search_tickets(query="login", status=TicketStatus.CLOSED)
 
-    try:
-        client.update_ticket("T-1", status=TicketStatus.CLOSED)
-        assert False, "Expected NotImplementedError"
-    except NotImplementedError:
-        assert True
+    assert [t.id for t in tickets] == ["T-1", "T-9"]
+    first_call, second_call = list_mock.call_args_list
+    assert first_call.kwargs["q"] == "login"
+    assert first_call.kwargs["status"].value == "closed"
+    assert second_call.kwargs["cursor"] == "c1"
 
 
-def test_delete_ticket_not_supported(monkeypatch) -> None:
-    """delete_ticket should fail cleanly since service does not support it."""
+def test_update_ticket_patches_single_ticket(monkeypatch) -> None:
+    """update_ticket should PATCH only the given fields and map 404 to KeyError."""
     monkeypatch.setenv("JIRA_SERVICE_BASE_URL", "http://testserver")
 
-    client = tickets_api.get_client()
+    updated = TicketOut(id="T-1", title="New", status="closed", description="d")
+    ok = Mock(status_code=200, parsed=updated)
+    missing = Mock(status_code=404, parsed=None)
+
+    with patch("jira_adapter.adapter.update_ticket", side_effect=[ok, missing]) as update_mock:
+        client = tickets_api.get_client()
+        ticket = client.update_ticket("T-1", status=TicketStatus.CLOSED)
+        with pytest.raises(KeyError):
+            client.update_ticket("T-404", title="x")
+
+    assert ticket.status == TicketStatus.CLOSED
+    assert update_mock.call_args_list[0].kwargs["body"].to_dict() == {"status": "closed"}
+
+
+def test_delete_ticket_reports_service_result(monkeypatch) -> None:
+    """delete_ticket should return the service's deleted flag."""
+    monkeypatch.setenv("JIRA_SERVICE_BASE_URL", "http://testserver")
+
+    with patch(
+        "jira_adapter.adapter.delete_ticket",
+        side_effect=[TicketDeletedResponse(deleted=True), TicketDeletedResponse(deleted=False)],
+    ):
+        client = tickets_api.get_client()
+        assert client.delete_ticket("T-1") is True
+        assert client.delete_ticket("T-1") is False
+
+
+def test_create_tickets_sends_one_batch_per_thousand(monkeypatch) -> None:
+    """create_tickets should chunk specs into :batchCreate calls and keep order."""
+    monkeypatch.setenv("JIRA_SERVICE_BASE_URL", "http://testserver")
+
+    def respond(*, client, body) -> BatchResponse:
+        return BatchResponse(
+            results=[
+                BatchItemResult(status=201, ticket=TicketOut(id=t.title, title=t.title, status="open", description=""))
+                if t.title
+                else BatchItemResult(status=400, ticket=None, error="title must be non-empty")
+                for t in body.tickets
+            ]
+        )
+
+    specs = [TicketSpec(title=str(i), description="") for i in range(1, 1200)] + [TicketSpec(title="", description="")]
+    with patch("jira_adapter.adapter.batch_create_tickets", side_effect=respond) as batch_mock:
+        results = tickets_api.get_client().create_tickets(specs)
+
+    assert [len(c.kwargs["body"].tickets) for c in batch_mock.call_args_list] == [1000, 200]
+    assert [r.ticket.id for r in results[:3]] == ["1", "2", "3"]
+    assert results[-1].ticket is None
+    assert results[-1].error == "title must be non-empty"
+
+
+def test_update_and_delete_tickets_report_per_item_results(monkeypatch) -> None:
+    """update_tickets/delete_tickets should map per-item statuses in input order."""
+    monkeypatch.setenv("JIRA_SERVICE_BASE_URL", "http://testserver")
+
+    closed = TicketOut(id="T-1", title="A", status="closed", description="")
+    updates = BatchResponse(results=[BatchItemResult(status=200, ticket=closed), BatchItemResult(status=404)])
+    deletes = BatchResponse(results=[BatchItemResult(status=200, ticket=closed), BatchItemResult(status=200)])
+
+    with (
+        patch("jira_adapter.adapter.batch_update_tickets", return_value=updates) as update_mock,
+        patch("jira_adapter.adapter.batch_delete_tickets", return_value=deletes),
+    ):
+        client = tickets_api.get_client()
+        updated = client.update_tickets(["T-1", "T-404"], status=TicketStatus.CLOSED)
+        deleted = client.delete_tickets(["T-1", "T-404"])
 
-    try:
-        client.delete_ticket("T-1")
-        assert False, "Expected NotImplementedError"
-    except NotImplementedError:
-        assert True
+    assert updated[0].status == TicketStatus.CLOSED
+    assert updated[1] is None
+    assert update_mock.call_args.kwargs["body"].to_dict()["updates"][0] == {"id": "T-1", "status": "closed"}
+    assert deleted == [True, False]
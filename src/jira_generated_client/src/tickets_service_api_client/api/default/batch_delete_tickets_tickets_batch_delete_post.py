@@ -0,0 +1,190 @@
+from http import HTTPStatus
+from typing import Any
+
+import httpx
+
+from ... import errors
+from ...client import AuthenticatedClient, Client
+from ...models.batch_delete_in import BatchDeleteIn
+from ...models.batch_response import BatchResponse
+from ...models.http_validation_error import HTTPValidationError
+from ...types import Response
+
+
+def _get_kwargs(
+    *,
+    body: BatchDeleteIn,
+) -> dict[str, Any]:
+    headers: dict[str, Any] = {}
+
+    _kwargs: dict[str, Any] = {
+        "method": "post",
+        "url": "/tickets:batchDelete",
+    }
+
+    _kwargs["json"] = body.to_dict()
+
+    headers["Content-Type"] = "application/json"
+
+    _kwargs["headers"] = headers
+    return _kwargs
+
+
+def _parse_response(
+    *, client: AuthenticatedClient | Client, response: httpx.Response
+) -> BatchResponse | HTTPValidationError | None:
+    if response.status_code == 200:
+        response_200 = BatchResponse.from_dict(response.json())
+
+        return response_200
+
+    if response.status_code == 422:
+        response_422 = HTTPValidationError.from_dict(response.json())
+
+        return response_422
+
+    if client.raise_on_unexpected_status:
+        raise errors.UnexpectedStatus(response.status_code, response.content)
+    else:
+        return None
+
+
+def _build_response(
+    *, client: AuthenticatedClient | Client, response: httpx.Response
+) -> Response[BatchResponse | HTTPValidationError]:
+    return Response(
+        status_code=HTTPStatus(response.status_code),
+        content=response.content,
+        headers=response.headers,
+        parsed=_parse_response(client=client, response=response),
+    )
+
+
+def sync_detailed(
+    *,
+    client: AuthenticatedClient | Client,
+    body: BatchDeleteIn,
+) -> Response[BatchResponse | HTTPValidationError]:
+    """Batch Delete Tickets
+
+     Delete up to MAX_BATCH_SIZE tickets in one store transaction.
+
+    Each item goes through the same code as ``DELETE /tickets/{id}``.
+    Results are per item, in request order: ``200`` with the removed ticket,
+    ``200`` with no ticket if it did not exist, or ``412``.
+
+    Args:
+        body (BatchDeleteIn):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[BatchResponse | HTTPValidationError]
+    """
+
+    kwargs = _get_kwargs(
+        body=body,
+    )
+
+    response = client.get_httpx_client().request(
+        **kwargs,
+    )
+
+    return _build_response(client=client, response=response)
+
+
+def sync(
+    *,
+    client: AuthenticatedClient | Client,
+    body: BatchDeleteIn,
+) -> BatchResponse | HTTPValidationError | None:
+    """Batch Delete Tickets
+
+     Delete up to MAX_BATCH_SIZE tickets in one store transaction.
+
+    Each item goes through the same code as ``DELETE /tickets/{id}``.
+    Results are per item, in request order: ``200`` with the removed ticket,
+    ``200`` with no ticket if it did not exist, or ``412``.
+
+    Args:
+        body (BatchDeleteIn):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        BatchResponse | HTTPValidationError
+    """
+
+    return sync_detailed(
+        client=client,
+        body=body,
+    ).parsed
+
+
+async def asyncio_detailed(
+    *,
+    client: AuthenticatedClient | Client,
+    body: BatchDeleteIn,
+) -> Response[BatchResponse | HTTPValidationError]:
+    """Batch Delete Tickets
+
+     Delete up to MAX_BATCH_SIZE tickets in one store transaction.
+
+    Each item goes through the same code as ``DELETE /tickets/{id}``.
+    Results are per item, in request order: ``200`` with the removed ticket,
+    ``200`` with no ticket if it did not exist, or ``412``.
+
+    Args:
+        body (BatchDeleteIn):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[BatchResponse | HTTPValidationError]
+    """
+
+    kwargs = _get_kwargs(
+        body=body,
+    )
+
+    response = await client.get_async_httpx_client().request(**kwargs)
+
+    return _build_response(client=client, response=response)
+
+
+async def asyncio(
+    *,
+    client: AuthenticatedClient | Client,
+    body: BatchDeleteIn,
+) -> BatchResponse | HTTPValidationError | None:
+    """Batch Delete Tickets
+
+     Delete up to MAX_BATCH_SIZE tickets in one store transaction.
+
+    Each item goes through the same code as ``DELETE /tickets/{id}``.
+    Results are per item, in request order: ``200`` with the removed ticket,
+    ``200`` with no ticket if it did not exist, or ``412``.
+
+    Args:
+        body (BatchDeleteIn):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        BatchResponse | HTTPValidationError
+    """
+
+    return (
+        await asyncio_detailed(
+            client=client,
+            body=body,
+        )
+    ).parsed
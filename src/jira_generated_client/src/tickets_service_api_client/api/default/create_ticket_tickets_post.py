@@ -33,10 +33,10 @@ def _get_kwargs(
 def _parse_response(
     *, client: AuthenticatedClient | Client, response: httpx.Response
 ) -> HTTPValidationError | TicketOut | None:
-    if response.status_code == 200:
-        response_200 = TicketOut.from_dict(response.json())
+    if response.status_code == 201:
+        response_201 = TicketOut.from_dict(response.json())
 
-        return response_200
+        return response_201
 
     if response.status_code == 422:
         response_422 = HTTPValidationError.from_dict(response.json())
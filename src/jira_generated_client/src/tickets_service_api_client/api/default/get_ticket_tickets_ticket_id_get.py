@@ -1,5 +1,6 @@
 from http import HTTPStatus
 from typing import Any
+from urllib.parse import quote
 
 import httpx
 
@@ -7,17 +8,26 @@ from ... import errors
 from ...client import AuthenticatedClient, Client
 from ...models.http_validation_error import HTTPValidationError
 from ...models.ticket_out import TicketOut
-from ...types import Response
+from ...types import UNSET, Response, Unset
 
 
 def _get_kwargs(
     ticket_id: str,
+    *,
+    if_none_match: None | str | Unset = UNSET,
 ) -> dict[str, Any]:
+    headers: dict[str, Any] = {}
+    if not isinstance(if_none_match, Unset) and if_none_match is not None:
+        headers["if-none-match"] = if_none_match
+
     _kwargs: dict[str, Any] = {
         "method": "get",
-        "url": f"/tickets/{ticket_id}",
+        "url": "/tickets/{ticket_id}".format(
+            ticket_id=quote(str(ticket_id), safe=""),
+        ),
     }
 
+    _kwargs["headers"] = headers
     return _kwargs
 
 
@@ -55,11 +65,16 @@ def sync_detailed(
     ticket_id: str,
     *,
     client: AuthenticatedClient | Client,
+    if_none_match: None | str | Unset = UNSET,
 ) -> Response[HTTPValidationError | TicketOut]:
     """Get Ticket
 
+     Fetch one ticket by id (an index lookup). The ``ETag`` header is
+    its version; send it as If-None-Match to get ``304`` when unchanged.
+
     Args:
         ticket_id (str):
+        if_none_match (None | str | Unset):
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
@@ -71,6 +86,7 @@ def sync_detailed(
 
     kwargs = _get_kwargs(
         ticket_id=ticket_id,
+        if_none_match=if_none_match,
     )
 
     response = client.get_httpx_client().request(
@@ -84,11 +100,16 @@ def sync(
     ticket_id: str,
     *,
     client: AuthenticatedClient | Client,
+    if_none_match: None | str | Unset = UNSET,
 ) -> HTTPValidationError | TicketOut | None:
     """Get Ticket
 
+     Fetch one ticket by id (an index lookup). The ``ETag`` header is
+    its version; send it as If-None-Match to get ``304`` when unchanged.
+
     Args:
         ticket_id (str):
+        if_none_match (None | str | Unset):
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
@@ -101,6 +122,7 @@ def sync(
     return sync_detailed(
         ticket_id=ticket_id,
         client=client,
+        if_none_match=if_none_match,
     ).parsed
 
 
@@ -108,11 +130,16 @@ async def asyncio_detailed(
     ticket_id: str,
     *,
     client: AuthenticatedClient | Client,
+    if_none_match: None | str | Unset = UNSET,
 ) -> Response[HTTPValidationError | TicketOut]:
     """Get Ticket
 
+     Fetch one ticket by id (an index lookup). The ``ETag`` header is
+    its version; send it as If-None-Match to get ``304`` when unchanged.
+
     Args:
         ticket_id (str):
+        if_none_match (None | str | Unset):
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
@@ -124,6 +151,7 @@ async def asyncio_detailed(
 
     kwargs = _get_kwargs(
         ticket_id=ticket_id,
+        if_none_match=if_none_match,
     )
 
     response = await client.get_async_httpx_client().request(**kwargs)
@@ -135,11 +163,16 @@ async def asyncio(
     ticket_id: str,
     *,
     client: AuthenticatedClient | Client,
+    if_none_match: None | str | Unset = UNSET,
 ) -> HTTPValidationError | TicketOut | None:
     """Get Ticket
 
+     Fetch one ticket by id (an index lookup). The ``ETag`` header is
+    its version; send it as If-None-Match to get ``304`` when unchanged.
+
     Args:
         ticket_id (str):
+        if_none_match (None | str | Unset):
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
@@ -153,5 +186,6 @@ async def asyncio(
         await asyncio_detailed(
             ticket_id=ticket_id,
             client=client,
+            if_none_match=if_none_match,
         )
     ).parsed
@@ -5,32 +5,79 @@ import httpx
 
 from ... import errors
 from ...client import AuthenticatedClient, Client
+from ...models.http_validation_error import HTTPValidationError
+from ...models.ticket_status import TicketStatus
 from ...models.tickets_response import TicketsResponse
-from ...types import Response
+from ...types import UNSET, Response, Unset
 
 
-def _get_kwargs() -> dict[str, Any]:
+def _get_kwargs(
+    *,
+    limit: int | Unset = 100,
+    cursor: None | str | Unset = UNSET,
+    status: None | TicketStatus | Unset = UNSET,
+    q: None | str | Unset = UNSET,
+) -> dict[str, Any]:
+    params: dict[str, Any] = {}
+
+    params["limit"] = limit
+
+    json_cursor: None | str | Unset
+    if isinstance(cursor, Unset):
+        json_cursor = UNSET
+    else:
+        json_cursor = cursor
+    params["cursor"] = json_cursor
+
+    json_status: None | str | Unset
+    if isinstance(status, Unset):
+        json_status = UNSET
+    elif isinstance(status, TicketStatus):
+        json_status = status.value
+    else:
+        json_status = status
+    params["status"] = json_status
+
+    json_q: None | str | Unset
+    if isinstance(q, Unset):
+        json_q = UNSET
+    else:
+        json_q = q
+    params["q"] = json_q
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
     _kwargs: dict[str, Any] = {
         "method": "get",
         "url": "/tickets",
+        "params": params,
     }
 
     return _kwargs
 
 
-def _parse_response(*, client: AuthenticatedClient | Client, response: httpx.Response) -> TicketsResponse | None:
+def _parse_response(
+    *, client: AuthenticatedClient | Client, response: httpx.Response
+) -> HTTPValidationError | TicketsResponse | None:
     if response.status_code == 200:
         response_200 = TicketsResponse.from_dict(response.json())
 
         return response_200
 
+    if response.status_code == 422:
+        response_422 = HTTPValidationError.from_dict(response.json())
+
+        return response_422
+
     if client.raise_on_unexpected_status:
         raise errors.UnexpectedStatus(response.status_code, response.content)
     else:
         return None
 
 
-def _build_response(*, client: AuthenticatedClient | Client, response: httpx.Response) -> Response[TicketsResponse]:
+def _build_response(
+    *, client: AuthenticatedClient | Client, response: httpx.Response
+) -> Response[HTTPValidationError | TicketsResponse]:
     return Response(
         status_code=HTTPStatus(response.status_code),
         content=response.content,
@@ -42,18 +89,39 @@ def _build_response(*, client: AuthenticatedClient | Client, response: httpx.Res
 def sync_detailed(
     *,
     client: AuthenticatedClient | Client,
-) -> Response[TicketsResponse]:
+    limit: int | Unset = 100,
+    cursor: None | str | Unset = UNSET,
+    status: None | TicketStatus | Unset = UNSET,
+    q: None | str | Unset = UNSET,
+) -> Response[HTTPValidationError | TicketsResponse]:
     """List Tickets
 
+     List tickets in creation order, one page at a time.
+
+    Filters are applied by the store through its indexes. Pass the returned
+    ``next_cursor`` back (with the same filters) to get the next page; it is
+    null on the last page.
+
+    Args:
+        limit (int | Unset):  Default: 100.
+        cursor (None | str | Unset):
+        status (None | TicketStatus | Unset):
+        q (None | str | Unset):
+
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
         httpx.TimeoutException: If the request takes longer than Client.timeout.
 
     Returns:
-        Response[TicketsResponse]
+        Response[HTTPValidationError | TicketsResponse]
     """
 
-    kwargs = _get_kwargs()
+    kwargs = _get_kwargs(
+        limit=limit,
+        cursor=cursor,
+        status=status,
+        q=q,
+    )
 
     response = client.get_httpx_client().request(
         **kwargs,
@@ -65,37 +133,78 @@ def sync_detailed(
 def sync(
     *,
     client: AuthenticatedClient | Client,
-) -> TicketsResponse | None:
+    limit: int | Unset = 100,
+    cursor: None | str | Unset = UNSET,
+    status: None | TicketStatus | Unset = UNSET,
+    q: None | str | Unset = UNSET,
+) -> HTTPValidationError | TicketsResponse | None:
     """List Tickets
 
+     List tickets in creation order, one page at a time.
+
+    Filters are applied by the store through its indexes. Pass the returned
+    ``next_cursor`` back (with the same filters) to get the next page; it is
+    null on the last page.
+
+    Args:
+        limit (int | Unset):  Default: 100.
+        cursor (None | str | Unset):
+        status (None | TicketStatus | Unset):
+        q (None | str | Unset):
+
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
         httpx.TimeoutException: If the request takes longer than Client.timeout.
 
     Returns:
-        TicketsResponse
+        HTTPValidationError | TicketsResponse
     """
 
     return sync_detailed(
         client=client,
+        limit=limit,
+        cursor=cursor,
+        status=status,
+        q=q,
     ).parsed
 
 
 async def asyncio_detailed(
     *,
     client: AuthenticatedClient | Client,
-) -> Response[TicketsResponse]:
+    limit: int | Unset = 100,
+    cursor: None | str | Unset = UNSET,
+    status: None | TicketStatus | Unset = UNSET,
+    q: None | str | Unset = UNSET,
+) -> Response[HTTPValidationError | TicketsResponse]:
     """List Tickets
 
+     List tickets in creation order, one page at a time.
+
+    Filters are applied by the store through its indexes. Pass the returned
+    ``next_cursor`` back (with the same filters) to get the next page; it is
+    null on the last page.
+
+    Args:
+        limit (int | Unset):  Default: 100.
+        cursor (None | str | Unset):
+        status (None | TicketStatus | Unset):
+        q (None | str | Unset):
+
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
         httpx.TimeoutException: If the request takes longer than Client.timeout.
 
     Returns:
-        Response[TicketsResponse]
+        Response[HTTPValidationError | TicketsResponse]
     """
 
-    kwargs = _get_kwargs()
+    kwargs = _get_kwargs(
+        limit=limit,
+        cursor=cursor,
+        status=status,
+        q=q,
+    )
 
     response = await client.get_async_httpx_client().request(**kwargs)
 
@@ -105,19 +214,39 @@ async def asyncio_detailed(
 async def asyncio(
     *,
     client: AuthenticatedClient | Client,
-) -> TicketsResponse | None:
+    limit: int | Unset = 100,
+    cursor: None | str | Unset = UNSET,
+    status: None | TicketStatus | Unset = UNSET,
+    q: None | str | Unset = UNSET,
+) -> HTTPValidationError | TicketsResponse | None:
     """List Tickets
 
+     List tickets in creation order, one page at a time.
+
+    Filters are applied by the store through its indexes. Pass the returned
+    ``next_cursor`` back (with the same filters) to get the next page; it is
+    null on the last page.
+
+    Args:
+        limit (int | Unset):  Default: 100.
+        cursor (None | str | Unset):
+        status (None | TicketStatus | Unset):
+        q (None | str | Unset):
+
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
         httpx.TimeoutException: If the request takes longer than Client.timeout.
 
     Returns:
-        TicketsResponse
+        HTTPValidationError | TicketsResponse
     """
 
     return (
         await asyncio_detailed(
             client=client,
+            limit=limit,
+            cursor=cursor,
+            status=status,
+            q=q,
         )
     ).parsed
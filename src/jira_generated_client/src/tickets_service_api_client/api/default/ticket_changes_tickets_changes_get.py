@@ -0,0 +1,223 @@
+from http import HTTPStatus
+from typing import Any
+
+import httpx
+
+from ... import errors
+from ...client import AuthenticatedClient, Client
+from ...models.http_validation_error import HTTPValidationError
+from ...models.ticket_changes_response import TicketChangesResponse
+from ...types import UNSET, Response, Unset
+
+
+def _get_kwargs(
+    *,
+    since: int | Unset = 0,
+    wait: float | Unset = 0.0,
+    limit: int | Unset = 100,
+) -> dict[str, Any]:
+    params: dict[str, Any] = {}
+
+    params["since"] = since
+
+    params["wait"] = wait
+
+    params["limit"] = limit
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
+    _kwargs: dict[str, Any] = {
+        "method": "get",
+        "url": "/tickets/changes",
+        "params": params,
+    }
+
+    return _kwargs
+
+
+def _parse_response(
+    *, client: AuthenticatedClient | Client, response: httpx.Response
+) -> HTTPValidationError | TicketChangesResponse | None:
+    if response.status_code == 200:
+        response_200 = TicketChangesResponse.from_dict(response.json())
+
+        return response_200
+
+    if response.status_code == 422:
+        response_422 = HTTPValidationError.from_dict(response.json())
+
+        return response_422
+
+    if client.raise_on_unexpected_status:
+        raise errors.UnexpectedStatus(response.status_code, response.content)
+    else:
+        return None
+
+
+def _build_response(
+    *, client: AuthenticatedClient | Client, response: httpx.Response
+) -> Response[HTTPValidationError | TicketChangesResponse]:
+    return Response(
+        status_code=HTTPStatus(response.status_code),
+        content=response.content,
+        headers=response.headers,
+        parsed=_parse_response(client=client, response=response),
+    )
+
+
+def sync_detailed(
+    *,
+    client: AuthenticatedClient | Client,
+    since: int | Unset = 0,
+    wait: float | Unset = 0.0,
+    limit: int | Unset = 100,
+) -> Response[HTTPValidationError | TicketChangesResponse]:
+    """Ticket Changes Route
+
+     Read the change log after sequence ``since``, oldest first.
+
+    With ``wait``, an empty result is held open for up to that many seconds
+    until a change arrives (long polling). Pass the ``seq`` of the last change
+    back as ``since``. ``last_seq`` is the newest sequence in the log, so a
+    consumer can start following from it after a full listing.
+
+    Args:
+        since (int | Unset):  Default: 0.
+        wait (float | Unset):  Default: 0.0.
+        limit (int | Unset):  Default: 100.
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[HTTPValidationError | TicketChangesResponse]
+    """
+
+    kwargs = _get_kwargs(
+        since=since,
+        wait=wait,
+        limit=limit,
+    )
+
+    response = client.get_httpx_client().request(
+        **kwargs,
+    )
+
+    return _build_response(client=client, response=response)
+
+
+def sync(
+    *,
+    client: AuthenticatedClient | Client,
+    since: int | Unset = 0,
+    wait: float | Unset = 0.0,
+    limit: int | Unset = 100,
+) -> HTTPValidationError | TicketChangesResponse | None:
+    """Ticket Changes Route
+
+     Read the change log after sequence ``since``, oldest first.
+
+    With ``wait``, an empty result is held open for up to that many seconds
+    until a change arrives (long polling). Pass the ``seq`` of the last change
+    back as ``since``. ``last_seq`` is the newest sequence in the log, so a
+    consumer can start following from it after a full listing.
+
+    Args:
+        since (int | Unset):  Default: 0.
+        wait (float | Unset):  Default: 0.0.
+        limit (int | Unset):  Default: 100.
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        HTTPValidationError | TicketChangesResponse
+    """
+
+    return sync_detailed(
+        client=client,
+        since=since,
+        wait=wait,
+        limit=limit,
+    ).parsed
+
+
+async def asyncio_detailed(
+    *,
+    client: AuthenticatedClient | Client,
+    since: int | Unset = 0,
+    wait: float | Unset = 0.0,
+    limit: int | Unset = 100,
+) -> Response[HTTPValidationError | TicketChangesResponse]:
+    """Ticket Changes Route
+
+     Read the change log after sequence ``since``, oldest first.
+
+    With ``wait``, an empty result is held open for up to that many seconds
+    until a change arrives (long polling). Pass the ``seq`` of the last change
+    back as ``since``. ``last_seq`` is the newest sequence in the log, so a
+    consumer can start following from it after a full listing.
+
+    Args:
+        since (int | Unset):  Default: 0.
+        wait (float | Unset):  Default: 0.0.
+        limit (int | Unset):  Default: 100.
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[HTTPValidationError | TicketChangesResponse]
+    """
+
+    kwargs = _get_kwargs(
+        since=since,
+        wait=wait,
+        limit=limit,
+    )
+
+    response = await client.get_async_httpx_client().request(**kwargs)
+
+    return _build_response(client=client, response=response)
+
+
+async def asyncio(
+    *,
+    client: AuthenticatedClient | Client,
+    since: int | Unset = 0,
+    wait: float | Unset = 0.0,
+    limit: int | Unset = 100,
+) -> HTTPValidationError | TicketChangesResponse | None:
+    """Ticket Changes Route
+
+     Read the change log after sequence ``since``, oldest first.
+
+    With ``wait``, an empty result is held open for up to that many seconds
+    until a change arrives (long polling). Pass the ``seq`` of the last change
+    back as ``since``. ``last_seq`` is the newest sequence in the log, so a
+    consumer can start following from it after a full listing.
+
+    Args:
+        since (int | Unset):  Default: 0.
+        wait (float | Unset):  Default: 0.0.
+        limit (int | Unset):  Default: 100.
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        HTTPValidationError | TicketChangesResponse
+    """
+
+    return (
+        await asyncio_detailed(
+            client=client,
+            since=since,
+            wait=wait,
+            limit=limit,
+        )
+    ).parsed
@@ -0,0 +1,221 @@
+from http import HTTPStatus
+from typing import Any
+from urllib.parse import quote
+
+import httpx
+
+from ... import errors
+from ...client import AuthenticatedClient, Client
+from ...models.http_validation_error import HTTPValidationError
+from ...models.ticket_out import TicketOut
+from ...models.ticket_patch import TicketPatch
+from ...types import UNSET, Response, Unset
+
+
+def _get_kwargs(
+    ticket_id: str,
+    *,
+    body: TicketPatch,
+    if_match: None | str | Unset = UNSET,
+) -> dict[str, Any]:
+    headers: dict[str, Any] = {}
+    if not isinstance(if_match, Unset) and if_match is not None:
+        headers["if-match"] = if_match
+
+    _kwargs: dict[str, Any] = {
+        "method": "patch",
+        "url": "/tickets/{ticket_id}".format(
+            ticket_id=quote(str(ticket_id), safe=""),
+        ),
+    }
+
+    _kwargs["json"] = body.to_dict()
+
+    headers["Content-Type"] = "application/json"
+
+    _kwargs["headers"] = headers
+    return _kwargs
+
+
+def _parse_response(
+    *, client: AuthenticatedClient | Client, response: httpx.Response
+) -> HTTPValidationError | TicketOut | None:
+    if response.status_code == 200:
+        response_200 = TicketOut.from_dict(response.json())
+
+        return response_200
+
+    if response.status_code == 422:
+        response_422 = HTTPValidationError.from_dict(response.json())
+
+        return response_422
+
+    if client.raise_on_unexpected_status:
+        raise errors.UnexpectedStatus(response.status_code, response.content)
+    else:
+        return None
+
+
+def _build_response(
+    *, client: AuthenticatedClient | Client, response: httpx.Response
+) -> Response[HTTPValidationError | TicketOut]:
+    return Response(
+        status_code=HTTPStatus(response.status_code),
+        content=response.content,
+        headers=response.headers,
+        parsed=_parse_response(client=client, response=response),
+    )
+
+
+def sync_detailed(
+    ticket_id: str,
+    *,
+    client: AuthenticatedClient | Client,
+    body: TicketPatch,
+    if_match: None | str | Unset = UNSET,
+) -> Response[HTTPValidationError | TicketOut]:
+    """Update Ticket
+
+     Update the fields present in the body.
+
+    With If-Match, the update only applies if the ticket still has that ETag
+    (``412`` otherwise). The swap itself is a store-level compare-and-set, so
+    a concurrent writer can never be overwritten silently.
+
+    Args:
+        ticket_id (str):
+        if_match (None | str | Unset):
+        body (TicketPatch):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[HTTPValidationError | TicketOut]
+    """
+
+    kwargs = _get_kwargs(
+        ticket_id=ticket_id,
+        body=body,
+        if_match=if_match,
+    )
+
+    response = client.get_httpx_client().request(
+        **kwargs,
+    )
+
+    return _build_response(client=client, response=response)
+
+
+def sync(
+    ticket_id: str,
+    *,
+    client: AuthenticatedClient | Client,
+    body: TicketPatch,
+    if_match: None | str | Unset = UNSET,
+) -> HTTPValidationError | TicketOut | None:
+    """Update Ticket
+
+     Update the fields present in the body.
+
+    With If-Match, the update only applies if the ticket still has that ETag
+    (``412`` otherwise). The swap itself is a store-level compare-and-set, so
+    a concurrent writer can never be overwritten silently.
+
+    Args:
+        ticket_id (str):
+        if_match (None | str | Unset):
+        body (TicketPatch):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        HTTPValidationError | TicketOut
+    """
+
+    return sync_detailed(
+        ticket_id=ticket_id,
+        client=client,
+        body=body,
+        if_match=if_match,
+    ).parsed
+
+
+async def asyncio_detailed(
+    ticket_id: str,
+    *,
+    client: AuthenticatedClient | Client,
+    body: TicketPatch,
+    if_match: None | str | Unset = UNSET,
+) -> Response[HTTPValidationError | TicketOut]:
+    """Update Ticket
+
+     Update the fields present in the body.
+
+    With If-Match, the update only applies if the ticket still has that ETag
+    (``412`` otherwise). The swap itself is a store-level compare-and-set, so
+    a concurrent writer can never be overwritten silently.
+
+    Args:
+        ticket_id (str):
+        if_match (None | str | Unset):
+        body (TicketPatch):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[HTTPValidationError | TicketOut]
+    """
+
+    kwargs = _get_kwargs(
+        ticket_id=ticket_id,
+        body=body,
+        if_match=if_match,
+    )
+
+    response = await client.get_async_httpx_client().request(**kwargs)
+
+    return _build_response(client=client, response=response)
+
+
+async def asyncio(
+    ticket_id: str,
+    *,
+    client: AuthenticatedClient | Client,
+    body: TicketPatch,
+    if_match: None | str | Unset = UNSET,
+) -> HTTPValidationError | TicketOut | None:
+    """Update Ticket
+
+     Update the fields present in the body.
+
+    With If-Match, the update only applies if the ticket still has that ETag
+    (``412`` otherwise). The swap itself is a store-level compare-and-set, so
+    a concurrent writer can never be overwritten silently.
+
+    Args:
+        ticket_id (str):
+        if_match (None | str | Unset):
+        body (TicketPatch):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        HTTPValidationError | TicketOut
+    """
+
+    return (
+        await asyncio_detailed(
+            ticket_id=ticket_id,
+            client=client,
+            body=body,
+            if_match=if_match,
+        )
+    ).parsed
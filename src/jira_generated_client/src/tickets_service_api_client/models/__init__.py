@@ -1,17 +1,43 @@
 """Contains all the data models used in inputs/outputs"""
 
+from .batch_create_in import BatchCreateIn
+from .batch_delete_in import BatchDeleteIn
+from .batch_delete_item import BatchDeleteItem
+from .batch_item_result import BatchItemResult
+from .batch_response import BatchResponse
+from .batch_update_in import BatchUpdateIn
+from .batch_update_item import BatchUpdateItem
 from .health_response import HealthResponse
 from .http_validation_error import HTTPValidationError
+from .ticket_change_out import TicketChangeOut
+from .ticket_change_out_kind import TicketChangeOutKind
+from .ticket_changes_response import TicketChangesResponse
+from .ticket_deleted_response import TicketDeletedResponse
 from .ticket_in import TicketIn
 from .ticket_out import TicketOut
+from .ticket_patch import TicketPatch
+from .ticket_status import TicketStatus
 from .tickets_response import TicketsResponse
 from .validation_error import ValidationError
 
 __all__ = (
+    "BatchCreateIn",
+    "BatchDeleteIn",
+    "BatchDeleteItem",
+    "BatchItemResult",
+    "BatchResponse",
+    "BatchUpdateIn",
+    "BatchUpdateItem",
     "HealthResponse",
     "HTTPValidationError",
+    "TicketChangeOut",
+    "TicketChangeOutKind",
+    "TicketChangesResponse",
+    "TicketDeletedResponse",
     "TicketIn",
     "TicketOut",
+    "TicketPatch",
+    "TicketStatus",
     "TicketsResponse",
     "ValidationError",
 )
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+if TYPE_CHECKING:
+    from ..models.batch_delete_item import BatchDeleteItem
+
+
+T = TypeVar("T", bound="BatchDeleteIn")
+
+
+@_attrs_define
+class BatchDeleteIn:
+    """
+    Attributes:
+        deletes (list[BatchDeleteItem]):
+    """
+
+    deletes: list[BatchDeleteItem]
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        deletes = []
+        for deletes_item_data in self.deletes:
+            deletes_item = deletes_item_data.to_dict()
+            deletes.append(deletes_item)
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        field_dict.update(
+            {
+                "deletes": deletes,
+            }
+        )
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        from ..models.batch_delete_item import BatchDeleteItem
+
+        d = dict(src_dict)
+        deletes = []
+        _deletes = d.pop("deletes")
+        for deletes_item_data in _deletes:
+            deletes_item = BatchDeleteItem.from_dict(deletes_item_data)
+
+            deletes.append(deletes_item)
+
+        batch_delete_in = cls(
+            deletes=deletes,
+        )
+
+        batch_delete_in.additional_properties = d
+        return batch_delete_in
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+from ..types import UNSET, Unset
+
+if TYPE_CHECKING:
+    from ..models.ticket_out import TicketOut
+
+
+T = TypeVar("T", bound="BatchItemResult")
+
+
+@_attrs_define
+class BatchItemResult:
+    """
+    Attributes:
+        status (int):
+        ticket (None | TicketOut | Unset):
+        error (None | str | Unset):
+    """
+
+    status: int
+    ticket: None | TicketOut | Unset = UNSET
+    error: None | str | Unset = UNSET
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        from ..models.ticket_out import TicketOut
+
+        status = self.status
+
+        ticket: dict[str, Any] | None | Unset
+        if isinstance(self.ticket, Unset):
+            ticket = UNSET
+        elif isinstance(self.ticket, TicketOut):
+            ticket = self.ticket.to_dict()
+        else:
+            ticket = self.ticket
+
+        error: None | str | Unset
+        if isinstance(self.error, Unset):
+            error = UNSET
+        else:
+            error = self.error
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        field_dict.update(
+            {
+                "status": status,
+            }
+        )
+        if ticket is not UNSET:
+            field_dict["ticket"] = ticket
+        if error is not UNSET:
+            field_dict["error"] = error
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        from ..models.ticket_out import TicketOut
+
+        d = dict(src_dict)
+        status = d.pop("status")
+
+        def _parse_ticket(data: object) -> None | TicketOut | Unset:
+            if data is None:
+                return data
+            if isinstance(data, Unset):
+                return data
+            try:
+                if not isinstance(data, dict):
+                    raise TypeError()
+                ticket_type_0 = TicketOut.from_dict(data)
+
+                return ticket_type_0
+            except (TypeError, ValueError, AttributeError, KeyError):
+                pass
+            return cast(None | TicketOut | Unset, data)
+
+        ticket = _parse_ticket(d.pop("ticket", UNSET))
+
+        def _parse_error(data: object) -> None | str | Unset:
+            if data is None:
+                return data
+            if isinstance(data, Unset):
+                return data
+            return cast(None | str | Unset, data)
+
+        error = _parse_error(d.pop("error", UNSET))
+
+        batch_item_result = cls(
+            status=status,
+            ticket=ticket,
+            error=error,
+        )
+
+        batch_item_result.additional_properties = d
+        return batch_item_result
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any, TypeVar
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+from ..models.ticket_change_out_kind import TicketChangeOutKind
+
+T = TypeVar("T", bound="TicketChangeOut")
+
+
+@_attrs_define
+class TicketChangeOut:
+    """
+    Attributes:
+        seq (int):
+        ticket_id (str):
+        kind (TicketChangeOutKind):
+        at (float):
+    """
+
+    seq: int
+    ticket_id: str
+    kind: TicketChangeOutKind
+    at: float
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        seq = self.seq
+
+        ticket_id = self.ticket_id
+
+        kind = self.kind.value
+
+        at = self.at
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        field_dict.update(
+            {
+                "seq": seq,
+                "ticket_id": ticket_id,
+                "kind": kind,
+                "at": at,
+            }
+        )
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        d = dict(src_dict)
+        seq = d.pop("seq")
+
+        ticket_id = d.pop("ticket_id")
+
+        kind = TicketChangeOutKind(d.pop("kind"))
+
+        at = d.pop("at")
+
+        ticket_change_out = cls(
+            seq=seq,
+            ticket_id=ticket_id,
+            kind=kind,
+            at=at,
+        )
+
+        ticket_change_out.additional_properties = d
+        return ticket_change_out
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
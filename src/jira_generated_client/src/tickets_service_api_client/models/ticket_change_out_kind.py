@@ -0,0 +1,10 @@
+from enum import Enum
+
+
+class TicketChangeOutKind(str, Enum):
+    CREATED = "created"
+    DELETED = "deleted"
+    UPDATED = "updated"
+
+    def __str__(self) -> str:
+        return str(self.value)
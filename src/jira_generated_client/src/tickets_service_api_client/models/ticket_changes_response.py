@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+from ..types import UNSET, Unset
+
+if TYPE_CHECKING:
+    from ..models.ticket_change_out import TicketChangeOut
+
+
+T = TypeVar("T", bound="TicketChangesResponse")
+
+
+@_attrs_define
+class TicketChangesResponse:
+    """
+    Attributes:
+        changes (list[TicketChangeOut]):
+        last_seq (int):
+        resync (bool | Unset):  Default: False.
+    """
+
+    changes: list[TicketChangeOut]
+    last_seq: int
+    resync: bool | Unset = False
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        changes = []
+        for changes_item_data in self.changes:
+            changes_item = changes_item_data.to_dict()
+            changes.append(changes_item)
+
+        last_seq = self.last_seq
+
+        resync = self.resync
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        field_dict.update(
+            {
+                "changes": changes,
+                "last_seq": last_seq,
+            }
+        )
+        if resync is not UNSET:
+            field_dict["resync"] = resync
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        from ..models.ticket_change_out import TicketChangeOut
+
+        d = dict(src_dict)
+        changes = []
+        _changes = d.pop("changes")
+        for changes_item_data in _changes:
+            changes_item = TicketChangeOut.from_dict(changes_item_data)
+
+            changes.append(changes_item)
+
+        last_seq = d.pop("last_seq")
+
+        resync = d.pop("resync", UNSET)
+
+        ticket_changes_response = cls(
+            changes=changes,
+            last_seq=last_seq,
+            resync=resync,
+        )
+
+        ticket_changes_response.additional_properties = d
+        return ticket_changes_response
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
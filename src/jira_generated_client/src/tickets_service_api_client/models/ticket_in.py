@@ -17,10 +17,12 @@ class TicketIn:
     Attributes:
         title (str):
         description (None | str | Unset):
+        assignee (None | str | Unset):
     """
 
     title: str
     description: None | str | Unset = UNSET
+    assignee: None | str | Unset = UNSET
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
@@ -32,6 +34,12 @@ class TicketIn:
         else:
             description = self.description
 
+        assignee: None | str | Unset
+        if isinstance(self.assignee, Unset):
+            assignee = UNSET
+        else:
+            assignee = self.assignee
+
         field_dict: dict[str, Any] = {}
         field_dict.update(self.additional_properties)
         field_dict.update(
@@ -41,6 +49,8 @@ class TicketIn:
         )
         if description is not UNSET:
             field_dict["description"] = description
+        if assignee is not UNSET:
+            field_dict["assignee"] = assignee
 
         return field_dict
 
@@ -58,9 +68,19 @@ class TicketIn:
 
         description = _parse_description(d.pop("description", UNSET))
 
+        def _parse_assignee(data: object) -> None | str | Unset:
+            if data is None:
+                return data
+            if isinstance(data, Unset):
+                return data
+            return cast(None | str | Unset, data)
+
+        assignee = _parse_assignee(d.pop("assignee", UNSET))
+
         ticket_in = cls(
             title=title,
             description=description,
+            assignee=assignee,
         )
 
         ticket_in.additional_properties = d
@@ -19,12 +19,14 @@ class TicketOut:
         title (str):
         status (str):
         description (None | str | Unset):
+        assignee (None | str | Unset):
     """
 
     id: str
     title: str
     status: str
     description: None | str | Unset = UNSET
+    assignee: None | str | Unset = UNSET
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
@@ -40,6 +42,12 @@ class TicketOut:
         else:
             description = self.description
 
+        assignee: None | str | Unset
+        if isinstance(self.assignee, Unset):
+            assignee = UNSET
+        else:
+            assignee = self.assignee
+
         field_dict: dict[str, Any] = {}
         field_dict.update(self.additional_properties)
         field_dict.update(
@@ -51,6 +59,8 @@ class TicketOut:
         )
         if description is not UNSET:
             field_dict["description"] = description
+        if assignee is not UNSET:
+            field_dict["assignee"] = assignee
 
         return field_dict
 
@@ -72,11 +82,21 @@ class TicketOut:
 
         description = _parse_description(d.pop("description", UNSET))
 
+        def _parse_assignee(data: object) -> None | str | Unset:
+            if data is None:
+                return data
+            if isinstance(data, Unset):
+                return data
+            return cast(None | str | Unset, data)
+
+        assignee = _parse_assignee(d.pop("assignee", UNSET))
+
         ticket_out = cls(
             id=id,
             title=title,
             status=status,
             description=description,
+            assignee=assignee,
         )
 
         ticket_out.additional_properties = d
@@ -7,14 +7,45 @@ Jira-backed TicketInterface implementation with tickets_api.get_client().
 
 from __future__ import annotations
 
-from tickets_api import client as tickets_api_client
+import threading
 
-from jira_impl.impl import JiraTicketClient
+from tickets_api.client import TicketInterface
 
+from jira_impl.config import JiraConfig
+from jira_impl.impl import JiraTicketClient
+from jira_impl.mirror import MirroredTicketClient, TicketMirror
+from tickets_api import client as tickets_api_client
 
-def _get_jira_client() -> JiraTicketClient:
-    """Create and return a Jira-backed ticket client."""
-    return JiraTicketClient()
+_client: TicketInterface | None = None
+_client_lock = threading.Lock()
+
+
+def _get_jira_client() -> TicketInterface:
+    """Return the shared Jira-backed ticket client.
+
+    The client is created once, under a lock, so concurrent first callers
+    share one connection pool and at most one mirror sync thread is started.
+    When JIRA_MIRROR_PATH is set, reads are served from a local SQLite mirror
+    kept fresh by a background sync.
+    """
+    global _client
+    if _client is not None:
+        return _client
+    with _client_lock:
+        if _client is None:
+            cfg = JiraConfig.from_env()
+            jira = JiraTicketClient(cfg)
+            if cfg.mirror_path is None:
+                _client = jira
+            else:
+                mirrored = MirroredTicketClient(
+                    jira,
+                    TicketMirror(cfg.mirror_path),
+                    max_staleness_seconds=cfg.mirror_max_staleness_seconds,
+                )
+                mirrored.start(cfg.mirror_sync_interval_seconds, cfg.mirror_full_sync_interval_seconds)
+                _client = mirrored
+    return _client
 
 
 # Monkey-patch the Tickets API dependency injection hook
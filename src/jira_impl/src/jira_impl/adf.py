@@ -0,0 +1,142 @@
+# src/jira_impl/src/jira_impl/adf.py
+"""Atlassian Document Format (ADF) to plain text.
+
+The walk is iterative (explicit stack), so deeply nested documents cannot hit
+Python's recursion limit. Block nodes become lines, list items are prefixed
+and indented by depth, table cells are joined with `` | `` per row, and code
+blocks keep their line breaks. Unknown node types contribute their children's
+text; malformed shapes are skipped, never raised on.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+# Nodes that start and end their own line(s).
+_BLOCK_TYPES = frozenset(
+    {
+        "blockquote",
+        "codeBlock",
+        "decisionItem",
+        "heading",
+        "listItem",
+        "mediaSingle",
+        "panel",
+        "paragraph",
+        "rule",
+        "tableRow",
+        "taskItem",
+    }
+)
+_LIST_TYPES = frozenset({"bulletList", "orderedList", "taskList", "decisionList"})
+_CELL_TYPES = frozenset({"tableCell", "tableHeader"})
+_CELL_SEPARATOR = " | "
+
+# Stack markers (compared by identity).
+_FLUSH = object()
+_CELL_START = object()
+
+
+def adf_to_text(doc: Any) -> str:
+    """Render an ADF document (or fragment) as plain text."""
+    lines: list[str] = []
+    current: list[str] = []
+    prefix = ""
+    cell_open = False
+
+    def flush() -> None:
+        nonlocal prefix
+        line = "".join(current).rstrip()
+        current.clear()
+        if line.strip():
+            lines.append(prefix + line.lstrip(" ") if prefix else line)
+            prefix = ""
+
+    # Entries: (node, list depth, inside table cell), ("prefix", marker),
+    # literal strings, or the _FLUSH/_CELL_START markers.
+    stack: list[Any] = [(doc, 0, False)]
+    while stack:
+        item = stack.pop()
+        if item is _FLUSH:
+            flush()
+            continue
+        if item is _CELL_START:
+            if cell_open:
+                current.append(_CELL_SEPARATOR)
+            cell_open = True
+            continue
+        if isinstance(item, str):
+            current.append(item)
+            continue
+        if len(item) == 2:
+            # A list-item marker applies to the next non-empty line.
+            flush()
+            prefix = item[1]
+            continue
+
+        node, depth, in_cell = item
+        if not isinstance(node, dict):
+            continue
+
+        text = node.get("text")
+        if isinstance(text, str):
+            current.append(text)
+            continue
+
+        node_type = node.get("type")
+        attrs = node.get("attrs") or {}
+        if not isinstance(attrs, dict):
+            attrs = {}
+        if node_type == "hardBreak":
+            current.append(" " if in_cell else "\n")
+            continue
+        if node_type in {"mention", "emoji", "status"}:
+            label = attrs.get("text") or attrs.get("shortName")
+            if isinstance(label, str):
+                current.append(label)
+            continue
+        if node_type in {"inlineCard", "blockCard"}:
+            url = attrs.get("url")
+            if isinstance(url, str):
+                current.append(url)
+            continue
+
+        children = node.get("content")
+        if not isinstance(children, list):
+            children = []
+
+        if node_type in _LIST_TYPES:
+            start = attrs.get("order", 1) if node_type == "orderedList" else None
+            indent = "  " * depth
+            for offset in range(len(children) - 1, -1, -1):
+                stack.append((children[offset], depth + 1, in_cell))
+                if not in_cell:
+                    marker = f"{start + offset}. " if isinstance(start, int) else "- "
+                    stack.append(("prefix", indent + marker))
+            continue
+
+        if node_type == "tableRow":
+            stack.append(_FLUSH)
+            stack.extend((child, depth, True) for child in reversed(children))
+            stack.append(_FLUSH)
+            cell_open = False
+            continue
+
+        if node_type in _CELL_TYPES:
+            stack.extend((child, depth, True) for child in reversed(children))
+            stack.append(_CELL_START)
+            continue
+
+        # Untyped nodes are treated as blocks (conservative for odd payloads).
+        is_block = (node_type in _BLOCK_TYPES or node_type is None) and not in_cell
+        if is_block:
+            stack.append(_FLUSH)
+        stack.extend((child, depth, in_cell) for child in reversed(children))
+        if is_block:
+            stack.append(_FLUSH)
+        elif in_cell and node_type in _BLOCK_TYPES and current and current[-1] != _CELL_SEPARATOR:
+            # Separate consecutive paragraphs inside one table cell.
+            stack.append(" ")
+
+    flush()
+    return "\n".join(lines)
@@ -15,6 +15,18 @@ class JiraConfig:
     email: str
     api_token: str
     project_key: str
+    timeout_seconds: float = 20.0
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry_seconds: float = 30.0
+    http2: bool = False
+    max_retries: int = 3
+    retry_budget_seconds: float = 30.0
+    mirror_path: str | None = None
+    mirror_max_staleness_seconds: float = 30.0
+    mirror_sync_interval_seconds: float = 10.0
+    mirror_full_sync_interval_seconds: float = 3600.0
+    transition_cache_ttl_seconds: float = 3600.0
 
     @staticmethod
     def from_env() -> "JiraConfig":
@@ -26,8 +38,30 @@ class JiraConfig:
           - JIRA_API_TOKEN      Atlassian API token
           - JIRA_PROJECT_KEY    Jira project key (e.g., "PROJ")
 
+        Optional (connection pool):
+          - JIRA_TIMEOUT_SECONDS        per-request timeout (default 20)
+          - JIRA_MAX_CONNECTIONS        pool size (default 20)
+          - JIRA_MAX_KEEPALIVE          idle connections kept open (default 10)
+          - JIRA_KEEPALIVE_EXPIRY       idle connection lifetime, seconds (default 30)
+          - JIRA_HTTP2                  "1"/"true" to negotiate HTTP/2 (needs h2)
+
+        Optional (retries):
+          - JIRA_MAX_RETRIES            retries for transient failures, 0 disables (default 3)
+          - JIRA_RETRY_BUDGET_SECONDS   max total time spent waiting to retry a call (default 30)
+
+        Optional (local read mirror):
+          - JIRA_MIRROR_PATH            SQLite file (or ":memory:") enabling the mirror
+          - JIRA_MIRROR_MAX_STALENESS   max age of mirror reads, seconds (default 30)
+          - JIRA_MIRROR_SYNC_INTERVAL   background sync period, seconds (default 10)
+          - JIRA_MIRROR_FULL_SYNC_INTERVAL  period of full syncs that drop deleted
+                                        issues, seconds (default 3600)
+
+        Optional (status transitions):
+          - JIRA_TRANSITION_CACHE_TTL   workflow transition-id cache lifetime, seconds (default 3600)
+
         Raises:
             RuntimeError: If any required environment variable is missing.
+            ValueError: If an optional numeric setting is malformed.
         """
         base_url = os.environ.get("JIRA_BASE_URL", "").strip().rstrip("/")
         email = os.environ.get("JIRA_EMAIL", "").strip()
@@ -52,4 +86,16 @@ class JiraConfig:
             email=email,
             api_token=api_token,
             project_key=project_key,
+            timeout_seconds=float(os.environ.get("JIRA_TIMEOUT_SECONDS", "20")),
+            max_connections=int(os.environ.get("JIRA_MAX_CONNECTIONS", "20")),
+            max_keepalive_connections=int(os.environ.get("JIRA_MAX_KEEPALIVE", "10")),
+            keepalive_expiry_seconds=float(os.environ.get("JIRA_KEEPALIVE_EXPIRY", "30")),
+            http2=os.environ.get("JIRA_HTTP2", "").strip().lower() in {"1", "true", "yes"},
+            max_retries=int(os.environ.get("JIRA_MAX_RETRIES", "3")),
+            retry_budget_seconds=float(os.environ.get("JIRA_RETRY_BUDGET_SECONDS", "30")),
+            mirror_path=os.environ.get("JIRA_MIRROR_PATH", "").strip() or None,
+            mirror_max_staleness_seconds=float(os.environ.get("JIRA_MIRROR_MAX_STALENESS", "30")),
+            mirror_sync_interval_seconds=float(os.environ.get("JIRA_MIRROR_SYNC_INTERVAL", "10")),
+            mirror_full_sync_interval_seconds=float(os.environ.get("JIRA_MIRROR_FULL_SYNC_INTERVAL", "3600")),
+            transition_cache_ttl_seconds=float(os.environ.get("JIRA_TRANSITION_CACHE_TTL", "3600")),
         )
@@ -9,15 +9,39 @@ This module is responsible for:
 
 from __future__ import annotations
 
+from collections.abc import Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 
-from tickets_api.client import Ticket, TicketInterface, TicketStatus
+from tickets_api.client import (
+    Ticket,
+    TicketCreateResult,
+    TicketInterface,
+    TicketSpec,
+    TicketStats,
+    TicketStatus,
+)
 
 from jira_impl.config import JiraConfig
-from jira_impl.jira_client import JiraClient, JiraIssue
-
-
-def _map_status(jira_status_name: str) -> TicketStatus:
+from jira_impl.jira_client import (
+    JiraClient,
+    JiraConnectionStats,
+    JiraIssue,
+    JiraSearchPage,
+    JiraTransition,
+)
+from jira_impl.retry import RetryPolicy
+from jira_impl.transitions import TransitionCache
+
+# Jira status category keys are stable across sites and languages, unlike names.
+_CATEGORY_STATUS = {
+    "new": TicketStatus.OPEN,
+    "indeterminate": TicketStatus.IN_PROGRESS,
+    "done": TicketStatus.CLOSED,
+}
+
+
+def map_status(jira_status_name: str) -> TicketStatus:
     """Map Jira workflow status name to OSS TicketStatus."""
     name = (jira_status_name or "").strip().lower()
     if name in {"to do", "todo", "open", "backlog"}:
@@ -29,6 +53,15 @@ def _map_status(jira_status_name: str) -> TicketStatus:
     return TicketStatus.OPEN
 
 
+def _transition_target(transition: JiraTransition) -> TicketStatus | None:
+    """Map a workflow transition to the OSS status it leads to."""
+    if transition.to_category in _CATEGORY_STATUS:
+        return _CATEGORY_STATUS[transition.to_category]
+    if transition.to_status:
+        return map_status(transition.to_status)
+    return None
+
+
 @dataclass(frozen=True, slots=True)
 class JiraTicket(Ticket):
     """Concrete Ticket implementation backed by Jira issue data."""
@@ -63,18 +96,52 @@ class JiraTicket(Ticket):
 class JiraTicketClient(TicketInterface):
     """TicketInterface implementation that delegates to JiraClient."""
 
-    def __init__(self) -> None:
-        cfg = JiraConfig.from_env()
+    def __init__(self, config: JiraConfig | None = None) -> None:
+        cfg = config or JiraConfig.from_env()
         self._project_key = cfg.project_key
-        self._jira = JiraClient(base_url=cfg.base_url, email=cfg.email, api_token=cfg.api_token)
+        self._jira = JiraClient(
+            base_url=cfg.base_url,
+            email=cfg.email,
+            api_token=cfg.api_token,
+            timeout_seconds=cfg.timeout_seconds,
+            max_connections=cfg.max_connections,
+            max_keepalive_connections=cfg.max_keepalive_connections,
+            keepalive_expiry_seconds=cfg.keepalive_expiry_seconds,
+            http2=cfg.http2,
+            retry_policy=RetryPolicy(max_retries=cfg.max_retries, budget_seconds=cfg.retry_budget_seconds),
+        )
+        self._transitions = TransitionCache(ttl_seconds=cfg.transition_cache_ttl_seconds)
+
+    def close(self) -> None:
+        """Release the pooled Jira connections."""
+        self._jira.close()
+
+    def _build_jql(self, query: str | None, status: TicketStatus | None) -> str:
+        """Build the project-scoped JQL for a text/status filter."""
+        clauses: list[str] = [f'project = "{self._project_key}"']
+
+        if query and query.strip():
+            q = query.strip().replace('"', '\\"')
+            clauses.append(f'(summary ~ "{q}" OR description ~ "{q}")')
+
+        if status is not None:
+            if status == TicketStatus.OPEN:
+                clauses.append('statusCategory = "To Do"')
+            elif status == TicketStatus.IN_PROGRESS:
+                clauses.append('statusCategory = "In Progress"')
+            elif status == TicketStatus.CLOSED:
+                clauses.append("statusCategory = Done")
+
+        return " AND ".join(clauses)
 
     def _to_ticket(self, issue: JiraIssue) -> JiraTicket:
         """Convert JiraIssue to JiraTicket."""
+        self._transitions.remember_issue_type(issue.key, issue.issue_type)
         return JiraTicket(
             _id=issue.key,
             _title=issue.summary,
             _description=issue.description,
-            _status=_map_status(issue.status_name),
+            _status=map_status(issue.status_name),
             _assignee=issue.assignee_account_id,
         )
 
@@ -82,7 +149,21 @@ class JiraTicketClient(TicketInterface):
     # Required OSS API methods
     # -------------------------
 
-    def create_ticket(self, title: str, description: str, assignee: str | None = None) -> Ticket:
+    def create_ticket(
+        self,
+        title: str,
+        description: str,
+        assignee: str | None = None,
+        *,
+        hydrate: bool = False,
+    ) -> Ticket:
+        """Create a ticket in one round trip.
+
+        The ticket is built from the submitted fields; new issues start in the
+        workflow's initial status (``OPEN``). Pass ``hydrate=True`` to re-read
+        the issue from Jira when the server view (e.g. a workflow that starts
+        elsewhere) matters.
+        """
         if not title.strip():
             raise ValueError("title must be non-empty")
         if not description.strip():
@@ -93,9 +174,34 @@ class JiraTicketClient(TicketInterface):
             summary=title.strip(),
             description=description,
             assignee_account_id=assignee,
+            hydrate=hydrate,
         )
         return self._to_ticket(issue)
 
+    def create_tickets(self, specs: Sequence[TicketSpec]) -> list[TicketCreateResult]:
+        """Create tickets through Jira's bulk endpoint (50 per request)."""
+        results: list[TicketCreateResult | None] = [None] * len(specs)
+        positions: list[int] = []
+        items: list[tuple[str, str, str | None]] = []
+        for position, spec in enumerate(specs):
+            if not spec.title.strip():
+                results[position] = TicketCreateResult(ticket=None, error="title must be non-empty")
+            elif not spec.description.strip():
+                results[position] = TicketCreateResult(ticket=None, error="description must be non-empty")
+            else:
+                positions.append(position)
+                items.append((spec.title.strip(), spec.description, spec.assignee))
+
+        if items:
+            created = self._jira.create_issues(project_key=self._project_key, items=items)
+            for position, result in zip(positions, created, strict=True):
+                if result.issue is not None:
+                    results[position] = TicketCreateResult(ticket=self._to_ticket(result.issue))
+                else:
+                    results[position] = TicketCreateResult(ticket=None, error=str(result.error))
+
+        return [r for r in results if r is not None]
+
     def get_ticket(self, ticket_id: str) -> Ticket | None:
         try:
             issue = self._jira.get_issue(ticket_id)
@@ -104,45 +210,175 @@ class JiraTicketClient(TicketInterface):
         return self._to_ticket(issue)
 
     def search_tickets(self, query: str | None = None, status: TicketStatus | None = None) -> list[Ticket]:
-        clauses: list[str] = [f'project = "{self._project_key}"']
-
-        if query and query.strip():
-            q = query.strip().replace('"', '\\"')
-            clauses.append(f'(summary ~ "{q}" OR description ~ "{q}")')
-
-        if status is not None:
-            if status == TicketStatus.OPEN:
-                clauses.append('statusCategory = "To Do"')
-            elif status == TicketStatus.IN_PROGRESS:
-                clauses.append('statusCategory = "In Progress"')
-            elif status == TicketStatus.CLOSED:
-                clauses.append("statusCategory = Done")
-
-        jql = " AND ".join(clauses)
+        jql = self._build_jql(query, status)
         issues = self._jira.search_issues(jql=jql, max_results=25)
         return [self._to_ticket(i) for i in issues]
 
+    def count_tickets(self, query: str | None = None, status: TicketStatus | None = None) -> int:
+        """Count matches with a total-only Jira search (no issues transferred)."""
+        return self._jira.count_issues(jql=self._build_jql(query, status))
+
+    def ticket_stats(self) -> TicketStats:
+        """Tally the project by status category with one status-only search.
+
+        If Jira caps the page below the project size, fall back to the inherited
+        one-count-per-status implementation.
+        """
+        tally = self._jira.count_by_status_category(jql=self._build_jql(None, None))
+        if not tally.complete:
+            return super().ticket_stats()
+        by_status = dict.fromkeys(TicketStatus, 0)
+        for category, count in tally.by_category.items():
+            status = _CATEGORY_STATUS.get(category)
+            if status is not None:
+                by_status[status] += count
+        return TicketStats(total=sum(by_status.values()), by_status=by_status)
+
     def update_ticket(self, ticket_id: str, status: TicketStatus | None = None, title: str | None = None) -> Ticket:
-        # OSS contract allows status/title updates, but Jira status transitions are workflow-specific.
-        _ = status  # intentionally accepted but not forced here
+        if title is not None and not title.strip():
+            raise ValueError("title must be non-empty when provided")
+
+        if status is not None:
+            self._transition(ticket_id, status)
 
         if title is None:
             existing = self._jira.get_issue(ticket_id)
             return self._to_ticket(existing)
 
-        if not title.strip():
-            raise ValueError("title must be non-empty when provided")
-
         issue = self._jira.update_issue_summary(issue_key=ticket_id, summary=title.strip())
         return self._to_ticket(issue)
 
     def delete_ticket(self, ticket_id: str) -> bool:
         return self._jira.delete_issue(ticket_id)
 
+    def _transition(self, issue_key: str, status: TicketStatus) -> None:
+        """Move an issue into ``status`` through its workflow.
+
+        With the issue type and workflow already cached this is a single POST.
+        Otherwise (or if Jira rejects the cached id) the issue's available
+        transitions are fetched once, learned, and applied.
+
+        Raises:
+            KeyError: If the issue does not exist.
+            ValueError: If no transition leads from the current status to ``status``.
+            RuntimeError: If Jira rejects the transition.
+        """
+        issue_type = self._transitions.issue_type(issue_key)
+        if issue_type is not None:
+            transition_id = self._transitions.transition_id(self._project_key, issue_type, status)
+            if transition_id is not None:
+                if self._jira.transition_issue(issue_key=issue_key, transition_id=transition_id):
+                    return
+                # Workflow edited, or the id is not offered from the current status.
+                self._transitions.invalidate(self._project_key, issue_type)
+
+        issue, transitions = self._jira.get_issue_transitions(issue_key)
+        ids: dict[TicketStatus, str] = {}
+        for transition in transitions:
+            target = _transition_target(transition)
+            if target is not None:
+                ids.setdefault(target, transition.id)
+        if issue.issue_type:
+            self._transitions.remember_issue_type(issue_key, issue.issue_type)
+            self._transitions.learn(self._project_key, issue.issue_type, ids)
+
+        if map_status(issue.status_name) == status:
+            return
+        if status not in ids:
+            raise ValueError(f"No Jira transition from '{issue.status_name}' to {status.value} for {issue_key}")
+        if not self._jira.transition_issue(issue_key=issue_key, transition_id=ids[status]):
+            raise RuntimeError(f"Jira rejected transition {ids[status]} for {issue_key}")
+
     # -----------------------------------------
     # Extra helper methods (NOT in tickets_api)
     # -----------------------------------------
 
+    def get_tickets(self, ticket_ids: list[str], *, max_concurrency: int = 8) -> list[Ticket | None]:
+        """Fetch many tickets concurrently, in input order (None when missing).
+
+        Raises:
+            RuntimeError | ConnectionError: The first non-404 failure, if any.
+        """
+        tickets: list[Ticket | None] = []
+        for result in self._jira.get_issues(ticket_ids, max_concurrency=max_concurrency):
+            if result.issue is not None:
+                tickets.append(self._to_ticket(result.issue))
+            elif isinstance(result.error, KeyError):
+                tickets.append(None)
+            elif result.error is not None:
+                raise result.error
+        return tickets
+
+    def iter_tickets(
+        self,
+        query: str | None = None,
+        status: TicketStatus | None = None,
+        page_size: int = 50,
+        *,
+        prefetch: bool = False,
+    ) -> Iterator[Ticket]:
+        """Lazily yield every matching ticket, walking Jira's pagination.
+
+        Unlike ``search_tickets`` this does not truncate. At most one page (two
+        with ``prefetch``) is held in memory at a time.
+
+        Args:
+            query: Optional free-text filter on summary/description.
+            status: Optional status filter.
+            page_size: Issues requested per Jira search call.
+            prefetch: Fetch the next page in the background while the caller
+                consumes the current one.
+
+        Raises:
+            ValueError: If page_size is not positive.
+        """
+        # Stable order so offset pagination does not skip or repeat issues.
+        jql = f"{self._build_jql(query, status)} ORDER BY created ASC, key ASC"
+        for issue in self._iter_issues(jql, page_size, prefetch=prefetch):
+            yield self._to_ticket(issue)
+
+    def iter_issues_updated_since(self, since: str | None, page_size: int = 100) -> Iterator[JiraIssue]:
+        """Yield project issues updated at or after ``since`` (JQL date), oldest first.
+
+        ``since=None`` walks the whole project. Used to sync local mirrors.
+        """
+        jql = f'project = "{self._project_key}"'
+        if since:
+            jql += f' AND updated >= "{since}"'
+        yield from self._iter_issues(f"{jql} ORDER BY updated ASC, key ASC", page_size, prefetch=True)
+
+    def _iter_issues(self, jql: str, page_size: int, *, prefetch: bool) -> Iterator[JiraIssue]:
+        """Walk every page of a JQL search, optionally one page ahead."""
+        if page_size < 1:
+            raise ValueError("page_size must be positive")
+
+        def fetch(start_at: int) -> JiraSearchPage:
+            return self._jira.search_issues_page(jql=jql, start_at=start_at, max_results=page_size)
+
+        if not prefetch:
+            next_start: int | None = 0
+            while next_start is not None:
+                page = fetch(next_start)
+                next_start = page.next_start_at
+                yield from page.issues
+            return
+
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="jira-prefetch")
+        try:
+            pending: Future[JiraSearchPage] | None = executor.submit(fetch, 0)
+            while pending is not None:
+                page = pending.result()
+                pending = None
+                if page.next_start_at is not None:
+                    pending = executor.submit(fetch, page.next_start_at)
+                yield from page.issues
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def jira_project_key(self) -> str:
         """Return the configured Jira project key (useful for diagnostics)."""
         return self._project_key
+
+    def connection_stats(self) -> JiraConnectionStats:
+        """Return handshake vs reused-connection counts (useful for diagnostics)."""
+        return self._jira.connection_stats()
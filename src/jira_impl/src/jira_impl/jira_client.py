@@ -4,11 +4,32 @@
 from __future__ import annotations
 
 import base64
-from dataclasses import dataclass
-from typing import Any
+import importlib.util
+import threading
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Self
+from urllib.parse import quote, urlencode
 
 import httpx
 
+from jira_impl.adf import adf_to_text
+from jira_impl.retry import IDEMPOTENT_METHODS, RetryPolicy, parse_retry_after
+
+# Fields needed to build a JiraIssue; requested up-front by search_issues.
+_ISSUE_FIELDS = ("summary", "description", "status", "assignee", "updated", "issuetype")
+
+# Issue type used for every issue this client creates.
+_CREATE_ISSUE_TYPE = "Task"
+
+# Jira rejects bulk-create requests with more than 50 issues.
+_BULK_CREATE_MAX = 50
+
+# httpcore trace event emitted once per newly opened (TCP/TLS) connection.
+_CONNECT_EVENT = "connection.connect_tcp.complete"
+
 
 @dataclass(frozen=True, slots=True)
 class JiraIssue:
@@ -19,6 +40,82 @@ class JiraIssue:
     description: str
     status_name: str
     assignee_account_id: str | None
+    updated: str | None = None
+    issue_type: str | None = None
+    # Set on issues built locally after a create; fetches the server view once.
+    loader: Callable[[], JiraIssue] | None = field(default=None, repr=False, compare=False)
+
+    def hydrated(self) -> JiraIssue:
+        """Return the server's view of this issue (fetched at most once per create).
+
+        Issues built from a create call only know what was submitted; status,
+        ``updated`` and other server-computed fields are filled in here.
+        """
+        return self if self.loader is None else self.loader()
+
+
+@dataclass(frozen=True, slots=True)
+class JiraTransition:
+    """A workflow transition currently available on an issue."""
+
+    id: str
+    name: str
+    to_status: str
+    to_category: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class JiraConnectionStats:
+    """Connection reuse counters for a JiraClient's pool."""
+
+    requests: int
+    handshakes: int
+    reused: int
+    retries: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class JiraSearchPage:
+    """One page of JQL search results.
+
+    ``next_start_at`` is the offset of the following page, or None when the
+    result set is exhausted.
+    """
+
+    issues: list[JiraIssue]
+    start_at: int
+    total: int | None
+    next_start_at: int | None
+
+
+@dataclass(frozen=True, slots=True)
+class JiraStatusTally:
+    """Issue counts per status category key (``new``/``indeterminate``/``done``).
+
+    ``complete`` is False when Jira returned fewer issues than ``total`` in the
+    single page, in which case ``by_category`` only covers that page.
+    """
+
+    total: int
+    by_category: dict[str, int]
+    complete: bool
+
+
+@dataclass(frozen=True, slots=True)
+class JiraIssueResult:
+    """Outcome of fetching one key in a bulk ``get_issues`` call.
+
+    Exactly one of ``issue`` and ``error`` is set. A missing issue is reported
+    as a ``KeyError``.
+    """
+
+    key: str
+    issue: JiraIssue | None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
 
 
 def _basic_auth_value(email: str, api_token: str) -> str:
@@ -37,26 +134,90 @@ def _extract_description_text(value: Any) -> str:
         return ""
     if isinstance(value, str):
         return value
-
     if isinstance(value, dict):
-        content = value.get("content")
-        if not isinstance(content, list):
-            return ""
-        parts: list[str] = []
-        for block in content:
-            if not isinstance(block, dict):
-                continue
-            inner = block.get("content")
-            if not isinstance(inner, list):
-                continue
-            for node in inner:
-                if isinstance(node, dict) and isinstance(node.get("text"), str):
-                    parts.append(node["text"])
-        return "\n".join([p for p in parts if p.strip()])
-
+        return adf_to_text(value)
     return ""
 
 
+def parse_issue(data: Any, fallback_key: str = "") -> JiraIssue:
+    """Normalize a Jira issue payload (from get or search) into a JiraIssue."""
+    if not isinstance(data, dict):
+        data = {}
+    fields = data.get("fields")
+    if not isinstance(fields, dict):
+        fields = {}
+
+    summary = str(fields.get("summary") or "")
+    description = _extract_description_text(fields.get("description"))
+
+    status_name = ""
+    status_field = fields.get("status")
+    if isinstance(status_field, dict):
+        status_name = str(status_field.get("name") or "")
+
+    assignee_account_id: str | None = None
+    assignee_field = fields.get("assignee")
+    if isinstance(assignee_field, dict) and isinstance(assignee_field.get("accountId"), str):
+        assignee_account_id = assignee_field["accountId"]
+
+    issue_type: str | None = None
+    type_field = fields.get("issuetype")
+    if isinstance(type_field, dict) and isinstance(type_field.get("name"), str):
+        issue_type = type_field["name"]
+
+    return JiraIssue(
+        key=str(data.get("key") or fallback_key),
+        summary=summary,
+        description=description,
+        status_name=status_name,
+        assignee_account_id=assignee_account_id,
+        updated=fields["updated"] if isinstance(fields.get("updated"), str) else None,
+        issue_type=issue_type,
+    )
+
+
+def _parse_transitions(value: Any) -> list[JiraTransition]:
+    """Normalize a Jira ``transitions`` array, skipping malformed entries."""
+    transitions: list[JiraTransition] = []
+    for entry in value if isinstance(value, list) else []:
+        if not isinstance(entry, dict) or not entry.get("id"):
+            continue
+        to = entry.get("to")
+        if not isinstance(to, dict):
+            to = {}
+        category = to.get("statusCategory")
+        if not isinstance(category, dict):
+            category = {}
+        key = category.get("key")
+        transitions.append(
+            JiraTransition(
+                id=str(entry["id"]),
+                name=str(entry.get("name") or ""),
+                to_status=str(to.get("name") or ""),
+                to_category=key if isinstance(key, str) else None,
+            )
+        )
+    return transitions
+
+
+def _issue_fields(
+    project_key: str,
+    summary: str,
+    description: str,
+    assignee_account_id: str | None,
+) -> dict[str, Any]:
+    """Build the ``fields`` object for creating a Task."""
+    fields: dict[str, Any] = {
+        "project": {"key": project_key},
+        "summary": summary,
+        "description": _to_adf(description),
+        "issuetype": {"name": _CREATE_ISSUE_TYPE},
+    }
+    if assignee_account_id:
+        fields["assignee"] = {"accountId": assignee_account_id}
+    return fields
+
+
 def _to_adf(text: str) -> dict[str, Any]:
     """Convert plain text into a minimal ADF document."""
     return {
@@ -71,10 +232,33 @@ def _to_adf(text: str) -> dict[str, Any]:
     }
 
 
+class _IssueLoader:
+    """Memoized ``get_issue`` for one key, used as JiraIssue.loader."""
+
+    __slots__ = ("_client", "_issue", "_key", "_lock")
+
+    def __init__(self, client: JiraClient, key: str) -> None:
+        self._client = client
+        self._key = key
+        self._lock = threading.Lock()
+        self._issue: JiraIssue | None = None
+
+    def __call__(self) -> JiraIssue:
+        with self._lock:
+            if self._issue is None:
+                self._issue = self._client.get_issue(self._key)
+            return self._issue
+
+
 class JiraClient:
     """HTTP client for Jira Cloud REST API v3.
 
     This layer should not expose tickets_api concepts; it deals in Jira issues.
+
+    One pooled keep-alive ``httpx.Client`` is held for the lifetime of the
+    JiraClient, so DNS/TCP/TLS setup is paid once per pooled connection rather
+    than once per call. Call ``close()`` (or use it as a context manager) to
+    release the pool.
     """
 
     def __init__(
@@ -84,7 +268,28 @@ class JiraClient:
         email: str,
         api_token: str,
         timeout_seconds: float = 20.0,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry_seconds: float = 30.0,
+        http2: bool = False,
+        http_client: httpx.Client | None = None,
+        retry_policy: RetryPolicy | None = None,
     ) -> None:
+        """Initialize the client and its connection pool.
+
+        Args:
+            base_url: Jira site URL, e.g. https://your-domain.atlassian.net.
+            email: Atlassian account email.
+            api_token: Atlassian API token.
+            timeout_seconds: Per-request timeout.
+            max_connections: Upper bound on open connections in the pool.
+            max_keepalive_connections: Idle connections kept open for reuse.
+            keepalive_expiry_seconds: How long an idle connection is kept.
+            http2: Negotiate HTTP/2 when the optional ``h2`` package is
+                installed; silently stays on HTTP/1.1 otherwise.
+            http_client: Pre-built client (tests); pool options are then ignored.
+            retry_policy: Backoff for transient failures (default ``RetryPolicy()``).
+        """
         self._base_url = base_url.rstrip("/")
         self._headers = {
             "Accept": "application/json",
@@ -92,19 +297,119 @@ class JiraClient:
             "Authorization": _basic_auth_value(email, api_token),
         }
         self._timeout = httpx.Timeout(timeout_seconds)
+        if http_client is None:
+            http_client = httpx.Client(
+                timeout=self._timeout,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive_connections,
+                    keepalive_expiry=keepalive_expiry_seconds,
+                ),
+                http2=http2 and importlib.util.find_spec("h2") is not None,
+            )
+        self._http = http_client
+        self._max_connections = max_connections
+        self._stats_lock = threading.Lock()
+        self._requests = 0
+        self._handshakes = 0
+        self._retries = 0
+        self._retry = retry_policy or RetryPolicy()
+        self._sleep = time.sleep
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        self._http.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def connection_stats(self) -> JiraConnectionStats:
+        """Return how many requests opened a new connection vs reused one."""
+        with self._stats_lock:
+            return JiraConnectionStats(
+                requests=self._requests,
+                handshakes=self._handshakes,
+                reused=self._requests - self._handshakes,
+                retries=self._retries,
+            )
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        json_body: dict[str, Any] | None = None,
+        *,
+        idempotent: bool | None = None,
+    ) -> httpx.Response:
+        """Make a Jira API request on the pooled client, retrying transient failures.
 
-    def _request(self, method: str, path: str, json_body: dict[str, Any] | None = None) -> httpx.Response:
-        """Make a Jira API request.
+        Args:
+            idempotent: Whether repeating the call is safe. Defaults to True for
+                GET/PUT/DELETE; pass True for read-only POSTs such as search.
+
+        Returns:
+            The final response. A retryable status is returned as-is once
+            retries or the time budget are exhausted.
 
         Raises:
-            ConnectionError: On network/transport failures.
+            ConnectionError: On network/transport failures that were not (or
+                could no longer be) retried.
         """
-        url = f"{self._base_url}{path}"
+        if idempotent is None:
+            idempotent = method.upper() in IDEMPOTENT_METHODS
+        policy = self._retry
+        deadline = time.monotonic() + policy.budget_seconds
+        retry_number = 0
+        while True:
+            try:
+                resp = self._send(method, path, json_body)
+            except httpx.TransportError as exc:
+                if retry_number >= policy.max_retries or not policy.should_retry_error(exc, idempotent=idempotent):
+                    raise ConnectionError(f"Jira request failed: {exc}") from exc
+                delay = policy.backoff(retry_number + 1)
+                if time.monotonic() + delay > deadline:
+                    raise ConnectionError(f"Jira request failed: {exc}") from exc
+            except httpx.RequestError as exc:
+                raise ConnectionError(f"Jira request failed: {exc}") from exc
+            else:
+                if retry_number >= policy.max_retries or not policy.should_retry_status(
+                    resp.status_code, idempotent=idempotent
+                ):
+                    return resp
+                delay = policy.backoff(retry_number + 1, parse_retry_after(resp.headers.get("Retry-After")))
+                if time.monotonic() + delay > deadline:
+                    return resp
+                resp.close()
+
+            retry_number += 1
+            with self._stats_lock:
+                self._retries += 1
+            self._sleep(delay)
+
+    def _send(self, method: str, path: str, json_body: dict[str, Any] | None) -> httpx.Response:
+        """Send one attempt, counting whether it opened a new connection."""
+        connected: list[bool] = []
+
+        def trace(event_name: str, info: dict[str, Any]) -> None:
+            _ = info
+            if event_name == _CONNECT_EVENT:
+                connected.append(True)
+
         try:
-            with httpx.Client(timeout=self._timeout) as client:
-                return client.request(method=method, url=url, headers=self._headers, json=json_body)
-        except httpx.RequestError as exc:
-            raise ConnectionError(f"Jira request failed: {exc}") from exc
+            return self._http.request(
+                method=method,
+                url=f"{self._base_url}{path}",
+                headers=self._headers,
+                json=json_body,
+                extensions={"trace": trace},
+            )
+        finally:
+            with self._stats_lock:
+                self._requests += 1
+                self._handshakes += bool(connected)
 
     def create_issue(
         self,
@@ -113,18 +418,19 @@ class JiraClient:
         summary: str,
         description: str,
         assignee_account_id: str | None,
+        hydrate: bool = False,
     ) -> JiraIssue:
-        """Create a Jira issue (Task)."""
-        payload: dict[str, Any] = {
-            "fields": {
-                "project": {"key": project_key},
-                "summary": summary,
-                "description": _to_adf(description),
-                "issuetype": {"name": "Task"},
-            }
-        }
-        if assignee_account_id:
-            payload["fields"]["assignee"] = {"accountId": assignee_account_id}
+        """Create a Jira issue (Task).
+
+        The returned issue is built from the submitted fields and the key in the
+        create response, so creating costs one round trip. Server-computed
+        fields (status, ``updated``) are available through ``issue.hydrated()``.
+
+        Args:
+            hydrate: Fetch the issue after creating it and return the server
+                view (previous behaviour; one extra request).
+        """
+        payload = {"fields": _issue_fields(project_key, summary, description, assignee_account_id)}
 
         resp = self._request("POST", "/rest/api/3/issue", json_body=payload)
         if resp.status_code >= 400:
@@ -135,62 +441,287 @@ class JiraClient:
         if not key:
             raise RuntimeError("Jira create_issue returned no issue key")
 
-        return self.get_issue(key)
+        if hydrate:
+            return self.get_issue(key)
+        return self._created_issue(key, summary, description, assignee_account_id)
+
+    def _created_issue(self, key: str, summary: str, description: str, assignee: str | None) -> JiraIssue:
+        """Build a just-created issue from the submitted fields, with lazy hydration."""
+        return JiraIssue(
+            key=key,
+            summary=summary,
+            description=description,
+            status_name="",
+            assignee_account_id=assignee,
+            issue_type=_CREATE_ISSUE_TYPE,
+            loader=_IssueLoader(self, key),
+        )
+
+    def create_issues(
+        self,
+        *,
+        project_key: str,
+        items: Sequence[tuple[str, str, str | None]],
+        chunk_size: int = _BULK_CREATE_MAX,
+    ) -> list[JiraIssueResult]:
+        """Create many Tasks via ``/rest/api/3/issue/bulk``.
+
+        Items are ``(summary, description, assignee_account_id)`` tuples, sent in
+        chunks of at most ``chunk_size`` (Jira's limit is 50). Results come back
+        in input order. Created issues are built from the submitted fields, so no
+        follow-up ``get_issue`` is made. Failed items carry the error, and a
+        failed chunk does not affect the others.
+        """
+        chunk_size = max(1, min(chunk_size, _BULK_CREATE_MAX))
+        results: list[JiraIssueResult] = []
+        for offset in range(0, len(items), chunk_size):
+            chunk = items[offset : offset + chunk_size]
+            results.extend(self._create_chunk(project_key, chunk))
+        return results
+
+    def _create_chunk(
+        self,
+        project_key: str,
+        chunk: Sequence[tuple[str, str, str | None]],
+    ) -> list[JiraIssueResult]:
+        """POST one bulk-create chunk and map its response onto the items."""
+        payload = {
+            "issueUpdates": [
+                {"fields": _issue_fields(project_key, summary, description, assignee)}
+                for summary, description, assignee in chunk
+            ]
+        }
+        try:
+            resp = self._request("POST", "/rest/api/3/issue/bulk", json_body=payload)
+        except ConnectionError as exc:
+            return [JiraIssueResult(key="", issue=None, error=exc) for _ in chunk]
+        try:
+            data = resp.json()
+        except ValueError:
+            data = None
+
+        # Jira answers 201 (some created) or 400 (none created) with the same body:
+        # created issues in submission order, plus errors keyed by element index.
+        created = data.get("issues") if isinstance(data, dict) else None
+        errors = data.get("errors") if isinstance(data, dict) else None
+        if not isinstance(created, list) or (resp.status_code >= 400 and not errors):
+            error = RuntimeError(f"Jira bulk create failed: HTTP {resp.status_code}: {resp.text}")
+            return [JiraIssueResult(key="", issue=None, error=error) for _ in chunk]
+
+        failed: dict[int, Exception] = {}
+        for entry in errors if isinstance(errors, list) else []:
+            if isinstance(entry, dict) and isinstance(entry.get("failedElementNumber"), int):
+                detail = entry.get("elementErrors") or entry.get("status")
+                failed[entry["failedElementNumber"]] = RuntimeError(
+                    f"Jira bulk create item failed: {detail}"
+                )
+
+        results: list[JiraIssueResult] = []
+        keys = iter(created)
+        for index, (summary, description, assignee) in enumerate(chunk):
+            if index in failed:
+                results.append(JiraIssueResult(key="", issue=None, error=failed[index]))
+                continue
+            entry = next(keys, None)
+            key = str(entry.get("key") or "") if isinstance(entry, dict) else ""
+            if not key:
+                error = RuntimeError("Jira bulk create returned no issue key")
+                results.append(JiraIssueResult(key="", issue=None, error=error))
+                continue
+            issue = self._created_issue(key, summary, description, assignee)
+            results.append(JiraIssueResult(key=key, issue=issue))
+        return results
+
+    def get_issue(
+        self,
+        issue_key: str,
+        *,
+        fields: Sequence[str] | None = _ISSUE_FIELDS,
+        expand: Sequence[str] = (),
+    ) -> JiraIssue:
+        """Get a Jira issue by key.
 
-    def get_issue(self, issue_key: str) -> JiraIssue:
-        """Get a Jira issue by key."""
-        resp = self._request("GET", f"/rest/api/3/issue/{issue_key}")
+        Args:
+            issue_key: Issue key, e.g. "PROJ-1".
+            fields: Fields to transfer (default: only those JiraIssue needs).
+                ``None`` requests the full representation.
+            expand: Optional ``expand`` entities (e.g. "renderedFields").
+        """
+        params: dict[str, str] = {}
+        if fields is not None:
+            params["fields"] = ",".join(fields)
+        if expand:
+            params["expand"] = ",".join(expand)
+        path = f"/rest/api/3/issue/{quote(issue_key, safe='')}"
+        if params:
+            path = f"{path}?{urlencode(params, safe=',')}"
+        resp = self._request("GET", path)
         if resp.status_code == 404:
             raise KeyError(issue_key)
         if resp.status_code >= 400:
             raise RuntimeError(f"Jira get_issue failed: HTTP {resp.status_code}: {resp.text}")
 
-        data = resp.json()
-        fields = data.get("fields", {}) if isinstance(data, dict) else {}
+        return parse_issue(resp.json(), issue_key)
 
-        summary = str(fields.get("summary") or "")
-        description = _extract_description_text(fields.get("description"))
+    def get_issues(self, keys: Sequence[str], *, max_concurrency: int = 8) -> list[JiraIssueResult]:
+        """Fetch many issues concurrently on the shared connection pool.
 
-        status_name = ""
-        status_field = fields.get("status")
-        if isinstance(status_field, dict):
-            status_name = str(status_field.get("name") or "")
+        Results are returned in input order, one per key; a failure for one key
+        (missing issue, HTTP or transport error, unparsable body) does not
+        affect the others.
 
-        assignee_account_id: str | None = None
-        assignee_field = fields.get("assignee")
-        if isinstance(assignee_field, dict) and isinstance(assignee_field.get("accountId"), str):
-            assignee_account_id = assignee_field["accountId"]
+        Args:
+            keys: Issue keys to fetch.
+            max_concurrency: Upper bound on in-flight requests (also capped by the
+                pool's ``max_connections``).
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be positive")
 
-        return JiraIssue(
-            key=str(data.get("key") or issue_key),
-            summary=summary,
-            description=description,
-            status_name=status_name,
-            assignee_account_id=assignee_account_id,
-        )
+        def fetch(key: str) -> JiraIssueResult:
+            try:
+                return JiraIssueResult(key=key, issue=self.get_issue(key))
+            except (KeyError, RuntimeError, ConnectionError, ValueError, httpx.HTTPError) as exc:
+                return JiraIssueResult(key=key, issue=None, error=exc)
+
+        if len(keys) <= 1:
+            return [fetch(key) for key in keys]
 
-    def search_issues(self, *, jql: str, max_results: int = 25) -> list[JiraIssue]:
-        """Search Jira issues by JQL."""
-        payload = {"jql": jql, "maxResults": max_results}
-        resp = self._request("POST", "/rest/api/3/search", json_body=payload)
+        workers = min(max_concurrency, self._max_connections, len(keys))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="jira-hydrate") as pool:
+            return list(pool.map(fetch, keys))
+
+    def search_issues(
+        self,
+        *,
+        jql: str,
+        max_results: int = 25,
+        hydrate_each: bool = False,
+    ) -> list[JiraIssue]:
+        """Search Jira issues by JQL.
+
+        The needed fields are requested in the search call itself, so a search is
+        a single round trip.
+
+        Args:
+            jql: JQL query.
+            max_results: Maximum number of issues to return.
+            hydrate_each: Legacy behaviour kept for comparison: ignore the search
+                payload and fetch every hit separately (N+1 requests, issued
+                concurrently via ``get_issues``).
+        """
+        payload: dict[str, Any] = {"jql": jql, "maxResults": max_results}
+        if not hydrate_each:
+            payload["fields"] = list(_ISSUE_FIELDS)
+        resp = self._request("POST", "/rest/api/3/search", json_body=payload, idempotent=True)
         if resp.status_code >= 400:
             raise RuntimeError(f"Jira search failed: HTTP {resp.status_code}: {resp.text}")
 
         data = resp.json()
-        issues = data.get("issues", []) if isinstance(data, dict) else []
+        raw = data.get("issues", []) if isinstance(data, dict) else []
+        issues = [
+            issue
+            for issue in raw
+            if isinstance(issue, dict) and isinstance(issue.get("key"), str) and issue["key"]
+        ]
+        if not hydrate_each:
+            return [parse_issue(issue) for issue in issues]
+
+        # Legacy path: fetch each full issue separately; vanished issues are skipped.
         results: list[JiraIssue] = []
-        for issue in issues:
-            if not isinstance(issue, dict):
-                continue
-            key = issue.get("key")
-            if isinstance(key, str) and key:
-                # Fetch full issue to normalize fields consistently.
-                try:
-                    results.append(self.get_issue(key))
-                except KeyError:
-                    continue
+        for result in self.get_issues([issue["key"] for issue in issues]):
+            if result.issue is not None:
+                results.append(result.issue)
+            elif not isinstance(result.error, KeyError) and result.error is not None:
+                raise result.error
         return results
 
+    def search_issues_page(
+        self,
+        *,
+        jql: str,
+        start_at: int = 0,
+        max_results: int = 50,
+    ) -> JiraSearchPage:
+        """Fetch one page of JQL search results (single round trip)."""
+        payload: dict[str, Any] = {
+            "jql": jql,
+            "startAt": start_at,
+            "maxResults": max_results,
+            "fields": list(_ISSUE_FIELDS),
+        }
+        resp = self._request("POST", "/rest/api/3/search", json_body=payload, idempotent=True)
+        if resp.status_code >= 400:
+            raise RuntimeError(f"Jira search failed: HTTP {resp.status_code}: {resp.text}")
+
+        data = resp.json()
+        raw = data.get("issues", []) if isinstance(data, dict) else []
+        if not isinstance(raw, list):
+            raw = []
+        issues = [
+            parse_issue(issue)
+            for issue in raw
+            if isinstance(issue, dict) and isinstance(issue.get("key"), str) and issue["key"]
+        ]
+
+        total = data.get("total") if isinstance(data, dict) else None
+        total = total if isinstance(total, int) else None
+        fetched = start_at + len(raw)
+        # Offsets advance by the raw page size so skipped entries are not refetched.
+        has_more = bool(raw) and (fetched < total if total is not None else len(raw) >= max_results)
+
+        return JiraSearchPage(
+            issues=issues,
+            start_at=start_at,
+            total=total,
+            next_start_at=fetched if has_more else None,
+        )
+
+    def count_issues(self, *, jql: str) -> int:
+        """Return how many issues match ``jql`` without transferring any of them.
+
+        Uses a total-only search (``maxResults=0``, no fields), so the cost does
+        not grow with the number of matches.
+        """
+        payload: dict[str, Any] = {"jql": jql, "maxResults": 0, "fields": []}
+        resp = self._request("POST", "/rest/api/3/search", json_body=payload, idempotent=True)
+        if resp.status_code >= 400:
+            raise RuntimeError(f"Jira count failed: HTTP {resp.status_code}: {resp.text}")
+
+        data = resp.json()
+        total = data.get("total") if isinstance(data, dict) else None
+        if not isinstance(total, int):
+            raise TypeError("Jira count returned no total")
+        return total
+
+    def count_by_status_category(self, *, jql: str, max_results: int = 1000) -> JiraStatusTally:
+        """Tally issues matching ``jql`` by status category in one search.
+
+        Only the ``status`` field is requested, so a page is cheap; Jira may cap
+        ``max_results``, which is reported through ``JiraStatusTally.complete``.
+        """
+        payload: dict[str, Any] = {"jql": jql, "maxResults": max_results, "fields": ["status"]}
+        resp = self._request("POST", "/rest/api/3/search", json_body=payload, idempotent=True)
+        if resp.status_code >= 400:
+            raise RuntimeError(f"Jira count failed: HTTP {resp.status_code}: {resp.text}")
+
+        data = resp.json()
+        total = data.get("total") if isinstance(data, dict) else None
+        if not isinstance(total, int):
+            raise TypeError("Jira count returned no total")
+        raw = data.get("issues")
+        issues = raw if isinstance(raw, list) else []
+
+        by_category: dict[str, int] = {}
+        for issue in issues:
+            fields = issue.get("fields") if isinstance(issue, dict) else None
+            status = fields.get("status") if isinstance(fields, dict) else None
+            category = status.get("statusCategory") if isinstance(status, dict) else None
+            key = category.get("key") if isinstance(category, dict) else None
+            if isinstance(key, str):
+                by_category[key] = by_category.get(key, 0) + 1
+        return JiraStatusTally(total=total, by_category=by_category, complete=len(issues) >= total)
+
     def update_issue_summary(self, *, issue_key: str, summary: str) -> JiraIssue:
         """Update the issue summary/title."""
         payload = {"fields": {"summary": summary}}
@@ -201,6 +732,44 @@ class JiraClient:
             raise RuntimeError(f"Jira update failed: HTTP {resp.status_code}: {resp.text}")
         return self.get_issue(issue_key)
 
+    def get_issue_transitions(self, issue_key: str) -> tuple[JiraIssue, list[JiraTransition]]:
+        """Get an issue together with the transitions available from its status.
+
+        Uses ``expand=transitions`` so the issue type and the transitions come
+        back in a single request.
+        """
+        params = urlencode({"fields": ",".join(_ISSUE_FIELDS), "expand": "transitions"}, safe=",")
+        resp = self._request("GET", f"/rest/api/3/issue/{quote(issue_key, safe='')}?{params}")
+        if resp.status_code == 404:
+            raise KeyError(issue_key)
+        if resp.status_code >= 400:
+            raise RuntimeError(f"Jira get transitions failed: HTTP {resp.status_code}: {resp.text}")
+
+        data = resp.json()
+        transitions = _parse_transitions(data.get("transitions") if isinstance(data, dict) else None)
+        return parse_issue(data, issue_key), transitions
+
+    def transition_issue(self, *, issue_key: str, transition_id: str) -> bool:
+        """Apply a workflow transition.
+
+        Returns:
+            False if Jira rejected the transition id for the issue's current
+            status (HTTP 400/409), True once applied.
+        """
+        payload = {"transition": {"id": transition_id}}
+        resp = self._request(
+            "POST",
+            f"/rest/api/3/issue/{quote(issue_key, safe='')}/transitions",
+            json_body=payload,
+        )
+        if resp.status_code == 404:
+            raise KeyError(issue_key)
+        if resp.status_code in {400, 409}:
+            return False
+        if resp.status_code >= 400:
+            raise RuntimeError(f"Jira transition failed: HTTP {resp.status_code}: {resp.text}")
+        return True
+
     def delete_issue(self, issue_key: str) -> bool:
         """Delete an issue by key."""
         resp = self._request("DELETE", f"/rest/api/3/issue/{issue_key}")
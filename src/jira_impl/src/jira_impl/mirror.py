@@ -0,0 +1,421 @@
+# src/jira_impl/src/jira_impl/mirror.py
+"""Local SQLite read replica of a Jira project.
+
+This module is responsible for:
+- Storing mirrored tickets in SQLite, indexed by status, assignee and updated time.
+- Incrementally syncing from Jira with relative ``updated >= "-Nm"`` JQL
+  (paginated), plus periodic full syncs that drop tickets deleted in Jira.
+- Serving get_ticket/search_tickets locally within a staleness bound, while
+  writes still go to Jira (and are written through to the mirror).
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable, Sequence
+from datetime import datetime
+
+from tickets_api.client import (
+    Ticket,
+    TicketCreateResult,
+    TicketInterface,
+    TicketSpec,
+    TicketStats,
+    TicketStatus,
+)
+
+from jira_impl.impl import JiraTicket, JiraTicketClient, map_status
+from jira_impl.jira_client import JiraIssue
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tickets (
+    id          TEXT PRIMARY KEY,
+    title       TEXT NOT NULL,
+    description TEXT NOT NULL,
+    status      TEXT NOT NULL,
+    assignee    TEXT,
+    updated     REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tickets_status   ON tickets (status);
+CREATE INDEX IF NOT EXISTS idx_tickets_assignee ON tickets (assignee);
+CREATE INDEX IF NOT EXISTS idx_tickets_updated  ON tickets (updated);
+CREATE TABLE IF NOT EXISTS sync_state (
+    name  TEXT PRIMARY KEY,
+    value REAL NOT NULL
+);
+"""
+
+_UPSERT = """
+INSERT INTO tickets (id, title, description, status, assignee, updated)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT (id) DO UPDATE SET
+    title = excluded.title,
+    description = excluded.description,
+    status = excluded.status,
+    assignee = excluded.assignee,
+    updated = excluded.updated
+"""
+
+_COLUMNS = "id, title, description, status, assignee"
+
+# Jira timestamps look like 2024-05-01T10:20:30.123+0000.
+_JIRA_TIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%f%z"
+
+
+def _relative_since(watermark: float, overlap_seconds: float) -> str:
+    """JQL ``updated >=`` operand reaching back to ``overlap_seconds`` before the watermark.
+
+    Absolute JQL dates are read in the Jira user's timezone; a relative offset
+    ("-15m") is measured from the server's current time, so it needs no
+    timezone. Offsets are whole minutes, rounded up.
+    """
+    minutes = int((time.time() - watermark + overlap_seconds) // 60) + 1
+    return f"-{max(minutes, 1)}m"
+
+
+def _parse_jira_time(value: str | None) -> float | None:
+    """Parse a Jira ``updated`` timestamp into epoch seconds (None if unparsable)."""
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, _JIRA_TIME_FORMAT).timestamp()
+    except ValueError:
+        return None
+
+
+def _row_to_ticket(row: tuple[str, str, str, str, str | None]) -> JiraTicket:
+    return JiraTicket(
+        _id=row[0],
+        _title=row[1],
+        _description=row[2],
+        _status=TicketStatus(row[3]),
+        _assignee=row[4],
+    )
+
+
+def _escape_like(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _filter(query: str | None, status: TicketStatus | None) -> tuple[str, list[str]]:
+    """Build the WHERE clause (and params) shared by search and count."""
+    clauses: list[str] = []
+    params: list[str] = []
+    if status is not None:
+        clauses.append("status = ?")
+        params.append(status.value)
+    if query and query.strip():
+        pattern = f"%{_escape_like(query.strip())}%"
+        clauses.append("(title LIKE ? ESCAPE '\\' OR description LIKE ? ESCAPE '\\')")
+        params.extend([pattern, pattern])
+    where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+    return where, params
+
+
+class TicketMirror:
+    """SQLite store of mirrored tickets plus the sync watermark."""
+
+    def __init__(self, path: str = ":memory:") -> None:
+        """Open (and create if needed) the mirror database at ``path``."""
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            if path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def get(self, ticket_id: str) -> JiraTicket | None:
+        """Return a mirrored ticket by id."""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM tickets WHERE id = ?", (ticket_id,)
+            ).fetchone()
+        return _row_to_ticket(row) if row else None
+
+    def search(self, query: str | None = None, status: TicketStatus | None = None) -> list[JiraTicket]:
+        """Return mirrored tickets matching a substring and/or status, newest first."""
+        where, params = _filter(query, status)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM tickets{where} ORDER BY updated DESC, id", params
+            ).fetchall()
+        return [_row_to_ticket(row) for row in rows]
+
+    def count(self, query: str | None = None, status: TicketStatus | None = None) -> int:
+        """Return the number of mirrored tickets matching the same filters as ``search``."""
+        where, params = _filter(query, status)
+        with self._lock:
+            return int(self._conn.execute(f"SELECT COUNT(*) FROM tickets{where}", params).fetchone()[0])
+
+    def status_counts(self) -> dict[TicketStatus, int]:
+        """Return ticket counts for every status (zero when absent)."""
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM tickets GROUP BY status").fetchall()
+        counts = dict.fromkeys(TicketStatus, 0)
+        for status, count in rows:
+            counts[TicketStatus(status)] = int(count)
+        return counts
+
+    def upsert_issues(self, issues: Iterable[JiraIssue]) -> float | None:
+        """Insert or replace issues in one transaction; return their max updated time."""
+        rows = []
+        newest: float | None = None
+        for issue in issues:
+            updated = _parse_jira_time(issue.updated)
+            if updated is not None:
+                newest = updated if newest is None else max(newest, updated)
+            rows.append(
+                (
+                    issue.key,
+                    issue.summary,
+                    issue.description,
+                    map_status(issue.status_name).value,
+                    issue.assignee_account_id,
+                    updated if updated is not None else time.time(),
+                )
+            )
+        with self._lock, self._conn:
+            self._conn.executemany(_UPSERT, rows)
+        return newest
+
+    def upsert_ticket(self, ticket: Ticket) -> None:
+        """Write a ticket returned by a Jira write through to the mirror."""
+        row = (ticket.id, ticket.title, ticket.description, ticket.status.value, ticket.assignee, time.time())
+        with self._lock, self._conn:
+            self._conn.execute(_UPSERT, row)
+
+    def delete(self, ticket_ids: Iterable[str]) -> None:
+        """Remove tickets from the mirror."""
+        with self._lock, self._conn:
+            self._conn.executemany("DELETE FROM tickets WHERE id = ?", [(i,) for i in ticket_ids])
+
+    def retain_only(self, ticket_ids: set[str]) -> int:
+        """Delete every mirrored ticket not in ``ticket_ids``; return how many."""
+        with self._lock:
+            existing = {row[0] for row in self._conn.execute("SELECT id FROM tickets")}
+        stale = existing - ticket_ids
+        self.delete(stale)
+        return len(stale)
+
+    def watermark(self) -> float | None:
+        """Return the newest Jira ``updated`` time synced so far (epoch seconds)."""
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM sync_state WHERE name = 'watermark'").fetchone()
+        return float(row[0]) if row else None
+
+    def set_watermark(self, value: float) -> None:
+        """Persist the sync watermark."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO sync_state (name, value) VALUES ('watermark', ?) "
+                "ON CONFLICT (name) DO UPDATE SET value = excluded.value",
+                (value,),
+            )
+
+
+class MirroredTicketClient(TicketInterface):
+    """TicketInterface that reads from a local mirror and writes to Jira.
+
+    Reads sync first when the mirror is older than ``max_staleness_seconds``;
+    ``start()`` keeps it fresh from a background thread instead.
+    """
+
+    def __init__(
+        self,
+        jira: JiraTicketClient,
+        mirror: TicketMirror,
+        *,
+        max_staleness_seconds: float = 30.0,
+        overlap_seconds: float = 120.0,
+        page_size: int = 100,
+    ) -> None:
+        """Initialize the mirrored client.
+
+        Args:
+            jira: Client used for writes, sync and mirror misses.
+            mirror: Local store.
+            max_staleness_seconds: Oldest mirror state a read may be served from.
+            overlap_seconds: How far before the watermark each incremental sync
+                starts. Covers minute-precision JQL offsets, clock skew between
+                this host and Jira, and issues indexed late by Jira.
+            page_size: Issues per Jira search page during sync.
+        """
+        self._jira = jira
+        self._mirror = mirror
+        self._max_staleness = max_staleness_seconds
+        self._overlap = overlap_seconds
+        self._page_size = page_size
+        self._sync_lock = threading.Lock()
+        self._last_sync: float | None = None
+        self._last_full_sync: float | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    # -------------------------
+    # Sync
+    # -------------------------
+
+    def sync(self, *, full: bool = False) -> int:
+        """Pull issues changed since the watermark into the mirror.
+
+        A full sync (also used when no watermark exists yet) walks the whole
+        project and drops mirrored tickets that no longer exist in Jira. An
+        incremental sync cannot see deletions; ``start()`` schedules full
+        syncs for that.
+
+        Returns:
+            The number of issues fetched from Jira.
+        """
+        with self._sync_lock:
+            return self._sync_locked(full=full)
+
+    def _sync_locked(self, *, full: bool) -> int:
+        started = time.monotonic()
+        watermark = None if full else self._mirror.watermark()
+        since = None if watermark is None else _relative_since(watermark, self._overlap)
+
+        fetched = 0
+        seen: set[str] = set()
+        newest = watermark
+        batch: list[JiraIssue] = []
+        for issue in self._jira.iter_issues_updated_since(since, page_size=self._page_size):
+            batch.append(issue)
+            seen.add(issue.key)
+            if len(batch) >= self._page_size:
+                newest = self._apply(batch, newest)
+                fetched += len(batch)
+                batch = []
+        if batch:
+            newest = self._apply(batch, newest)
+            fetched += len(batch)
+
+        if watermark is None:
+            self._mirror.retain_only(seen)
+            self._last_full_sync = started
+        if newest is not None:
+            self._mirror.set_watermark(newest)
+        self._last_sync = started
+        return fetched
+
+    def _apply(self, batch: list[JiraIssue], newest: float | None) -> float | None:
+        batch_newest = self._mirror.upsert_issues(batch)
+        if batch_newest is None:
+            return newest
+        return batch_newest if newest is None else max(newest, batch_newest)
+
+    def start(self, interval_seconds: float = 10.0, full_sync_interval_seconds: float = 3600.0) -> None:
+        """Keep the mirror fresh from a background thread.
+
+        Syncs incrementally every ``interval_seconds``. The first sync, and one
+        every ``full_sync_interval_seconds`` after it, is a full sync, so
+        issues deleted directly in Jira also leave the mirror.
+        """
+        if self._thread is not None:
+            return
+        self._stop.clear()
+
+        def loop() -> None:
+            while not self._stop.is_set():
+                last_full = self._last_full_sync
+                full = last_full is None or time.monotonic() - last_full >= full_sync_interval_seconds
+                try:
+                    self.sync(full=full)
+                except (RuntimeError, ConnectionError):
+                    pass  # reads fall back to inline sync once the mirror goes stale
+                self._stop.wait(interval_seconds)
+
+        self._thread = threading.Thread(target=loop, name="jira-mirror-sync", daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        """Stop background sync and release resources."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._mirror.close()
+        self._jira.close()
+
+    def staleness_seconds(self) -> float | None:
+        """Seconds since the last successful sync started (None if never synced)."""
+        if self._last_sync is None:
+            return None
+        return time.monotonic() - self._last_sync
+
+    def _is_fresh(self) -> bool:
+        staleness = self.staleness_seconds()
+        return staleness is not None and staleness <= self._max_staleness
+
+    def _ensure_fresh(self) -> None:
+        """Sync inline when the mirror is stale.
+
+        Readers that find it stale queue on the sync lock. Each checks again
+        once it holds the lock, so only the first one runs the sync and the
+        others read what it fetched.
+        """
+        if self._is_fresh():
+            return
+        with self._sync_lock:
+            if not self._is_fresh():
+                self._sync_locked(full=False)
+
+    # -------------------------
+    # Reads (local)
+    # -------------------------
+
+    def get_ticket(self, ticket_id: str) -> Ticket | None:
+        self._ensure_fresh()
+        mirrored = self._mirror.get(ticket_id)
+        if mirrored is not None:
+            return mirrored
+        # Created after the last sync (or never existed): ask Jira once.
+        ticket = self._jira.get_ticket(ticket_id)
+        if ticket is not None:
+            self._mirror.upsert_ticket(ticket)
+        return ticket
+
+    def search_tickets(self, query: str | None = None, status: TicketStatus | None = None) -> list[Ticket]:
+        self._ensure_fresh()
+        return list(self._mirror.search(query, status))
+
+    def count_tickets(self, query: str | None = None, status: TicketStatus | None = None) -> int:
+        self._ensure_fresh()
+        return self._mirror.count(query, status)
+
+    def ticket_stats(self) -> TicketStats:
+        self._ensure_fresh()
+        by_status = self._mirror.status_counts()
+        return TicketStats(total=sum(by_status.values()), by_status=by_status)
+
+    # -------------------------
+    # Writes (Jira, then mirror)
+    # -------------------------
+
+    def create_ticket(self, title: str, description: str, assignee: str | None = None) -> Ticket:
+        ticket = self._jira.create_ticket(title, description, assignee)
+        self._mirror.upsert_ticket(ticket)
+        return ticket
+
+    def create_tickets(self, specs: Sequence[TicketSpec]) -> list[TicketCreateResult]:
+        results = self._jira.create_tickets(specs)
+        for result in results:
+            if result.ticket is not None:
+                self._mirror.upsert_ticket(result.ticket)
+        return results
+
+    def update_ticket(self, ticket_id: str, status: TicketStatus | None = None, title: str | None = None) -> Ticket:
+        ticket = self._jira.update_ticket(ticket_id, status=status, title=title)
+        self._mirror.upsert_ticket(ticket)
+        return ticket
+
+    def delete_ticket(self, ticket_id: str) -> bool:
+        deleted = self._jira.delete_ticket(ticket_id)
+        self._mirror.delete([ticket_id])
+        return deleted
@@ -0,0 +1,82 @@
+# src/jira_impl/src/jira_impl/retry.py
+"""Retry policy for Jira REST calls.
+
+A policy decides whether a failed attempt may be retried and how long to wait.
+Retries are idempotency-aware:
+- Idempotent calls (GET/PUT/DELETE, read-only POST searches) are retried on
+  transport errors and on retryable statuses (429/502/503/504)
+- Non-idempotent POSTs are retried only when Jira cannot have acted on them: a
+  429 (rejected by the rate limiter) or a failure to open the connection
+
+Waits use exponential backoff with full jitter. A server ``Retry-After`` takes
+precedence, and every call has a total time budget that no wait may exceed.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Transport failures raised before any request bytes reached Jira.
+_NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """Backoff settings for JiraClient (``max_retries=0`` disables retries)."""
+
+    max_retries: int = 3
+    base_delay_seconds: float = 0.5
+    max_delay_seconds: float = 8.0
+    budget_seconds: float = 30.0
+    retry_statuses: frozenset[int] = frozenset({429, 502, 503, 504})
+    jitter: bool = True
+
+    def __post_init__(self) -> None:
+        if self.max_retries < 0:
+            raise ValueError("max_retries must be >= 0")
+        if self.base_delay_seconds < 0 or self.max_delay_seconds < 0 or self.budget_seconds < 0:
+            raise ValueError("retry delays and budget must be >= 0")
+
+    def should_retry_status(self, status_code: int, *, idempotent: bool) -> bool:
+        """Whether a response status may be retried for this kind of call."""
+        if status_code not in self.retry_statuses:
+            return False
+        return idempotent or status_code == 429
+
+    def should_retry_error(self, exc: BaseException, *, idempotent: bool) -> bool:
+        """Whether a transport error may be retried for this kind of call."""
+        if not isinstance(exc, httpx.TransportError):
+            return False
+        return idempotent or isinstance(exc, _NOT_SENT_ERRORS)
+
+    def backoff(self, retry_number: int, retry_after: float | None = None) -> float:
+        """Delay before retry ``retry_number`` (1-based)."""
+        if retry_after is not None:
+            return max(0.0, retry_after)
+        ceiling = min(self.max_delay_seconds, self.base_delay_seconds * (2 ** (retry_number - 1)))
+        return random.uniform(0, ceiling) if self.jitter else ceiling
+
+
+def parse_retry_after(value: str | None, *, now: float | None = None) -> float | None:
+    """Parse a ``Retry-After`` header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        return None
+    return max(0.0, when.timestamp() - (time.time() if now is None else now))
@@ -0,0 +1,89 @@
+# src/jira_impl/src/jira_impl/transitions.py
+"""Cache of Jira workflow transition ids.
+
+Jira moves an issue between statuses only through workflow transitions, and
+transition ids are defined per workflow, i.e. per (project, issue type). This
+cache learns "target status -> transition id" for each workflow the
+first time it is seen, and remembers the issue type of recently seen issues,
+so a status change normally needs just the transition POST.
+
+Entries expire after ``ttl_seconds``. A rejected transition also invalidates
+its workflow (see JiraTicketClient.update_ticket), so edited workflows are
+picked up without waiting for the TTL.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+
+from tickets_api.client import TicketStatus
+
+
+class TransitionCache:
+    """Thread-safe, TTL-bounded transition-id map per (project, issue type)."""
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = 3600.0,
+        max_issues: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive")
+        self._ttl = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._workflows: dict[tuple[str, str], tuple[float, dict[TicketStatus, str]]] = {}
+        self._issue_types: OrderedDict[str, str] = OrderedDict()
+        self._max_issues = max_issues
+
+    def transition_id(self, project_key: str, issue_type: str, status: TicketStatus) -> str | None:
+        """Return the cached transition id into ``status``, or None on miss/expiry."""
+        key = (project_key, issue_type)
+        with self._lock:
+            entry = self._workflows.get(key)
+            if entry is None:
+                return None
+            learned_at, ids = entry
+            if self._clock() - learned_at >= self._ttl:
+                del self._workflows[key]
+                return None
+            return ids.get(status)
+
+    def learn(self, project_key: str, issue_type: str, ids: Mapping[TicketStatus, str]) -> None:
+        """Merge target-status -> transition-id pairs seen on an issue.
+
+        The transitions offered depend on the issue's current status, so maps
+        learned from different statuses are merged; the newest id wins.
+        """
+        key = (project_key, issue_type)
+        with self._lock:
+            now = self._clock()
+            entry = self._workflows.get(key)
+            merged = dict(entry[1]) if entry and now - entry[0] < self._ttl else {}
+            merged.update(ids)
+            self._workflows[key] = (now, merged)
+
+    def invalidate(self, project_key: str, issue_type: str) -> None:
+        """Forget a workflow's map (e.g. after Jira rejected a cached id)."""
+        with self._lock:
+            self._workflows.pop((project_key, issue_type), None)
+
+    def issue_type(self, issue_key: str) -> str | None:
+        """Return the remembered issue type for an issue key, if any."""
+        with self._lock:
+            return self._issue_types.get(issue_key)
+
+    def remember_issue_type(self, issue_key: str, issue_type: str | None) -> None:
+        """Remember an issue's type (bounded, least recently stored evicted first)."""
+        if not issue_type:
+            return
+        with self._lock:
+            self._issue_types[issue_key] = issue_type
+            self._issue_types.move_to_end(issue_key)
+            while len(self._issue_types) > self._max_issues:
+                self._issue_types.popitem(last=False)
@@ -0,0 +1,107 @@
+"""Tests for the iterative ADF-to-text extractor."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from jira_impl.adf import adf_to_text
+from jira_impl.jira_client import _extract_description_text
+
+
+def _t(text: str) -> dict[str, Any]:
+    return {"type": "text", "text": text}
+
+
+def _p(*content: dict[str, Any]) -> dict[str, Any]:
+    return {"type": "paragraph", "content": list(content)}
+
+
+def _li(*content: dict[str, Any]) -> dict[str, Any]:
+    return {"type": "listItem", "content": list(content)}
+
+
+@pytest.mark.unit
+def test_paragraphs_headings_and_inline_nodes() -> None:
+    doc = {
+        "type": "doc",
+        "content": [
+            {"type": "heading", "attrs": {"level": 1}, "content": [_t("Title")]},
+            _p(_t("Hello "), {"type": "text", "text": "world", "marks": [{"type": "strong"}]}),
+            _p(_t("a"), {"type": "hardBreak"}, _t("b")),
+            _p({"type": "mention", "attrs": {"text": "@bob"}}, _t(" see "), {"type": "inlineCard", "attrs": {"url": "https://x"}}),
+        ],
+    }
+
+    assert adf_to_text(doc) == "Title\nHello world\na\nb\n@bob see https://x"
+
+
+@pytest.mark.unit
+def test_nested_lists_are_prefixed_and_indented() -> None:
+    doc = {
+        "type": "doc",
+        "content": [
+            {
+                "type": "bulletList",
+                "content": [
+                    _li(_p(_t("one"))),
+                    _li(
+                        _p(_t("two")),
+                        {"type": "orderedList", "attrs": {"order": 3}, "content": [_li(_p(_t("a"))), _li(_p(_t("b")))]},
+                    ),
+                ],
+            }
+        ],
+    }
+
+    assert adf_to_text(doc) == "- one\n- two\n  3. a\n  4. b"
+
+
+@pytest.mark.unit
+def test_code_blocks_and_tables() -> None:
+    cell = lambda kind, *ps: {"type": kind, "content": list(ps)}
+    doc = {
+        "type": "doc",
+        "content": [
+            {"type": "codeBlock", "attrs": {"language": "python"}, "content": [_t("x = 1\ny = 2")]},
+            {
+                "type": "table",
+                "content": [
+                    {"type": "tableRow", "content": [cell("tableHeader", _p(_t("H1"))), cell("tableHeader", _p(_t("H2")), _p(_t("more")))]},
+                    {"type": "tableRow", "content": [cell("tableCell", _p(_t("c1"))), cell("tableCell", _p(_t("c2")))]},
+                ],
+            },
+        ],
+    }
+
+    assert adf_to_text(doc) == "x = 1\ny = 2\nH1 | H2 more\nc1 | c2"
+
+
+@pytest.mark.unit
+def test_deep_nesting_does_not_recurse() -> None:
+    doc: dict[str, Any] = {"type": "doc", "content": []}
+    node = doc
+    for i in range(5000):
+        nested = {"type": "bulletList", "content": [_li(_p(_t(f"L{i}")))]}
+        node["content"].append(nested)
+        node = nested["content"][0]
+
+    lines = adf_to_text(doc).splitlines()
+
+    assert len(lines) == 5000
+    assert lines[-1].endswith("- L4999")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (None, ""),
+        ("plain", "plain"),
+        (42, ""),
+        ({"content": "nope"}, ""),
+        ({"content": [{"content": [{"text": "desc"}]}, "junk", {"content": [{"text": "  "}]}]}, "desc"),
+    ],
+)
+def test_extract_description_is_conservative(value: Any, expected: str) -> None:
+    assert _extract_description_text(value) == expected
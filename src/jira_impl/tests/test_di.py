@@ -2,15 +2,47 @@
 
 from __future__ import annotations
 
+import threading
+import time
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+import jira_impl
 from tickets_api import client as tickets_api_client
 
+if TYPE_CHECKING:
+    import pytest
+
 
 def test_importing_jira_impl_registers_dependency_injection() -> None:
     """Importing jira_impl should register a Jira-backed get_client hook."""
-    import jira_impl  # noqa: F401
-
     # Do NOT call get_client(); constructor requires real env vars.
     get_client = tickets_api_client.get_client
 
     assert callable(get_client)
     assert get_client.__name__ == "_get_jira_client"
+
+
+def test_concurrent_first_calls_build_one_client(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Racing first callers share a single lazily built client."""
+    built: list[object] = []
+
+    class _SlowClient:
+        def __init__(self, cfg: object) -> None:
+            _ = cfg
+            time.sleep(0.05)
+            built.append(self)
+
+    monkeypatch.setattr(jira_impl, "_client", None)
+    monkeypatch.setattr(jira_impl, "JiraTicketClient", _SlowClient)
+    monkeypatch.setattr(jira_impl.JiraConfig, "from_env", staticmethod(lambda: SimpleNamespace(mirror_path=None)))
+
+    results: list[object] = []
+    threads = [threading.Thread(target=lambda: results.append(jira_impl._get_jira_client())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(built) == 1
+    assert all(result is built[0] for result in results)
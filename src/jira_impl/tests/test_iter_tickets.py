@@ -0,0 +1,114 @@
+"""Tests for JiraTicketClient.iter_tickets pagination (no network)."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from jira_impl.impl import JiraTicketClient
+from jira_impl.jira_client import JiraIssue, JiraSearchPage
+from jira_impl.transitions import TransitionCache
+from tickets_api.client import TicketStatus
+
+
+class _PagedJiraClient:
+    """Serves ``total`` issues in pages and records every request."""
+
+    def __init__(self, total: int) -> None:
+        self.total = total
+        self.calls: list[tuple[str, int, int]] = []
+
+    def search_issues_page(self, *, jql: str, start_at: int = 0, max_results: int = 50) -> JiraSearchPage:
+        self.calls.append((jql, start_at, max_results))
+        end = min(start_at + max_results, self.total)
+        issues = [
+            JiraIssue(key=f"PROJ-{i}", summary=f"T{i}", description="", status_name="To Do", assignee_account_id=None)
+            for i in range(start_at, end)
+        ]
+        return JiraSearchPage(
+            issues=issues,
+            start_at=start_at,
+            total=self.total,
+            next_start_at=end if end < self.total else None,
+        )
+
+
+def _make_client(jira: _PagedJiraClient) -> JiraTicketClient:
+    client = object.__new__(JiraTicketClient)
+    client._project_key = "PROJ"  # type: ignore[attr-defined]
+    client._transitions = TransitionCache()  # type: ignore[attr-defined]
+    client._jira = jira  # type: ignore[attr-defined]
+    return client  # type: ignore[return-value]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("prefetch", [False, True])
+def test_iter_tickets_walks_every_page(prefetch: bool) -> None:
+    jira = _PagedJiraClient(total=23)
+    client = _make_client(jira)
+
+    tickets = list(client.iter_tickets(query="x", status=TicketStatus.OPEN, page_size=10, prefetch=prefetch))
+
+    assert [t.id for t in tickets] == [f"PROJ-{i}" for i in range(23)]
+    assert [start for _, start, _ in jira.calls] == [0, 10, 20]
+    jql = jira.calls[0][0]
+    assert 'statusCategory = "To Do"' in jql
+    assert jql.endswith("ORDER BY created ASC, key ASC")
+
+
+@pytest.mark.unit
+def test_iter_tickets_is_lazy() -> None:
+    jira = _PagedJiraClient(total=100)
+    client = _make_client(jira)
+
+    it = client.iter_tickets(page_size=10)
+    assert jira.calls == []
+
+    first = [next(it) for _ in range(10)]
+    assert len(first) == 10
+    assert len(jira.calls) == 1
+
+
+@pytest.mark.unit
+def test_iter_tickets_prefetches_one_page_ahead() -> None:
+    jira = _PagedJiraClient(total=100)
+    client = _make_client(jira)
+
+    it = client.iter_tickets(page_size=10, prefetch=True)
+    next(it)
+    deadline = time.monotonic() + 2.0
+    while len(jira.calls) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    it.close()
+
+    # The second page was requested before the first was consumed, no further.
+    assert [start for _, start, _ in jira.calls] == [0, 10]
+
+
+@pytest.mark.unit
+def test_iter_tickets_empty_result() -> None:
+    client = _make_client(_PagedJiraClient(total=0))
+
+    assert list(client.iter_tickets()) == []
+
+
+@pytest.mark.unit
+def test_iter_tickets_rejects_bad_page_size() -> None:
+    client = _make_client(_PagedJiraClient(total=1))
+
+    with pytest.raises(ValueError):
+        list(client.iter_tickets(page_size=0))
+
+
+@pytest.mark.unit
+def test_iter_issues_updated_since_orders_by_updated() -> None:
+    jira = _PagedJiraClient(total=3)
+    client = _make_client(jira)
+
+    keys = [i.key for i in client.iter_issues_updated_since("2024/05/01 10:28", page_size=2)]
+
+    assert keys == ["PROJ-0", "PROJ-1", "PROJ-2"]
+    assert jira.calls[0][0] == (
+        'project = "PROJ" AND updated >= "2024/05/01 10:28" ORDER BY updated ASC, key ASC'
+    )
@@ -5,8 +5,11 @@ These tests exercise higher-level JiraClient methods while mocking
 the underlying HTTP transport. No production code is modified.
 """
 
+import threading
+import time
 from unittest.mock import Mock, patch
 
+import httpx
 import pytest
 
 from jira_impl.jira_client import JiraClient, JiraIssue
@@ -85,16 +88,52 @@ def test_create_issue_success() -> None:
         },
     }
 
-    with patch.object(client, "_request", side_effect=[create_resp, get_resp]):
+    with patch.object(client, "_request", side_effect=[create_resp, get_resp]) as request:
         issue = client.create_issue(
             project_key="TEST",
             summary="Created",
             description="desc",
             assignee_account_id=None,
         )
+        assert request.call_count == 1
 
-    assert issue.key == "NEW-1"
-    assert issue.summary == "Created"
+        assert issue.key == "NEW-1"
+        assert issue.summary == "Created"
+        assert issue.description == "desc"
+        assert issue.status_name == ""
+
+        hydrated = issue.hydrated()
+        assert issue.hydrated() is hydrated
+        assert request.call_count == 2
+
+    assert hydrated.status_name == "Open"
+
+
+@pytest.mark.unit
+def test_create_issue_hydrate_fetches_server_view() -> None:
+    client = JiraClient(
+        base_url="https://example.atlassian.net",
+        email="user@example.com",
+        api_token="fake-token",
+    )
+
+    create_resp = Mock(status_code=201)
+    create_resp.json.return_value = {"key": "NEW-2"}
+    get_resp = Mock(status_code=200)
+    get_resp.json.return_value = {"key": "NEW-2", "fields": {"summary": "Created", "status": {"name": "Backlog"}}}
+
+    with patch.object(client, "_request", side_effect=[create_resp, get_resp]) as request:
+        issue = client.create_issue(
+            project_key="TEST",
+            summary="Created",
+            description="desc",
+            assignee_account_id=None,
+            hydrate=True,
+        )
+
+    assert request.call_count == 2
+    assert issue.status_name == "Backlog"
+    assert issue.hydrated() is issue
 
 
 @pytest.mark.unit
@@ -116,3 +155,256 @@ def test_delete_issue_success_and_not_found() -> None:
 
     with patch.object(client, "_request", return_value=not_found_resp):
         assert client.delete_issue("DEL-2") is False
+
+
+@pytest.mark.unit
+def test_search_issues_is_single_round_trip() -> None:
+    client = JiraClient(
+        base_url="https://example.atlassian.net",
+        email="user@example.com",
+        api_token="fake-token",
+    )
+
+    search_resp = Mock()
+    search_resp.status_code = 200
+    search_resp.json.return_value = {
+        "issues": [
+            {
+                "key": "S-1",
+                "fields": {
+                    "summary": "First",
+                    "description": {"content": [{"content": [{"text": "body"}]}]},
+                    "status": {"name": "Done"},
+                    "assignee": {"accountId": "acc-1"},
+                },
+            },
+            {"key": "S-2", "fields": {"summary": "Second", "assignee": None}},
+            {"fields": {"summary": "no key"}},
+        ]
+    }
+
+    with patch.object(client, "_request", return_value=search_resp) as request:
+        issues = client.search_issues(jql="project = S", max_results=10)
+
+    request.assert_called_once()
+    payload = request.call_args.kwargs["json_body"]
+    assert payload["fields"] == ["summary", "description", "status", "assignee", "updated", "issuetype"]
+    assert issues == [
+        JiraIssue("S-1", "First", "body", "Done", "acc-1"),
+        JiraIssue("S-2", "Second", "", "", None),
+    ]
+
+
+@pytest.mark.unit
+def test_search_issues_hydrate_each_keeps_legacy_fan_out() -> None:
+    client = JiraClient(
+        base_url="https://example.atlassian.net",
+        email="user@example.com",
+        api_token="fake-token",
+    )
+
+    search_resp = Mock()
+    search_resp.status_code = 200
+    search_resp.json.return_value = {"issues": [{"key": "S-1"}, {"key": "S-2"}]}
+    hydrated = JiraIssue("S-1", "Full", "", "To Do", None)
+
+    def get_issue(key: str) -> JiraIssue:
+        if key == "S-2":
+            raise KeyError(key)
+        return hydrated
+
+    with (
+        patch.object(client, "_request", return_value=search_resp) as request,
+        patch.object(client, "get_issue", side_effect=get_issue),
+    ):
+        issues = client.search_issues(jql="project = S", hydrate_each=True)
+
+    assert "fields" not in request.call_args.kwargs["json_body"]
+    assert issues == [hydrated]
+
+
+@pytest.mark.unit
+def test_search_issues_page_reports_next_offset() -> None:
+    client = JiraClient(
+        base_url="https://example.atlassian.net",
+        email="user@example.com",
+        api_token="fake-token",
+    )
+
+    page_resp = Mock()
+    page_resp.status_code = 200
+    page_resp.json.return_value = {
+        "startAt": 0,
+        "total": 3,
+        "issues": [{"key": "P-1", "fields": {"summary": "a"}}, {"fields": {}}],
+    }
+    last_resp = Mock()
+    last_resp.status_code = 200
+    last_resp.json.return_value = {"total": 3, "issues": [{"key": "P-3", "fields": {}}]}
+
+    with patch.object(client, "_request", side_effect=[page_resp, last_resp]) as request:
+        first = client.search_issues_page(jql="project = P", start_at=0, max_results=2)
+        second = client.search_issues_page(jql="project = P", start_at=2, max_results=2)
+
+    assert request.call_args_list[0].kwargs["json_body"]["startAt"] == 0
+    assert [i.key for i in first.issues] == ["P-1"]
+    assert first.next_start_at == 2
+    assert [i.key for i in second.issues] == ["P-3"]
+    assert second.next_start_at is None
+
+
+@pytest.mark.unit
+def test_get_issues_preserves_order_and_reports_failures() -> None:
+    client = JiraClient(
+        base_url="https://example.atlassian.net",
+        email="user@example.com",
+        api_token="fake-token",
+    )
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def get_issue(key: str) -> JiraIssue:
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        try:
+            number = int(key.split("-")[1])
+            time.sleep(0.02 * (number % 3))  # finish out of order
+            if key == "K-4":
+                raise KeyError(key)
+            if key == "K-5":
+                raise ValueError("Expecting value: line 1 column 1 (char 0)")  # non-JSON body
+            if key == "K-6":
+                raise httpx.ReadTimeout("timed out")
+            if key == "K-7":
+                raise RuntimeError("Jira get_issue failed: HTTP 500")
+            return JiraIssue(key, f"S{number}", "", "To Do", None)
+        finally:
+            with lock:
+                in_flight -= 1
+
+    keys = [f"K-{i}" for i in range(12)]
+    with patch.object(client, "get_issue", side_effect=get_issue):
+        results = client.get_issues(keys, max_concurrency=4)
+
+    assert [r.key for r in results] == keys
+    assert 1 < peak <= 4
+    failed = {r.key: type(r.error) for r in results if not r.ok}
+    assert failed == {
+        "K-4": KeyError,
+        "K-5": ValueError,
+        "K-6": httpx.ReadTimeout,
+        "K-7": RuntimeError,
+    }
+    assert results[0].issue is not None and results[0].issue.summary == "S0"
+
+
+@pytest.mark.unit
+def test_create_issues_chunks_and_maps_per_item_results() -> None:
+    client = JiraClient(
+        base_url="https://example.atlassian.net",
+        email="user@example.com",
+        api_token="fake-token",
+    )
+
+    first = Mock()
+    first.status_code = 201
+    first.json.return_value = {
+        "issues": [{"key": "B-1"}],
+        "errors": [{"status": 400, "elementErrors": {"errors": {"summary": "bad"}}, "failedElementNumber": 1}],
+    }
+    second = Mock()
+    second.status_code = 503
+    second.text = "unavailable"
+    second.json.side_effect = ValueError("not json")
+
+    items = [("One", "d1", "acc-1"), ("Two", "d2", None), ("Three", "d3", None)]
+    with patch.object(client, "_request", side_effect=[first, second]) as request:
+        results = client.create_issues(project_key="B", items=items, chunk_size=2)
+
+    assert request.call_count == 2
+    first_payload = request.call_args_list[0].kwargs["json_body"]
+    assert request.call_args_list[0].args == ("POST", "/rest/api/3/issue/bulk")
+    assert [u["fields"]["summary"] for u in first_payload["issueUpdates"]] == ["One", "Two"]
+    assert first_payload["issueUpdates"][0]["fields"]["assignee"] == {"accountId": "acc-1"}
+
+    assert [r.ok for r in results] == [True, False, False]
+    assert results[0].issue == JiraIssue("B-1", "One", "d1", "", "acc-1", issue_type="Task")
+    assert "bad" in str(results[1].error)
+    assert "HTTP 503" in str(results[2].error)
+
+
+@pytest.mark.unit
+def test_get_issue_projects_fields_and_expand() -> None:
+    client = JiraClient(
+        base_url="https://example.atlassian.net",
+        email="user@example.com",
+        api_token="fake-token",
+    )
+
+    resp = Mock()
+    resp.status_code = 200
+    resp.json.return_value = {"key": "TEST-1", "fields": {"summary": "S"}}
+
+    with patch.object(client, "_request", return_value=resp) as request:
+        client.get_issue("TEST-1")
+        client.get_issue("TEST-1", fields=["summary"], expand=["renderedFields"])
+        client.get_issue("TEST-1", fields=None)
+
+    paths = [c.args[1] for c in request.call_args_list]
+    assert paths == [
+        "/rest/api/3/issue/TEST-1?fields=summary,description,status,assignee,updated,issuetype",
+        "/rest/api/3/issue/TEST-1?fields=summary&expand=renderedFields",
+        "/rest/api/3/issue/TEST-1",
+    ]
+
+
+@pytest.mark.unit
+def test_count_issues_uses_total_only_search() -> None:
+    client = JiraClient(
+        base_url="https://example.atlassian.net",
+        email="user@example.com",
+        api_token="fake-token",
+    )
+
+    resp = Mock(status_code=200)
+    resp.json.return_value = {"startAt": 0, "maxResults": 0, "total": 1234, "issues": []}
+
+    with patch.object(client, "_request", return_value=resp) as request:
+        assert client.count_issues(jql="project = P") == 1234
+
+    assert request.call_args.kwargs["json_body"] == {"jql": "project = P", "maxResults": 0, "fields": []}
+    assert request.call_args.kwargs["idempotent"] is True
+
+    resp.json.return_value = {"issues": []}
+    with patch.object(client, "_request", return_value=resp), pytest.raises(TypeError, match="no total"):
+        client.count_issues(jql="project = P")
+
+
+@pytest.mark.unit
+def test_count_by_status_category_tallies_one_status_only_search() -> None:
+    client = JiraClient(
+        base_url="https://example.atlassian.net",
+        email="user@example.com",
+        api_token="fake-token",
+    )
+
+    def issue(category: str) -> dict[str, object]:
+        return {"key": "P-1", "fields": {"status": {"statusCategory": {"key": category}}}}
+
+    resp = Mock(status_code=200)
+    resp.json.return_value = {"total": 3, "issues": [issue("new"), issue("done"), issue("new")]}
+
+    with patch.object(client, "_request", return_value=resp) as request:
+        tally = client.count_by_status_category(jql="project = P")
+
+    assert tally.by_category == {"new": 2, "done": 1}
+    assert tally.complete is True
+    assert request.call_count == 1
+    assert request.call_args.kwargs["json_body"] == {"jql": "project = P", "maxResults": 1000, "fields": ["status"]}
+
+    resp.json.return_value = {"total": 5000, "issues": [issue("new")]}
+    with patch.object(client, "_request", return_value=resp):
+        assert client.count_by_status_category(jql="project = P").complete is False
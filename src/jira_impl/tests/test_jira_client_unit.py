@@ -1,12 +1,15 @@
 """
 Unit tests for jira_impl.jira_client.
 
-These tests mock httpx.Client (used as a context manager) to exercise
-success, error, and exception paths without making real HTTP calls.
-No production code is modified.
+These tests inject a mocked pooled httpx.Client to exercise success, error,
+and exception paths without making real HTTP calls. Connection reuse is
+checked against a local keep-alive server.
 """
 
-from unittest.mock import Mock, patch
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock
 
 import pytest
 import httpx
@@ -29,23 +32,20 @@ def test_jira_client_initializes_successfully() -> None:
 @pytest.mark.unit
 def test_jira_client_request_success_response() -> None:
     """_request returns response object on HTTP 200."""
-    client = JiraClient(
-        base_url="https://example.atlassian.net",
-        email="user@example.com",
-        api_token="fake-token",
-    )
-
     mock_response = Mock()
     mock_response.status_code = 200
     mock_response.json.return_value = {"key": "TEST-123"}
 
     mock_client = Mock()
     mock_client.request.return_value = mock_response
+    client = JiraClient(
+        base_url="https://example.atlassian.net",
+        email="user@example.com",
+        api_token="fake-token",
+        http_client=mock_client,
+    )
 
-    with patch("jira_impl.jira_client.httpx.Client") as client_cls:
-        client_cls.return_value.__enter__.return_value = mock_client
-
-        resp = client._request("GET", "/rest/api/3/issue/TEST-123")
+    resp = client._request("GET", "/rest/api/3/issue/TEST-123")
 
     assert resp.status_code == 200
     assert resp.json()["key"] == "TEST-123"
@@ -54,23 +54,20 @@ def test_jira_client_request_success_response() -> None:
 @pytest.mark.unit
 def test_jira_client_request_non_200_response() -> None:
     """_request returns response even for non-200 status codes."""
-    client = JiraClient(
-        base_url="https://example.atlassian.net",
-        email="user@example.com",
-        api_token="fake-token",
-    )
-
     mock_response = Mock()
     mock_response.status_code = 401
     mock_response.text = "Unauthorized"
 
     mock_client = Mock()
     mock_client.request.return_value = mock_response
+    client = JiraClient(
+        base_url="https://example.atlassian.net",
+        email="user@example.com",
+        api_token="fake-token",
+        http_client=mock_client,
+    )
 
-    with patch("jira_impl.jira_client.httpx.Client") as client_cls:
-        client_cls.return_value.__enter__.return_value = mock_client
-
-        resp = client._request("GET", "/rest/api/3/issue/FAIL")
+    resp = client._request("GET", "/rest/api/3/issue/FAIL")
 
     assert resp.status_code == 401
 
@@ -78,17 +75,71 @@ def test_jira_client_request_non_200_response() -> None:
 @pytest.mark.unit
 def test_jira_client_request_raises_connection_error_on_httpx_exception() -> None:
     """httpx.RequestError is translated into ConnectionError."""
+    mock_client = Mock()
+    mock_client.request.side_effect = httpx.RequestError("boom")
     client = JiraClient(
         base_url="https://example.atlassian.net",
         email="user@example.com",
         api_token="fake-token",
+        http_client=mock_client,
     )
 
+    with pytest.raises(ConnectionError):
+        client._request("GET", "/rest/api/3/issue/ERROR")
+
+
+class _KeepAliveJira(BaseHTTPRequestHandler):
+    """Minimal keep-alive stand-in that answers every GET with an empty issue."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args: object) -> None:
+        """Keep test output quiet."""
+
+    def do_GET(self) -> None:
+        body = b'{"key": "TEST-1", "fields": {}}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def jira_server() -> Iterator[str]:
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveJira)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.mark.unit
+def test_jira_client_reuses_pooled_connection(jira_server: str) -> None:
+    """Sequential calls pay one handshake and reuse the pooled connection."""
+    with JiraClient(base_url=jira_server, email="u@example.com", api_token="t") as client:
+        for _ in range(5):
+            assert client.get_issue("TEST-1").key == "TEST-1"
+
+        stats = client.connection_stats()
+
+    assert stats.requests == 5
+    assert stats.handshakes == 1
+    assert stats.reused == 4
+
+
+@pytest.mark.unit
+def test_jira_client_close_closes_pool() -> None:
+    """close() releases the injected pooled client."""
     mock_client = Mock()
-    mock_client.request.side_effect = httpx.RequestError("boom")
+    client = JiraClient(
+        base_url="https://example.atlassian.net",
+        email="user@example.com",
+        api_token="fake-token",
+        http_client=mock_client,
+    )
 
-    with patch("jira_impl.jira_client.httpx.Client") as client_cls:
-        client_cls.return_value.__enter__.return_value = mock_client
+    client.close()
 
-        with pytest.raises(ConnectionError):
-            client._request("GET", "/rest/api/3/issue/ERROR")
+    mock_client.close.assert_called_once_with()
@@ -0,0 +1,188 @@
+"""Tests for the local SQLite ticket mirror (no network)."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Iterator
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from jira_impl.impl import JiraTicket
+from jira_impl.jira_client import JiraIssue
+from jira_impl.mirror import MirroredTicketClient, TicketMirror
+from tickets_api.client import Ticket, TicketStats, TicketStatus
+
+
+def _issue(key: str, summary: str, status: str = "To Do", updated: str = "2024-05-01T10:00:00.000+0000") -> JiraIssue:
+    return JiraIssue(key, summary, f"{summary} body", status, None, updated)
+
+
+class _FakeJira:
+    """Stands in for JiraTicketClient: serves issues and records sync queries."""
+
+    def __init__(self, issues: list[JiraIssue]) -> None:
+        self.issues = {i.key: i for i in issues}
+        self.since_calls: list[str | None] = []
+        self.get_calls: list[str] = []
+
+    def iter_issues_updated_since(self, since: str | None, page_size: int = 100) -> Iterator[JiraIssue]:
+        _ = page_size
+        self.since_calls.append(since)
+        yield from self.issues.values()
+
+    def get_ticket(self, ticket_id: str) -> Ticket | None:
+        self.get_calls.append(ticket_id)
+        return None
+
+    def update_ticket(self, ticket_id: str, status: TicketStatus | None = None, title: str | None = None) -> Ticket:
+        _ = status
+        return JiraTicket(ticket_id, title or "", "", TicketStatus.CLOSED, None)
+
+    def delete_ticket(self, ticket_id: str) -> bool:
+        return self.issues.pop(ticket_id, None) is not None
+
+    def close(self) -> None:
+        pass
+
+
+def _client(jira: _FakeJira, **kwargs: float) -> MirroredTicketClient:
+    return MirroredTicketClient(jira, TicketMirror(), **kwargs)  # type: ignore[arg-type]
+
+
+@pytest.mark.unit
+def test_first_read_syncs_then_serves_locally() -> None:
+    jira = _FakeJira([_issue("P-1", "Login bug"), _issue("P-2", "Signup", "Done")])
+    client = _client(jira, max_staleness_seconds=60)
+
+    ticket = client.get_ticket("P-2")
+    results = client.search_tickets(query="login")
+
+    assert ticket is not None and ticket.status == TicketStatus.CLOSED
+    assert [t.id for t in results] == ["P-1"]
+    assert jira.since_calls == [None]
+    assert [t.id for t in client.search_tickets(status=TicketStatus.CLOSED)] == ["P-2"]
+
+
+@pytest.mark.unit
+def test_stale_mirror_syncs_incrementally_from_watermark() -> None:
+    five_minutes_ago = (datetime.now(UTC) - timedelta(minutes=5)).strftime("%Y-%m-%dT%H:%M:%S.%f%z")
+    jira = _FakeJira([_issue("P-1", "A", updated=five_minutes_ago)])
+    client = _client(jira, max_staleness_seconds=0, overlap_seconds=120)
+
+    client.search_tickets()
+    jira.issues["P-3"] = _issue("P-3", "New", updated=datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%S.%f%z"))
+    results = client.search_tickets()
+
+    # Relative to Jira's clock, so independent of the Jira user's timezone:
+    # 5 minutes back to the watermark plus 2 of overlap, rounded up.
+    assert jira.since_calls == [None, "-8m"]
+    assert {t.id for t in results} == {"P-1", "P-3"}
+
+
+@pytest.mark.unit
+def test_full_sync_drops_issues_deleted_in_jira() -> None:
+    jira = _FakeJira([_issue("P-1", "A"), _issue("P-2", "B")])
+    client = _client(jira)
+    client.sync()
+
+    del jira.issues["P-2"]
+    client.sync(full=True)
+
+    assert [t.id for t in client.search_tickets()] == ["P-1"]
+
+
+@pytest.mark.unit
+def test_concurrent_stale_reads_share_one_sync() -> None:
+    class _SlowJira(_FakeJira):
+        def iter_issues_updated_since(self, since: str | None, page_size: int = 100) -> Iterator[JiraIssue]:
+            time.sleep(0.2)
+            return super().iter_issues_updated_since(since, page_size)
+
+    jira = _SlowJira([_issue("P-1", "A")])
+    client = _client(jira, max_staleness_seconds=60)
+    readers = [threading.Thread(target=client.search_tickets) for _ in range(10)]
+
+    for reader in readers:
+        reader.start()
+    for reader in readers:
+        reader.join()
+
+    assert jira.since_calls == [None]
+
+
+def _wait_until(condition: Callable[[], bool]) -> None:
+    deadline = time.monotonic() + 5
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+@pytest.mark.unit
+def test_background_sync_runs_periodic_full_syncs() -> None:
+    jira = _FakeJira([_issue("P-1", "A"), _issue("P-2", "B")])
+    client = _client(jira, max_staleness_seconds=60)
+
+    client.start(interval_seconds=0.01, full_sync_interval_seconds=0.2)
+    try:
+        _wait_until(lambda: any(since is not None for since in jira.since_calls))
+        del jira.issues["P-2"]  # incremental syncs cannot see this
+        _wait_until(lambda: client.get_ticket("P-2") is None)
+        remaining = [t.id for t in client.search_tickets()]
+    finally:
+        client.close()
+
+    assert remaining == ["P-1"]
+    assert jira.since_calls[0] is None  # the first background sync is a full one
+    assert jira.since_calls.count(None) >= 2
+
+
+@pytest.mark.unit
+def test_writes_go_to_jira_and_through_to_mirror() -> None:
+    jira = _FakeJira([_issue("P-1", "A")])
+    client = _client(jira, max_staleness_seconds=60)
+    client.sync()
+
+    client.update_ticket("P-1", status=TicketStatus.CLOSED, title="Renamed")
+    assert client.get_ticket("P-1") == JiraTicket("P-1", "Renamed", "", TicketStatus.CLOSED, None)
+
+    assert client.delete_ticket("P-1") is True
+    assert client.get_ticket("P-1") is None
+    assert jira.get_calls == ["P-1"]  # the miss falls through to Jira once
+
+
+@pytest.mark.unit
+def test_search_escapes_like_wildcards() -> None:
+    mirror = TicketMirror()
+    mirror.upsert_issues([_issue("P-1", "100% done"), _issue("P-2", "1000 items")])
+
+    assert [t.id for t in mirror.search("100%")] == ["P-1"]
+    assert mirror.count() == 2
+
+
+@pytest.mark.unit
+def test_counts_and_stats_are_served_from_sqlite() -> None:
+    jira = _FakeJira([_issue("P-1", "Login bug"), _issue("P-2", "Login slow", "Done"), _issue("P-3", "Export")])
+    client = _client(jira, max_staleness_seconds=60)
+
+    assert client.count_tickets() == 3
+    assert client.count_tickets(query="login") == 2
+    assert client.count_tickets(query="login", status=TicketStatus.OPEN) == 1
+    assert client.ticket_stats() == TicketStats(
+        total=3,
+        by_status={TicketStatus.OPEN: 2, TicketStatus.IN_PROGRESS: 0, TicketStatus.CLOSED: 1},
+    )
+    assert jira.since_calls == [None]
+
+
+@pytest.mark.unit
+def test_mirror_persists_watermark(tmp_path) -> None:
+    path = str(tmp_path / "mirror.db")
+    mirror = TicketMirror(path)
+    mirror.upsert_issues([_issue("P-1", "A")])
+    mirror.set_watermark(123.0)
+    mirror.close()
+
+    reopened = TicketMirror(path)
+    assert reopened.watermark() == 123.0
+    assert reopened.get("P-1") is not None
+
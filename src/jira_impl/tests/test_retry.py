@@ -0,0 +1,161 @@
+"""Tests for JiraClient retry/backoff behaviour (httpx.MockTransport, no network)."""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from jira_impl.jira_client import JiraClient
+from jira_impl.retry import RetryPolicy, parse_retry_after
+
+
+def _client(
+    responses: list[httpx.Response | Exception],
+    policy: RetryPolicy | None = None,
+) -> tuple[JiraClient, list[httpx.Request], list[float]]:
+    """JiraClient whose transport replays ``responses`` and whose sleeps are recorded."""
+    seen: list[httpx.Request] = []
+    queue = list(responses)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        item = queue.pop(0)
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    client = JiraClient(
+        base_url="https://example.atlassian.net",
+        email="u@example.com",
+        api_token="t",
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        retry_policy=policy or RetryPolicy(jitter=False),
+    )
+    slept: list[float] = []
+    client._sleep = slept.append  # type: ignore[method-assign]
+    return client, seen, slept
+
+
+def _issue() -> httpx.Response:
+    return httpx.Response(200, json={"key": "P-1", "fields": {"summary": "S"}})
+
+
+@pytest.mark.unit
+def test_get_retries_transient_statuses_with_exponential_backoff() -> None:
+    client, seen, slept = _client([httpx.Response(503), httpx.Response(502), _issue()])
+
+    assert client.get_issue("P-1").summary == "S"
+    assert len(seen) == 3
+    assert slept == [0.5, 1.0]
+    assert client.connection_stats().retries == 2
+
+
+@pytest.mark.unit
+def test_retry_after_header_is_honoured() -> None:
+    client, _, slept = _client([httpx.Response(429, headers={"Retry-After": "7"}), _issue()])
+
+    client.get_issue("P-1")
+
+    assert slept == [7.0]
+
+
+@pytest.mark.unit
+def test_retry_after_beyond_budget_returns_response_without_waiting() -> None:
+    client, seen, slept = _client(
+        [httpx.Response(429, headers={"Retry-After": "120"})],
+        RetryPolicy(budget_seconds=30, jitter=False),
+    )
+
+    with pytest.raises(RuntimeError, match="HTTP 429"):
+        client.get_issue("P-1")
+    assert len(seen) == 1
+    assert slept == []
+
+
+@pytest.mark.unit
+def test_gives_up_after_max_retries() -> None:
+    client, seen, _ = _client([httpx.Response(503)] * 3, RetryPolicy(max_retries=2, jitter=False))
+
+    with pytest.raises(RuntimeError, match="HTTP 503"):
+        client.get_issue("P-1")
+    assert len(seen) == 3
+
+
+@pytest.mark.unit
+def test_create_post_is_not_retried_on_503() -> None:
+    client, seen, _ = _client([httpx.Response(503), httpx.Response(201, json={"key": "P-9"})])
+
+    with pytest.raises(RuntimeError, match="HTTP 503"):
+        client.create_issue(project_key="P", summary="S", description="D", assignee_account_id=None)
+    assert len(seen) == 1
+
+
+@pytest.mark.unit
+def test_create_post_is_retried_when_rate_limited_or_not_sent() -> None:
+    connect_error = httpx.ConnectError("refused")
+    client, seen, _ = _client(
+        [
+            httpx.Response(429),
+            connect_error,
+            httpx.Response(201, json={"key": "P-9"}),
+            _issue(),
+        ]
+    )
+
+    issue = client.create_issue(
+        project_key="P", summary="S", description="D", assignee_account_id=None, hydrate=True
+    )
+
+    assert issue.key == "P-1"
+    assert [r.method for r in seen] == ["POST", "POST", "POST", "GET"]
+
+
+@pytest.mark.unit
+def test_create_post_read_timeout_is_not_retried() -> None:
+    client, seen, _ = _client([httpx.ReadTimeout("slow")])
+
+    with pytest.raises(ConnectionError, match="Jira request failed"):
+        client.create_issue(project_key="P", summary="S", description="D", assignee_account_id=None)
+    assert len(seen) == 1
+
+
+@pytest.mark.unit
+def test_search_post_is_treated_as_idempotent() -> None:
+    client, seen, _ = _client(
+        [httpx.ReadTimeout("slow"), httpx.Response(503), httpx.Response(200, json={"issues": []})]
+    )
+
+    assert client.search_issues(jql="project = P") == []
+    assert len(seen) == 3
+
+
+@pytest.mark.unit
+def test_jittered_backoff_stays_within_cap() -> None:
+    policy = RetryPolicy(base_delay_seconds=1, max_delay_seconds=4)
+
+    delays = [policy.backoff(n) for n in range(1, 8) for _ in range(20)]
+
+    assert all(0 <= d <= 4 for d in delays)
+    assert RetryPolicy(base_delay_seconds=1, max_delay_seconds=4, jitter=False).backoff(6) == 4
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        ("3", 3.0),
+        (" 1.5 ", 1.5),
+        ("-2", 0.0),
+        ("Thu, 01 Jan 1970 00:00:30 GMT", 20.0),
+        ("soon", None),
+        (None, None),
+    ],
+)
+def test_parse_retry_after(header: str | None, expected: float | None) -> None:
+    assert parse_retry_after(header, now=10.0) == expected
+
+
+@pytest.mark.unit
+def test_policy_rejects_negative_settings() -> None:
+    with pytest.raises(ValueError, match="max_retries"):
+        RetryPolicy(max_retries=-1)
@@ -4,8 +4,14 @@
 from __future__ import annotations
 
 from jira_impl.impl import JiraTicketClient
-from jira_impl.jira_client import JiraIssue
-from tickets_api.client import TicketStatus
+from jira_impl.jira_client import (
+    JiraIssue,
+    JiraIssueResult,
+    JiraStatusTally,
+    JiraTransition,
+)
+from jira_impl.transitions import TransitionCache
+from tickets_api.client import TicketSpec, TicketStats, TicketStatus
 
 
 class _FakeJiraClient:
@@ -16,8 +22,9 @@ class _FakeJiraClient:
         summary: str,
         description: str,
         assignee_account_id: str | None,
+        hydrate: bool = False,
     ) -> JiraIssue:
-        _ = (project_key, assignee_account_id)
+        _ = (project_key, assignee_account_id, hydrate)
         return JiraIssue(
             key="PROJ-1",
             summary=summary,
@@ -31,6 +38,16 @@ class _FakeJiraClient:
             raise KeyError(issue_key)
         return JiraIssue(key=issue_key, summary="S", description="D", status_name="In Progress", assignee_account_id=None)
 
+    def get_issues(self, keys: list[str], *, max_concurrency: int = 8) -> list[JiraIssueResult]:
+        _ = max_concurrency
+        results: list[JiraIssueResult] = []
+        for key in keys:
+            try:
+                results.append(JiraIssueResult(key=key, issue=self.get_issue(key)))
+            except KeyError as exc:
+                results.append(JiraIssueResult(key=key, issue=None, error=exc))
+        return results
+
     def search_issues(self, *, jql: str, max_results: int = 25) -> list[JiraIssue]:
         _ = (jql, max_results)
         return [
@@ -41,6 +58,23 @@ class _FakeJiraClient:
     def update_issue_summary(self, *, issue_key: str, summary: str) -> JiraIssue:
         return JiraIssue(key=issue_key, summary=summary, description="D", status_name="To Do", assignee_account_id=None)
 
+    def get_issue_transitions(self, issue_key: str) -> tuple[JiraIssue, list[JiraTransition]]:
+        issue = JiraIssue(issue_key, "S", "D", "To Do", None, issue_type="Task")
+        return issue, [JiraTransition(id="31", name="Done", to_status="Done", to_category="done")]
+
+    def transition_issue(self, *, issue_key: str, transition_id: str) -> bool:
+        _ = issue_key
+        return transition_id == "31"
+
+    def count_issues(self, *, jql: str) -> int:
+        if 'statusCategory = "In Progress"' in jql:
+            return 2
+        return 7 if "statusCategory" in jql else 10
+
+    def count_by_status_category(self, *, jql: str, max_results: int = 1000) -> JiraStatusTally:
+        _ = (jql, max_results)
+        return JiraStatusTally(total=5, by_category={"new": 3, "done": 1, "undefined": 1}, complete=True)
+
     def delete_issue(self, issue_key: str) -> bool:
         return issue_key != "NOPE-1"
 
@@ -48,6 +82,7 @@ class _FakeJiraClient:
 def _make_client_with_fake_jira() -> JiraTicketClient:
     client = object.__new__(JiraTicketClient)
     client._project_key = "PROJ"  # type: ignore[attr-defined]
+    client._transitions = TransitionCache()  # type: ignore[attr-defined]
     client._jira = _FakeJiraClient()  # type: ignore[attr-defined]
     return client  # type: ignore[return-value]
 
@@ -78,3 +113,62 @@ def test_create_get_search_update_delete_smoke() -> None:
 
     assert client.delete_ticket("PROJ-10") is True
     assert client.delete_ticket("NOPE-1") is False
+
+
+def test_get_tickets_maps_bulk_results_in_order() -> None:
+    client = _make_client_with_fake_jira()
+    tickets = client.get_tickets(["PROJ-1", "MISSING-1", "PROJ-2"])
+
+    assert [t.id if t else None for t in tickets] == ["PROJ-1", None, "PROJ-2"]
+
+
+def test_create_tickets_uses_bulk_create_and_keeps_order() -> None:
+    client = _make_client_with_fake_jira()
+    sent: list[tuple[str, str, str | None]] = []
+
+    def create_issues(*, project_key: str, items: list[tuple[str, str, str | None]]) -> list[JiraIssueResult]:
+        assert project_key == "PROJ"
+        sent.extend(items)
+        return [
+            JiraIssueResult(key="PROJ-5", issue=JiraIssue("PROJ-5", "A", "a", "", None)),
+            JiraIssueResult(key="", issue=None, error=RuntimeError("Jira bulk create item failed")),
+        ]
+
+    client._jira.create_issues = create_issues  # type: ignore[attr-defined]
+
+    results = client.create_tickets(
+        [TicketSpec(" A ", "a"), TicketSpec("", "x"), TicketSpec("C", "c")]
+    )
+
+    assert sent == [("A", "a", None), ("C", "c", None)]
+    assert results[0].ticket is not None and results[0].ticket.id == "PROJ-5"
+    assert results[0].ticket.status == TicketStatus.OPEN
+    assert results[1].error == "title must be non-empty"
+    assert results[2].error == "Jira bulk create item failed"
+
+
+def test_count_tickets_uses_total_only_search() -> None:
+    client = _make_client_with_fake_jira()
+
+    assert client.count_tickets(query="login") == 10
+
+
+def test_ticket_stats_tallies_one_status_search() -> None:
+    client = _make_client_with_fake_jira()
+
+    assert client.ticket_stats() == TicketStats(
+        total=4,
+        by_status={TicketStatus.OPEN: 3, TicketStatus.IN_PROGRESS: 0, TicketStatus.CLOSED: 1},
+    )
+
+
+def test_ticket_stats_falls_back_to_counts_when_page_is_capped() -> None:
+    client = _make_client_with_fake_jira()
+    client._jira.count_by_status_category = lambda **_: JiraStatusTally(  # type: ignore[attr-defined]
+        total=5000, by_category={"new": 100}, complete=False
+    )
+
+    assert client.ticket_stats() == TicketStats(
+        total=16,
+        by_status={TicketStatus.OPEN: 7, TicketStatus.IN_PROGRESS: 2, TicketStatus.CLOSED: 7},
+    )
@@ -0,0 +1,166 @@
+"""Tests for status transitions and the workflow transition-id cache."""
+
+from __future__ import annotations
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from jira_impl.impl import JiraTicketClient
+from jira_impl.jira_client import JiraClient, JiraIssue, JiraTransition
+from jira_impl.transitions import TransitionCache
+from tickets_api.client import TicketStatus
+
+_WORKFLOW = [
+    JiraTransition(id="11", name="Reopen", to_status="To Do", to_category="new"),
+    JiraTransition(id="21", name="Start", to_status="In Progress", to_category="indeterminate"),
+    JiraTransition(id="31", name="Resolve", to_status="Done", to_category="done"),
+]
+
+
+class _FakeJira:
+    """Records calls; transitions are accepted unless their id is in ``reject``."""
+
+    def __init__(self, status_name: str = "To Do", transitions: list[JiraTransition] | None = None) -> None:
+        self.status_name = status_name
+        self.transitions = _WORKFLOW if transitions is None else transitions
+        self.reject: set[str] = set()
+        self.calls: list[tuple[str, str]] = []
+
+    def get_issue_transitions(self, issue_key: str) -> tuple[JiraIssue, list[JiraTransition]]:
+        self.calls.append(("GET transitions", issue_key))
+        issue = JiraIssue(issue_key, "S", "D", self.status_name, None, issue_type="Task")
+        return issue, self.transitions
+
+    def transition_issue(self, *, issue_key: str, transition_id: str) -> bool:
+        self.calls.append(("POST", transition_id))
+        return transition_id not in self.reject
+
+    def get_issue(self, issue_key: str) -> JiraIssue:
+        self.calls.append(("GET", issue_key))
+        return JiraIssue(issue_key, "S", "D", self.status_name, None, issue_type="Task")
+
+
+def _client(jira: _FakeJira, cache: TransitionCache | None = None) -> JiraTicketClient:
+    client = object.__new__(JiraTicketClient)
+    client._project_key = "PROJ"  # type: ignore[attr-defined]
+    client._transitions = cache or TransitionCache()  # type: ignore[attr-defined]
+    client._jira = jira  # type: ignore[attr-defined]
+    return client  # type: ignore[return-value]
+
+
+@pytest.mark.unit
+def test_first_transition_learns_then_single_post() -> None:
+    jira = _FakeJira()
+    client = _client(jira)
+
+    client.update_ticket("PROJ-1", status=TicketStatus.IN_PROGRESS)
+    assert jira.calls == [("GET transitions", "PROJ-1"), ("POST", "21"), ("GET", "PROJ-1")]
+
+    # Another Task in the same project: issue type known from the fetch, ids cached.
+    jira.calls.clear()
+    client.get_ticket("PROJ-2")
+    jira.calls.clear()
+    client.update_ticket("PROJ-2", status=TicketStatus.CLOSED)
+    assert jira.calls == [("POST", "31"), ("GET", "PROJ-2")]
+
+
+@pytest.mark.unit
+def test_rejected_cached_id_refreshes_workflow() -> None:
+    jira = _FakeJira()
+    client = _client(jira)
+    client.update_ticket("PROJ-1", status=TicketStatus.CLOSED)
+
+    jira.transitions = [JiraTransition(id="41", name="Close", to_status="Closed", to_category="done")]
+    jira.reject = {"31"}
+    jira.calls.clear()
+    client.update_ticket("PROJ-1", status=TicketStatus.CLOSED)
+
+    assert jira.calls == [
+        ("POST", "31"),
+        ("GET transitions", "PROJ-1"),
+        ("POST", "41"),
+        ("GET", "PROJ-1"),
+    ]
+
+
+@pytest.mark.unit
+def test_already_in_target_status_is_a_no_op() -> None:
+    jira = _FakeJira(status_name="Done", transitions=[_WORKFLOW[0]])
+    client = _client(jira)
+
+    ticket = client.update_ticket("PROJ-1", status=TicketStatus.CLOSED)
+
+    assert ticket.status == TicketStatus.CLOSED
+    assert ("POST", "11") not in jira.calls
+
+
+@pytest.mark.unit
+def test_unreachable_status_raises_value_error() -> None:
+    client = _client(_FakeJira(transitions=[_WORKFLOW[1]]))
+
+    with pytest.raises(ValueError, match="No Jira transition"):
+        client.update_ticket("PROJ-1", status=TicketStatus.CLOSED)
+
+
+@pytest.mark.unit
+def test_transition_rejected_after_refresh_raises() -> None:
+    jira = _FakeJira()
+    jira.reject = {"31"}
+    client = _client(jira)
+
+    with pytest.raises(RuntimeError, match="rejected transition 31"):
+        client.update_ticket("PROJ-1", status=TicketStatus.CLOSED)
+
+
+@pytest.mark.unit
+def test_cache_entries_expire_after_ttl() -> None:
+    now = [0.0]
+    cache = TransitionCache(ttl_seconds=60, clock=lambda: now[0])
+    cache.learn("PROJ", "Task", {TicketStatus.CLOSED: "31"})
+
+    assert cache.transition_id("PROJ", "Task", TicketStatus.CLOSED) == "31"
+    assert cache.transition_id("PROJ", "Bug", TicketStatus.CLOSED) is None
+    now[0] = 60.0
+    assert cache.transition_id("PROJ", "Task", TicketStatus.CLOSED) is None
+
+
+@pytest.mark.unit
+def test_cache_merges_and_bounds_issue_types() -> None:
+    cache = TransitionCache(max_issues=2)
+    cache.learn("PROJ", "Task", {TicketStatus.CLOSED: "31"})
+    cache.learn("PROJ", "Task", {TicketStatus.OPEN: "11"})
+    for key in ("P-1", "P-2", "P-3"):
+        cache.remember_issue_type(key, "Task")
+
+    assert cache.transition_id("PROJ", "Task", TicketStatus.CLOSED) == "31"
+    assert cache.transition_id("PROJ", "Task", TicketStatus.OPEN) == "11"
+    assert cache.issue_type("P-1") is None
+    assert cache.issue_type("P-3") == "Task"
+
+
+@pytest.mark.unit
+def test_jira_client_transition_endpoints() -> None:
+    client = JiraClient(base_url="https://example.atlassian.net", email="u@example.com", api_token="t")
+    get_resp = Mock(status_code=200)
+    get_resp.json.return_value = {
+        "key": "PROJ-1",
+        "fields": {"status": {"name": "To Do"}, "issuetype": {"name": "Bug"}},
+        "transitions": [
+            {"id": "21", "name": "Start", "to": {"name": "In Progress", "statusCategory": {"key": "indeterminate"}}},
+            {"name": "no id"},
+        ],
+    }
+    post_ok = Mock(status_code=204)
+    post_bad = Mock(status_code=400)
+
+    with patch.object(client, "_request", side_effect=[get_resp, post_ok, post_bad]) as request:
+        issue, transitions = client.get_issue_transitions("PROJ-1")
+        assert client.transition_issue(issue_key="PROJ-1", transition_id="21") is True
+        assert client.transition_issue(issue_key="PROJ-1", transition_id="99") is False
+
+    assert issue.issue_type == "Bug"
+    assert transitions == [JiraTransition("21", "Start", "In Progress", "indeterminate")]
+    assert request.call_args_list[0].args[1].endswith("&expand=transitions")
+    assert request.call_args_list[1].args[1] == "/rest/api/3/issue/PROJ-1/transitions"
+    assert request.call_args_list[1].kwargs["json_body"] == {"transition": {"id": "21"}}
@@ -0,0 +1,163 @@
+"""In-process invalidation stream for ticket changes.
+
+Every change applied to the ticket store (API writes and Jira webhooks) is
+published here with a monotonically increasing sequence number. Subscribers
+(e.g. integration_app over ``GET /events/invalidations``) resume from the last
+sequence they saw; a bounded history covers short disconnects.
+
+Sequence numbers restart when the process does, so each bus has a random
+``epoch``. When a subscriber resumes from a position the bus cannot replay
+(another epoch, a sequence it has not reached, or events that already fell
+out of the history) it gets a ``reset`` event instead and must drop
+everything it cached.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import secrets
+import threading
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from dataclasses import asdict, dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class InvalidationEvent:
+    """A ticket changed; consumers should drop any cached copy."""
+
+    seq: int
+    ticket_id: str
+    kind: str  # "created" | "updated" | "deleted"
+    at: float
+
+
+class InvalidationBus:
+    """Thread-safe publish/wait bus with a bounded replay history.
+
+    Publishers may be threads or coroutines. Threads wait on a condition;
+    coroutines wait on an asyncio.Event that ``publish`` sets through their
+    loop, so an async waiter never holds a worker thread.
+    """
+
+    def __init__(self, history: int = 1024) -> None:
+        self._events: deque[InvalidationEvent] = deque(maxlen=history)
+        self._cond = threading.Condition()
+        self._waiters: set[tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
+        self._seq = 0
+        self.epoch = secrets.token_hex(8)
+
+    @property
+    def last_seq(self) -> int:
+        with self._cond:
+            return self._seq
+
+    def publish(self, ticket_id: str, kind: str) -> InvalidationEvent:
+        """Record a change and wake waiting subscribers."""
+        with self._cond:
+            self._seq += 1
+            event = InvalidationEvent(seq=self._seq, ticket_id=ticket_id, kind=kind, at=time.time())
+            self._events.append(event)
+            self._cond.notify_all()
+            waiters = list(self._waiters)
+        for loop, woken in waiters:
+            try:
+                loop.call_soon_threadsafe(woken.set)
+            except RuntimeError:  # loop already closed; its waiter is gone
+                pass
+        return event
+
+    def wait(self, seq: int, timeout: float) -> bool:
+        """Block until an event after ``seq`` is published; False on timeout."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self._seq <= seq:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return True
+
+    async def wait_async(self, seq: int, timeout: float) -> bool:
+        """Like :meth:`wait`, but suspends the coroutine instead of a thread."""
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with self._cond:
+            if self._seq > seq:
+                return True
+            self._waiters.add(waiter)
+        try:
+            async with asyncio.timeout(timeout):
+                await waiter[1].wait()
+        except TimeoutError:
+            return False
+        finally:
+            with self._cond:
+                self._waiters.discard(waiter)
+        return True
+
+    def replay(self, seq: int) -> list[InvalidationEvent] | None:
+        """Events after ``seq``, or None if they cannot all be replayed:
+        ``seq`` is ahead of this bus (an earlier process) or older than the
+        retained history."""
+        with self._cond:
+            if seq > self._seq:
+                return None
+            if self._events and self._events[0].seq > seq + 1:
+                return None
+            if not self._events and seq < self._seq:
+                return None
+            return [e for e in self._events if e.seq > seq]
+
+    def since(self, seq: int, timeout: float = 0.0) -> list[InvalidationEvent]:
+        """Return events after ``seq``, waiting up to ``timeout`` seconds for one."""
+        if not self.wait(seq, timeout):
+            return []
+        with self._cond:
+            return [e for e in self._events if e.seq > seq]
+
+
+DEFAULT_BUS = InvalidationBus()
+
+
+def _reset_frame(bus: InvalidationBus, seq: int) -> str:
+    data = json.dumps({"seq": seq, "kind": "reset", "epoch": bus.epoch})
+    return f"id: {seq}\nevent: reset\ndata: {data}\n\n"
+
+
+async def sse_stream(
+    bus: InvalidationBus,
+    since: int,
+    *,
+    epoch: str | None = None,
+    heartbeat_seconds: float = 15.0,
+    max_events: int | None = None,
+) -> AsyncIterator[str]:
+    """Yield invalidation events as Server-Sent Events, with heartbeats.
+
+    Each event carries its sequence number as the SSE ``id`` so clients can
+    resume with ``?since=<last id>&epoch=<epoch>``. If that position cannot
+    be replayed, a single ``reset`` event (counted in ``max_events``) tells
+    the client to flush its cache and continue from the given ``seq``.
+    """
+    sent = 0
+    last = since
+    while max_events is None or sent < max_events:
+        events = bus.replay(last) if epoch in (None, bus.epoch) else None
+        epoch = bus.epoch
+        if events is None:
+            last = bus.last_seq
+            yield _reset_frame(bus, last)
+            sent += 1
+            continue
+        if not events:
+            if not await bus.wait_async(last, heartbeat_seconds):
+                yield ": keepalive\n\n"
+            continue
+        for event in events:
+            last = event.seq
+            yield f"id: {event.seq}\nevent: invalidate\ndata: {json.dumps(asdict(event))}\n\n"
+            sent += 1
+            if max_events is not None and sent >= max_events:
+                return
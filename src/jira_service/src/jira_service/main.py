@@ -5,6 +5,7 @@ from __future__ import annotations
 from fastapi import FastAPI
 
 from jira_service.routes import router
+from jira_service.webhooks import router as webhooks_router
 
 app = FastAPI(
     title="Jira Service API",
@@ -15,6 +16,7 @@ app = FastAPI(
 )
 
 app.include_router(router)
+app.include_router(webhooks_router)
 
 if __name__ == "__main__":
     import uvicorn
@@ -1,10 +1,22 @@
 from __future__ import annotations
 
+import bisect
+import hashlib
+import heapq
+import json
+import os
+import re
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import AbstractContextManager, contextmanager
 from dataclasses import dataclass
-from typing import List
+from typing import Protocol
 
 from tickets_api.client import TicketStatus
 
+from jira_service.search import TextIndex, query_terms
+
 
 @dataclass
 class Ticket:
@@ -15,24 +27,509 @@ class Ticket:
     assignee: str | None = None
 
 
+@dataclass(frozen=True)
+class TicketChange:
+    """One change log entry. ``seq`` increases by one per change and is never
+    reused; ``kind`` is "created", "updated" or "deleted"."""
+
+    seq: int
+    ticket_id: str
+    kind: str
+    at: float
+
+
+@dataclass
+class TicketPage:
+    """One page of a listing; ``next_after`` is the position to resume after,
+    or None when there are no further matches."""
+
+    tickets: list[Ticket]
+    next_after: int | None
+
+
+_ID_PREFIX = "TICKET-"
+# Change log entries kept (at least) by each store; older ones are dropped.
+CHANGE_HISTORY = 10_000
+_ALLOCATED_ID = re.compile(rf"^{_ID_PREFIX}(\d+)$")
+
+
+def format_ticket_id(number: int) -> str:
+    return f"{_ID_PREFIX}{number}"
+
+
+def ticket_etag(ticket: Ticket) -> str:
+    """Strong ETag for a ticket: a digest of every field, quoted per RFC 9110."""
+    fields = [ticket.id, ticket.title, ticket.description, ticket.status.value, ticket.assignee]
+    digest = hashlib.blake2b(json.dumps(fields).encode(), digest_size=12).hexdigest()
+    return f'"{digest}"'
+
+
+def allocated_id_number(ticket_id: str) -> int | None:
+    """Return n for allocator-style ``TICKET-<n>`` ids, else None."""
+    match = _ALLOCATED_ID.match(ticket_id)
+    return int(match.group(1)) if match else None
+
+
+class TicketStorage(Protocol):
+    """Storage backend used by the module-level functions below."""
+
+    def __len__(self) -> int: ...
+
+    def create(self, title: str, description: str, assignee: str | None) -> Ticket: ...
+
+    def create_many(self, items: Iterable[tuple[str, str, str | None]]) -> list[Ticket]: ...
+
+    def get(self, ticket_id: str) -> Ticket | None: ...
+
+    def upsert(self, ticket: Ticket) -> bool: ...
+
+    def replace(self, ticket: Ticket, *, expected: Ticket) -> bool: ...
+
+    def delete(self, ticket_id: str, *, expected: Ticket | None = None) -> bool: ...
+
+    def find(self, *, status: TicketStatus | None = None, assignee: str | None = None) -> list[Ticket]: ...
+
+    def page(
+        self,
+        *,
+        status: TicketStatus | None = None,
+        assignee: str | None = None,
+        query: str | None = None,
+        after: int | None = None,
+        limit: int,
+    ) -> TicketPage: ...
+
+    def search(self, query: str, *, status: TicketStatus | None = None, limit: int) -> list[Ticket]: ...
+
+    def count(self, query: str | None = None, status: TicketStatus | None = None) -> int: ...
+
+    def status_counts(self) -> dict[TicketStatus, int]: ...
+
+    def changes(self, after: int, limit: int) -> list[TicketChange]: ...
+
+    def last_change_seq(self) -> int: ...
+
+    def change_horizon(self) -> int: ...
+
+    def clear(self) -> None: ...
+
+    def transaction(self) -> AbstractContextManager[None]: ...
+
+
 # -------------------------
-# IN-MEMORY STORE (FIX)
+# IN-MEMORY STORE
 # -------------------------
 
-_TICKETS: List[Ticket] = []
+
+class TicketStore:
+    """Thread-safe in-memory ticket store.
+
+    Every ticket gets a creation sequence number when first stored. Tickets
+    are held in dicts by id and by sequence, with secondary indexes by status
+    and by assignee kept as sorted sequence lists. The list of all sequences
+    keeps deleted entries as tombstones until they make up half of it, so a
+    delete does not shift the list. Filtered listings walk the
+    smallest matching index, so they cost O(matches) and keep creation order,
+    and a page cursor is a sequence number that is found by bisection. Text
+    queries go through an inverted index (``jira_service.search``). Ids come
+    from a monotonic counter and are never reused after a delete.
+
+    Every create, update and delete is appended to a change log under the
+    same lock as the write itself. The log keeps at least the newest
+    ``change_history`` entries.
+    """
+
+    def __init__(self, *, change_history: int = CHANGE_HISTORY) -> None:
+        self._lock = threading.RLock()
+        self._by_id: dict[str, Ticket] = {}
+        self._seq: dict[str, int] = {}
+        self._by_seq: dict[int, Ticket] = {}
+        self._all: list[int] = []
+        self._dead = 0
+        self._by_status: dict[TicketStatus, list[int]] = {s: [] for s in TicketStatus}
+        self._by_assignee: dict[str | None, list[int]] = {}
+        self._text = TextIndex()
+        self._changes: list[TicketChange] = []
+        self._change_seq = 0
+        self._change_history = change_history
+        self._next_seq = 0
+        self._next_id = 1
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def _index(self, ticket: Ticket) -> None:
+        seq = self._next_seq
+        self._next_seq += 1
+        self._seq[ticket.id] = seq
+        self._by_id[ticket.id] = self._by_seq[seq] = ticket
+        self._all.append(seq)
+        _insert_seq(self._by_status[ticket.status], seq)
+        _insert_seq(self._by_assignee.setdefault(ticket.assignee, []), seq)
+        self._text.add(seq, ticket.title, ticket.description)
+        self._log(ticket.id, "created")
+
+    def _reindex(self, old: Ticket, new: Ticket) -> None:
+        """Replace a ticket in place; it keeps its creation position."""
+        if old == new:
+            return
+        self._log(new.id, "updated")
+        seq = self._seq[old.id]
+        self._by_id[new.id] = self._by_seq[seq] = new
+        if old.status != new.status:
+            _remove_seq(self._by_status[old.status], seq)
+            _insert_seq(self._by_status[new.status], seq)
+        if old.assignee != new.assignee:
+            self._remove_assignee(old.assignee, seq)
+            _insert_seq(self._by_assignee.setdefault(new.assignee, []), seq)
+        if (old.title, old.description) != (new.title, new.description):
+            self._text.remove(seq, old.title, old.description)
+            self._text.add(seq, new.title, new.description)
+
+    def _unindex(self, ticket: Ticket) -> None:
+        seq = self._seq.pop(ticket.id)
+        del self._by_id[ticket.id]
+        del self._by_seq[seq]
+        # Leave a tombstone in _all and compact once half of it is dead.
+        self._dead += 1
+        if 2 * self._dead > len(self._all):
+            self._all = [s for s in self._all if s in self._by_seq]
+            self._dead = 0
+        _remove_seq(self._by_status[ticket.status], seq)
+        self._remove_assignee(ticket.assignee, seq)
+        self._text.remove(seq, ticket.title, ticket.description)
+        self._log(ticket.id, "deleted")
+
+    def _log(self, ticket_id: str, kind: str) -> None:
+        self._change_seq += 1
+        self._changes.append(TicketChange(self._change_seq, ticket_id, kind, time.time()))
+        # Trim in batches so the cost per write stays O(1) amortised.
+        if len(self._changes) > 2 * self._change_history:
+            del self._changes[: -self._change_history]
+
+    def _remove_assignee(self, assignee: str | None, seq: int) -> None:
+        seqs = self._by_assignee.get(assignee)
+        if seqs is not None:
+            _remove_seq(seqs, seq)
+            if not seqs:
+                del self._by_assignee[assignee]
+
+    def _narrowest(self, status: TicketStatus | None, assignee: str | None) -> list[int]:
+        """Return the smallest index covering both filters (all tickets if none).
+
+        The list of all tickets may hold deleted sequences; callers skip them.
+        """
+        candidates: list[list[int]] = []
+        if status is not None:
+            candidates.append(self._by_status[status])
+        if assignee is not None:
+            candidates.append(self._by_assignee.get(assignee, []))
+        return min(candidates, key=len) if candidates else self._all
+
+    def _reserve(self, ticket_id: str) -> None:
+        """Keep the allocator ahead of externally supplied ``TICKET-<n>`` ids."""
+        number = allocated_id_number(ticket_id)
+        if number is not None:
+            self._next_id = max(self._next_id, number + 1)
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Hold the store lock across several operations, e.g. a batch."""
+        with self._lock:
+            yield
+
+    def create(self, title: str, description: str, assignee: str | None) -> Ticket:
+        return self.create_many([(title, description, assignee)])[0]
+
+    def create_many(self, items: Iterable[tuple[str, str, str | None]]) -> list[Ticket]:
+        """Create tickets under one lock acquisition, allocating consecutive ids."""
+        with self._lock:
+            tickets: list[Ticket] = []
+            for title, description, assignee in items:
+                ticket = Ticket(
+                    id=format_ticket_id(self._next_id),
+                    title=title,
+                    description=description,
+                    status=TicketStatus.OPEN,
+                    assignee=assignee,
+                )
+                self._next_id += 1
+                self._index(ticket)
+                tickets.append(ticket)
+            return tickets
+
+    def get(self, ticket_id: str) -> Ticket | None:
+        return self._by_id.get(ticket_id)
+
+    def upsert(self, ticket: Ticket) -> bool:
+        """Insert or replace a ticket by id; return True if it was new."""
+        with self._lock:
+            existing = self._by_id.get(ticket.id)
+            if existing is None:
+                self._index(ticket)
+            else:
+                self._reindex(existing, ticket)
+            self._reserve(ticket.id)
+            return existing is None
+
+    def replace(self, ticket: Ticket, *, expected: Ticket) -> bool:
+        """Compare-and-set: store ``ticket`` only if ``expected`` is still current."""
+        with self._lock:
+            existing = self._by_id.get(ticket.id)
+            if existing is None or existing != expected:
+                return False
+            self._reindex(existing, ticket)
+            return True
+
+    def delete(self, ticket_id: str, *, expected: Ticket | None = None) -> bool:
+        """Delete a ticket; with ``expected``, only if it is still current."""
+        with self._lock:
+            existing = self._by_id.get(ticket_id)
+            if existing is None or (expected is not None and existing != expected):
+                return False
+            self._unindex(existing)
+            return True
+
+    def find(
+        self,
+        *,
+        status: TicketStatus | None = None,
+        assignee: str | None = None,
+    ) -> list[Ticket]:
+        """List tickets in creation order, narrowed through the smallest index."""
+        with self._lock:
+            tickets = map(self._by_seq.get, self._narrowest(status, assignee))
+            return [t for t in tickets if t is not None and _matches(t, status, assignee)]
+
+    def page(
+        self,
+        *,
+        status: TicketStatus | None = None,
+        assignee: str | None = None,
+        query: str | None = None,
+        after: int | None = None,
+        limit: int,
+    ) -> TicketPage:
+        """Return up to ``limit`` matches created after position ``after``.
+
+        The scan runs over the narrowest status/assignee index, or over the
+        text matches when those are fewer. Its start is found by bisection, so
+        a page costs O(log n + scanned) however deep the cursor is.
+        """
+        terms = query_terms(query)
+        with self._lock:
+            seqs = self._narrowest(status, assignee)
+            matches: set[int] | None = None
+            if terms:
+                matches = self._text.matching(terms)
+                if len(matches) <= len(seqs):
+                    seqs, matches = sorted(matches), None
+            tickets: list[Ticket] = []
+            last = -1
+            for i in range(0 if after is None else bisect.bisect_right(seqs, after), len(seqs)):
+                seq = seqs[i]
+                ticket = self._by_seq.get(seq)
+                if ticket is None or (matches is not None and seq not in matches):
+                    continue
+                if not _matches(ticket, status, assignee):
+                    continue
+                if len(tickets) == limit:
+                    return TicketPage(tickets=tickets, next_after=last)
+                tickets.append(ticket)
+                last = seq
+            return TicketPage(tickets=tickets, next_after=None)
+
+    def search(self, query: str, *, status: TicketStatus | None = None, limit: int) -> list[Ticket]:
+        """Return the ``limit`` best text matches, best first."""
+        terms = query_terms(query)
+        if not terms:
+            return []
+        with self._lock:
+            matches = [
+                seq for seq in self._text.matching(terms) if status is None or self._by_seq[seq].status == status
+            ]
+            scores = self._text.rank(terms, matches)
+            best = heapq.nsmallest(limit, matches, key=lambda seq: (-scores[seq], seq))
+            return [self._by_seq[seq] for seq in best]
+
+    def count(self, query: str | None = None, status: TicketStatus | None = None) -> int:
+        """Count tickets; without a query this is an index size lookup."""
+        terms = query_terms(query)
+        with self._lock:
+            if not terms:
+                return len(self._by_id) if status is None else len(self._by_status[status])
+            matches = self._text.matching(terms)
+            if status is None:
+                return len(matches)
+            return sum(1 for seq in matches if self._by_seq[seq].status == status)
+
+    def status_counts(self) -> dict[TicketStatus, int]:
+        with self._lock:
+            return {status: len(seqs) for status, seqs in self._by_status.items()}
+
+    def changes(self, after: int, limit: int) -> list[TicketChange]:
+        """Return up to ``limit`` log entries after sequence ``after``, oldest first."""
+        with self._lock:
+            start = bisect.bisect_right(self._changes, after, key=_change_seq)
+            return self._changes[start : start + limit]
+
+    def last_change_seq(self) -> int:
+        return self._change_seq
+
+    def change_horizon(self) -> int:
+        """Smallest ``after`` the log still serves completely."""
+        with self._lock:
+            return self._changes[0].seq - 1 if self._changes else self._change_seq
+
+    def clear(self) -> None:
+        """Drop every ticket and restart id allocation (tests, admin resets).
+
+        The change log is emptied too, but its sequence keeps counting so that
+        consumers never see a number twice.
+        """
+        with self._lock:
+            self._by_id.clear()
+            self._seq.clear()
+            self._by_seq.clear()
+            self._all.clear()
+            self._dead = 0
+            for seqs in self._by_status.values():
+                seqs.clear()
+            self._by_assignee.clear()
+            self._text.clear()
+            self._changes.clear()
+            self._next_id = 1
+
+
+def _insert_seq(seqs: list[int], seq: int) -> None:
+    if not seqs or seqs[-1] < seq:
+        seqs.append(seq)
+    else:
+        bisect.insort(seqs, seq)
+
+
+def _remove_seq(seqs: list[int], seq: int) -> None:
+    i = bisect.bisect_left(seqs, seq)
+    if i < len(seqs) and seqs[i] == seq:
+        del seqs[i]
+
+
+def _change_seq(change: TicketChange) -> int:
+    return change.seq
+
+
+def _matches(ticket: Ticket, status: TicketStatus | None, assignee: str | None) -> bool:
+    return (status is None or ticket.status == status) and (assignee is None or ticket.assignee == assignee)
+
+
+def _open_store() -> TicketStorage:
+    """Pick the backend: SQLite when JIRA_SERVICE_DB_PATH is set, else memory.
+
+    The SQLite schema is migrated here, i.e. on service startup.
+    """
+    path = os.environ.get("JIRA_SERVICE_DB_PATH", "").strip()
+    if not path:
+        return TicketStore()
+    from jira_service.sqlite_store import SqliteTicketStore
+
+    return SqliteTicketStore(path)
+
+
+_STORE: TicketStorage = _open_store()
+
+
+def set_store(store: TicketStorage) -> TicketStorage:
+    """Swap the active backend (tests, embedding); returns the previous one."""
+    global _STORE  # noqa: PLW0603
+    previous, _STORE = _STORE, store
+    return previous
+
+
+def store_transaction() -> AbstractContextManager[None]:
+    """Run several store operations as one transaction: no other writer can
+    interleave, and SQLite commits them together."""
+    return _STORE.transaction()
 
 
 def create_ticket(title: str, description: str, assignee: str | None) -> Ticket:
-    ticket = Ticket(
-        id=f"TICKET-{len(_TICKETS) + 1}",
-        title=title,
-        description=description,
-        status=TicketStatus.OPEN,
-        assignee=assignee,
-    )
-    _TICKETS.append(ticket)
-    return ticket
-
-
-def list_tickets() -> list[Ticket]:
-    return list(_TICKETS)
+    return _STORE.create(title, description, assignee)
+
+
+def create_tickets(items: list[tuple[str, str, str | None]]) -> list[Ticket]:
+    """Create many tickets in one step: ids are allocated and indexed under a
+    single lock acquisition instead of once per ticket."""
+    return _STORE.create_many(items)
+
+
+def get_ticket(ticket_id: str) -> Ticket | None:
+    return _STORE.get(ticket_id)
+
+
+def upsert_ticket(ticket: Ticket) -> bool:
+    """Insert or replace a ticket by id; return True if it was new."""
+    return _STORE.upsert(ticket)
+
+
+def replace_ticket(ticket: Ticket, *, expected: Ticket) -> bool:
+    """Atomically swap ``expected`` for ``ticket``; False if it changed meanwhile."""
+    return _STORE.replace(ticket, expected=expected)
+
+
+def delete_ticket(ticket_id: str, *, expected: Ticket | None = None) -> bool:
+    return _STORE.delete(ticket_id, expected=expected)
+
+
+def clear_tickets() -> None:
+    """Empty the store (and its indexes)."""
+    _STORE.clear()
+
+
+def count_tickets(query: str | None = None, status: TicketStatus | None = None) -> int:
+    """Count tickets; status-only counts come from the index without a scan."""
+    return _STORE.count(query, status)
+
+
+def ticket_stats() -> dict[TicketStatus, int]:
+    """Return the ticket count for every status (zero when absent)."""
+    return _STORE.status_counts()
+
+
+def list_tickets(
+    status: TicketStatus | None = None,
+    assignee: str | None = None,
+) -> list[Ticket]:
+    return _STORE.find(status=status, assignee=assignee)
+
+
+def page_tickets(
+    *,
+    status: TicketStatus | None = None,
+    assignee: str | None = None,
+    query: str | None = None,
+    after: int | None = None,
+    limit: int,
+) -> TicketPage:
+    """Return one page of matching tickets in creation order, resuming after
+    the position a previous page returned as ``next_after``."""
+    return _STORE.page(status=status, assignee=assignee, query=query, after=after, limit=limit)
+
+
+def search_tickets(query: str, status: TicketStatus | None = None, limit: int = 20) -> list[Ticket]:
+    """Rank tickets against a text query using the backend's full-text index."""
+    return _STORE.search(query, status=status, limit=limit)
+
+
+def ticket_changes(after: int, limit: int = 100) -> list[TicketChange]:
+    """Read the change log: entries with ``seq > after``, oldest first."""
+    return _STORE.changes(after, limit)
+
+
+def last_change_seq() -> int:
+    """Sequence number of the newest change log entry (0 when none)."""
+    return _STORE.last_change_seq()
+
+
+def change_horizon() -> int:
+    """Oldest position the change log can replay from; reading from an
+    earlier ``after`` would silently skip dropped entries."""
+    return _STORE.change_horizon()
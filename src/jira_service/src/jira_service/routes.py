@@ -1,13 +1,35 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, status
-from pydantic import BaseModel
+import base64
+import binascii
+import time
+from typing import Literal
 
+from fastapi import APIRouter, Header, HTTPException, Query, Response, status
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel, Field
+
+from jira_service.invalidation import DEFAULT_BUS
 from jira_service.models import (
+    Ticket,
+    TicketChange,
     TicketStatus,
+    change_horizon,
+    count_tickets,
     create_ticket,
-    list_tickets,
+    create_tickets,
+    delete_ticket,
+    get_ticket,
+    last_change_seq,
+    page_tickets,
+    replace_ticket,
+    search_tickets,
+    store_transaction,
+    ticket_changes,
+    ticket_etag,
+    ticket_stats,
 )
+from service_common import json_response
 
 router = APIRouter()
 
@@ -26,23 +48,463 @@ class TicketOut(BaseModel):
     assignee: str | None
 
 
+class TicketPatch(BaseModel):
+    title: str | None = None
+    description: str | None = None
+    status: TicketStatus | None = None
+    assignee: str | None = None
+
+
+class TicketDeletedResponse(BaseModel):
+    deleted: bool
+
+
 class TicketsResponse(BaseModel):
     tickets: list[TicketOut]
+    next_cursor: str | None = None
+
+
+class TicketChangeOut(BaseModel):
+    seq: int
+    ticket_id: str
+    kind: Literal["created", "updated", "deleted"]
+    at: float
+
+
+class TicketChangesResponse(BaseModel):
+    changes: list[TicketChangeOut]
+    last_seq: int
+    resync: bool = False
+
+
+class TicketCountResponse(BaseModel):
+    count: int
+
+
+class TicketStatsResponse(BaseModel):
+    total: int
+    by_status: dict[TicketStatus, int]
+
+
+# Largest number of operations accepted by one batch request.
+MAX_BATCH_SIZE = 1000
+
+
+class BulkTicketsIn(BaseModel):
+    tickets: list[TicketIn] = Field(max_length=MAX_BATCH_SIZE)
+
+
+class BulkTicketResult(BaseModel):
+    ticket: TicketOut | None = None
+    error: str | None = None
+
+
+class BulkTicketsResponse(BaseModel):
+    results: list[BulkTicketResult]
+
+
+class BatchCreateIn(BaseModel):
+    tickets: list[TicketIn] = Field(max_length=MAX_BATCH_SIZE)
+
+
+class BatchUpdateItem(TicketPatch):
+    id: str
+    if_match: str | None = None
+
+
+class BatchUpdateIn(BaseModel):
+    updates: list[BatchUpdateItem] = Field(max_length=MAX_BATCH_SIZE)
+
+
+class BatchDeleteItem(BaseModel):
+    id: str
+    if_match: str | None = None
+
+
+class BatchDeleteIn(BaseModel):
+    deletes: list[BatchDeleteItem] = Field(max_length=MAX_BATCH_SIZE)
+
+
+class BatchItemResult(BaseModel):
+    """Outcome of one batch item; ``status`` is the HTTP status the
+    equivalent single-ticket request would have returned. For a delete,
+    ``ticket`` is the ticket removed, or null if it did not exist."""
+
+    status: int
+    ticket: TicketOut | None = None
+    error: str | None = None
+
+
+class BatchResponse(BaseModel):
+    results: list[BatchItemResult]
+
+
+def _validate_new(payload: TicketIn) -> None:
+    """Reject a ticket that cannot be created; raises ValueError."""
+    if not payload.title.strip():
+        raise ValueError("title must be non-empty")
 
 
 @router.post("/tickets", response_model=TicketOut, status_code=status.HTTP_201_CREATED)
 def create_ticket_route(payload: TicketIn) -> TicketOut:
+    try:
+        _validate_new(payload)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
     ticket = create_ticket(
         title=payload.title,
         description=payload.description,
         assignee=payload.assignee,
     )
+    DEFAULT_BUS.publish(ticket.id, "created")
     return TicketOut(**ticket.__dict__)
 
 
+_CURSOR_PREFIX = "v1:"
+
+
+def _encode_cursor(after: int) -> str:
+    return base64.urlsafe_b64encode(f"{_CURSOR_PREFIX}{after}".encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> int:
+    """Turn an opaque cursor back into a store position (400 if malformed)."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        if raw.startswith(_CURSOR_PREFIX):
+            return int(raw.removeprefix(_CURSOR_PREFIX))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        pass
+    raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
 @router.get("/tickets", response_model=TicketsResponse)
-def list_tickets_route() -> TicketsResponse:
-    tickets = list_tickets()
-    return TicketsResponse(
-        tickets=[TicketOut(**t.__dict__) for t in tickets]
+def list_tickets_route(
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: str | None = None,
+    status: TicketStatus | None = None,
+    q: str | None = None,
+) -> Response:
+    """List tickets in creation order, one page at a time.
+
+    Filters are applied by the store through its indexes. Pass the returned
+    ``next_cursor`` back (with the same filters) to get the next page; it is
+    null on the last page.
+
+    Store tickets already have the ``TicketOut`` shape, so the page is encoded
+    directly, without building and re-validating a response model per row.
+    """
+    page = page_tickets(
+        status=status,
+        query=q,
+        after=None if cursor is None else _decode_cursor(cursor),
+        limit=limit,
     )
+    return json_response(
+        {
+            "tickets": [t.__dict__ for t in page.tickets],
+            "next_cursor": None if page.next_after is None else _encode_cursor(page.next_after),
+        }
+    )
+
+
+@router.get("/tickets/search", response_model=TicketsResponse)
+def search_tickets_route(
+    q: str,
+    status: TicketStatus | None = None,
+    limit: int = Query(20, ge=1, le=100),
+) -> Response:
+    """Rank tickets against a text query, best match first.
+
+    Every word of ``q`` matches as a prefix, and a ticket must match all of
+    them. Title matches rank above description matches.
+    """
+    tickets = search_tickets(q, status=status, limit=limit)
+    return json_response({"tickets": [t.__dict__ for t in tickets], "next_cursor": None})
+
+
+# Longest long-poll. Waiting requests are suspended coroutines, not threads.
+MAX_CHANGES_WAIT_SECONDS = 30.0
+# Writes made through this process publish to the invalidation bus and wake
+# waiters at once. Writes by other worker processes sharing the SQLite store
+# are noticed by re-reading the log this often.
+_CHANGES_POLL_SECONDS = 1.0
+
+
+def _read_changes(since: int, limit: int) -> tuple[list[TicketChange], bool]:
+    """Read a page of the log, and whether ``since`` is outside what it retains."""
+    changes = ticket_changes(since, limit)
+    # Checked after the read: a prune in between only causes a needless resync.
+    resync = since < change_horizon() or since > last_change_seq()
+    return changes, resync
+
+
+@router.get("/tickets/changes", response_model=TicketChangesResponse)
+async def ticket_changes_route(
+    since: int = Query(0, ge=0),
+    wait: float = Query(0.0, ge=0.0, le=MAX_CHANGES_WAIT_SECONDS),
+    limit: int = Query(100, ge=1, le=1000),
+) -> Response:
+    """Read the change log after sequence ``since``, oldest first.
+
+    With ``wait``, an empty result is held open for up to that many seconds
+    until a change arrives (long polling). Pass the ``seq`` of the last change
+    back as ``since``. ``last_seq`` is the newest sequence in the log, so a
+    consumer can start following from it after a full listing.
+
+    ``resync`` is true, with no changes, when ``since`` is older than the
+    retained log or ahead of it (the store was reset): list tickets again and
+    continue from ``last_seq``.
+    """
+    deadline = time.monotonic() + wait
+    while True:
+        # Read the bus position first, so a write that lands after the log
+        # read below still ends the wait.
+        mark = DEFAULT_BUS.last_seq
+        changes, resync = await run_in_threadpool(_read_changes, since, limit)
+        remaining = deadline - time.monotonic()
+        if changes or resync or remaining <= 0:
+            break
+        await DEFAULT_BUS.wait_async(mark, min(remaining, _CHANGES_POLL_SECONDS))
+    return json_response(
+        {
+            "changes": [] if resync else [c.__dict__ for c in changes],
+            "last_seq": last_change_seq(),
+            "resync": resync,
+        }
+    )
+
+
+@router.get("/tickets/count", response_model=TicketCountResponse)
+def count_tickets_route(q: str | None = None, status: TicketStatus | None = None) -> TicketCountResponse:
+    """Count tickets matching a text query and/or status without listing them."""
+    return TicketCountResponse(count=count_tickets(query=q, status=status))
+
+
+@router.get("/tickets/stats", response_model=TicketStatsResponse)
+def ticket_stats_route() -> TicketStatsResponse:
+    """Ticket totals overall and per status."""
+    by_status = ticket_stats()
+    return TicketStatsResponse(total=sum(by_status.values()), by_status=by_status)
+
+
+# Compare-and-set attempts for a PATCH without If-Match before giving up.
+_PATCH_ATTEMPTS = 3
+
+
+def _precondition_failed() -> HTTPException:
+    return HTTPException(status_code=status.HTTP_412_PRECONDITION_FAILED, detail="Ticket has changed")
+
+
+def _validate_patch(payload: TicketPatch) -> None:
+    """Reject PATCH values a ticket cannot hold; raises ValueError."""
+    for field in ("title", "description", "status"):
+        if field in payload.model_fields_set and getattr(payload, field) is None:
+            raise ValueError(f"{field} cannot be null")
+    if payload.title is not None and not payload.title.strip():
+        raise ValueError("title must be non-empty")
+
+
+def _patched(current: Ticket, payload: TicketPatch) -> Ticket:
+    """``current`` with the fields a validated PATCH sets."""
+    return Ticket(
+        id=current.id,
+        title=current.title if payload.title is None else payload.title,
+        description=current.description if payload.description is None else payload.description,
+        status=current.status if payload.status is None else TicketStatus(payload.status),
+        assignee=payload.assignee if "assignee" in payload.model_fields_set else current.assignee,
+    )
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    """Match an If-Match / If-None-Match header value against an ETag."""
+    candidates = {tag.strip() for tag in header.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def _apply_patch(ticket_id: str, payload: TicketPatch, if_match: str | None) -> tuple[Ticket, Ticket]:
+    """Apply a PATCH as a compare-and-set; return the ticket before and after.
+
+    Shared by ``PATCH /tickets/{id}`` and ``:batchUpdate``. Raises
+    HTTPException with 400, 404, 412, or 409 when every attempt lost to a
+    concurrent writer.
+    """
+    try:
+        _validate_patch(payload)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+    for _ in range(_PATCH_ATTEMPTS):
+        current = get_ticket(ticket_id)
+        if current is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Ticket not found")
+        if if_match is not None and not _etag_matches(if_match, ticket_etag(current)):
+            raise _precondition_failed()
+        updated = _patched(current, payload)
+        if updated == current or replace_ticket(updated, expected=current):
+            return current, updated
+    raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Ticket is being modified concurrently")
+
+
+def _apply_delete(ticket_id: str, if_match: str | None) -> Ticket | None:
+    """Delete a ticket; return it, or None if it did not exist.
+
+    Shared by ``DELETE /tickets/{id}`` and ``:batchDelete``. With If-Match,
+    only the version with that ETag is deleted; otherwise, or if the ticket
+    does not exist, raises HTTPException 412 (RFC 9110).
+    """
+    current = get_ticket(ticket_id)
+    if if_match is not None:
+        if current is None or not _etag_matches(if_match, ticket_etag(current)):
+            raise _precondition_failed()
+        if not delete_ticket(ticket_id, expected=current):
+            raise _precondition_failed()
+        return current
+    return current if delete_ticket(ticket_id) else None
+
+
+@router.get("/tickets/{ticket_id}", response_model=TicketOut)
+def get_ticket_route(
+    ticket_id: str,
+    response: Response,
+    if_none_match: str | None = Header(None),
+) -> TicketOut | Response:
+    """Fetch one ticket by id (an index lookup). The ``ETag`` header is
+    its version; send it as If-None-Match to get ``304`` when unchanged."""
+    ticket = get_ticket(ticket_id)
+    if ticket is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Ticket not found")
+    etag = ticket_etag(ticket)
+    if if_none_match is not None and _etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return TicketOut(**ticket.__dict__)
+
+
+@router.patch("/tickets/{ticket_id}", response_model=TicketOut)
+def update_ticket_route(
+    ticket_id: str,
+    payload: TicketPatch,
+    response: Response,
+    if_match: str | None = Header(None),
+) -> TicketOut:
+    """Update the fields present in the body.
+
+    With If-Match, the update only applies if the ticket still has that ETag
+    (``412`` otherwise). The swap itself is a store-level compare-and-set, so
+    a concurrent writer can never be overwritten silently.
+    """
+    current, updated = _apply_patch(ticket_id, payload, if_match)
+    if updated != current:
+        DEFAULT_BUS.publish(ticket_id, "updated")
+    response.headers["ETag"] = ticket_etag(updated)
+    return TicketOut(**updated.__dict__)
+
+
+@router.delete("/tickets/{ticket_id}", response_model=TicketDeletedResponse)
+def delete_ticket_route(ticket_id: str, if_match: str | None = Header(None)) -> TicketDeletedResponse:
+    """Delete a ticket; ``deleted`` is false if it did not exist. With
+    If-Match, only deletes the version with that ETag (``412`` otherwise)."""
+    deleted = _apply_delete(ticket_id, if_match)
+    if deleted is not None:
+        DEFAULT_BUS.publish(ticket_id, "deleted")
+    return TicketDeletedResponse(deleted=deleted is not None)
+
+
+def _batch_result(code: int, ticket: Ticket | None = None, error: str | None = None) -> BatchItemResult:
+    return BatchItemResult(
+        status=code,
+        ticket=None if ticket is None else TicketOut(**ticket.__dict__),
+        error=error,
+    )
+
+
+@router.post("/tickets:batchCreate", response_model=BatchResponse)
+def batch_create_tickets_route(payload: BatchCreateIn) -> BatchResponse:
+    """Create up to MAX_BATCH_SIZE tickets in one store transaction.
+
+    Results are per item, in request order (``201`` or ``400``).
+    """
+    results: list[BatchItemResult | None] = [None] * len(payload.tickets)
+    positions: list[int] = []
+    items: list[tuple[str, str, str | None]] = []
+    for position, item in enumerate(payload.tickets):
+        try:
+            _validate_new(item)
+        except ValueError as exc:
+            results[position] = _batch_result(status.HTTP_400_BAD_REQUEST, error=str(exc))
+            continue
+        positions.append(position)
+        items.append((item.title, item.description, item.assignee))
+
+    created = create_tickets(items)
+    for position, ticket in zip(positions, created, strict=True):
+        results[position] = _batch_result(status.HTTP_201_CREATED, ticket)
+    for ticket in created:
+        DEFAULT_BUS.publish(ticket.id, "created")
+    return BatchResponse(results=[r for r in results if r is not None])
+
+
+@router.post(
+    "/tickets/bulk",
+    response_model=BulkTicketsResponse,
+    status_code=status.HTTP_201_CREATED,
+    deprecated=True,
+)
+def create_tickets_route(payload: BulkTicketsIn) -> BulkTicketsResponse:
+    """Deprecated alias of ``POST /tickets:batchCreate``, in the older result shape."""
+    batch = batch_create_tickets_route(BatchCreateIn(tickets=payload.tickets))
+    return BulkTicketsResponse(
+        results=[BulkTicketResult(ticket=r.ticket, error=r.error) for r in batch.results]
+    )
+
+
+@router.post("/tickets:batchUpdate", response_model=BatchResponse)
+def batch_update_tickets_route(payload: BatchUpdateIn) -> BatchResponse:
+    """Apply up to MAX_BATCH_SIZE PATCHes in one store transaction.
+
+    Each item goes through the same code as ``PATCH /tickets/{id}``
+    (``if_match`` standing in for the header). Results are per item, in
+    request order (``200``, ``400``, ``404``, ``409`` or ``412``), and one
+    failure does not stop the others.
+    """
+    results: list[BatchItemResult] = []
+    changed: list[str] = []
+    with store_transaction():
+        for item in payload.updates:
+            try:
+                current, updated = _apply_patch(item.id, item, item.if_match)
+            except HTTPException as exc:
+                results.append(_batch_result(exc.status_code, error=exc.detail))
+                continue
+            if updated != current:
+                changed.append(updated.id)
+            results.append(_batch_result(status.HTTP_200_OK, updated))
+    for ticket_id in changed:
+        DEFAULT_BUS.publish(ticket_id, "updated")
+    return BatchResponse(results=results)
+
+
+@router.post("/tickets:batchDelete", response_model=BatchResponse)
+def batch_delete_tickets_route(payload: BatchDeleteIn) -> BatchResponse:
+    """Delete up to MAX_BATCH_SIZE tickets in one store transaction.
+
+    Each item goes through the same code as ``DELETE /tickets/{id}``.
+    Results are per item, in request order: ``200`` with the removed ticket,
+    ``200`` with no ticket if it did not exist, or ``412``.
+    """
+    results: list[BatchItemResult] = []
+    deleted: list[str] = []
+    with store_transaction():
+        for item in payload.deletes:
+            try:
+                removed = _apply_delete(item.id, item.if_match)
+            except HTTPException as exc:
+                results.append(_batch_result(exc.status_code, error=exc.detail))
+                continue
+            if removed is not None:
+                deleted.append(item.id)
+            results.append(_batch_result(status.HTTP_200_OK, removed))
+    for ticket_id in deleted:
+        DEFAULT_BUS.publish(ticket_id, "deleted")
+    return BatchResponse(results=results)
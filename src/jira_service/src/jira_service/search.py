@@ -0,0 +1,107 @@
+"""In-memory full-text index for ticket titles and descriptions.
+
+``TextIndex`` is an inverted index from word to the tickets (by creation
+sequence) that contain it. It is kept up to date one ticket at a time by
+``TicketStore``. Query semantics:
+- Text is split into lowercase words (``\\w+``)
+- Every query word is a prefix: ``exp`` matches "export" and "expired"
+- A ticket matches when it matches every query word
+- Ranking is tf-idf, with title words weighted twice as much as description
+  words. Ties are broken by creation order
+
+The SQLite backend gives the same semantics through FTS5 (ranked by bm25).
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+import re
+from collections import Counter
+from collections.abc import Iterable
+
+_WORD = re.compile(r"\w+")
+_TITLE_WEIGHT = 2
+# Sorts after every string that starts with a given prefix.
+_PREFIX_END = "\U0010ffff"
+
+
+def query_terms(query: str | None) -> list[str]:
+    """Split a search query into lowercase words (empty for a blank query)."""
+    return _WORD.findall(query.casefold()) if query else []
+
+
+def _weights(title: str, description: str) -> Counter[str]:
+    weights: Counter[str] = Counter()
+    for word in _WORD.findall(title.casefold()):
+        weights[word] += _TITLE_WEIGHT
+    weights.update(_WORD.findall(description.casefold()))
+    return weights
+
+
+class TextIndex:
+    """Inverted index with prefix lookup over a sorted vocabulary.
+
+    Not thread-safe on its own; the owning store serialises access.
+    """
+
+    def __init__(self) -> None:
+        self._postings: dict[str, dict[int, int]] = {}
+        self._vocabulary: list[str] = []
+        self._documents = 0
+
+    def add(self, seq: int, title: str, description: str) -> None:
+        for word, weight in _weights(title, description).items():
+            postings = self._postings.get(word)
+            if postings is None:
+                postings = self._postings[word] = {}
+                bisect.insort(self._vocabulary, word)
+            postings[seq] = weight
+        self._documents += 1
+
+    def remove(self, seq: int, title: str, description: str) -> None:
+        for word in _weights(title, description):
+            postings = self._postings.get(word)
+            if postings is None:
+                continue
+            postings.pop(seq, None)
+            if not postings:
+                del self._postings[word]
+                del self._vocabulary[bisect.bisect_left(self._vocabulary, word)]
+        self._documents -= 1
+
+    def clear(self) -> None:
+        self._postings.clear()
+        self._vocabulary.clear()
+        self._documents = 0
+
+    def _expand(self, prefix: str) -> list[str]:
+        """Vocabulary words starting with ``prefix``, found by bisection."""
+        start = bisect.bisect_left(self._vocabulary, prefix)
+        end = bisect.bisect_left(self._vocabulary, prefix + _PREFIX_END, start)
+        return self._vocabulary[start:end]
+
+    def matching(self, terms: Iterable[str]) -> set[int]:
+        """Sequences of tickets that match every term as a word prefix."""
+        matches: set[int] | None = None
+        for words in sorted((self._expand(term) for term in set(terms)), key=len):
+            found: set[int] = set()
+            for word in words:
+                found.update(self._postings[word])
+            matches = found if matches is None else matches & found
+            if not matches:
+                return set()
+        return matches or set()
+
+    def rank(self, terms: Iterable[str], seqs: Iterable[int]) -> dict[int, float]:
+        """Score ``seqs`` (already known to match) against the query terms."""
+        scores = dict.fromkeys(seqs, 0.0)
+        for term in set(terms):
+            for word in self._expand(term):
+                postings = self._postings[word]
+                idf = math.log(1 + self._documents / len(postings))
+                for seq in scores:
+                    weight = postings.get(seq)
+                    if weight:
+                        scores[seq] += idf * weight
+        return scores
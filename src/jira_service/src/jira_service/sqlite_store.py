@@ -0,0 +1,417 @@
+"""SQLite ticket storage for jira_service.
+
+A drop-in alternative to the in-memory ``TicketStore`` that survives restarts
+and can be shared by several uvicorn worker processes:
+- WAL journal, so readers never block the single writer and vice versa
+- One connection per thread (sqlite3 connections must not be shared), each
+  with its own prepared-statement cache; all SQL below is constant and
+  parameterised so statements are compiled once per connection
+- Writes run in ``BEGIN IMMEDIATE`` transactions; bulk creates insert with one
+  ``executemany`` in a single transaction
+- Ids come from a persistent allocator row, so they stay unique and monotonic
+  across processes
+- The schema is migrated on open, tracked with ``PRAGMA user_version``
+- Text queries use an FTS5 index kept in sync by triggers
+- Triggers also append every create, update and delete to a change log table,
+  in the same transaction as the write. Old entries are pruned every
+  ``_PRUNE_EVERY`` write transactions, keeping ``change_history`` of them
+"""
+
+from __future__ import annotations
+
+import itertools
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+
+from tickets_api.client import TicketStatus
+
+from jira_service.models import (
+    CHANGE_HISTORY,
+    Ticket,
+    TicketChange,
+    TicketPage,
+    allocated_id_number,
+    format_ticket_id,
+)
+from jira_service.search import query_terms
+
+# Each entry upgrades the schema by one version; never edit a shipped entry.
+_MIGRATIONS: tuple[str, ...] = (
+    """
+    CREATE TABLE tickets (
+        seq         INTEGER PRIMARY KEY AUTOINCREMENT,
+        id          TEXT NOT NULL UNIQUE,
+        title       TEXT NOT NULL,
+        description TEXT NOT NULL,
+        status      TEXT NOT NULL,
+        assignee    TEXT
+    );
+    CREATE INDEX idx_tickets_status   ON tickets (status, seq);
+    CREATE INDEX idx_tickets_assignee ON tickets (assignee, seq);
+    CREATE TABLE id_allocator (
+        name TEXT PRIMARY KEY,
+        next INTEGER NOT NULL
+    );
+    INSERT INTO id_allocator (name, next) VALUES ('ticket', 1);
+    """,
+    # Full-text index over title/description, kept in sync by triggers.
+    """
+    CREATE VIRTUAL TABLE tickets_fts USING fts5(
+        title, description, content='tickets', content_rowid='seq'
+    );
+    CREATE TRIGGER tickets_fts_insert AFTER INSERT ON tickets BEGIN
+        INSERT INTO tickets_fts (rowid, title, description)
+        VALUES (new.seq, new.title, new.description);
+    END;
+    CREATE TRIGGER tickets_fts_delete AFTER DELETE ON tickets BEGIN
+        INSERT INTO tickets_fts (tickets_fts, rowid, title, description)
+        VALUES ('delete', old.seq, old.title, old.description);
+    END;
+    CREATE TRIGGER tickets_fts_update AFTER UPDATE OF title, description ON tickets BEGIN
+        INSERT INTO tickets_fts (tickets_fts, rowid, title, description)
+        VALUES ('delete', old.seq, old.title, old.description);
+        INSERT INTO tickets_fts (rowid, title, description)
+        VALUES (new.seq, new.title, new.description);
+    END;
+    INSERT INTO tickets_fts (tickets_fts) VALUES ('rebuild');
+    """,
+    # Append-only change log. AUTOINCREMENT keeps seq monotonic even after
+    # entries are deleted; "at" is Unix time in seconds.
+    """
+    CREATE TABLE ticket_changes (
+        seq       INTEGER PRIMARY KEY AUTOINCREMENT,
+        ticket_id TEXT NOT NULL,
+        kind      TEXT NOT NULL,
+        at        REAL NOT NULL
+    );
+    CREATE TRIGGER tickets_change_insert AFTER INSERT ON tickets BEGIN
+        INSERT INTO ticket_changes (ticket_id, kind, at)
+        VALUES (new.id, 'created', (julianday('now') - 2440587.5) * 86400.0);
+    END;
+    CREATE TRIGGER tickets_change_update AFTER UPDATE ON tickets
+    WHEN old.title IS NOT new.title OR old.description IS NOT new.description
+        OR old.status IS NOT new.status OR old.assignee IS NOT new.assignee
+    BEGIN
+        INSERT INTO ticket_changes (ticket_id, kind, at)
+        VALUES (new.id, 'updated', (julianday('now') - 2440587.5) * 86400.0);
+    END;
+    CREATE TRIGGER tickets_change_delete AFTER DELETE ON tickets BEGIN
+        INSERT INTO ticket_changes (ticket_id, kind, at)
+        VALUES (old.id, 'deleted', (julianday('now') - 2440587.5) * 86400.0);
+    END;
+    """,
+)
+
+_COLUMNS = "id, title, description, status, assignee"
+_SELECT_BY_ID = f"SELECT {_COLUMNS} FROM tickets WHERE id = ?"
+_EXISTS = "SELECT 1 FROM tickets WHERE id = ?"
+_INSERT = "INSERT INTO tickets (id, title, description, status, assignee) VALUES (?, ?, ?, ?, ?)"
+_UPSERT = """
+INSERT INTO tickets (id, title, description, status, assignee) VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (id) DO UPDATE SET
+    title = excluded.title,
+    description = excluded.description,
+    status = excluded.status,
+    assignee = excluded.assignee
+"""
+_UPDATE = "UPDATE tickets SET title = ?, description = ?, status = ?, assignee = ? WHERE id = ?"
+_DELETE = "DELETE FROM tickets WHERE id = ?"
+_NEXT_ID = "SELECT next FROM id_allocator WHERE name = 'ticket'"
+_ADVANCE_ID = "UPDATE id_allocator SET next = MAX(next, ?) WHERE name = 'ticket'"
+_COUNT_BY_STATUS = "SELECT status, COUNT(*) FROM tickets GROUP BY status"
+_CHANGES = "SELECT seq, ticket_id, kind, at FROM ticket_changes WHERE seq > ? ORDER BY seq LIMIT ?"
+_LAST_CHANGE = "SELECT seq FROM sqlite_sequence WHERE name = 'ticket_changes'"
+_FIRST_CHANGE = "SELECT MIN(seq) FROM ticket_changes"
+_PRUNE_CHANGES = f"DELETE FROM ticket_changes WHERE seq <= ({_LAST_CHANGE}) - ?"
+_PRUNE_EVERY = 256
+_TEXT_MATCH = "seq IN (SELECT rowid FROM tickets_fts WHERE tickets_fts MATCH ?)"
+# bm25 weights per column (title, description), matching TextIndex's 2:1.
+_SEARCH = """
+SELECT t.id, t.title, t.description, t.status, t.assignee
+FROM tickets_fts JOIN tickets t ON t.seq = tickets_fts.rowid
+WHERE tickets_fts MATCH ? AND (? IS NULL OR t.status = ?)
+ORDER BY bm25(tickets_fts, 2.0, 1.0), t.seq
+LIMIT ?
+"""
+
+
+def _row_to_ticket(row: tuple[str, str, str, str, str | None]) -> Ticket:
+    ticket_id, title, description, status, assignee = row
+    return Ticket(id=ticket_id, title=title, description=description, status=TicketStatus(status), assignee=assignee)
+
+
+def _match_expression(terms: list[str]) -> str:
+    """FTS5 query matching every term as a prefix (terms are ``\\w+`` words)."""
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def _statements(script: str) -> Iterator[str]:
+    """Split a migration script into statements, keeping trigger bodies whole."""
+    buffer = ""
+    for chunk in script.split(";"):
+        buffer += chunk + ";"
+        if sqlite3.complete_statement(buffer):
+            statement = buffer.strip()
+            if statement != ";":
+                yield statement
+            buffer = ""
+
+
+def _where(
+    *,
+    status: TicketStatus | None = None,
+    assignee: str | None = None,
+    query: str | None = None,
+    after: int | None = None,
+) -> tuple[str, list[object]]:
+    """Build a parameterised WHERE clause for the listing filters."""
+    clauses: list[str] = []
+    params: list[object] = []
+    if status is not None:
+        clauses.append("status = ?")
+        params.append(status.value)
+    if assignee is not None:
+        clauses.append("assignee = ?")
+        params.append(assignee)
+    terms = query_terms(query)
+    if terms:
+        clauses.append(_TEXT_MATCH)
+        params.append(_match_expression(terms))
+    if after is not None:
+        clauses.append("seq > ?")
+        params.append(after)
+    return (f" WHERE {' AND '.join(clauses)}" if clauses else ""), params
+
+
+class SqliteTicketStore:
+    """Durable TicketStore backed by a SQLite file in WAL mode."""
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        busy_timeout_ms: int = 5000,
+        change_history: int = CHANGE_HISTORY,
+    ) -> None:
+        if path == ":memory:" or not path.strip():
+            raise ValueError("SqliteTicketStore needs a file path (use TicketStore for in-memory)")
+        self._path = path
+        self._busy_timeout_ms = busy_timeout_ms
+        self._change_history = change_history
+        self._writes = itertools.count(1)
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._migrate()
+
+    # -------------------------
+    # Connections
+    # -------------------------
+
+    def _conn(self) -> sqlite3.Connection:
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self._path,
+                isolation_level=None,  # explicit BEGIN/COMMIT below
+                check_same_thread=False,
+                cached_statements=64,
+            )
+            conn.execute(f"PRAGMA busy_timeout = {int(self._busy_timeout_ms)}")
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    @contextmanager
+    def _write(self) -> Iterator[sqlite3.Connection]:
+        """Run a write transaction, taking the write lock up front.
+
+        Inside ``transaction()`` this joins the open transaction instead.
+        """
+        conn = self._conn()
+        if conn.in_transaction:
+            yield conn
+            return
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+            if next(self._writes) % _PRUNE_EVERY == 0:
+                conn.execute(_PRUNE_CHANGES, (self._change_history,))
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def _migrate(self) -> None:
+        with self._write() as conn:
+            version = int(conn.execute("PRAGMA user_version").fetchone()[0])
+            for number, script in enumerate(_MIGRATIONS[version:], start=version + 1):
+                for statement in _statements(script):
+                    conn.execute(statement)
+                conn.execute(f"PRAGMA user_version = {number}")
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group several operations into one write transaction and commit."""
+        with self._write():
+            yield
+
+    def schema_version(self) -> int:
+        return int(self._conn().execute("PRAGMA user_version").fetchone()[0])
+
+    def close(self) -> None:
+        """Close every connection opened by this store."""
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+    # -------------------------
+    # TicketStore API
+    # -------------------------
+
+    def __len__(self) -> int:
+        return int(self._conn().execute("SELECT COUNT(*) FROM tickets").fetchone()[0])
+
+    def create(self, title: str, description: str, assignee: str | None) -> Ticket:
+        return self.create_many([(title, description, assignee)])[0]
+
+    def create_many(self, items: Iterable[tuple[str, str, str | None]]) -> list[Ticket]:
+        """Allocate ids and insert every ticket in one transaction."""
+        items = list(items)
+        with self._write() as conn:
+            start = int(conn.execute(_NEXT_ID).fetchone()[0])
+            tickets = [
+                Ticket(
+                    id=format_ticket_id(start + offset),
+                    title=title,
+                    description=description,
+                    status=TicketStatus.OPEN,
+                    assignee=assignee,
+                )
+                for offset, (title, description, assignee) in enumerate(items)
+            ]
+            conn.executemany(
+                _INSERT,
+                [(t.id, t.title, t.description, t.status.value, t.assignee) for t in tickets],
+            )
+            conn.execute(_ADVANCE_ID, (start + len(tickets),))
+        return tickets
+
+    def get(self, ticket_id: str) -> Ticket | None:
+        row = self._conn().execute(_SELECT_BY_ID, (ticket_id,)).fetchone()
+        return _row_to_ticket(row) if row else None
+
+    def upsert(self, ticket: Ticket) -> bool:
+        """Insert or replace a ticket by id; return True if it was new."""
+        with self._write() as conn:
+            existed = conn.execute(_EXISTS, (ticket.id,)).fetchone() is not None
+            conn.execute(
+                _UPSERT,
+                (ticket.id, ticket.title, ticket.description, ticket.status.value, ticket.assignee),
+            )
+            number = allocated_id_number(ticket.id)
+            if number is not None:
+                conn.execute(_ADVANCE_ID, (number + 1,))
+        return not existed
+
+    def replace(self, ticket: Ticket, *, expected: Ticket) -> bool:
+        """Compare-and-set inside one write transaction."""
+        with self._write() as conn:
+            row = conn.execute(_SELECT_BY_ID, (ticket.id,)).fetchone()
+            if row is None or _row_to_ticket(row) != expected:
+                return False
+            conn.execute(
+                _UPDATE,
+                (ticket.title, ticket.description, ticket.status.value, ticket.assignee, ticket.id),
+            )
+            return True
+
+    def delete(self, ticket_id: str, *, expected: Ticket | None = None) -> bool:
+        with self._write() as conn:
+            if expected is not None:
+                row = conn.execute(_SELECT_BY_ID, (ticket_id,)).fetchone()
+                if row is None or _row_to_ticket(row) != expected:
+                    return False
+            return conn.execute(_DELETE, (ticket_id,)).rowcount > 0
+
+    def find(
+        self,
+        *,
+        status: TicketStatus | None = None,
+        assignee: str | None = None,
+    ) -> list[Ticket]:
+        """List tickets in creation order using the status/assignee indexes."""
+        where, params = _where(status=status, assignee=assignee)
+        rows = self._conn().execute(f"SELECT {_COLUMNS} FROM tickets{where} ORDER BY seq", params)
+        return [_row_to_ticket(row) for row in rows]
+
+    def page(
+        self,
+        *,
+        status: TicketStatus | None = None,
+        assignee: str | None = None,
+        query: str | None = None,
+        after: int | None = None,
+        limit: int,
+    ) -> TicketPage:
+        """Keyset page on ``seq``: the (status, seq) and (assignee, seq) indexes
+        serve both the filter and the seek, so deep pages cost the same as the
+        first one."""
+        where, params = _where(status=status, assignee=assignee, query=query, after=after)
+        rows = self._conn().execute(
+            f"SELECT seq, {_COLUMNS} FROM tickets{where} ORDER BY seq LIMIT ?",
+            [*params, limit + 1],
+        ).fetchall()
+        tickets = [_row_to_ticket(row[1:]) for row in rows[:limit]]
+        next_after = int(rows[limit - 1][0]) if len(rows) > limit else None
+        return TicketPage(tickets=tickets, next_after=next_after)
+
+    def search(self, query: str, *, status: TicketStatus | None = None, limit: int) -> list[Ticket]:
+        """Return the ``limit`` best FTS5 matches, best (lowest bm25) first."""
+        terms = query_terms(query)
+        if not terms:
+            return []
+        value = None if status is None else status.value
+        rows = self._conn().execute(_SEARCH, (_match_expression(terms), value, value, limit))
+        return [_row_to_ticket(row) for row in rows]
+
+    def count(self, query: str | None = None, status: TicketStatus | None = None) -> int:
+        where, params = _where(status=status, query=query)
+        return int(self._conn().execute(f"SELECT COUNT(*) FROM tickets{where}", params).fetchone()[0])
+
+    def status_counts(self) -> dict[TicketStatus, int]:
+        counts = dict.fromkeys(TicketStatus, 0)
+        for status, count in self._conn().execute(_COUNT_BY_STATUS):
+            counts[TicketStatus(status)] = int(count)
+        return counts
+
+    def changes(self, after: int, limit: int) -> list[TicketChange]:
+        """Return up to ``limit`` log entries after ``after``: a primary-key range scan."""
+        rows = self._conn().execute(_CHANGES, (after, limit))
+        return [TicketChange(int(seq), ticket_id, kind, float(at)) for seq, ticket_id, kind, at in rows]
+
+    def last_change_seq(self) -> int:
+        row = self._conn().execute(_LAST_CHANGE).fetchone()
+        return int(row[0]) if row else 0
+
+    def change_horizon(self) -> int:
+        """Smallest ``after`` the log still serves completely."""
+        first = self._conn().execute(_FIRST_CHANGE).fetchone()[0]
+        return self.last_change_seq() if first is None else int(first) - 1
+
+    def clear(self) -> None:
+        """Drop every ticket and restart id allocation (tests, admin resets).
+
+        The change log is emptied too; its sequence keeps counting.
+        """
+        with self._write() as conn:
+            conn.execute("DELETE FROM tickets")
+            conn.execute("DELETE FROM ticket_changes")
+            conn.execute("UPDATE id_allocator SET next = 1 WHERE name = 'ticket'")
@@ -0,0 +1,161 @@
+"""Jira webhook ingestion and the invalidation stream endpoint."""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import json
+import os
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from fastapi import APIRouter, HTTPException, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, StreamingResponse
+from jira_impl.impl import map_status
+from jira_impl.jira_client import JiraIssue, parse_issue
+
+from jira_service.invalidation import DEFAULT_BUS, sse_stream
+from jira_service.models import Ticket, delete_ticket, upsert_ticket
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+router = APIRouter()
+
+_EVENT_KINDS = {
+    "jira:issue_created": "created",
+    "jira:issue_updated": "updated",
+    "jira:issue_deleted": "deleted",
+}
+
+
+def _verify_signature(body: bytes, header: str | None) -> None:
+    """Check Jira's ``X-Hub-Signature`` against JIRA_WEBHOOK_SECRET.
+
+    Fails closed: without a configured secret every delivery is rejected,
+    since the endpoint writes to the ticket store.
+    """
+    secret = os.environ.get("JIRA_WEBHOOK_SECRET", "")
+    if not secret:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Jira webhooks are not configured",
+        )
+    expected = "sha256=" + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    if not header or not hmac.compare_digest(header, expected):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid webhook signature")
+
+
+class _EventOrder:
+    """Time of the newest event applied per issue key.
+
+    Jira does not deliver webhooks in order, so an event older than one
+    already applied to the same issue is dropped. Keys are kept in LRU order
+    up to ``capacity``; the record is per process.
+    """
+
+    def __init__(self, capacity: int = 100_000) -> None:
+        self._lock = threading.Lock()
+        self._applied: OrderedDict[str, float] = OrderedDict()
+        self._capacity = capacity
+
+    def apply(self, key: str, at: float | None, write: Callable[[], None]) -> bool:
+        """Run ``write()`` unless a newer event for ``key`` was applied; False if dropped."""
+        with self._lock:
+            last = self._applied.get(key)
+            if at is not None and last is not None and at < last:
+                return False
+            write()
+            if at is not None:
+                self._applied[key] = at if last is None else max(at, last)
+                self._applied.move_to_end(key)
+                if len(self._applied) > self._capacity:
+                    self._applied.popitem(last=False)
+            return True
+
+
+_EVENT_ORDER = _EventOrder()
+
+
+def _event_time(payload: dict[str, Any], issue: JiraIssue) -> float | None:
+    """When the event happened: Jira's ``timestamp`` (ms), else ``fields.updated``."""
+    timestamp = payload.get("timestamp")
+    if isinstance(timestamp, int | float) and not isinstance(timestamp, bool):
+        return timestamp / 1000
+    if issue.updated is None:
+        return None
+    try:
+        return datetime.fromisoformat(issue.updated).timestamp()
+    except ValueError:
+        return None
+
+
+def _apply_event(kind: str, issue: JiraIssue, at: float | None) -> bool:
+    """Write one event to the store unless it is stale; runs in a worker thread."""
+
+    def write() -> None:
+        if kind == "deleted":
+            delete_ticket(issue.key)
+        else:
+            upsert_ticket(
+                Ticket(
+                    id=issue.key,
+                    title=issue.summary,
+                    description=issue.description,
+                    status=map_status(issue.status_name),
+                    assignee=issue.assignee_account_id,
+                )
+            )
+
+    return _EVENT_ORDER.apply(issue.key, at, write)
+
+
+@router.post("/webhooks/jira")
+async def jira_webhook(request: Request) -> JSONResponse:
+    """Apply a Jira issue created/updated/deleted event to the ticket store.
+
+    The store write runs in a worker thread, since the SQLite backend may
+    wait on its write lock. Events older than one already applied to the same
+    issue are acknowledged with ``202`` and ignored.
+    """
+    body = await request.body()
+    _verify_signature(body, request.headers.get("X-Hub-Signature"))
+
+    try:
+        payload: Any = json.loads(body)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid JSON") from None
+    if not isinstance(payload, dict):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid payload")
+
+    kind = _EVENT_KINDS.get(str(payload.get("webhookEvent", "")))
+    issue = parse_issue(payload.get("issue"))
+    if kind is None or not issue.key:
+        return JSONResponse(status_code=status.HTTP_202_ACCEPTED, content={"ignored": True})
+
+    if not await run_in_threadpool(_apply_event, kind, issue, _event_time(payload, issue)):
+        return JSONResponse(status_code=status.HTTP_202_ACCEPTED, content={"ignored": True, "stale": True})
+    event = DEFAULT_BUS.publish(issue.key, kind)
+    return JSONResponse(content={"ticket_id": issue.key, "kind": kind, "seq": event.seq})
+
+
+@router.get("/events/invalidations")
+async def invalidation_stream(
+    since: int = Query(0, ge=0),
+    epoch: str | None = None,
+    max_events: int | None = Query(None, ge=1),
+) -> StreamingResponse:
+    """Stream ticket invalidations as Server-Sent Events.
+
+    Resume with ``since`` and the ``epoch`` from the ``X-Invalidation-Epoch``
+    header; a position this process cannot replay yields a ``reset`` event.
+    The stream is an async generator, so idle subscribers hold no thread.
+    """
+    return StreamingResponse(
+        sse_stream(DEFAULT_BUS, since, epoch=epoch, max_events=max_events),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Invalidation-Epoch": DEFAULT_BUS.epoch},
+    )
@@ -0,0 +1,117 @@
+"""Tests for the :batchCreate, :batchUpdate and :batchDelete endpoints."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from jira_service import models, routes
+from jira_service.invalidation import DEFAULT_BUS
+from jira_service.main import app
+from jira_service.models import TicketStore
+from jira_service.sqlite_store import SqliteTicketStore
+from tickets_api.client import TicketStatus
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def client(request: pytest.FixtureRequest, tmp_path: Path) -> Iterator[TestClient]:
+    store = TicketStore() if request.param == "memory" else SqliteTicketStore(str(tmp_path / "t.db"))
+    previous = models.set_store(store)
+    try:
+        yield TestClient(app)
+    finally:
+        models.set_store(previous)
+        if isinstance(store, SqliteTicketStore):
+            store.close()
+
+
+def _statuses(body: dict) -> list[int]:
+    return [r["status"] for r in body["results"]]
+
+
+def test_batch_create_reports_per_item_status(client: TestClient) -> None:
+    r = client.post(
+        "/tickets:batchCreate",
+        json={"tickets": [{"title": "A", "description": "a"}, {"title": " ", "description": "b"}, {"title": "C", "description": "c"}]},
+    )
+
+    assert r.status_code == 200
+    body = r.json()
+    assert _statuses(body) == [201, 400, 201]
+    assert [(res["ticket"] or {}).get("id") for res in body["results"]] == ["TICKET-1", None, "TICKET-2"]
+    assert body["results"][1]["error"] == "title must be non-empty"
+
+
+def test_batch_update_applies_items_independently(client: TestClient) -> None:
+    models.create_tickets([("A", "a", None), ("B", "b", None), ("C", "c", None)])
+    stale = client.get("/tickets/TICKET-3").headers["etag"]
+    client.patch("/tickets/TICKET-3", json={"title": "C2"})
+    seq = DEFAULT_BUS.last_seq
+
+    r = client.post(
+        "/tickets:batchUpdate",
+        json={
+            "updates": [
+                {"id": "TICKET-1", "status": "closed"},
+                {"id": "TICKET-404", "status": "closed"},
+                {"id": "TICKET-2", "title": ""},
+                {"id": "TICKET-3", "status": "closed", "if_match": stale},
+            ]
+        },
+    )
+
+    assert _statuses(r.json()) == [200, 404, 400, 412]
+    assert r.json()["results"][0]["ticket"]["status"] == "closed"
+    assert models.count_tickets(status=TicketStatus.CLOSED) == 1
+    assert [(e.ticket_id, e.kind) for e in DEFAULT_BUS.since(seq)] == [("TICKET-1", "updated")]
+
+
+def test_batch_delete_honours_if_match(client: TestClient) -> None:
+    models.create_tickets([("A", "a", None), ("B", "b", None)])
+    etag = client.get("/tickets/TICKET-2").headers["etag"]
+
+    r = client.post(
+        "/tickets:batchDelete",
+        json={
+            "deletes": [
+                {"id": "TICKET-1"},
+                {"id": "TICKET-1"},
+                {"id": "TICKET-2", "if_match": '"stale"'},
+                {"id": "TICKET-2", "if_match": etag},
+            ]
+        },
+    )
+
+    # As for DELETE /tickets/{id}: a missing ticket is 200 with nothing removed.
+    assert _statuses(r.json()) == [200, 200, 412, 200]
+    assert [(res["ticket"] or {}).get("id") for res in r.json()["results"]] == ["TICKET-1", None, None, "TICKET-2"]
+    assert models.list_tickets() == []
+
+
+def test_single_and_batch_create_reject_the_same_titles(client: TestClient) -> None:
+    single = client.post("/tickets", json={"title": " ", "description": "b"})
+    batch = client.post("/tickets:batchCreate", json={"tickets": [{"title": " ", "description": "b"}]})
+
+    assert single.status_code == 400
+    assert single.json()["detail"] == batch.json()["results"][0]["error"] == "title must be non-empty"
+    assert models.list_tickets() == []
+
+
+def test_batch_update_reports_a_lost_compare_and_set(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    models.create_tickets([("A", "a", None)])
+    monkeypatch.setattr(routes, "replace_ticket", lambda ticket, *, expected: False)
+    seq = DEFAULT_BUS.last_seq
+
+    r = client.post("/tickets:batchUpdate", json={"updates": [{"id": "TICKET-1", "status": "closed"}]})
+
+    assert _statuses(r.json()) == [409]
+    assert DEFAULT_BUS.since(seq) == []
+
+
+def test_batch_size_is_capped(client: TestClient) -> None:
+    deletes = [{"id": f"TICKET-{i}"} for i in range(1001)]
+
+    assert client.post("/tickets:batchDelete", json={"deletes": deletes}).status_code == 422
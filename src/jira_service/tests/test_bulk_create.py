@@ -0,0 +1,68 @@
+"""Tests for the deprecated bulk create endpoint and the store's create_tickets."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+
+from jira_service import models
+from jira_service.main import app
+
+
+@pytest.fixture(autouse=True)
+def _empty_store() -> Iterator[None]:
+    saved = models.list_tickets()
+    models.clear_tickets()
+    yield
+    models.clear_tickets()
+    for ticket in saved:
+        models.upsert_ticket(ticket)
+
+
+def test_bulk_create_returns_per_item_results_in_order() -> None:
+    client = TestClient(app)
+
+    resp = client.post(
+        "/tickets/bulk",
+        json={
+            "tickets": [
+                {"title": "A", "description": "a"},
+                {"title": " ", "description": "b"},
+                {"title": "C", "description": "c", "assignee": "acct-1"},
+            ]
+        },
+    )
+
+    assert resp.status_code == 201
+    results = resp.json()["results"]
+    assert [r["ticket"]["id"] if r["ticket"] else None for r in results] == [
+        "TICKET-1",
+        None,
+        "TICKET-2",
+    ]
+    assert results[1]["error"] == "title must be non-empty"
+    assert results[2]["ticket"]["assignee"] == "acct-1"
+    assert [t["id"] for t in client.get("/tickets").json()["tickets"]] == [
+        "TICKET-1",
+        "TICKET-2",
+    ]
+
+
+def test_bulk_create_is_a_deprecated_alias_of_batch_create() -> None:
+    client = TestClient(app)
+
+    operation = client.get("/openapi.json").json()["paths"]["/tickets/bulk"]["post"]
+    too_many = client.post("/tickets/bulk", json={"tickets": [{"title": "t", "description": ""}] * 1001})
+
+    assert operation["deprecated"] is True
+    assert too_many.status_code == 422
+
+
+def test_create_tickets_allocates_sequential_ids() -> None:
+    models.create_ticket("first", "d", None)
+
+    created = models.create_tickets([("x", "d", None), ("y", "d", None)])
+
+    assert [t.id for t in created] == ["TICKET-2", "TICKET-3"]
@@ -0,0 +1,145 @@
+"""Tests for the ticket change log and GET /tickets/changes."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from jira_service import models
+from jira_service.main import app
+from jira_service.models import TicketStore
+from jira_service.sqlite_store import SqliteTicketStore
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def client(request: pytest.FixtureRequest, tmp_path: Path) -> Iterator[TestClient]:
+    store = TicketStore() if request.param == "memory" else SqliteTicketStore(str(tmp_path / "t.db"))
+    previous = models.set_store(store)
+    try:
+        yield TestClient(app)
+    finally:
+        models.set_store(previous)
+        if isinstance(store, SqliteTicketStore):
+            store.close()
+
+
+def _kinds(body: dict) -> list[tuple[int, str, str]]:
+    return [(c["seq"], c["ticket_id"], c["kind"]) for c in body["changes"]]
+
+
+def test_changes_record_create_update_and_delete_in_order(client: TestClient) -> None:
+    client.post("/tickets", json={"title": "A", "description": "a"})
+    client.post("/tickets", json={"title": "B", "description": "b"})
+    client.patch("/tickets/TICKET-1", json={"status": "closed"})
+    client.patch("/tickets/TICKET-1", json={"status": "closed"})  # no change, no entry
+    client.delete("/tickets/TICKET-2")
+
+    body = client.get("/tickets/changes").json()
+
+    assert _kinds(body) == [
+        (1, "TICKET-1", "created"),
+        (2, "TICKET-2", "created"),
+        (3, "TICKET-1", "updated"),
+        (4, "TICKET-2", "deleted"),
+    ]
+    assert body["last_seq"] == 4
+    assert all(c["at"] > 0 for c in body["changes"])
+
+
+def test_changes_resume_after_since_and_respect_limit(client: TestClient) -> None:
+    client.post("/tickets:batchCreate", json={"tickets": [{"title": str(i), "description": ""} for i in range(5)]})
+
+    first = client.get("/tickets/changes?since=0&limit=2").json()
+    rest = client.get(f"/tickets/changes?since={first['changes'][-1]['seq']}").json()
+
+    assert [c["seq"] for c in first["changes"]] == [1, 2]
+    assert [c["seq"] for c in rest["changes"]] == [3, 4, 5]
+    assert first["last_seq"] == rest["last_seq"] == 5
+    assert client.get("/tickets/changes?since=5").json() == {"changes": [], "last_seq": 5, "resync": False}
+
+
+def test_long_poll_returns_as_soon_as_a_change_arrives(client: TestClient) -> None:
+    client.post("/tickets", json={"title": "A", "description": "a"})
+    timer = threading.Timer(0.2, lambda: client.patch("/tickets/TICKET-1", json={"title": "A2"}))
+
+    started = time.monotonic()
+    timer.start()
+    body = client.get("/tickets/changes?since=1&wait=10").json()
+    elapsed = time.monotonic() - started
+    timer.join()
+
+    assert _kinds(body) == [(2, "TICKET-1", "updated")]
+    assert elapsed < 5
+
+
+def test_long_poll_times_out_empty(client: TestClient) -> None:
+    started = time.monotonic()
+    body = client.get("/tickets/changes?since=0&wait=0.3").json()
+
+    assert body == {"changes": [], "last_seq": 0, "resync": False}
+    assert time.monotonic() - started >= 0.3
+
+
+def test_waiting_polls_do_not_hold_worker_threads(client: TestClient) -> None:
+    # More concurrent long-polls than anyio's default 40 worker threads.
+    client.post("/tickets", json={"title": "A", "description": "a"})
+    bodies: list[dict] = []
+    pollers = [
+        threading.Thread(target=lambda: bodies.append(client.get("/tickets/changes?since=1&wait=10").json()))
+        for _ in range(50)
+    ]
+    for poller in pollers:
+        poller.start()
+    time.sleep(0.5)
+
+    started = time.monotonic()
+    assert client.get("/tickets/TICKET-1").status_code == 200
+    assert time.monotonic() - started < 2
+    client.patch("/tickets/TICKET-1", json={"title": "A2"})
+    for poller in pollers:
+        poller.join()
+
+    assert [_kinds(body) for body in bodies] == [[(2, "TICKET-1", "updated")]] * 50
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_since_older_than_the_retained_log_asks_for_a_resync(backend: str, tmp_path: Path) -> None:
+    store = (
+        TicketStore(change_history=2)
+        if backend == "memory"
+        else SqliteTicketStore(str(tmp_path / "t.db"), change_history=2)
+    )
+    previous = models.set_store(store)
+    try:
+        client = TestClient(app)
+        for i in range(300):
+            client.post("/tickets", json={"title": str(i), "description": ""})
+        horizon = store.change_horizon()
+
+        stale = client.get("/tickets/changes?since=0&wait=5").json()
+        current = client.get(f"/tickets/changes?since={horizon}").json()
+    finally:
+        models.set_store(previous)
+        if isinstance(store, SqliteTicketStore):
+            store.close()
+
+    assert 0 < horizon <= 298
+    assert stale == {"changes": [], "last_seq": 300, "resync": True}
+    assert current["resync"] is False
+    assert current["changes"][0]["seq"] == horizon + 1
+
+
+def test_since_ahead_of_the_log_asks_for_a_resync(client: TestClient) -> None:
+    client.post("/tickets", json={"title": "A", "description": "a"})
+
+    assert client.get("/tickets/changes?since=7&wait=5").json() == {"changes": [], "last_seq": 1, "resync": True}
+
+
+def test_wait_is_bounded(client: TestClient) -> None:
+    assert client.get("/tickets/changes?wait=31").status_code == 422
+    assert client.get("/tickets/changes?since=-1").status_code == 422
@@ -0,0 +1,58 @@
+"""Tests for ticket count and stats endpoints."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+
+from jira_service import models
+from jira_service.main import app
+from tickets_api.client import TicketStatus
+
+
+@pytest.fixture(autouse=True)
+def _empty_store() -> Iterator[None]:
+    saved = models.list_tickets()
+    models.clear_tickets()
+    yield
+    models.clear_tickets()
+    for ticket in saved:
+        models.upsert_ticket(ticket)
+
+
+def _seed() -> None:
+    models.create_tickets([("Login bug", "fails", None), ("Export", "slow login", None), ("Docs", "typo", None)])
+    models.upsert_ticket(models.Ticket("TICKET-3", "Docs", "typo", TicketStatus.CLOSED))
+    models.upsert_ticket(models.Ticket("EXT-1", "Imported", "from Jira", TicketStatus.IN_PROGRESS))
+
+
+def test_count_endpoint_filters_by_status_and_query() -> None:
+    _seed()
+    client = TestClient(app)
+
+    assert client.get("/tickets/count").json() == {"count": 4}
+    assert client.get("/tickets/count", params={"status": "open"}).json() == {"count": 2}
+    assert client.get("/tickets/count", params={"q": "LOGIN"}).json() == {"count": 2}
+    assert client.get("/tickets/count", params={"q": "login", "status": "closed"}).json() == {"count": 0}
+
+
+def test_stats_endpoint_tracks_upserts_and_deletes() -> None:
+    _seed()
+    models.delete_ticket("TICKET-1")
+    client = TestClient(app)
+
+    resp = client.get("/tickets/stats")
+
+    assert resp.status_code == 200
+    assert resp.json() == {
+        "total": 3,
+        "by_status": {"open": 1, "in_progress": 1, "closed": 1},
+    }
+
+
+def test_count_rejects_unknown_status() -> None:
+    client = TestClient(app)
+
+    assert client.get("/tickets/count", params={"status": "blocked"}).status_code == 422
@@ -0,0 +1,86 @@
+"""Tests for the filtered, cursor-paginated ticket listing."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+
+from jira_service import models
+from jira_service.main import app
+from tickets_api.client import TicketStatus
+
+
+@pytest.fixture(autouse=True)
+def _empty_store() -> Iterator[None]:
+    saved = models.list_tickets()
+    models.clear_tickets()
+    yield
+    models.clear_tickets()
+    for ticket in saved:
+        models.upsert_ticket(ticket)
+
+
+def _pages(client: TestClient, **params: object) -> list[list[str]]:
+    pages: list[list[str]] = []
+    cursor = None
+    while True:
+        query = {**params, **({"cursor": cursor} if cursor else {})}
+        body = client.get("/tickets", params=query).json()
+        pages.append([t["id"] for t in body["tickets"]])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+def test_cursor_walks_every_ticket_once_in_creation_order() -> None:
+    models.create_tickets([(f"T{i}", "d", None) for i in range(7)])
+    client = TestClient(app)
+
+    pages = _pages(client, limit=3)
+
+    assert pages == [
+        ["TICKET-1", "TICKET-2", "TICKET-3"],
+        ["TICKET-4", "TICKET-5", "TICKET-6"],
+        ["TICKET-7"],
+    ]
+
+
+def test_last_full_page_has_no_cursor() -> None:
+    models.create_tickets([("A", "d", None), ("B", "d", None)])
+
+    body = TestClient(app).get("/tickets", params={"limit": 2}).json()
+
+    assert len(body["tickets"]) == 2
+    assert body["next_cursor"] is None
+
+
+def test_status_and_query_filters_are_applied_before_paging() -> None:
+    models.create_tickets([("Login bug", "x", None), ("Export", "slow login", None), ("Docs", "typo", None)])
+    models.create_tickets([("Login again", "x", None)])
+    models.upsert_ticket(models.Ticket("TICKET-2", "Export", "slow login", TicketStatus.CLOSED))
+    client = TestClient(app)
+
+    assert _pages(client, q="LOGIN", limit=2) == [["TICKET-1", "TICKET-2"], ["TICKET-4"]]
+    assert _pages(client, q="login", status="open", limit=1) == [["TICKET-1"], ["TICKET-4"]]
+    assert _pages(client, status="closed") == [["TICKET-2"]]
+
+
+def test_cursor_survives_deletes_and_new_tickets() -> None:
+    models.create_tickets([(f"T{i}", "d", None) for i in range(4)])
+    client = TestClient(app)
+    first = client.get("/tickets", params={"limit": 2}).json()
+
+    models.delete_ticket("TICKET-3")
+    models.create_tickets([("late", "d", None)])
+    second = client.get("/tickets", params={"limit": 2, "cursor": first["next_cursor"]}).json()
+
+    assert [t["id"] for t in second["tickets"]] == ["TICKET-4", "TICKET-5"]
+
+
+@pytest.mark.parametrize("params", [{"cursor": "not-a-cursor"}, {"limit": 0}, {"limit": 1001}])
+def test_rejects_bad_paging_parameters(params: dict[str, object]) -> None:
+    response = TestClient(app).get("/tickets", params=params)
+
+    assert response.status_code in (400, 422)
@@ -0,0 +1,204 @@
+"""Tests for the SQLite ticket storage backend."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from jira_service import models
+from jira_service.main import app
+from jira_service.models import Ticket, TicketStorage, TicketStore
+from jira_service.sqlite_store import _MIGRATIONS, SqliteTicketStore, _statements
+from tickets_api.client import TicketStatus
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> str:
+    return str(tmp_path / "tickets.db")
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request: pytest.FixtureRequest, db_path: str) -> Iterator[TicketStorage]:
+    if request.param == "memory":
+        yield TicketStore()
+        return
+    sqlite_store = SqliteTicketStore(db_path)
+    yield sqlite_store
+    sqlite_store.close()
+
+
+def test_backends_share_semantics(store: TicketStorage) -> None:
+    created = store.create_many([("A", "login", "alice"), ("B", "b", None), ("C", "c", "alice")])
+    assert [t.id for t in created] == ["TICKET-1", "TICKET-2", "TICKET-3"]
+
+    assert store.upsert(Ticket("TICKET-1", "A2", "login", TicketStatus.CLOSED, "alice")) is False
+    assert store.upsert(Ticket("PROJ-9", "Jira", "x", TicketStatus.IN_PROGRESS, "bob")) is True
+    assert store.delete("TICKET-2") is True
+    assert store.delete("TICKET-2") is False
+
+    assert store.get("TICKET-1") == Ticket("TICKET-1", "A2", "login", TicketStatus.CLOSED, "alice")
+    assert [t.id for t in store.find(assignee="alice")] == ["TICKET-1", "TICKET-3"]
+    assert [t.id for t in store.find(status=TicketStatus.OPEN, assignee="alice")] == ["TICKET-3"]
+    assert store.count(query="LOGIN") == 1
+    assert store.count(status=TicketStatus.CLOSED) == 1
+    assert store.status_counts() == {
+        TicketStatus.OPEN: 1,
+        TicketStatus.IN_PROGRESS: 1,
+        TicketStatus.CLOSED: 1,
+    }
+    assert len(store) == 3
+    assert store.create("D", "d", None).id == "TICKET-4"
+
+
+def test_backends_page_through_filtered_indexes(store: TicketStorage) -> None:
+    store.create_many([(f"T{i}", "login" if i % 2 else "other", "alice" if i < 4 else "bob") for i in range(8)])
+    store.upsert(Ticket("TICKET-2", "T1", "login", TicketStatus.CLOSED, "alice"))
+
+    def walk(**filters: object) -> list[list[str]]:
+        pages, after = [], None
+        while True:
+            page = store.page(after=after, limit=2, **filters)
+            pages.append([t.id for t in page.tickets])
+            if page.next_after is None:
+                return pages
+            after = page.next_after
+
+    assert walk() == [["TICKET-1", "TICKET-2"], ["TICKET-3", "TICKET-4"], ["TICKET-5", "TICKET-6"], ["TICKET-7", "TICKET-8"]]
+    assert walk(status=TicketStatus.OPEN, assignee="alice") == [["TICKET-1", "TICKET-3"], ["TICKET-4"]]
+    assert walk(query="LOGIN", assignee="bob") == [["TICKET-6", "TICKET-8"]]
+    assert walk(status=TicketStatus.IN_PROGRESS) == [[]]
+
+
+def test_backends_search_with_prefixes_and_ranking(store: TicketStorage) -> None:
+    store.create_many(
+        [
+            ("Export is slow", "the login page times out", None),
+            ("Login fails", "after password reset", None),
+            ("Docs typo", "nothing about logging in", None),
+            ("Logout button", "missing on mobile", None),
+        ]
+    )
+    store.upsert(Ticket("TICKET-4", "Logout button", "missing on mobile", TicketStatus.CLOSED))
+
+    assert [t.id for t in store.search("login", limit=10)] == ["TICKET-2", "TICKET-1"]
+    assert {t.id for t in store.search("LOG", limit=10)} == {"TICKET-1", "TICKET-2", "TICKET-3", "TICKET-4"}
+    assert [t.id for t in store.search("log mob", limit=10)] == ["TICKET-4"]
+    assert [t.id for t in store.search("log", status=TicketStatus.CLOSED, limit=10)] == ["TICKET-4"]
+    assert len(store.search("log", limit=2)) == 2
+    assert store.search("   ", limit=10) == []
+    assert store.count(query="log out") == 1
+    assert store.count(query="log zebra") == 0
+
+    store.upsert(Ticket("TICKET-3", "Docs typo", "fixed", TicketStatus.OPEN))
+    store.delete("TICKET-1")
+    assert [t.id for t in store.search("login", limit=10)] == ["TICKET-2"]
+    assert [t.id for t in store.page(query="log", limit=10).tickets] == ["TICKET-2", "TICKET-4"]
+    assert store.count(query="log", status=TicketStatus.OPEN) == 1
+
+
+def test_tickets_and_ids_survive_reopen(db_path: str) -> None:
+    first = SqliteTicketStore(db_path)
+    first.create("A", "a", None)
+    first.upsert(Ticket("TICKET-10", "X", "x", TicketStatus.OPEN))
+    first.close()
+
+    reopened = SqliteTicketStore(db_path)
+    assert reopened.get("TICKET-1") is not None
+    assert reopened.create("B", "b", None).id == "TICKET-11"
+    reopened.close()
+
+
+def test_schema_is_migrated_once_and_uses_wal(db_path: str) -> None:
+    store = SqliteTicketStore(db_path)
+    store.close()
+    again = SqliteTicketStore(db_path)
+
+    assert again.schema_version() == 3
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    again.close()
+
+
+def test_upgrade_indexes_existing_tickets_for_search(db_path: str) -> None:
+    with sqlite3.connect(db_path) as conn:
+        for statement in _statements(_MIGRATIONS[0]):
+            conn.execute(statement)
+        conn.execute("INSERT INTO tickets (id, title, description, status) VALUES ('TICKET-1', 'Old login', 'x', 'open')")
+        conn.execute("PRAGMA user_version = 1")
+    conn.close()
+
+    store = SqliteTicketStore(db_path)
+
+    assert store.schema_version() == 3
+    assert [t.id for t in store.search("login", limit=5)] == ["TICKET-1"]
+    # The change log starts at the upgrade; existing tickets are not replayed.
+    assert store.changes(0, 10) == []
+    store.delete("TICKET-1")
+    assert [(c.seq, c.kind) for c in store.changes(0, 10)] == [(1, "deleted")]
+    store.close()
+
+
+def test_two_processes_worth_of_stores_allocate_unique_ids(db_path: str) -> None:
+    workers = [SqliteTicketStore(db_path), SqliteTicketStore(db_path)]
+    ids: list[str] = []
+    lock = threading.Lock()
+
+    def create(store: SqliteTicketStore) -> None:
+        for _ in range(50):
+            ticket = store.create("t", "d", None)
+            with lock:
+                ids.append(ticket.id)
+
+    threads = [threading.Thread(target=create, args=(w,)) for w in workers for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(set(ids)) == 200
+    assert len(workers[0]) == 200
+    for worker in workers:
+        worker.close()
+
+
+def test_transaction_commits_or_rolls_back_as_one(db_path: str) -> None:
+    store = SqliteTicketStore(db_path)
+    with store.transaction():
+        store.create("A", "a", None)
+        store.upsert(Ticket("TICKET-1", "A2", "a", TicketStatus.CLOSED))
+    assert store.get("TICKET-1") == Ticket("TICKET-1", "A2", "a", TicketStatus.CLOSED)
+
+    with pytest.raises(RuntimeError), store.transaction():
+        store.create("B", "b", None)
+        store.delete("TICKET-1")
+        raise RuntimeError("abort batch")
+
+    assert len(store) == 1
+    assert store.get("TICKET-2") is None
+    store.close()
+
+
+def test_rejects_in_memory_path() -> None:
+    with pytest.raises(ValueError, match="file path"):
+        SqliteTicketStore(":memory:")
+
+
+def test_routes_serve_from_sqlite_backend(db_path: str) -> None:
+    sqlite_store = SqliteTicketStore(db_path)
+    previous = models.set_store(sqlite_store)
+    try:
+        client = TestClient(app)
+        created = client.post("/tickets", json={"title": "Durable", "description": "d"}).json()
+        assert created["id"] == "TICKET-1"
+        assert client.get("/tickets/count").json() == {"count": 1}
+        assert [t["id"] for t in client.get("/tickets/search", params={"q": "dur"}).json()["tickets"]] == ["TICKET-1"]
+    finally:
+        models.set_store(previous)
+        sqlite_store.close()
+
+    assert SqliteTicketStore(db_path).get("TICKET-1") is not None
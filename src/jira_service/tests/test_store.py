@@ -0,0 +1,98 @@
+"""Tests for the indexed in-memory TicketStore."""
+
+from __future__ import annotations
+
+import threading
+
+from jira_service.models import Ticket, TicketStore
+from tickets_api.client import TicketStatus
+
+
+def _seed(store: TicketStore) -> list[Ticket]:
+    return store.create_many(
+        [
+            ("A", "a", "alice"),
+            ("B", "b", None),
+            ("C", "c", "alice"),
+            ("D", "d", "bob"),
+        ]
+    )
+
+
+def test_ids_are_monotonic_and_never_reused_after_delete() -> None:
+    store = TicketStore()
+    _seed(store)
+
+    assert store.delete("TICKET-4") is True
+    assert store.create("E", "e", None).id == "TICKET-5"
+    assert store.get("TICKET-4") is None
+    assert len(store) == 4
+
+
+def test_upserted_allocator_ids_are_reserved() -> None:
+    store = TicketStore()
+    assert store.upsert(Ticket("TICKET-41", "X", "x", TicketStatus.OPEN)) is True
+    assert store.upsert(Ticket("PROJ-7", "Y", "y", TicketStatus.OPEN)) is True
+
+    assert store.create("Z", "z", None).id == "TICKET-42"
+
+
+def test_find_uses_status_and_assignee_indexes() -> None:
+    store = TicketStore()
+    _seed(store)
+    store.upsert(Ticket("TICKET-1", "A", "a", TicketStatus.CLOSED, "alice"))
+
+    assert [t.id for t in store.find(assignee="alice")] == ["TICKET-1", "TICKET-3"]
+    assert [t.id for t in store.find(status=TicketStatus.OPEN, assignee="alice")] == ["TICKET-3"]
+    assert [t.id for t in store.find(status=TicketStatus.CLOSED)] == ["TICKET-1"]
+    assert store.find(assignee="nobody") == []
+    assert store.status_counts() == {
+        TicketStatus.OPEN: 3,
+        TicketStatus.IN_PROGRESS: 0,
+        TicketStatus.CLOSED: 1,
+    }
+
+
+def test_delete_updates_indexes() -> None:
+    store = TicketStore()
+    _seed(store)
+
+    store.delete("TICKET-4")
+
+    assert store.find(assignee="bob") == []
+    assert store.count(status=TicketStatus.OPEN) == 3
+    assert store.count(query="C") == 1
+
+
+def test_pages_skip_deleted_tickets_until_the_index_is_compacted() -> None:
+    store = TicketStore()
+    store.create_many([(str(i), "", None) for i in range(10)])
+
+    for n in (2, 3, 5):
+        store.delete(f"TICKET-{n}")
+    first = store.page(limit=3)
+    second = store.page(after=first.next_after, limit=3)
+    for n in (1, 4, 6, 7):
+        store.delete(f"TICKET-{n}")
+
+    assert [t.id for t in first.tickets] == ["TICKET-1", "TICKET-4", "TICKET-6"]
+    assert [t.id for t in second.tickets] == ["TICKET-7", "TICKET-8", "TICKET-9"]
+    assert [t.id for t in store.find()] == ["TICKET-8", "TICKET-9", "TICKET-10"]
+    assert len(store._all) < 10
+
+
+def test_concurrent_creates_allocate_unique_ids() -> None:
+    store = TicketStore()
+
+    def worker() -> None:
+        for _ in range(500):
+            store.create("t", "d", None)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(store) == 4000
+    assert store.count(status=TicketStatus.OPEN) == 4000
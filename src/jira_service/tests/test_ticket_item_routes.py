@@ -0,0 +1,111 @@
+"""Tests for GET/PATCH/DELETE /tickets/{ticket_id} and their ETags."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+
+from jira_service import models
+from jira_service.invalidation import DEFAULT_BUS
+from jira_service.main import app
+from tickets_api.client import TicketStatus
+
+
+@pytest.fixture(autouse=True)
+def _empty_store() -> Iterator[None]:
+    saved = models.list_tickets()
+    models.clear_tickets()
+    yield
+    models.clear_tickets()
+    for ticket in saved:
+        models.upsert_ticket(ticket)
+
+
+@pytest.fixture
+def client() -> TestClient:
+    models.create_tickets([("Login bug", "fails", "alice")])
+    return TestClient(app)
+
+
+def test_get_returns_ticket_with_etag_and_304_when_unchanged(client: TestClient) -> None:
+    r = client.get("/tickets/TICKET-1")
+
+    assert r.status_code == 200
+    assert r.json()["title"] == "Login bug"
+    etag = r.headers["etag"]
+    assert client.get("/tickets/TICKET-1", headers={"If-None-Match": etag}).status_code == 304
+    assert client.get("/tickets/TICKET-404").status_code == 404
+
+
+def test_patch_updates_only_sent_fields_and_changes_etag(client: TestClient) -> None:
+    before = client.get("/tickets/TICKET-1").headers["etag"]
+    seq = DEFAULT_BUS.last_seq
+
+    r = client.patch("/tickets/TICKET-1", json={"status": "closed", "assignee": None})
+
+    assert r.status_code == 200
+    assert r.json() == {
+        "id": "TICKET-1",
+        "title": "Login bug",
+        "description": "fails",
+        "status": "closed",
+        "assignee": None,
+    }
+    assert r.headers["etag"] != before
+    assert models.count_tickets(status=TicketStatus.CLOSED) == 1
+    assert [(e.ticket_id, e.kind) for e in DEFAULT_BUS.since(seq)] == [("TICKET-1", "updated")]
+
+
+def test_patch_with_stale_if_match_is_rejected(client: TestClient) -> None:
+    etag = client.get("/tickets/TICKET-1").headers["etag"]
+    assert client.patch("/tickets/TICKET-1", json={"title": "First"}, headers={"If-Match": etag}).status_code == 200
+
+    r = client.patch("/tickets/TICKET-1", json={"title": "Second"}, headers={"If-Match": etag})
+
+    assert r.status_code == 412
+    assert models.get_ticket("TICKET-1").title == "First"
+
+
+def test_patch_validates_fields(client: TestClient) -> None:
+    assert client.patch("/tickets/TICKET-1", json={"title": "  "}).status_code == 400
+    assert client.patch("/tickets/TICKET-1", json={"status": None}).status_code == 400
+    assert client.patch("/tickets/TICKET-404", json={"title": "x"}).status_code == 404
+
+
+def test_delete_honours_if_match(client: TestClient) -> None:
+    assert client.delete("/tickets/TICKET-1", headers={"If-Match": '"stale"'}).status_code == 412
+
+    etag = client.get("/tickets/TICKET-1").headers["etag"]
+    assert client.delete("/tickets/TICKET-1", headers={"If-Match": etag}).json() == {"deleted": True}
+    assert client.delete("/tickets/TICKET-1").json() == {"deleted": False}
+    assert models.get_ticket("TICKET-1") is None
+
+
+def test_conditional_delete_of_a_missing_ticket_fails_the_precondition(client: TestClient) -> None:
+    etag = client.get("/tickets/TICKET-1").headers["etag"]
+    client.delete("/tickets/TICKET-1")
+
+    assert client.delete("/tickets/TICKET-1", headers={"If-Match": etag}).status_code == 412
+    assert client.delete("/tickets/TICKET-1", headers={"If-Match": "*"}).status_code == 412
+
+
+def test_patch_stores_typed_fields(client: TestClient) -> None:
+    r = client.patch("/tickets/TICKET-1", json={"status": "closed", "assignee": None})
+
+    stored = models.get_ticket("TICKET-1")
+    assert r.status_code == 200
+    assert stored.status is TicketStatus.CLOSED
+    assert stored.assignee is None
+    assert client.patch("/tickets/TICKET-1", json={"status": "bogus"}).status_code == 422
+
+
+def test_store_compare_and_set_rejects_stale_expected() -> None:
+    (ticket,) = models.create_tickets([("A", "a", None)])
+    first = models.Ticket(ticket.id, "B", "a", TicketStatus.OPEN)
+
+    assert models.replace_ticket(first, expected=ticket) is True
+    assert models.replace_ticket(models.Ticket(ticket.id, "C", "a", TicketStatus.OPEN), expected=ticket) is False
+    assert models.delete_ticket(ticket.id, expected=ticket) is False
+    assert models.delete_ticket(ticket.id, expected=first) is True
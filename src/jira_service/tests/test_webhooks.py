@@ -0,0 +1,214 @@
+"""Tests for Jira webhook ingestion and the invalidation stream."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import hmac
+import json
+import threading
+import time
+from collections.abc import Iterator
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from jira_service import models
+from jira_service.invalidation import DEFAULT_BUS, InvalidationBus, sse_stream
+from jira_service.main import app
+from tickets_api.client import TicketStatus
+
+
+_SECRET = "s3cret"
+
+
+@pytest.fixture(autouse=True)
+def _webhook_secret(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("JIRA_WEBHOOK_SECRET", _SECRET)
+
+
+def _deliver(client: TestClient, payload: dict[str, object]) -> httpx.Response:
+    """POST a webhook payload signed the way Jira signs it."""
+    body = json.dumps(payload).encode()
+    signature = "sha256=" + hmac.new(_SECRET.encode(), body, hashlib.sha256).hexdigest()
+    return client.post("/webhooks/jira", content=body, headers={"X-Hub-Signature": signature})
+
+
+@pytest.fixture(autouse=True)
+def _empty_store() -> Iterator[None]:
+    saved = models.list_tickets()
+    models.clear_tickets()
+    yield
+    models.clear_tickets()
+    for ticket in saved:
+        models.upsert_ticket(ticket)
+
+
+def _event(kind: str, key: str = "PROJ-7", status: str = "In Progress") -> dict[str, object]:
+    return {
+        "webhookEvent": f"jira:issue_{kind}",
+        "issue": {
+            "key": key,
+            "fields": {
+                "summary": "From Jira",
+                "description": {"content": [{"content": [{"text": "body"}]}]},
+                "status": {"name": status},
+                "assignee": {"accountId": "acc-1"},
+            },
+        },
+    }
+
+
+def test_webhook_applies_created_updated_deleted() -> None:
+    client = TestClient(app)
+
+    r = _deliver(client, _event("created", status="To Do"))
+    assert r.status_code == 200
+    assert r.json()["kind"] == "created"
+    ticket = models.get_ticket("PROJ-7")
+    assert ticket is not None
+    assert ticket.status == TicketStatus.OPEN
+    assert ticket.description == "body"
+
+    _deliver(client, _event("updated", status="Done"))
+    ticket = models.get_ticket("PROJ-7")
+    assert ticket is not None and ticket.status == TicketStatus.CLOSED
+    assert len(models.list_tickets()) == 1
+
+    r = _deliver(client, _event("deleted"))
+    assert r.json()["seq"] > 0
+    assert models.get_ticket("PROJ-7") is None
+
+
+def test_webhook_drops_events_older_than_the_applied_one() -> None:
+    client = TestClient(app)
+    newer = {**_event("updated", key="PROJ-8", status="Done"), "timestamp": 1_714_557_600_500}
+    late = {**_event("updated", key="PROJ-8", status="To Do"), "timestamp": 1_714_557_600_000}
+
+    assert _deliver(client, newer).status_code == 200
+    r = _deliver(client, late)
+
+    assert r.status_code == 202
+    assert r.json() == {"ignored": True, "stale": True}
+    ticket = models.get_ticket("PROJ-8")
+    assert ticket is not None and ticket.status == TicketStatus.CLOSED
+
+
+def test_webhook_orders_by_issue_updated_without_a_timestamp() -> None:
+    client = TestClient(app)
+    deleted = _event("deleted", key="PROJ-9")
+    late = _event("updated", key="PROJ-9")
+    deleted["timestamp"] = 1_714_557_660_000
+    late["issue"]["fields"]["updated"] = "2024-05-01T10:00:00.000+0000"
+
+    _deliver(client, deleted)
+
+    assert _deliver(client, late).status_code == 202
+    assert models.get_ticket("PROJ-9") is None
+
+
+def test_webhook_ignores_unknown_events() -> None:
+    client = TestClient(app)
+
+    r = _deliver(client, {"webhookEvent": "comment_created"})
+
+    assert r.status_code == 202
+    assert models.list_tickets() == []
+
+
+def test_webhook_signature_is_verified() -> None:
+    client = TestClient(app)
+    body = json.dumps(_event("created")).encode()
+
+    bad = client.post("/webhooks/jira", content=body, headers={"X-Hub-Signature": "sha256=0"})
+    unsigned = client.post("/webhooks/jira", content=body)
+    good = _deliver(client, _event("created"))
+
+    assert bad.status_code == 401
+    assert unsigned.status_code == 401
+    assert good.status_code == 200
+
+
+def test_webhook_is_rejected_without_a_configured_secret(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("JIRA_WEBHOOK_SECRET")
+    client = TestClient(app)
+
+    r = client.post("/webhooks/jira", json=_event("created"))
+
+    assert r.status_code == 503
+    assert models.get_ticket("PROJ-7") is None
+
+
+def test_invalidation_stream_replays_since_sequence() -> None:
+    client = TestClient(app)
+    first = _deliver(client, _event("created", key="A-1")).json()["seq"]
+    _deliver(client, _event("updated", key="A-2"))
+
+    with client.stream("GET", "/events/invalidations", params={"since": first, "max_events": 1}) as resp:
+        body = "".join(resp.iter_text())
+
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    assert f"id: {first + 1}" in body
+    assert '"ticket_id": "A-2"' in body
+
+
+def test_bus_waits_for_events_and_emits_heartbeats() -> None:
+    bus = InvalidationBus(history=2)
+
+    assert bus.since(0, timeout=0.01) == []
+    assert asyncio.run(anext(sse_stream(bus, 0, heartbeat_seconds=0.01))) == ": keepalive\n\n"
+
+    for key in ("X-1", "X-2", "X-3"):
+        bus.publish(key, "updated")
+    assert [e.ticket_id for e in bus.since(0)] == ["X-2", "X-3"]
+
+
+async def _frames(bus: InvalidationBus, since: int, n: int, epoch: str | None = None) -> list[str]:
+    return [frame async for frame in sse_stream(bus, since, epoch=epoch, max_events=n)]
+
+
+def test_stream_resets_when_position_cannot_be_replayed() -> None:
+    bus = InvalidationBus(history=2)
+    for key in ("X-1", "X-2", "X-3"):
+        bus.publish(key, "updated")
+
+    # X-1 fell out of the history: reset, then nothing more to send.
+    gap = asyncio.run(_frames(bus, 0, 1))
+    # A sequence this bus never reached (the service restarted).
+    ahead = asyncio.run(_frames(bus, 99, 1))
+    # Another process's epoch, even with a plausible sequence.
+    other = asyncio.run(_frames(bus, 2, 1, epoch="stale"))
+    same = asyncio.run(_frames(bus, 2, 1, epoch=bus.epoch))
+
+    for frames in (gap, ahead):
+        assert frames[0].startswith("id: 3\nevent: reset\n")
+        assert f'"epoch": "{bus.epoch}"' in frames[0]
+    assert other[0].startswith("id: 3\nevent: reset\n")
+    assert same[0].startswith("id: 3\nevent: invalidate\n")
+
+
+def test_async_waiter_is_woken_by_a_publishing_thread() -> None:
+    bus = InvalidationBus()
+
+    async def follow() -> list[str]:
+        timer = threading.Timer(0.05, bus.publish, args=("X-1", "created"))
+        timer.start()
+        started = time.monotonic()
+        frames = await _frames(bus, 0, 1)
+        assert time.monotonic() - started < 5
+        return frames
+
+    frames = asyncio.run(follow())
+
+    assert frames[0].startswith("id: 1\nevent: invalidate\n")
+
+
+def test_stream_reports_its_epoch_header() -> None:
+    client = TestClient(app)
+    _deliver(client, _event("created", key="A-1"))
+
+    with client.stream("GET", "/events/invalidations", params={"since": 0, "max_events": 1}) as resp:
+        "".join(resp.iter_text())
+
+    assert resp.headers["x-invalidation-epoch"] == DEFAULT_BUS.epoch
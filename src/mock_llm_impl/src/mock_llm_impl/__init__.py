@@ -0,0 +1,74 @@
+"""Deterministic mock LLM implementation for the AI API.
+
+Unlike the real providers, importing this package registers nothing.
+``register()`` makes ``ai_api.get_client()`` return the mock, so the AI path
+can be exercised and load-tested without a paid provider.
+
+The registration is process-wide: every ``ai_api.get_client()`` caller gets
+the mock, including services that imported a real provider first. That
+replacement is logged as a warning. ``unregister()`` restores the previous
+hook.
+"""
+
+from collections.abc import Callable
+import logging
+
+import ai_api
+from ai_api.client import get_client as _no_client_registered
+from mock_llm_impl.config import MockLLMConfig
+from mock_llm_impl.errors import (
+    MockInvalidResponseError,
+    MockProviderError,
+    MockRateLimitedError,
+    MockTimeoutError,
+)
+from mock_llm_impl.provider import MockLLMProvider, jira_action
+
+logger = logging.getLogger(__name__)
+
+_provider: MockLLMProvider | None = None
+_previous_get_client: Callable[[], ai_api.AIInterface] | None = None
+
+
+def _get_mock_client() -> MockLLMProvider:
+    """Return the shared mock AI client (one RNG stream per process)."""
+    global _provider  # noqa: PLW0603
+    if _provider is None:
+        _provider = MockLLMProvider()
+    return _provider
+
+
+def register() -> None:
+    """Make ``ai_api.get_client()`` return the mock provider (idempotent)."""
+    global _previous_get_client  # noqa: PLW0603
+    previous = ai_api.get_client
+    if previous is _get_mock_client:
+        return
+    if previous is not _no_client_registered:
+        logger.warning(
+            "mock_llm_impl replaces the registered AI client %s; "
+            "ai_api.get_client() now returns the mock provider",
+            getattr(previous, "__module__", "?"),
+        )
+    _previous_get_client = previous
+    ai_api.get_client = _get_mock_client
+
+
+def unregister() -> None:
+    """Give ``ai_api.get_client`` back to whatever ``register()`` replaced."""
+    global _previous_get_client  # noqa: PLW0603
+    if _previous_get_client is not None and ai_api.get_client is _get_mock_client:
+        ai_api.get_client = _previous_get_client
+    _previous_get_client = None
+
+__all__ = [
+    "MockInvalidResponseError",
+    "MockLLMConfig",
+    "MockLLMProvider",
+    "MockProviderError",
+    "MockRateLimitedError",
+    "MockTimeoutError",
+    "jira_action",
+    "register",
+    "unregister",
+]
@@ -0,0 +1,52 @@
+"""Mock LLM configuration loader."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import os
+
+from mock_llm_impl.latency import LatencyProfile, parse_latency
+
+
+@dataclass(frozen=True, slots=True)
+class MockLLMConfig:
+    """Latency, error-injection and streaming settings for the mock provider."""
+
+    latency: LatencyProfile
+    token_latency: LatencyProfile
+    error_rate: float = 0.0
+    timeout_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    seed: int | None = None
+
+    @staticmethod
+    def from_env() -> MockLLMConfig:
+        """Load mock settings from environment variables.
+
+        Optional:
+          - MOCK_LLM_LATENCY         e.g. "fixed:50", "lognormal:300,0.5"
+          - MOCK_LLM_TOKEN_LATENCY   per streamed token, same syntax (default none)
+          - MOCK_LLM_ERROR_RATE      probability of a generic failure (0-1)
+          - MOCK_LLM_TIMEOUT_RATE    probability of a timeout failure (0-1)
+          - MOCK_LLM_RATE_LIMIT_RATE probability of a rate-limit failure (0-1)
+          - MOCK_LLM_SEED            integer seed for reproducible runs
+
+        Raises:
+            ValueError: If a value is malformed or a rate is outside [0, 1].
+        """
+        seed = os.environ.get("MOCK_LLM_SEED", "").strip()
+        config = MockLLMConfig(
+            latency=parse_latency(os.environ.get("MOCK_LLM_LATENCY", "none")),
+            token_latency=parse_latency(
+                os.environ.get("MOCK_LLM_TOKEN_LATENCY", "none")
+            ),
+            error_rate=float(os.environ.get("MOCK_LLM_ERROR_RATE", "0")),
+            timeout_rate=float(os.environ.get("MOCK_LLM_TIMEOUT_RATE", "0")),
+            rate_limit_rate=float(os.environ.get("MOCK_LLM_RATE_LIMIT_RATE", "0")),
+            seed=int(seed) if seed else None,
+        )
+        for name in ("error_rate", "timeout_rate", "rate_limit_rate"):
+            if not 0.0 <= getattr(config, name) <= 1.0:
+                msg = f"{name} must be between 0 and 1"
+                raise ValueError(msg)
+        return config
@@ -0,0 +1,38 @@
+"""Exceptions raised by the mock LLM provider."""
+
+
+class MockRateLimitedError(RuntimeError):
+    """Injected rate-limit failure carrying a ``retry_after`` hint (seconds).
+
+    Mirrors the back-pressure signal of real providers so callers such as
+    ai_service exercise their 429 path.
+    """
+
+    def __init__(self, retry_after: float) -> None:
+        """Initialize with the suggested retry delay."""
+        super().__init__("AI provider rate limit reached; please retry shortly")
+        self.retry_after = retry_after
+
+
+class MockTimeoutError(RuntimeError):
+    """Injected timeout, with the message real providers use."""
+
+    def __init__(self) -> None:
+        """Initialize with the sanitized timeout message."""
+        super().__init__("AI service timed out while generating a response")
+
+
+class MockProviderError(RuntimeError):
+    """Injected generic provider failure, with the sanitized message."""
+
+    def __init__(self) -> None:
+        """Initialize with the sanitized failure message."""
+        super().__init__("AI service failed to generate a response")
+
+
+class MockInvalidResponseError(RuntimeError):
+    """A scripted reply is not the JSON object a structured call needs."""
+
+    def __init__(self) -> None:
+        """Initialize with the sanitized invalid-format message."""
+        super().__init__("AI service returned an invalid response format")
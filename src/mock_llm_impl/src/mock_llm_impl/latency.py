@@ -0,0 +1,103 @@
+"""Latency distributions for the mock LLM provider.
+
+Profiles are parsed from compact specs so they can be set from the environment:
+
+- ``none``                      no delay
+- ``fixed:<ms>``                constant delay
+- ``lognormal:<median_ms>,<sigma>``
+- ``heavytail:<scale_ms>,<alpha>[,<cap_ms>]``  Pareto tail (p99 >> median)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import math
+from typing import TYPE_CHECKING, Protocol
+
+if TYPE_CHECKING:
+    import random
+
+
+class LatencyProfile(Protocol):
+    """A delay distribution sampled once per call (or per token)."""
+
+    def sample(self, rng: random.Random) -> float:
+        """Return a delay in seconds."""
+        ...
+
+
+@dataclass(frozen=True, slots=True)
+class NoLatency:
+    """Zero delay."""
+
+    def sample(self, rng: random.Random) -> float:
+        """Return 0 seconds."""
+        _ = rng
+        return 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class FixedLatency:
+    """Constant delay."""
+
+    ms: float
+
+    def sample(self, rng: random.Random) -> float:
+        """Return the configured delay."""
+        _ = rng
+        return self.ms / 1000.0
+
+
+@dataclass(frozen=True, slots=True)
+class LognormalLatency:
+    """Log-normal delay parameterised by its median and shape."""
+
+    median_ms: float
+    sigma: float
+
+    def sample(self, rng: random.Random) -> float:
+        """Return a log-normally distributed delay."""
+        return rng.lognormvariate(math.log(self.median_ms), self.sigma) / 1000.0
+
+
+@dataclass(frozen=True, slots=True)
+class HeavyTailLatency:
+    """Pareto delay: most calls near ``scale_ms``, rare very slow outliers."""
+
+    scale_ms: float
+    alpha: float
+    cap_ms: float | None = None
+
+    def sample(self, rng: random.Random) -> float:
+        """Return a Pareto-distributed delay (optionally capped)."""
+        ms = self.scale_ms * rng.paretovariate(self.alpha)
+        if self.cap_ms is not None:
+            ms = min(ms, self.cap_ms)
+        return ms / 1000.0
+
+
+def parse_latency(spec: str) -> LatencyProfile:
+    """Parse a latency spec such as ``lognormal:200,0.6``.
+
+    Raises:
+        ValueError: If the spec is malformed.
+    """
+    kind, _, raw_args = spec.strip().partition(":")
+    kind = kind.lower()
+    try:
+        args = [float(a) for a in raw_args.split(",") if a.strip()]
+    except ValueError:
+        msg = f"Invalid latency spec: {spec!r}"
+        raise ValueError(msg) from None
+
+    if kind in {"", "none"} and not args:
+        return NoLatency()
+    if kind == "fixed" and len(args) == 1:
+        return FixedLatency(args[0])
+    if kind == "lognormal" and len(args) == 2:  # noqa: PLR2004
+        return LognormalLatency(args[0], args[1])
+    if kind == "heavytail" and len(args) in {2, 3}:
+        cap = args[2] if len(args) == 3 else None  # noqa: PLR2004
+        return HeavyTailLatency(args[0], args[1], cap)
+    msg = f"Invalid latency spec: {spec!r}"
+    raise ValueError(msg)
@@ -0,0 +1,198 @@
+"""Deterministic mock AIInterface provider for offline load testing."""
+
+from __future__ import annotations
+
+import copy
+import json
+import random
+import re
+from string import Template
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+from ai_api import AIInterface
+from mock_llm_impl.config import MockLLMConfig
+from mock_llm_impl.errors import (
+    MockInvalidResponseError,
+    MockProviderError,
+    MockRateLimitedError,
+    MockTimeoutError,
+)
+from mock_llm_impl.latency import NoLatency
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Sequence
+
+_TICKET_KEY = re.compile(r"\b[A-Z][A-Z0-9]+-\d+\b")
+_TOKEN = re.compile(r"\s*\S+")
+_TITLE_MAX_CHARS = 60
+_UPDATE_WORDS = ("update", "move", "close", "status", "reopen")
+
+
+def jira_action(user_input: str) -> dict[str, Any]:
+    """Derive a valid Jira action payload (as the orchestrator expects) from text."""
+    text = user_input.lower()
+    match = _TICKET_KEY.search(user_input)
+
+    if match and any(w in text for w in ("delete", "remove")):
+        return {"action": "delete_ticket", "ticket_id": match.group(0)}
+
+    if match and any(w in text for w in _UPDATE_WORDS):
+        payload: dict[str, Any] = {
+            "action": "update_ticket",
+            "ticket_id": match.group(0),
+        }
+        if "progress" in text:
+            payload["status"] = "in_progress"
+        elif any(w in text for w in ("close", "done", "resolve")):
+            payload["status"] = "closed"
+        elif "open" in text:
+            payload["status"] = "open"
+        return payload
+
+    if any(w in text for w in ("list", "show", "all tickets")):
+        return {"action": "list_tickets"}
+
+    title = user_input.strip().split("\n", 1)[0][:_TITLE_MAX_CHARS] or "Untitled"
+    return {
+        "action": "create_ticket",
+        "title": title,
+        "description": user_input.strip(),
+    }
+
+
+class MockLLMProvider(AIInterface):
+    """Scripted/templated AIInterface with latency profiles and fault injection.
+
+    All randomness (latency, injected errors) comes from one seeded RNG so a
+    run with the same seed and call order is reproducible.
+    """
+
+    DEFAULT_TEMPLATE = "Mock reply: $user_input"
+
+    def __init__(
+        self,
+        config: MockLLMConfig | None = None,
+        *,
+        script: Sequence[str | dict[str, Any]] | None = None,
+        template: str = DEFAULT_TEMPLATE,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Initialize the mock provider.
+
+        Args:
+            config: Latency/error settings. Defaults to ``MockLLMConfig.from_env()``.
+            script: Optional responses returned in order (cycled). Strings are
+                ``string.Template``s with ``$user_input`` / ``$system_prompt``.
+            template: Conversational reply template when no script is given.
+            sleep: Sleep function (injectable so tests run instantly).
+        """
+        self._config = config or MockLLMConfig.from_env()
+        self._script = list(script or [])
+        self._template = Template(template)
+        self._sleep = sleep
+        self._rng = random.Random(self._config.seed)  # noqa: S311
+        self._lock = threading.Lock()
+        self._calls = 0
+        self._failures = 0
+
+    @property
+    def call_count(self) -> int:
+        """Number of generate/stream calls received."""
+        return self._calls
+
+    @property
+    def failure_count(self) -> int:
+        """Number of injected failures raised."""
+        return self._failures
+
+    def generate_response(
+        self,
+        user_input: str,
+        system_prompt: str,
+        response_schema: dict[str, Any] | None = None,
+    ) -> str | dict[str, Any]:
+        """Return a scripted/templated response after a sampled delay.
+
+        Raises:
+            RuntimeError: For injected failures (same messages as real providers).
+        """
+        delay, index = self._begin_call()
+        self._sleep(delay)
+        return self._respond(index, user_input, system_prompt, response_schema)
+
+    def stream_response(self, user_input: str, system_prompt: str) -> Iterator[str]:
+        """Yield the conversational response token by token.
+
+        The call latency is used as time-to-first-token and the token latency
+        profile is sampled between tokens.
+        """
+        delay, index = self._begin_call()
+        self._sleep(delay)
+        text = str(self._respond(index, user_input, system_prompt, None))
+        for position, token in enumerate(_TOKEN.findall(text)):
+            if position:
+                self._sleep(self._sample_token_delay())
+            yield token
+
+    # -------------------------
+    # Internals
+    # -------------------------
+
+    def _begin_call(self) -> tuple[float, int]:
+        """Count the call, sample latency and apply fault injection."""
+        cfg = self._config
+        with self._lock:
+            index = self._calls
+            self._calls += 1
+            delay = cfg.latency.sample(self._rng)
+            roll = self._rng.random()
+            if roll < cfg.rate_limit_rate + cfg.timeout_rate + cfg.error_rate:
+                self._failures += 1
+
+        if roll < cfg.rate_limit_rate:
+            raise MockRateLimitedError(retry_after=1.0)
+        if roll < cfg.rate_limit_rate + cfg.timeout_rate:
+            self._sleep(delay)
+            raise MockTimeoutError
+        if roll < cfg.rate_limit_rate + cfg.timeout_rate + cfg.error_rate:
+            raise MockProviderError
+        return delay, index
+
+    def _sample_token_delay(self) -> float:
+        if isinstance(self._config.token_latency, NoLatency):
+            return 0.0
+        with self._lock:
+            return self._config.token_latency.sample(self._rng)
+
+    def _respond(
+        self,
+        index: int,
+        user_input: str,
+        system_prompt: str,
+        response_schema: dict[str, Any] | None,
+    ) -> str | dict[str, Any]:
+        values = {"user_input": user_input, "system_prompt": system_prompt}
+
+        if self._script:
+            item = self._script[index % len(self._script)]
+            if isinstance(item, dict):
+                return copy.deepcopy(item)
+            text = Template(item).safe_substitute(values)
+            if response_schema:
+                try:
+                    loaded = json.loads(text)
+                except ValueError:
+                    loaded = None
+                if not isinstance(loaded, dict):
+                    raise MockInvalidResponseError
+                return loaded
+            return text
+
+        if response_schema:
+            return jira_action(user_input)
+        if "json" in system_prompt.lower():
+            # Prompted (not schema-enforced) JSON, as the orchestrator's Jira path uses.
+            return json.dumps(jira_action(user_input))
+        return self._template.safe_substitute(values)
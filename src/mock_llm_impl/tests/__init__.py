@@ -0,0 +1 @@
+"""Tests for the mock LLM provider."""
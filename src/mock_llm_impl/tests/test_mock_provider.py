@@ -0,0 +1,276 @@
+"""Tests for the deterministic mock LLM provider."""
+
+from __future__ import annotations
+
+import json
+import random
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+import ai_api
+from mock_llm_impl import MockLLMConfig, MockRateLimitedError
+from mock_llm_impl.latency import (
+    FixedLatency,
+    HeavyTailLatency,
+    LognormalLatency,
+    NoLatency,
+    parse_latency,
+)
+from mock_llm_impl.provider import MockLLMProvider, jira_action
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from types import ModuleType
+
+
+def _provider(
+    script: list[str | dict[str, Any]] | None = None, **config: object
+) -> tuple[MockLLMProvider, list[float]]:
+    """Build a provider whose sleeps are recorded instead of slept.
+
+    ``config`` overrides MockLLMConfig fields; by default there is no latency
+    and the seed is 7.
+    """
+    slept: list[float] = []
+    fields: dict[str, Any] = {
+        "latency": NoLatency(),
+        "token_latency": NoLatency(),
+        "seed": 7,
+        **config,
+    }
+    settings = MockLLMConfig(**fields)
+    return MockLLMProvider(settings, script=script, sleep=slept.append), slept
+
+
+@pytest.fixture
+def mock_llm_impl(monkeypatch: pytest.MonkeyPatch) -> Iterator[ModuleType]:
+    """Import the package and undo its registration after the test."""
+    import mock_llm_impl
+
+    monkeypatch.setattr(ai_api, "get_client", ai_api.get_client)
+    yield mock_llm_impl
+    mock_llm_impl.unregister()
+
+
+@pytest.mark.unit
+def test_template_reply() -> None:
+    """Without a script the reply is a template, after the first-token latency."""
+    provider, slept = _provider(latency=FixedLatency(50))
+
+    assert provider.generate_response("Hello", "Be helpful") == "Mock reply: Hello"
+    assert slept == [0.05]
+    assert provider.call_count == 1
+
+
+@pytest.mark.unit
+def test_script_cycles_and_substitutes() -> None:
+    """Scripted replies cycle and substitute the user input."""
+    provider, _ = _provider(script=["A: $user_input", {"action": "list_tickets"}])
+
+    assert provider.generate_response("x", "sys") == "A: x"
+    assert provider.generate_response("y", "sys") == {"action": "list_tickets"}
+    assert provider.generate_response("z", "sys") == "A: z"
+
+
+@pytest.mark.unit
+def test_structured_script_must_be_json_object() -> None:
+    """A structured call rejects a scripted reply that is not a JSON object."""
+    provider, _ = _provider(script=["not json"])
+
+    with pytest.raises(RuntimeError, match="invalid response format"):
+        provider.generate_response("x", "sys", response_schema={"type": "object"})
+
+
+@pytest.mark.unit
+def test_json_prompt_returns_jira_action() -> None:
+    """A prompt asking for JSON gets a Jira action derived from the input."""
+    provider, _ = _provider()
+
+    text = provider.generate_response("Please close PROJ-12", "Reply with JSON only")
+
+    assert json.loads(str(text)) == {
+        "action": "update_ticket",
+        "ticket_id": "PROJ-12",
+        "status": "closed",
+    }
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("text", "action"),
+    [
+        ("Delete ABC-1", {"action": "delete_ticket", "ticket_id": "ABC-1"}),
+        (
+            "Move ABC-2 to in progress",
+            {"action": "update_ticket", "ticket_id": "ABC-2", "status": "in_progress"},
+        ),
+        ("List my tickets", {"action": "list_tickets"}),
+        (
+            "Login page is broken",
+            {
+                "action": "create_ticket",
+                "title": "Login page is broken",
+                "description": "Login page is broken",
+            },
+        ),
+    ],
+)
+def test_jira_action(text: str, action: dict[str, str]) -> None:
+    """Free text maps to the expected Jira action."""
+    assert jira_action(text) == action
+
+
+@pytest.mark.unit
+def test_same_seed_is_reproducible() -> None:
+    """The same seed gives the same latency samples."""
+    def run() -> list[float]:
+        provider, slept = _provider(latency=LognormalLatency(200, 0.6), seed=123)
+        for _ in range(20):
+            provider.generate_response("hi", "sys")
+        return slept
+
+    first = run()
+    assert first == run()
+    assert len(set(first)) > 1
+
+
+@pytest.mark.unit
+def test_error_injection() -> None:
+    """error_rate=1 fails every call with a sanitized message."""
+    provider, _ = _provider(error_rate=1.0)
+
+    with pytest.raises(RuntimeError, match="failed to generate"):
+        provider.generate_response("hi", "sys")
+    assert provider.failure_count == 1
+
+
+@pytest.mark.unit
+def test_timeout_injection_sleeps_first() -> None:
+    """An injected timeout fails only after the latency has elapsed."""
+    provider, slept = _provider(latency=FixedLatency(100), timeout_rate=1.0)
+
+    with pytest.raises(RuntimeError, match="timed out"):
+        provider.generate_response("hi", "sys")
+    assert slept == [0.1]
+
+
+@pytest.mark.unit
+def test_rate_limit_injection_carries_retry_after() -> None:
+    """An injected rate limit carries retry_after and stays a RuntimeError."""
+    provider, _ = _provider(rate_limit_rate=1.0)
+
+    with pytest.raises(MockRateLimitedError) as exc:
+        provider.generate_response("hi", "sys")
+    assert exc.value.retry_after == 1.0
+    assert isinstance(exc.value, RuntimeError)
+
+
+@pytest.mark.unit
+def test_stream_yields_tokens_with_token_latency() -> None:
+    """Streaming sleeps once for the first token, then per token."""
+    provider, slept = _provider(latency=FixedLatency(30), token_latency=FixedLatency(5))
+
+    tokens = list(provider.stream_response("one two", "sys"))
+
+    assert "".join(tokens) == "Mock reply: one two"
+    assert tokens[0] == "Mock"
+    assert slept == [0.03] + [0.005] * (len(tokens) - 1)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("spec", "expected"),
+    [
+        ("none", NoLatency()),
+        ("fixed:50", FixedLatency(50)),
+        ("lognormal:200,0.6", LognormalLatency(200, 0.6)),
+        ("heavytail:100,1.5", HeavyTailLatency(100, 1.5)),
+        ("heavytail:100,1.5,2000", HeavyTailLatency(100, 1.5, 2000)),
+    ],
+)
+def test_parse_latency(spec: str, expected: object) -> None:
+    """Latency specs parse into their profiles."""
+    assert parse_latency(spec) == expected
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("spec", ["fixed", "lognormal:1", "pareto:1,2", "fixed:x"])
+def test_parse_latency_rejects_bad_specs(spec: str) -> None:
+    """Malformed latency specs raise ValueError."""
+    with pytest.raises(ValueError, match="Invalid latency spec"):
+        parse_latency(spec)
+
+
+@pytest.mark.unit
+def test_heavy_tail_cap() -> None:
+    """Heavy-tail samples stay between the scale and the cap."""
+    profile = HeavyTailLatency(100, 0.5, cap_ms=300)
+    rng = random.Random(0)  # noqa: S311
+
+    samples = [profile.sample(rng) for _ in range(200)]
+
+    assert max(samples) == 0.3
+    assert min(samples) >= 0.1
+
+
+@pytest.mark.unit
+def test_config_from_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """MockLLMConfig reads its settings from the environment."""
+    monkeypatch.setenv("MOCK_LLM_LATENCY", "fixed:10")
+    monkeypatch.setenv("MOCK_LLM_ERROR_RATE", "0.25")
+    monkeypatch.setenv("MOCK_LLM_SEED", "9")
+
+    config = MockLLMConfig.from_env()
+
+    assert config.latency == FixedLatency(10)
+    assert config.error_rate == 0.25
+    assert config.seed == 9
+
+
+@pytest.mark.unit
+def test_config_rejects_bad_rate(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A rate outside [0, 1] is rejected."""
+    monkeypatch.setenv("MOCK_LLM_TIMEOUT_RATE", "1.5")
+
+    with pytest.raises(ValueError, match="timeout_rate"):
+        MockLLMConfig.from_env()
+
+
+@pytest.mark.unit
+def test_import_alone_registers_nothing(mock_llm_impl: ModuleType) -> None:
+    """Importing the package leaves ai_api.get_client untouched."""
+    assert ai_api.get_client.__module__ != mock_llm_impl.__name__
+
+
+@pytest.mark.unit
+def test_register_installs_a_shared_client(mock_llm_impl: ModuleType) -> None:
+    """register() makes get_client return one shared mock provider."""
+    mock_llm_impl.register()
+    mock_llm_impl.register()
+
+    client = ai_api.get_client()
+
+    assert isinstance(client, mock_llm_impl.MockLLMProvider)
+    assert ai_api.get_client() is client
+
+
+@pytest.mark.unit
+def test_register_warns_when_replacing_a_provider_and_unregister_restores_it(
+    mock_llm_impl: ModuleType,
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """A replaced provider is logged, and unregister() puts it back."""
+
+    def real_provider() -> ai_api.AIInterface:
+        raise AssertionError
+
+    monkeypatch.setattr(ai_api, "get_client", real_provider)
+    with caplog.at_level("WARNING", logger="mock_llm_impl"):
+        mock_llm_impl.register()
+
+    assert isinstance(ai_api.get_client(), mock_llm_impl.MockLLMProvider)
+    assert "replaces the registered AI client" in caplog.text
+    mock_llm_impl.unregister()
+    assert ai_api.get_client is real_provider
@@ -5,19 +5,40 @@ This component:
 - Talks directly to the OpenAI SDK
 - Fails fast if OPENAI_API_KEY is missing (TA-style behavior)
 - Supports both conversational output and structured JSON-schema output
+- Reuses precompiled, content-hashed schemas for structured output
+- Schedules calls through a shared RPM/TPM budget and retries provider 429s
+  and transient failures (connection errors, timeouts, 408/409/5xx)
+- Lays out messages for prompt-prefix caching and records cached-token usage
 """
 
 from __future__ import annotations
 
 import json
 import os
+import time
 from typing import TYPE_CHECKING, Any
 
 from ai_api import AIInterface
+from openai_impl.prompt_cache import (
+    DEFAULT_PROMPT_ASSEMBLER,
+    DEFAULT_PROMPT_TELEMETRY,
+    PromptAssembler,
+    PromptCacheTelemetry,
+)
+from openai_impl.rate_limit import (
+    RateLimitedError,
+    RateLimitScheduler,
+    default_scheduler,
+    usage_total_tokens,
+)
+from openai_impl.schema_registry import (
+    DEFAULT_SCHEMA_REGISTRY,
+    CompiledSchema,
+    SchemaRegistry,
+)
 
 if TYPE_CHECKING:
     from openai import OpenAI
-    from openai.types.chat import ChatCompletionMessageParam
 
 
 class OpenAIClient(AIInterface):
@@ -25,12 +46,24 @@ class OpenAIClient(AIInterface):
 
     DEFAULT_MODEL = "gpt-4o-mini"
 
-    def __init__(self, api_key: str | None = None, model: str | None = None) -> None:
+    def __init__(
+        self,
+        api_key: str | None = None,
+        model: str | None = None,
+        schema_registry: SchemaRegistry | None = None,
+        scheduler: RateLimitScheduler | None = None,
+        prompt_assembler: PromptAssembler | None = None,
+        prompt_telemetry: PromptCacheTelemetry | None = None,
+    ) -> None:
         """Initialize the OpenAI client.
 
         Args:
             api_key: Optional key. If omitted, reads OPENAI_API_KEY from env.
             model: Optional model override.
+            schema_registry: Optional schema cache. Defaults to the shared registry.
+            scheduler: Optional rate-limit scheduler. Defaults to the shared one.
+            prompt_assembler: Optional message layout. Defaults to the shared one.
+            prompt_telemetry: Optional usage recorder. Defaults to the shared one.
 
         Raises:
             RuntimeError: If no API key is available.
@@ -42,10 +75,31 @@ class OpenAIClient(AIInterface):
             )
 
         # Import here to keep module import light and make tests easier to patch.
-        from openai import OpenAI  # noqa: PLC0415
+        from openai import APIConnectionError, OpenAI
 
-        self._sdk: OpenAI = OpenAI(api_key=key)
+        # All retries are owned by the scheduler, not the SDK: SDK retries
+        # would sleep on 429s without pausing the other callers.
+        self._sdk: OpenAI = OpenAI(api_key=key, max_retries=0)
+        self._transient_errors: tuple[type[BaseException], ...] = (APIConnectionError,)
         self._model = model or self.DEFAULT_MODEL
+        self._schemas = (
+            schema_registry if schema_registry is not None else DEFAULT_SCHEMA_REGISTRY
+        )
+        self._scheduler = scheduler if scheduler is not None else default_scheduler()
+        self._prompts = prompt_assembler or DEFAULT_PROMPT_ASSEMBLER
+        self._telemetry = prompt_telemetry or DEFAULT_PROMPT_TELEMETRY
+
+    @property
+    def prompt_telemetry(self) -> PromptCacheTelemetry:
+        """Cached-token telemetry recorded by this client."""
+        return self._telemetry
+
+    def compile_schema(self, response_schema: dict[str, Any]) -> CompiledSchema:
+        """Return the compiled schema (including its content hash) for reuse.
+
+        Downstream caches can key on ``compile_schema(s).schema_hash``.
+        """
+        return self._schemas.compile(response_schema)
 
     def generate_response(
         self,
@@ -59,14 +113,23 @@ class OpenAIClient(AIInterface):
         Otherwise returns a conversational string.
 
         Raises:
+            RateLimitedError: If the rate-limit budget stays exhausted
+                (a RuntimeError carrying ``retry_after``).
             RuntimeError: For missing credentials, SDK failures, or invalid output.
         """
+        estimated = self._scheduler.estimate_tokens(system_prompt, user_input)
         try:
-            return self._call_openai(
-                user_input=user_input,
-                system_prompt=system_prompt,
-                response_schema=response_schema,
+            return self._scheduler.run(
+                lambda: self._call_openai(
+                    user_input=user_input,
+                    system_prompt=system_prompt,
+                    response_schema=response_schema,
+                ),
+                estimated_tokens=estimated,
+                transient=self._transient_errors,
             )
+        except RateLimitedError:
+            raise
         except TimeoutError:
             raise RuntimeError(
                 "AI service timed out while generating a response"
@@ -91,46 +154,39 @@ class OpenAIClient(AIInterface):
 
         Kept as an internal method so unit tests can patch it without doing real calls.
         """
-        messages: list[ChatCompletionMessageParam] = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_input},
-        ]
-
-        if response_schema:
-            schema_name = str(response_schema.get("name", "structured_output"))
-            schema_description = str(
-                response_schema.get("description", "Structured output schema")
-            )
-            json_schema = response_schema.get("schema", response_schema)
-
-            if isinstance(json_schema, dict) and "additionalProperties" not in json_schema:
-                json_schema["additionalProperties"] = False
-
-            response = self._sdk.chat.completions.create(
-                model=self._model,
-                messages=messages,
-                response_format={
-                    "type": "json_schema",
-                    "json_schema": {
-                        "name": schema_name,
-                        "description": schema_description,
-                        "schema": json_schema,
-                        "strict": True,
-                    },
-                },
-            )
-
-            content = response.choices[0].message.content
-            if not content:
-                return {}
-            loaded = json.loads(content)
-            if not isinstance(loaded, dict):
-                raise ValueError("Structured response is not a JSON object")
-            return loaded
-
-        response = self._sdk.chat.completions.create(
-            model=self._model,
-            messages=messages,
+        compiled = self._schemas.compile(response_schema) if response_schema else None
+        prompt = self._prompts.assemble(system_prompt, user_input, compiled)
+        request: dict[str, Any] = {
+            "model": self._model,
+            "messages": prompt.messages,
+            # Routes requests sharing a static prefix to the same prompt cache.
+            "extra_body": {"prompt_cache_key": prompt.prefix_hash[:32]},
+        }
+        if compiled is not None:
+            request["response_format"] = compiled.response_format
+
+        started = time.perf_counter()
+        response = self._sdk.chat.completions.create(**request)
+        self._telemetry.record(
+            prompt.prefix_hash, response, time.perf_counter() - started
         )
+        self._record_usage(user_input, system_prompt, response)
+
         content = response.choices[0].message.content
-        return "" if content is None else content
+        if compiled is None:
+            return "" if content is None else content
+
+        if not content:
+            return {}
+        loaded = json.loads(content)
+        if not isinstance(loaded, dict):
+            raise ValueError("Structured response is not a JSON object")
+        compiled.validate(loaded)
+        return loaded
+
+    def _record_usage(self, user_input: str, system_prompt: str, response: Any) -> None:
+        """Reconcile the scheduler's token estimate with reported usage."""
+        self._scheduler.record_usage(
+            self._scheduler.estimate_tokens(system_prompt, user_input),
+            usage_total_tokens(response),
+        )
@@ -0,0 +1,221 @@
+"""Prompt-prefix-cache-friendly message layout and cached-token telemetry.
+
+OpenAI caches (and discounts) repeated prompt prefixes. This component:
+- Assembles messages so static content (instructions, examples) comes first
+  in a stable byte order and the per-request user input comes last
+- Tags each request with a prefix hash used as ``prompt_cache_key``; the hash
+  covers the schema too, which is sent once, through ``response_format``
+- Records ``usage.prompt_tokens_details.cached_tokens`` and latency per request
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict, deque
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from openai.types.chat import ChatCompletionMessageParam
+
+    from openai_impl.schema_registry import CompiledSchema
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class AssembledPrompt:
+    """Messages for one request plus the identity of their static prefix."""
+
+    messages: list[ChatCompletionMessageParam]
+    prefix_hash: str
+
+
+@dataclass(frozen=True, slots=True)
+class PromptUsage:
+    """Token usage and latency observed for a single request."""
+
+    prefix_hash: str
+    prompt_tokens: int
+    cached_tokens: int
+    latency_seconds: float
+
+
+@dataclass(frozen=True, slots=True)
+class PromptCacheSummary:
+    """Aggregated cached-token telemetry."""
+
+    requests: int
+    prompt_tokens: int
+    cached_tokens: int
+    cache_hit_requests: int
+    mean_latency_cached: float | None
+    mean_latency_uncached: float | None
+
+    @property
+    def cached_ratio(self) -> float:
+        """Fraction of prompt tokens served from the provider cache."""
+        return self.cached_tokens / self.prompt_tokens if self.prompt_tokens else 0.0
+
+
+class PromptAssembler:
+    """Builds byte-stable message prefixes and caches them per prefix identity."""
+
+    DEFAULT_MAX_PREFIXES = 128
+
+    def __init__(
+        self,
+        examples: Sequence[tuple[str, str]] = (),
+        max_prefixes: int = DEFAULT_MAX_PREFIXES,
+    ) -> None:
+        """Initialize the assembler.
+
+        Args:
+            examples: Static few-shot ``(user, assistant)`` pairs placed after
+                the system message and before the user input.
+            max_prefixes: Upper bound on cached prefixes (oldest evicted first).
+        """
+        self._examples = tuple(examples)
+        self._max_prefixes = max_prefixes
+        self._prefixes: OrderedDict[
+            tuple[str, str | None], tuple[list[ChatCompletionMessageParam], str]
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def assemble(
+        self,
+        system_prompt: str,
+        user_input: str,
+        schema: CompiledSchema | None = None,
+    ) -> AssembledPrompt:
+        """Return messages with the static prefix first and user input last."""
+        key = (system_prompt, schema.schema_hash if schema else None)
+        with self._lock:
+            cached = self._prefixes.get(key)
+            if cached is not None:
+                self._prefixes.move_to_end(key)
+        if cached is None:
+            cached = self._build_prefix(system_prompt, schema)
+            with self._lock:
+                self._prefixes[key] = cached
+                while len(self._prefixes) > self._max_prefixes:
+                    self._prefixes.popitem(last=False)
+
+        prefix, prefix_hash = cached
+        messages: list[ChatCompletionMessageParam] = [
+            *prefix,
+            {"role": "user", "content": user_input},
+        ]
+        return AssembledPrompt(messages=messages, prefix_hash=prefix_hash)
+
+    def _build_prefix(
+        self,
+        system_prompt: str,
+        schema: CompiledSchema | None,
+    ) -> tuple[list[ChatCompletionMessageParam], str]:
+        """Build the static prefix once; identical inputs give identical bytes.
+
+        The system prompt is used verbatim. The schema is not repeated in the
+        messages, since ``response_format`` already sends it, but its hash is
+        part of the prefix hash: the provider caches it ahead of the messages.
+        """
+        prefix: list[ChatCompletionMessageParam] = [
+            {"role": "system", "content": system_prompt}
+        ]
+        for example_user, example_assistant in self._examples:
+            prefix.append({"role": "user", "content": example_user})
+            prefix.append({"role": "assistant", "content": example_assistant})
+
+        encoded = json.dumps(
+            [schema.schema_hash if schema else None, prefix],
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        digest = hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+        return prefix, digest
+
+
+class PromptCacheTelemetry:
+    """Thread-safe recorder for per-request cached-token usage."""
+
+    DEFAULT_HISTORY = 256
+
+    def __init__(self, history: int = DEFAULT_HISTORY) -> None:
+        """Initialize with a bounded history of recent requests."""
+        self._recent: deque[PromptUsage] = deque(maxlen=history)
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._prompt_tokens = 0
+        self._cached_tokens = 0
+        self._hits = 0
+        self._latency_cached = 0.0
+        self._latency_uncached = 0.0
+
+    def record(
+        self,
+        prefix_hash: str,
+        response: Any,
+        latency_seconds: float,
+    ) -> PromptUsage:
+        """Record usage from an SDK response (missing fields count as zero)."""
+        usage = getattr(response, "usage", None)
+        prompt_tokens = getattr(usage, "prompt_tokens", 0)
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached_tokens = getattr(details, "cached_tokens", 0)
+        entry = PromptUsage(
+            prefix_hash=prefix_hash,
+            prompt_tokens=prompt_tokens if isinstance(prompt_tokens, int) else 0,
+            cached_tokens=cached_tokens if isinstance(cached_tokens, int) else 0,
+            latency_seconds=latency_seconds,
+        )
+
+        with self._lock:
+            self._recent.append(entry)
+            self._requests += 1
+            self._prompt_tokens += entry.prompt_tokens
+            self._cached_tokens += entry.cached_tokens
+            if entry.cached_tokens > 0:
+                self._hits += 1
+                self._latency_cached += latency_seconds
+            else:
+                self._latency_uncached += latency_seconds
+
+        logger.info(
+            "OpenAI usage | prefix=%s prompt_tokens=%d cached_tokens=%d latency=%.3f",
+            prefix_hash[:12],
+            entry.prompt_tokens,
+            entry.cached_tokens,
+            latency_seconds,
+        )
+        return entry
+
+    def recent(self) -> list[PromptUsage]:
+        """Return the most recent per-request records (oldest first)."""
+        with self._lock:
+            return list(self._recent)
+
+    def summary(self) -> PromptCacheSummary:
+        """Return aggregate counters, including mean latency with/without hits."""
+        with self._lock:
+            misses = self._requests - self._hits
+            return PromptCacheSummary(
+                requests=self._requests,
+                prompt_tokens=self._prompt_tokens,
+                cached_tokens=self._cached_tokens,
+                cache_hit_requests=self._hits,
+                mean_latency_cached=(
+                    self._latency_cached / self._hits if self._hits else None
+                ),
+                mean_latency_uncached=(
+                    self._latency_uncached / misses if misses else None
+                ),
+            )
+
+
+# Shared across client instances so telemetry survives per-request clients.
+DEFAULT_PROMPT_ASSEMBLER = PromptAssembler()
+DEFAULT_PROMPT_TELEMETRY = PromptCacheTelemetry()
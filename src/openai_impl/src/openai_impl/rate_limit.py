@@ -0,0 +1,372 @@
+"""Provider rate-limit aware scheduling for OpenAI calls.
+
+This component:
+- Tracks requests-per-minute and tokens-per-minute with two token buckets
+- Queues callers (FIFO) while the budget is exhausted instead of failing them
+- Honours ``Retry-After`` on 429 responses with jittered exponential backoff
+- Retries transient failures (connection errors, timeouts, 408/409/5xx) the
+  way the SDK would, with the same backoff
+- Records queue wait time so bursts are visible in logs and stats
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import random
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_CHARS_PER_TOKEN = 4
+_RATE_LIMITED = 429
+# Statuses the OpenAI SDK itself retries, besides 429 and 5xx.
+_RETRYABLE_STATUSES = frozenset({408, 409})
+_SERVER_ERROR = 500
+
+
+class RateLimitedError(RuntimeError):
+    """Raised when a call cannot be scheduled within the queue budget.
+
+    ``retry_after`` is the suggested delay (seconds) before trying again.
+    """
+
+    def __init__(self, message: str, retry_after: float) -> None:
+        """Initialize with a sanitized message and retry hint."""
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+@dataclass(frozen=True, slots=True)
+class SchedulerStats:
+    """Point-in-time counters for a RateLimitScheduler."""
+
+    requests: int
+    queued: int
+    rate_limited: int
+    retries: int
+    total_wait_seconds: float
+    max_wait_seconds: float
+    last_wait_seconds: float
+
+
+class _TokenBucket:
+    """Continuous-refill bucket sized to one minute of budget."""
+
+    def __init__(self, per_minute: float, now: float) -> None:
+        self.capacity = float(per_minute)
+        self.level = float(per_minute)
+        self._rate = float(per_minute) / 60.0
+        self._updated = now
+
+    def refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self.level = min(self.capacity, self.level + elapsed * self._rate)
+            self._updated = now
+
+    def time_until(self, amount: float) -> float:
+        missing = amount - self.level
+        return 0.0 if missing <= 0 else missing / self._rate
+
+
+def _status_code(exc: BaseException) -> int | None:
+    status = getattr(exc, "status_code", None)
+    if isinstance(status, int):
+        return status
+    resp = getattr(exc, "response", None)
+    status = getattr(resp, "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def _is_transient(
+    exc: BaseException, status: int | None, transient: tuple[type[BaseException], ...]
+) -> bool:
+    """True for failures worth retrying: timeouts, dropped connections, 408/409/5xx."""
+    if status is not None:
+        return status in _RETRYABLE_STATUSES or status >= _SERVER_ERROR
+    return isinstance(exc, (ConnectionError, TimeoutError, *transient))
+
+
+def _retry_after_seconds(exc: BaseException) -> float | None:
+    """Read ``retry-after-ms`` / ``retry-after`` from a provider error, if any."""
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if headers is None:
+        return None
+    try:
+        raw_ms = headers.get("retry-after-ms")
+        if raw_ms is not None:
+            return max(0.0, float(raw_ms) / 1000.0)
+        raw = headers.get("retry-after")
+        if raw is not None:
+            return max(0.0, float(raw))
+    except (TypeError, ValueError):
+        return None
+    return None
+
+
+class RateLimitScheduler:
+    """Token-bucket scheduler placed in front of a rate-limited provider."""
+
+    DEFAULT_RPM = 500
+    DEFAULT_TPM = 200_000
+    DEFAULT_MAX_QUEUE_SECONDS = 30.0
+    DEFAULT_MAX_RETRIES = 3
+    DEFAULT_BACKOFF_SECONDS = 1.0
+    DEFAULT_COMPLETION_TOKENS = 256
+
+    def __init__(
+        self,
+        *,
+        requests_per_minute: int = DEFAULT_RPM,
+        tokens_per_minute: int = DEFAULT_TPM,
+        max_queue_seconds: float = DEFAULT_MAX_QUEUE_SECONDS,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_seconds: float = DEFAULT_BACKOFF_SECONDS,
+        completion_tokens: int = DEFAULT_COMPLETION_TOKENS,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            requests_per_minute: Request budget per rolling minute.
+            tokens_per_minute: Token budget per rolling minute.
+            max_queue_seconds: Longest a caller may wait before RateLimitedError.
+            max_retries: Retries for provider 429s, and separately for
+                transient failures, on a single call.
+            backoff_seconds: Base delay when a retried error carries no Retry-After.
+            completion_tokens: Output allowance added to each token estimate.
+        """
+        now = time.monotonic()
+        self._requests = _TokenBucket(requests_per_minute, now)
+        self._tokens = _TokenBucket(tokens_per_minute, now)
+        self._max_queue_seconds = max_queue_seconds
+        self._max_retries = max_retries
+        self._backoff_seconds = backoff_seconds
+        self._completion_tokens = completion_tokens
+
+        self._cond = threading.Condition()
+        self._next_ticket = 0
+        self._waiting: deque[int] = deque()
+        self._blocked_until = 0.0
+
+        self._count_requests = 0
+        self._count_queued = 0
+        self._count_rate_limited = 0
+        self._count_retries = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._wait_last = 0.0
+
+    @classmethod
+    def from_env(cls) -> RateLimitScheduler:
+        """Build a scheduler from OPENAI_RPM_LIMIT / OPENAI_TPM_LIMIT / ..."""
+        env = os.environ
+        return cls(
+            requests_per_minute=int(env.get("OPENAI_RPM_LIMIT", cls.DEFAULT_RPM)),
+            tokens_per_minute=int(env.get("OPENAI_TPM_LIMIT", cls.DEFAULT_TPM)),
+            max_queue_seconds=float(
+                env.get("OPENAI_MAX_QUEUE_SECONDS", cls.DEFAULT_MAX_QUEUE_SECONDS)
+            ),
+        )
+
+    # -------------------------
+    # Budget accounting
+    # -------------------------
+
+    def estimate_tokens(self, *texts: str) -> int:
+        """Cheap prompt+completion token estimate (~4 chars per token)."""
+        prompt_chars = sum(len(t) for t in texts)
+        return prompt_chars // _CHARS_PER_TOKEN + 1 + self._completion_tokens
+
+    def acquire(self, tokens: int) -> float:
+        """Block until one request and ``tokens`` fit the budget.
+
+        Callers are served in arrival order.
+
+        Returns:
+            Seconds spent queued.
+
+        Raises:
+            RateLimitedError: If the wait would exceed ``max_queue_seconds``.
+        """
+        start = time.monotonic()
+        deadline = start + self._max_queue_seconds
+        with self._cond:
+            ticket = self._next_ticket
+            self._next_ticket += 1
+            self._waiting.append(ticket)
+            queued = False
+            try:
+                while True:
+                    now = time.monotonic()
+                    at_head = self._waiting[0] == ticket
+                    delay = self._budget_delay(tokens, now) if at_head else None
+                    if delay is not None and delay <= 0:
+                        break
+                    queued = True
+                    remaining = deadline - now
+                    if remaining <= 0 or (delay is not None and delay > remaining):
+                        raise RateLimitedError(
+                            "AI provider rate limit reached; please retry shortly",
+                            retry_after=max(delay or 0.0, 1.0),
+                        )
+                    self._cond.wait(timeout=remaining if delay is None else delay)
+
+                self._requests.level -= 1
+                self._tokens.level -= min(tokens, self._tokens.capacity)
+            finally:
+                self._waiting.remove(ticket)
+                self._cond.notify_all()
+
+            waited = time.monotonic() - start
+            self._count_requests += 1
+            self._count_queued += int(queued)
+            self._wait_total += waited
+            self._wait_max = max(self._wait_max, waited)
+            self._wait_last = waited
+
+        if queued:
+            logger.info("AI request queued for rate limit | wait=%.3fs", waited)
+        return waited
+
+    def record_usage(self, estimated_tokens: int, actual_tokens: int | None) -> None:
+        """Correct the token bucket once the provider reports real usage."""
+        if actual_tokens is None:
+            return
+        with self._cond:
+            self._tokens.level = min(
+                self._tokens.capacity,
+                self._tokens.level + estimated_tokens - actual_tokens,
+            )
+            self._cond.notify_all()
+
+    def penalize(self, retry_after: float) -> None:
+        """Pause all scheduling for ``retry_after`` seconds (provider 429)."""
+        with self._cond:
+            self._blocked_until = max(
+                self._blocked_until, time.monotonic() + retry_after
+            )
+
+    def _budget_delay(self, tokens: int, now: float) -> float:
+        """Seconds until the head of the queue fits the budget (0 = now)."""
+        self._requests.refill(now)
+        self._tokens.refill(now)
+        return max(
+            self._blocked_until - now,
+            self._requests.time_until(1),
+            self._tokens.time_until(min(tokens, self._tokens.capacity)),
+        )
+
+    # -------------------------
+    # Scheduling wrapper
+    # -------------------------
+
+    def run(
+        self,
+        call: Callable[[], T],
+        *,
+        estimated_tokens: int,
+        transient: tuple[type[BaseException], ...] = (),
+    ) -> T:
+        """Run ``call`` within the budget, retrying provider 429s.
+
+        Transient failures are retried too, up to ``max_retries`` times, after
+        a backoff that only delays this caller: 408, 409 and 5xx responses,
+        ``ConnectionError``, ``TimeoutError`` and any type in ``transient``
+        (e.g. the SDK's connection error). Once retries run out, and for any
+        other exception, the error propagates unchanged.
+        """
+        attempt = 0
+        failures = 0
+        while True:
+            self.acquire(estimated_tokens)
+            try:
+                return call()
+            except Exception as exc:
+                status = _status_code(exc)
+                if status != _RATE_LIMITED:
+                    if failures >= self._max_retries or not _is_transient(
+                        exc, status, transient
+                    ):
+                        raise
+                    delay = self._backoff_delay(failures, _retry_after_seconds(exc))
+                    with self._cond:
+                        self._count_retries += 1
+                    logger.warning(
+                        "AI provider call failed | error=%s attempt=%d retry_in=%.2fs",
+                        type(exc).__name__,
+                        failures + 1,
+                        delay,
+                    )
+                    failures += 1
+                    time.sleep(delay)
+                    continue
+                retry_after = _retry_after_seconds(exc)
+                with self._cond:
+                    self._count_rate_limited += 1
+                if attempt >= self._max_retries:
+                    raise RateLimitedError(
+                        "AI provider rate limit reached; please retry shortly",
+                        retry_after=retry_after or self._backoff_seconds,
+                    ) from None
+
+                delay = self._backoff_delay(attempt, retry_after)
+                self.penalize(delay)
+                with self._cond:
+                    self._count_retries += 1
+                logger.warning(
+                    "AI provider returned 429 | attempt=%d retry_in=%.2fs",
+                    attempt + 1,
+                    delay,
+                )
+                attempt += 1
+
+    def _backoff_delay(self, attempt: int, retry_after: float | None) -> float:
+        """Retry-After (or exponential backoff) plus up to 25% jitter."""
+        base = self._backoff_seconds * (2**attempt)
+        if retry_after is not None:
+            base = max(retry_after, 0.0)
+        return float(base + random.uniform(0.0, 0.25 * max(base, 0.1)))
+
+    # -------------------------
+    # Introspection
+    # -------------------------
+
+    def stats(self) -> SchedulerStats:
+        """Return current counters, including queue wait time."""
+        with self._cond:
+            return SchedulerStats(
+                requests=self._count_requests,
+                queued=self._count_queued,
+                rate_limited=self._count_rate_limited,
+                retries=self._count_retries,
+                total_wait_seconds=self._wait_total,
+                max_wait_seconds=self._wait_max,
+                last_wait_seconds=self._wait_last,
+            )
+
+
+_default: RateLimitScheduler | None = None
+_default_lock = threading.Lock()
+
+
+def default_scheduler() -> RateLimitScheduler:
+    """Return the process-wide scheduler (budgets are per API key, not per client)."""
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = RateLimitScheduler.from_env()
+        return _default
+
+
+def usage_total_tokens(response: Any) -> int | None:
+    """Extract ``usage.total_tokens`` from an SDK response, if present."""
+    total = getattr(getattr(response, "usage", None), "total_tokens", None)
+    return total if isinstance(total, int) else None
@@ -0,0 +1,288 @@
+"""Precompiled, content-hashed structured-output schemas.
+
+This component:
+- Normalises a caller's ``response_schema`` once into a private strict-mode copy
+- Content-hashes the normalised schema so caches can key on schema identity
+- Compiles a lightweight validator for the JSON Schema subset used by strict mode
+- Never mutates the caller's schema and never copies the model's output
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+_Check = Callable[[Any, str], str | None]
+
+_JSON_TYPES: dict[str, Callable[[Any], bool]] = {
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+    "string": lambda v: isinstance(v, str),
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "number": lambda v: isinstance(v, int | float) and not isinstance(v, bool),
+    "boolean": lambda v: isinstance(v, bool),
+    "null": lambda v: v is None,
+}
+
+
+class SchemaValidationError(ValueError):
+    """Raised when a structured response does not match its schema."""
+
+
+def _canonical_json(value: Any) -> str:
+    """Return a stable, whitespace-free JSON encoding used for hashing."""
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def _close_objects(node: Any) -> None:
+    """Set ``additionalProperties: false`` on every object node (in place).
+
+    Only ever called on the registry's private copy of a schema.
+    """
+    if isinstance(node, dict):
+        if node.get("type") == "object" and "additionalProperties" not in node:
+            node["additionalProperties"] = False
+        for value in node.values():
+            _close_objects(value)
+    elif isinstance(node, list):
+        for item in node:
+            _close_objects(item)
+
+
+def _compile(node: Any) -> _Check:
+    """Compile a JSON Schema node into a check function.
+
+    Supported keywords: type, enum, const, properties, required,
+    additionalProperties, items and anyOf. Unknown keywords are ignored.
+    """
+    if not isinstance(node, dict):
+        return lambda _value, _path: None
+
+    checks: list[_Check] = []
+
+    raw_type = node.get("type")
+    if raw_type is not None:
+        names = [raw_type] if isinstance(raw_type, str) else list(raw_type)
+        predicates = [_JSON_TYPES[n] for n in names if n in _JSON_TYPES]
+        expected = "|".join(names)
+
+        def check_type(value: Any, path: str) -> str | None:
+            if predicates and not any(p(value) for p in predicates):
+                return f"{path}: expected {expected}"
+            return None
+
+        checks.append(check_type)
+
+    if "enum" in node:
+        allowed = list(node["enum"])
+
+        def check_enum(value: Any, path: str) -> str | None:
+            return None if value in allowed else f"{path}: not one of {allowed!r}"
+
+        checks.append(check_enum)
+
+    if "const" in node:
+        const = node["const"]
+
+        def check_const(value: Any, path: str) -> str | None:
+            return None if value == const else f"{path}: expected {const!r}"
+
+        checks.append(check_const)
+
+    properties = node.get("properties")
+    prop_checks: dict[str, _Check] = {}
+    if isinstance(properties, dict):
+        prop_checks = {name: _compile(sub) for name, sub in properties.items()}
+    required = tuple(node.get("required") or ())
+    extra = node.get("additionalProperties", True)
+    extra_check = _compile(extra) if isinstance(extra, dict) else None
+
+    if prop_checks or required or extra is not True:
+
+        def check_object(value: Any, path: str) -> str | None:
+            if not isinstance(value, dict):
+                return None
+            for name in required:
+                if name not in value:
+                    return f"{path}: missing required property {name!r}"
+            for key, item in value.items():
+                sub = prop_checks.get(key)
+                if sub is None:
+                    if extra is False:
+                        return f"{path}: unexpected property {key!r}"
+                    sub = extra_check
+                if sub is not None:
+                    error = sub(item, f"{path}.{key}")
+                    if error:
+                        return error
+            return None
+
+        checks.append(check_object)
+
+    if "items" in node:
+        item_check = _compile(node["items"])
+
+        def check_items(value: Any, path: str) -> str | None:
+            if not isinstance(value, list):
+                return None
+            for index, item in enumerate(value):
+                error = item_check(item, f"{path}[{index}]")
+                if error:
+                    return error
+            return None
+
+        checks.append(check_items)
+
+    any_of = node.get("anyOf")
+    if isinstance(any_of, list) and any_of:
+        options = [_compile(option) for option in any_of]
+
+        def check_any_of(value: Any, path: str) -> str | None:
+            if any(option(value, path) is None for option in options):
+                return None
+            return f"{path}: does not match any allowed schema"
+
+        checks.append(check_any_of)
+
+    def check(value: Any, path: str) -> str | None:
+        for fn in checks:
+            error = fn(value, path)
+            if error:
+                return error
+        return None
+
+    return check
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledSchema:
+    """A normalised, hashed and compiled structured-output schema."""
+
+    name: str
+    description: str
+    json_schema: dict[str, Any]
+    schema_hash: str
+    response_format: dict[str, Any] = field(repr=False)
+    _check: _Check = field(repr=False, compare=False)
+
+    def validate(self, data: Any) -> None:
+        """Validate a decoded response against the schema.
+
+        The value is walked read-only; it is never copied or modified.
+
+        Raises:
+            SchemaValidationError: If the value does not conform.
+        """
+        error = self._check(data, "$")
+        if error:
+            raise SchemaValidationError(error)
+
+
+class SchemaRegistry:
+    """Thread-safe cache of compiled schemas keyed by schema content.
+
+    Lookups try the caller's mapping by identity first, so a schema constant
+    passed on every request is found without re-canonicalising it; any other
+    mapping falls back to the canonical content hash. Schemas are treated as
+    immutable once compiled: mutating one in place is not detected.
+    """
+
+    DEFAULT_MAX_ENTRIES = 256
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """Initialize an empty registry.
+
+        Args:
+            max_entries: Upper bound on cached schemas (oldest evicted first).
+        """
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, CompiledSchema] = OrderedDict()
+        # id() -> (mapping, compiled); holding the mapping keeps its id from
+        # being reused by another object while the entry is cached.
+        self._by_identity: OrderedDict[
+            int, tuple[Mapping[str, Any], CompiledSchema]
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of cached schemas."""
+        return len(self._entries)
+
+    def compile(self, response_schema: Mapping[str, Any]) -> CompiledSchema:
+        """Return the compiled form of ``response_schema``, building it once.
+
+        Accepts either an envelope (``{"name", "description", "schema"}``)
+        or a bare JSON schema. The caller's mapping is never mutated.
+        """
+        ident = id(response_schema)
+        with self._lock:
+            hit = self._by_identity.get(ident)
+            if hit is not None and hit[0] is response_schema:
+                self._by_identity.move_to_end(ident)
+                return hit[1]
+
+        key = _canonical_json(response_schema)
+        with self._lock:
+            compiled = self._entries.get(key)
+            if compiled is not None:
+                self._entries.move_to_end(key)
+
+        if compiled is None:
+            compiled = self._build(response_schema)
+
+        with self._lock:
+            compiled = self._entries.setdefault(key, compiled)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+            self._by_identity[ident] = (response_schema, compiled)
+            while len(self._by_identity) > self._max_entries:
+                self._by_identity.popitem(last=False)
+        return compiled
+
+    def hash_of(self, response_schema: Mapping[str, Any]) -> str:
+        """Return the content hash identifying ``response_schema``."""
+        return self.compile(response_schema).schema_hash
+
+    @staticmethod
+    def _build(response_schema: Mapping[str, Any]) -> CompiledSchema:
+        """Normalise, hash and compile a schema (uncached)."""
+        name = str(response_schema.get("name", "structured_output"))
+        description = str(
+            response_schema.get("description", "Structured output schema")
+        )
+        raw = response_schema.get("schema", response_schema)
+
+        json_schema: dict[str, Any] = (
+            copy.deepcopy(dict(raw)) if isinstance(raw, Mapping) else {}
+        )
+        if "additionalProperties" not in json_schema:
+            json_schema["additionalProperties"] = False
+        _close_objects(json_schema)
+
+        envelope = {
+            "name": name,
+            "description": description,
+            "schema": json_schema,
+            "strict": True,
+        }
+        digest = hashlib.sha256(_canonical_json(envelope).encode("utf-8")).hexdigest()
+
+        return CompiledSchema(
+            name=name,
+            description=description,
+            json_schema=json_schema,
+            schema_hash=digest,
+            response_format={"type": "json_schema", "json_schema": envelope},
+            _check=_compile(json_schema),
+        )
+
+
+# Shared across client instances: ai_service resolves a fresh client per request.
+DEFAULT_SCHEMA_REGISTRY = SchemaRegistry()
@@ -5,20 +5,24 @@ No real OpenAI calls are made.
 
 from unittest.mock import Mock, patch
 
+import httpx
 import pytest
+from openai import APIConnectionError
 
 from openai_impl.openai_client import OpenAIClient
+from openai_impl.rate_limit import RateLimitScheduler
 
 
 @pytest.mark.unit
 def test_generate_response_timeout_error() -> None:
-    client = OpenAIClient(api_key="fake-key")
+    scheduler = RateLimitScheduler(max_retries=2, backoff_seconds=0.01)
+    client = OpenAIClient(api_key="fake-key", scheduler=scheduler)
 
     with patch.object(
         client,
         "_call_openai",
         side_effect=TimeoutError("timeout"),
-    ):
+    ) as call:
         with pytest.raises(RuntimeError) as exc:
             client.generate_response(
                 user_input="hi",
@@ -26,6 +30,20 @@ def test_generate_response_timeout_error() -> None:
             )
 
     assert "timed out" in str(exc.value)
+    assert call.call_count == 3  # retried before giving up
+
+
+@pytest.mark.unit
+def test_generate_response_retries_sdk_connection_errors() -> None:
+    scheduler = RateLimitScheduler(max_retries=2, backoff_seconds=0.01)
+    client = OpenAIClient(api_key="fake-key", scheduler=scheduler)
+    dropped = APIConnectionError(request=httpx.Request("POST", "https://api.openai.com/v1/chat/completions"))
+
+    with patch.object(client, "_call_openai", side_effect=[dropped, "hello"]) as call:
+        result = client.generate_response(user_input="hi", system_prompt="sys")
+
+    assert result == "hello"
+    assert call.call_count == 2
 
 
 @pytest.mark.unit
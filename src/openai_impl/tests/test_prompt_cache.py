@@ -0,0 +1,104 @@
+"""Unit tests for openai_impl.prompt_cache (no real OpenAI calls)."""
+
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+from openai_impl.openai_client import OpenAIClient
+from openai_impl.prompt_cache import PromptAssembler, PromptCacheTelemetry
+from openai_impl.schema_registry import SchemaRegistry
+
+_SCHEMA = {"name": "intent", "schema": {"type": "object", "properties": {}}}
+
+
+def _completion(content: str, prompt_tokens: int, cached_tokens: int) -> Mock:
+    response = Mock()
+    response.choices = [SimpleNamespace(message=SimpleNamespace(content=content))]
+    response.usage = SimpleNamespace(
+        prompt_tokens=prompt_tokens,
+        total_tokens=prompt_tokens + 5,
+        prompt_tokens_details=SimpleNamespace(cached_tokens=cached_tokens),
+    )
+    return response
+
+
+@pytest.mark.unit
+def test_static_prefix_first_and_byte_stable() -> None:
+    assembler = PromptAssembler(examples=[("list tickets", '{"action":"list_tickets"}')])
+    compiled = SchemaRegistry().compile(_SCHEMA)
+
+    first = assembler.assemble("Route Jira requests.\n", "make a ticket", compiled)
+    second = assembler.assemble("Route Jira requests.\n", "delete PROJ-1", compiled)
+
+    assert [m["role"] for m in first.messages] == ["system", "user", "assistant", "user"]
+    assert first.messages[-1]["content"] == "make a ticket"
+    assert json.dumps(first.messages[:-1]) == json.dumps(second.messages[:-1])
+    assert first.prefix_hash == second.prefix_hash
+    assert first.messages[0]["content"] == "Route Jira requests.\n"
+
+
+@pytest.mark.unit
+def test_schema_is_not_repeated_in_messages_but_keys_the_prefix() -> None:
+    assembler = PromptAssembler()
+    compiled = SchemaRegistry().compile(_SCHEMA)
+
+    plain = assembler.assemble("Route Jira requests.", "hi")
+    structured = assembler.assemble("Route Jira requests.", "hi", compiled)
+
+    assert structured.messages == plain.messages
+    assert structured.prefix_hash != plain.prefix_hash
+
+
+@pytest.mark.unit
+def test_prefix_hash_changes_with_static_content() -> None:
+    assembler = PromptAssembler()
+
+    chat = assembler.assemble("Be helpful.", "hi")
+    jira = assembler.assemble("Route Jira requests.", "hi")
+
+    assert chat.prefix_hash != jira.prefix_hash
+
+
+@pytest.mark.unit
+def test_telemetry_summarises_cached_tokens() -> None:
+    telemetry = PromptCacheTelemetry()
+
+    telemetry.record("abc", _completion("x", 1200, 0), 0.8)
+    telemetry.record("abc", _completion("x", 1200, 1024), 0.3)
+    telemetry.record("abc", object(), 0.5)
+
+    summary = telemetry.summary()
+    assert summary.requests == 3
+    assert summary.cached_tokens == 1024
+    assert summary.cache_hit_requests == 1
+    assert summary.cached_ratio == pytest.approx(1024 / 2400)
+    assert summary.mean_latency_cached == pytest.approx(0.3)
+    assert summary.mean_latency_uncached == pytest.approx(0.65)
+    assert [u.cached_tokens for u in telemetry.recent()] == [0, 1024, 0]
+
+
+@pytest.mark.unit
+def test_client_sends_assembled_prompt_and_records_usage() -> None:
+    telemetry = PromptCacheTelemetry()
+    client = OpenAIClient(
+        api_key="fake-key",
+        prompt_assembler=PromptAssembler(),
+        prompt_telemetry=telemetry,
+    )
+
+    with patch.object(
+        client._sdk.chat.completions,
+        "create",
+        return_value=_completion("hello", 1500, 1280),
+    ) as create:
+        result = client.generate_response(user_input="hi", system_prompt="Be helpful.")
+
+    assert result == "hello"
+    kwargs = create.call_args.kwargs
+    assert kwargs["messages"][0] == {"role": "system", "content": "Be helpful."}
+    assert kwargs["messages"][-1] == {"role": "user", "content": "hi"}
+    assert len(kwargs["extra_body"]["prompt_cache_key"]) == 32
+    assert client.prompt_telemetry.summary().cached_tokens == 1280
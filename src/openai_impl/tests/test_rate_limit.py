@@ -0,0 +1,193 @@
+"""Unit tests for openai_impl.rate_limit (no real OpenAI calls)."""
+
+from __future__ import annotations
+
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+from openai_impl.openai_client import OpenAIClient
+from openai_impl.rate_limit import RateLimitedError, RateLimitScheduler
+
+
+class _Provider429(Exception):
+    """Mimics openai.RateLimitError (status_code + response.headers)."""
+
+    status_code = 429
+
+    def __init__(self, headers: dict[str, str]) -> None:
+        super().__init__("rate limited")
+        self.response = Mock(headers=headers)
+
+
+@pytest.mark.unit
+def test_acquire_queues_until_token_budget_refills() -> None:
+    scheduler = RateLimitScheduler(requests_per_minute=6000, tokens_per_minute=6000)
+
+    assert scheduler.acquire(6000) == pytest.approx(0.0, abs=0.01)
+    waited = scheduler.acquire(10)  # 100 tokens/s refill -> ~0.1s
+
+    stats = scheduler.stats()
+    assert 0.05 <= waited < 1.0
+    assert stats.requests == 2
+    assert stats.queued == 1
+    assert stats.last_wait_seconds == waited
+
+
+@pytest.mark.unit
+def test_acquire_raises_when_wait_exceeds_queue_budget() -> None:
+    scheduler = RateLimitScheduler(requests_per_minute=1, max_queue_seconds=0.1)
+    scheduler.acquire(1)
+
+    with pytest.raises(RateLimitedError) as exc:
+        scheduler.acquire(1)
+
+    assert exc.value.retry_after >= 1.0
+
+
+@pytest.mark.unit
+def test_concurrent_callers_are_all_served() -> None:
+    scheduler = RateLimitScheduler(requests_per_minute=600, max_queue_seconds=5)
+    scheduler.acquire(1)
+    scheduler._requests.level = 0  # exhausted: each request now waits ~0.1s
+
+    threads = [threading.Thread(target=scheduler.acquire, args=(1,)) for _ in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=5)
+
+    stats = scheduler.stats()
+    assert stats.requests == 4
+    assert stats.queued == 3
+    assert stats.max_wait_seconds >= 0.2
+
+
+@pytest.mark.unit
+def test_run_honours_retry_after_then_succeeds() -> None:
+    scheduler = RateLimitScheduler(max_retries=2)
+    call = Mock(side_effect=[_Provider429({"retry-after-ms": "50"}), "ok"])
+
+    assert scheduler.run(call, estimated_tokens=10) == "ok"
+
+    stats = scheduler.stats()
+    assert call.call_count == 2
+    assert stats.rate_limited == 1
+    assert stats.retries == 1
+    assert stats.last_wait_seconds >= 0.05
+
+
+@pytest.mark.unit
+def test_run_gives_up_after_max_retries() -> None:
+    scheduler = RateLimitScheduler(max_retries=0)
+    call = Mock(side_effect=_Provider429({"retry-after": "7"}))
+
+    with pytest.raises(RateLimitedError) as exc:
+        scheduler.run(call, estimated_tokens=10)
+
+    assert exc.value.retry_after == 7.0
+    assert call.call_count == 1
+
+
+class _ProviderError(Exception):
+    """Mimics an openai.APIStatusError with the given status."""
+
+    def __init__(self, status_code: int) -> None:
+        super().__init__(f"status {status_code}")
+        self.status_code = status_code
+        self.response = Mock(headers={})
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "error",
+    [
+        TimeoutError(),
+        ConnectionError(),
+        _ProviderError(503),
+        _ProviderError(408),
+        _ProviderError(409),
+    ],
+)
+def test_run_retries_transient_errors(error: Exception) -> None:
+    scheduler = RateLimitScheduler(max_retries=2, backoff_seconds=0.01)
+    call = Mock(side_effect=[error, error, "ok"])
+
+    assert scheduler.run(call, estimated_tokens=10) == "ok"
+
+    assert call.call_count == 3
+    assert scheduler.stats().retries == 2
+    assert scheduler.stats().rate_limited == 0
+
+
+@pytest.mark.unit
+def test_run_retries_caller_supplied_transient_types() -> None:
+    class _SDKConnectionError(Exception):
+        pass
+
+    scheduler = RateLimitScheduler(max_retries=1, backoff_seconds=0.01)
+    call = Mock(side_effect=[_SDKConnectionError(), "ok"])
+
+    assert (
+        scheduler.run(call, estimated_tokens=10, transient=(_SDKConnectionError,))
+        == "ok"
+    )
+
+
+@pytest.mark.unit
+def test_run_reraises_transient_errors_once_retries_run_out() -> None:
+    scheduler = RateLimitScheduler(max_retries=1, backoff_seconds=0.01)
+    call = Mock(side_effect=TimeoutError())
+
+    with pytest.raises(TimeoutError):
+        scheduler.run(call, estimated_tokens=10)
+
+    assert call.call_count == 2
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "error", [ValueError("bad"), _ProviderError(400), _ProviderError(401)]
+)
+def test_run_propagates_other_errors_unchanged(error: Exception) -> None:
+    scheduler = RateLimitScheduler(backoff_seconds=0.01)
+    call = Mock(side_effect=error)
+
+    with pytest.raises(type(error)) as exc:
+        scheduler.run(call, estimated_tokens=10)
+
+    assert exc.value is error
+    assert call.call_count == 1
+
+
+@pytest.mark.unit
+def test_record_usage_refunds_overestimate() -> None:
+    scheduler = RateLimitScheduler(tokens_per_minute=1000)
+    scheduler.acquire(600)
+
+    scheduler.record_usage(600, 100)
+
+    assert scheduler._tokens.level == pytest.approx(900, abs=5)
+
+
+@pytest.mark.unit
+def test_generate_response_surfaces_rate_limit_with_retry_hint() -> None:
+    scheduler = RateLimitScheduler(max_retries=0)
+    client = OpenAIClient(api_key="fake-key", scheduler=scheduler)
+
+    with (
+        patch.object(
+            client,
+            "_call_openai",
+            side_effect=_Provider429({"retry-after": "3"}),
+        ),
+        pytest.raises(RateLimitedError) as exc,
+    ):
+        client.generate_response(user_input="hi", system_prompt="sys")
+
+    assert isinstance(exc.value, RuntimeError)
+    assert exc.value.retry_after == 3.0
+    # Sanitized: our own message, and the provider error is not chained.
+    assert str(exc.value) == "AI provider rate limit reached; please retry shortly"
+    assert exc.value.__cause__ is None
+    assert exc.value.__suppress_context__ is True
@@ -0,0 +1,153 @@
+"""Unit tests for openai_impl.schema_registry (no real OpenAI calls)."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+from openai_impl.openai_client import OpenAIClient
+from openai_impl.schema_registry import (
+    SchemaRegistry,
+    SchemaValidationError,
+    _canonical_json,
+)
+
+_SCHEMA = {
+    "name": "jira_action",
+    "description": "Route a Jira request",
+    "schema": {
+        "type": "object",
+        "properties": {
+            "action": {"type": "string", "enum": ["create_ticket", "list_tickets"]},
+            "title": {"type": "string"},
+            "meta": {
+                "type": "object",
+                "properties": {"priority": {"type": "integer"}},
+            },
+        },
+        "required": ["action"],
+    },
+}
+
+
+def _completion(content: str | None) -> Mock:
+    message = Mock()
+    message.content = content
+    choice = Mock()
+    choice.message = message
+    response = Mock()
+    response.choices = [choice]
+    return response
+
+
+@pytest.mark.unit
+def test_compile_is_cached_and_does_not_mutate_caller_schema() -> None:
+    registry = SchemaRegistry()
+    original = json.dumps(_SCHEMA, sort_keys=True)
+
+    first = registry.compile(_SCHEMA)
+    second = registry.compile(json.loads(original))
+
+    assert first is second
+    assert len(registry) == 1
+    assert json.dumps(_SCHEMA, sort_keys=True) == original
+    assert first.json_schema["additionalProperties"] is False
+    assert first.json_schema["properties"]["meta"]["additionalProperties"] is False
+    assert first.response_format["json_schema"]["strict"] is True
+
+
+@pytest.mark.unit
+def test_same_mapping_is_found_without_recanonicalising() -> None:
+    registry = SchemaRegistry()
+    first = registry.compile(_SCHEMA)
+
+    with patch(
+        "openai_impl.schema_registry._canonical_json",
+        wraps=_canonical_json,
+    ) as canonical:
+        assert registry.compile(_SCHEMA) is first
+        canonical.assert_not_called()
+
+        assert registry.compile(json.loads(json.dumps(_SCHEMA))) is first
+        canonical.assert_called_once()
+
+
+@pytest.mark.unit
+def test_hash_is_stable_and_tracks_content() -> None:
+    registry = SchemaRegistry()
+    reordered = {
+        "schema": _SCHEMA["schema"],
+        "description": "Route a Jira request",
+        "name": "jira_action",
+    }
+    changed = {**_SCHEMA, "name": "other"}
+
+    assert registry.hash_of(_SCHEMA) == registry.hash_of(reordered)
+    assert registry.hash_of(_SCHEMA) != registry.hash_of(changed)
+
+
+@pytest.mark.unit
+def test_validate_accepts_and_rejects() -> None:
+    compiled = SchemaRegistry().compile(_SCHEMA)
+
+    compiled.validate({"action": "create_ticket", "meta": {"priority": 2}})
+
+    with pytest.raises(SchemaValidationError, match="missing required"):
+        compiled.validate({"title": "x"})
+    with pytest.raises(SchemaValidationError, match="not one of"):
+        compiled.validate({"action": "explode"})
+    with pytest.raises(SchemaValidationError, match="unexpected property"):
+        compiled.validate({"action": "list_tickets", "extra": 1})
+    with pytest.raises(SchemaValidationError, match=r"\$\.meta\.priority"):
+        compiled.validate({"action": "list_tickets", "meta": {"priority": "high"}})
+
+
+@pytest.mark.unit
+def test_registry_evicts_oldest_entry() -> None:
+    registry = SchemaRegistry(max_entries=2)
+    for name in ("a", "b", "c"):
+        registry.compile({"name": name, "schema": {"type": "object"}})
+
+    assert len(registry) == 2
+
+
+@pytest.mark.unit
+def test_call_openai_uses_compiled_schema_and_validates() -> None:
+    registry = SchemaRegistry()
+    client = OpenAIClient(api_key="fake-key", schema_registry=registry)
+
+    with patch.object(
+        client._sdk.chat.completions,
+        "create",
+        return_value=_completion('{"action": "list_tickets"}'),
+    ) as create:
+        result = client._call_openai(
+            user_input="hi",
+            system_prompt="sys",
+            response_schema=_SCHEMA,
+        )
+
+    assert result == {"action": "list_tickets"}
+    expected = registry.compile(_SCHEMA).response_format
+    assert create.call_args.kwargs["response_format"] is expected
+    assert client.compile_schema(_SCHEMA).schema_hash == registry.hash_of(_SCHEMA)
+
+
+@pytest.mark.unit
+def test_schema_mismatch_is_invalid_response_format() -> None:
+    client = OpenAIClient(api_key="fake-key", schema_registry=SchemaRegistry())
+
+    with (
+        patch.object(
+            client._sdk.chat.completions,
+            "create",
+            return_value=_completion('{"action": "explode"}'),
+        ),
+        pytest.raises(RuntimeError, match="invalid response format"),
+    ):
+        client.generate_response(
+            user_input="hi",
+            system_prompt="sys",
+            response_schema=_SCHEMA,
+        )
@@ -0,0 +1,5 @@
+"""Helpers shared by the FastAPI services."""
+
+from service_common.fast_json import FastJSONResponse, dumps, json_response
+
+__all__ = ["FastJSONResponse", "dumps", "json_response"]
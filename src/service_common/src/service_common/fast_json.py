@@ -0,0 +1,71 @@
+"""Fast JSON responses for list-heavy endpoints.
+
+By default FastAPI validates a route's return value against its
+``response_model``, converts it with ``jsonable_encoder`` and then encodes
+it. For a page of thousands of rows that round trip takes most of the
+request's CPU. A route whose rows are trusted internal data (records the
+service built itself) can opt out by returning :func:`json_response`:
+- Rows are plain dicts or dataclass ``__dict__``s, not pydantic models
+- The body is encoded once, with orjson when it is installed and with the
+  stdlib encoder otherwise
+- ``response_model`` is not checked. Keep it on the route decorator, so the
+  OpenAPI schema does not change
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+from typing import TYPE_CHECKING, Any, cast
+
+from fastapi import Response
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+
+def _optional_module(name: str) -> ModuleType | None:
+    try:
+        return importlib.import_module(name)
+    except ModuleNotFoundError:  # pragma: no cover
+        return None
+
+
+# Optional, see the "fast" extra. Loaded by name so that the module types the
+# same whether or not orjson is installed.
+orjson = _optional_module("orjson")
+
+
+def dumps(content: Any) -> bytes:  # noqa: ANN401
+    """Encode ``content`` as compact UTF-8 JSON.
+
+    Supports what both encoders do: dicts, lists, strings, numbers, None and
+    str/int enums. orjson also accepts dataclasses and datetimes, but the
+    stdlib fallback does not, so do not pass them.
+    """
+    if orjson is not None:
+        return cast("bytes", orjson.dumps(content))
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+class FastJSONResponse(Response):
+    """JSON response encoded by :func:`dumps`, with no model validation."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:  # noqa: ANN401
+        """Encode the response body."""
+        return dumps(content)
+
+
+def json_response(content: Any, status_code: int = 200) -> FastJSONResponse:  # noqa: ANN401
+    """Return ``content`` as-is, skipping ``response_model`` validation.
+
+    Only use this for data whose shape the service already guarantees.
+    """
+    return FastJSONResponse(content, status_code=status_code)
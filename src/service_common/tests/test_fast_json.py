@@ -0,0 +1,53 @@
+"""Tests for the fast JSON response helpers."""
+
+from __future__ import annotations
+
+from enum import StrEnum
+import json
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from service_common import FastJSONResponse, dumps, json_response
+
+
+class _Status(StrEnum):
+    CLOSED = "closed"
+
+
+class _RowsOut(BaseModel):
+    rows: list[dict[str, str]]
+
+
+def test_dumps_is_compact_utf8_and_encodes_str_enums() -> None:
+    """Output is compact UTF-8, and StrEnum members encode as their values."""
+    body = dumps(
+        {"title": "café", "status": _Status.CLOSED, "assignee": None, "n": [1, 2.5]}
+    )
+
+    expected = '{"title":"café","status":"closed","assignee":null,"n":[1,2.5]}'
+    assert body == expected.encode()
+    assert json.loads(body)["status"] == "closed"
+
+
+def test_json_response_skips_response_model_but_keeps_schema() -> None:
+    """The body is not validated, but the OpenAPI schema keeps the model."""
+    app = FastAPI()
+
+    @app.get("/rows", response_model=_RowsOut)
+    def rows() -> FastJSONResponse:
+        # Would fail _RowsOut validation; the fast path does not check it.
+        return json_response({"rows": [{"id": 1}], "extra": True}, status_code=203)
+
+    client = TestClient(app)
+    response = client.get("/rows")
+
+    assert response.status_code == 203
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {"rows": [{"id": 1}], "extra": True}
+    schema = client.get("/openapi.json").json()
+    ok = schema["paths"]["/rows"]["get"]["responses"]["200"]
+    assert ok["content"]["application/json"]["schema"] == {
+        "$ref": "#/components/schemas/_RowsOut"
+    }
@@ -29,6 +29,41 @@ def test_list_messages_success() -> None:
     assert data["messages"][0]["text"] == "hello"
 
 
+def test_list_messages_response_shape() -> None:
+    """Provider messages are validated into the MessageOut shape."""
+    client = TestClient(app)
+
+    mock_client = Mock()
+    mock_client.get_messages.return_value = [
+        Mock(id="1714557600.000100", content="hello", sender_id="U1"),
+        Mock(id="1714557601.000200", content="", sender_id="U2"),
+    ]
+
+    with patch("chat_api.get_client", return_value=mock_client):
+        response = client.get("/channels/C1/messages?limit=2")
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "messages": [
+            {
+                "id": "1714557600.000100",
+                "channel_id": "C1",
+                "text": "hello",
+                "sender_id": "U1",
+                "ts": "1714557600.000100",
+            },
+            {
+                "id": "1714557601.000200",
+                "channel_id": "C1",
+                "text": "",
+                "sender_id": "U2",
+                "ts": "1714557601.000200",
+            },
+        ]
+    }
+    mock_client.get_messages.assert_called_once_with(channel_id="C1", limit=2)
+
+
 def test_post_message_success() -> None:
     """POST message should succeed when client returns True."""
     client = TestClient(app)
@@ -9,14 +9,20 @@ from __future__ import annotations
 
 from tickets_api.client import (
     Ticket,
+    TicketCreateResult,
     TicketInterface,
+    TicketSpec,
+    TicketStats,
     TicketStatus,
     get_client,
 )
 
 __all__ = [
     "Ticket",
+    "TicketCreateResult",
     "TicketInterface",
+    "TicketSpec",
+    "TicketStats",
     "TicketStatus",
     "get_client",
 ]
@@ -3,7 +3,12 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from enum import StrEnum
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
 
 
 class TicketStatus(StrEnum):
@@ -45,6 +50,37 @@ class Ticket(ABC):
         """Return the unique ticket identifier."""
         ...
 
+
+@dataclass(frozen=True, slots=True)
+class TicketSpec:
+    """Input for one ticket in a bulk create."""
+
+    title: str
+    description: str
+    assignee: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class TicketCreateResult:
+    """Per-item outcome of a bulk create; exactly one of ticket/error is set."""
+
+    ticket: Ticket | None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Return True when the ticket was created."""
+        return self.error is None
+
+
+@dataclass(frozen=True, slots=True)
+class TicketStats:
+    """Ticket counts, overall and per status."""
+
+    total: int
+    by_status: dict[TicketStatus, int]
+
+
 class TicketInterface(ABC):
     """The contract for ticketing service implementations."""
     @abstractmethod
@@ -57,6 +93,23 @@ class TicketInterface(ABC):
         """Create a new ticket."""
         ...
 
+    def create_tickets(self, specs: Sequence[TicketSpec]) -> list[TicketCreateResult]:
+        """Create many tickets, returning one result per spec in input order.
+
+        A failure for one spec does not abort the others. The default
+        implementation calls ``create_ticket`` per spec; providers with a bulk
+        endpoint should override it.
+        """
+        results: list[TicketCreateResult] = []
+        for spec in specs:
+            try:
+                ticket = self.create_ticket(spec.title, spec.description, spec.assignee)
+            except (ValueError, RuntimeError, ConnectionError) as exc:
+                results.append(TicketCreateResult(ticket=None, error=str(exc)))
+            else:
+                results.append(TicketCreateResult(ticket=ticket))
+        return results
+
     @abstractmethod
     def get_ticket(self, ticket_id: str) -> Ticket | None:
         """Return a ticket by ID, or None if not found."""
@@ -71,6 +124,29 @@ class TicketInterface(ABC):
         """Search tickets by query and/or status."""
         ...
 
+    def count_tickets(
+        self,
+        query: str | None = None,
+        status: TicketStatus | None = None,
+    ) -> int:
+        """Return how many tickets match ``query``/``status``.
+
+        The default counts ``search_tickets`` results, so it transfers every
+        match and is bounded by any result cap the provider applies. Providers
+        that can count server-side should override it.
+        """
+        return len(self.search_tickets(query, status))
+
+    def ticket_stats(self) -> TicketStats:
+        """Return ticket counts overall and per status.
+
+        The default makes one ``count_tickets`` call per status.
+        """
+        by_status = {
+            status: self.count_tickets(status=status) for status in TicketStatus
+        }
+        return TicketStats(total=sum(by_status.values()), by_status=by_status)
+
     @abstractmethod
     def update_ticket(
         self,
@@ -0,0 +1,106 @@
+"""Shared fixtures for the tickets_api tests."""
+
+from __future__ import annotations
+
+import pytest
+
+from tickets_api.client import Ticket, TicketInterface, TicketStatus
+
+
+class FakeTicket(Ticket):
+    """Minimal concrete ticket."""
+
+    def __init__(self, ticket_id: str, title: str, status: TicketStatus) -> None:
+        """Store the fields the tests look at."""
+        self._id = ticket_id
+        self._title = title
+        self._status = status
+
+    @property
+    def id(self) -> str:
+        """Return the ticket id."""
+        return self._id
+
+    @property
+    def title(self) -> str:
+        """Return the ticket title."""
+        return self._title
+
+    @property
+    def description(self) -> str:
+        """Return an empty description."""
+        return ""
+
+    @property
+    def status(self) -> TicketStatus:
+        """Return the ticket status."""
+        return self._status
+
+    @property
+    def assignee(self) -> str | None:
+        """Return no assignee."""
+        return None
+
+
+class FakeClient(TicketInterface):
+    """In-memory client implementing only the abstract methods.
+
+    The default ``create_tickets``, ``count_tickets`` and ``ticket_stats``
+    are inherited, so tests exercise the fallbacks on ``TicketInterface``.
+    """
+
+    def __init__(self) -> None:
+        """Start with no tickets."""
+        self.tickets: list[FakeTicket] = []
+
+    def add(self, title: str, status: TicketStatus = TicketStatus.OPEN) -> FakeTicket:
+        """Store a ticket with the given status."""
+        ticket = FakeTicket(f"T-{len(self.tickets) + 1}", title, status)
+        self.tickets.append(ticket)
+        return ticket
+
+    def create_ticket(
+        self, title: str, description: str, assignee: str | None = None
+    ) -> Ticket:
+        """Create an open ticket; an empty title is rejected."""
+        _ = (description, assignee)
+        if not title:
+            error_msg = "title must be non-empty"
+            raise ValueError(error_msg)
+        return self.add(title)
+
+    def get_ticket(self, ticket_id: str) -> Ticket | None:
+        """Return the ticket with ``ticket_id``, if any."""
+        return next((t for t in self.tickets if t.id == ticket_id), None)
+
+    def search_tickets(
+        self, query: str | None = None, status: TicketStatus | None = None
+    ) -> list[Ticket]:
+        """Filter by status and by a substring of the title."""
+        return [
+            t
+            for t in self.tickets
+            if (status is None or t.status == status)
+            and (not query or query in t.title)
+        ]
+
+    def update_ticket(
+        self,
+        ticket_id: str,
+        status: TicketStatus | None = None,
+        title: str | None = None,
+    ) -> Ticket:
+        """Updates are not supported by the fake."""
+        _ = (status, title)
+        raise KeyError(ticket_id)
+
+    def delete_ticket(self, ticket_id: str) -> bool:
+        """Deletes are not supported by the fake."""
+        _ = ticket_id
+        return False
+
+
+@pytest.fixture
+def fake_client() -> FakeClient:
+    """Return an empty in-memory ticket client."""
+    return FakeClient()
@@ -0,0 +1,29 @@
+"""Tests for the default TicketInterface.count_tickets / ticket_stats fallbacks."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from tickets_api.client import TicketStats, TicketStatus
+
+if TYPE_CHECKING:
+    from .conftest import FakeClient
+
+
+def test_default_count_and_stats_use_search(fake_client: FakeClient) -> None:
+    """Counts and stats are derived from search_tickets."""
+    fake_client.add("login bug", TicketStatus.OPEN)
+    fake_client.add("export", TicketStatus.OPEN)
+    fake_client.add("login slow", TicketStatus.CLOSED)
+
+    assert fake_client.count_tickets() == 3
+    assert fake_client.count_tickets(query="login") == 2
+    assert fake_client.count_tickets(status=TicketStatus.OPEN) == 2
+    assert fake_client.ticket_stats() == TicketStats(
+        total=3,
+        by_status={
+            TicketStatus.OPEN: 2,
+            TicketStatus.IN_PROGRESS: 0,
+            TicketStatus.CLOSED: 1,
+        },
+    )
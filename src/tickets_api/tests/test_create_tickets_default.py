@@ -0,0 +1,23 @@
+"""Tests for the default TicketInterface.create_tickets fallback."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from tickets_api.client import TicketSpec
+
+if TYPE_CHECKING:
+    from .conftest import FakeClient
+
+
+def test_default_create_tickets_reports_per_item_results(
+    fake_client: FakeClient,
+) -> None:
+    """A failed item is reported without stopping the others."""
+    results = fake_client.create_tickets(
+        [TicketSpec("A", "d"), TicketSpec("", "d"), TicketSpec("C", "d")]
+    )
+
+    assert [r.ok for r in results] == [True, False, True]
+    assert [r.ticket.title for r in results if r.ticket] == ["A", "C"]
+    assert results[1].error == "title must be non-empty"